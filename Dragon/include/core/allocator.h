@@ -0,0 +1,72 @@
+// ------------------------------------------------------------
+// Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+//
+// Licensed under the BSD 2-Clause License.
+// You should have received a copy of the BSD 2-Clause License
+// along with the software. If not, See,
+//
+//      <https://opensource.org/licenses/BSD-2-Clause>
+//
+// ------------------------------------------------------------
+
+#ifndef DRAGON_CORE_ALLOCATOR_H_
+#define DRAGON_CORE_ALLOCATOR_H_
+
+#include "core/common.h"
+
+namespace dragon {
+
+/*!
+ *  The caching allocator of CPU memory.
+ *
+ *  The requests are rounded up to the size classes,
+ *  i.e., four classes per power of two, aligned to 64 bytes.
+ *
+ *  The freed blocks are cached in the lists of their classes,
+ *  and reused by the later requests of the same class.
+ *
+ *  The largest blocks are released if the cached bytes exceed the limit,
+ *  and all the cached blocks are released if the system allocation fails.
+ */
+class CPUAllocator {
+ public:
+    struct Stats {
+        size_t bytes_in_use, bytes_cached, peak_bytes_in_use;
+        size_t cache_limit;
+        int64_t num_allocs, num_system_allocs;
+    };
+
+    static CPUAllocator* Get();
+
+    void* New(size_t nbytes);
+    void Delete(void* ptr);
+
+    /*! \brief Release all the cached blocks */
+    void EmptyCache();
+
+    /*! \brief Set the max cached bytes, 0 to disable the caching */
+    void SetCacheLimit(size_t nbytes);
+
+    Stats GetStats();
+    void ResetStats();
+
+    static size_t RoundSize(size_t nbytes);
+
+ private:
+    CPUAllocator();
+
+    void* SystemNew(size_t nbytes);
+    void SystemDelete(void* ptr);
+    void ReleaseCache(size_t nbytes);
+
+    std::mutex mutex_;
+    Map<void*, size_t> blocks_;
+    std::map<size_t, vector<void*> > free_blocks_;
+    size_t bytes_in_use_, bytes_cached_, peak_bytes_in_use_;
+    size_t cache_limit_;
+    int64_t num_allocs_, num_system_allocs_;
+};
+
+}    // namespace dragon
+
+#endif    // DRAGON_CORE_ALLOCATOR_H_
@@ -13,6 +13,8 @@
 #define DRAGON_CORE_CONTEXT_H_
 
 #include "core/common.h"
+#include "core/allocator.h"
+#include "utils/profiler.h"
 
 namespace dragon {
 
@@ -36,9 +38,10 @@ class CPUContext {
 #ifdef WITH_CUDA_HOST_MEM
         CUDA_CHECK(cudaMallocHost(&data, nbytes));
 #else
-        data = malloc(nbytes);
+        data = CPUAllocator::Get()->New(nbytes);
 #endif
         CHECK(data) << "\nMalloc mem: " << nbytes << " bytes failed.";
+        if (Profiler::IsEnabled()) Profiler::allocated() += nbytes;
         return data;
     }
 
@@ -83,7 +86,9 @@ class CPUContext {
         else for (int i = 0; i < n; i++) dst[i] = src[i];
     }
 
-    inline static void Delete(void* data) { free(data); }
+    inline static void Delete(void* data) {
+        CPUAllocator::Get()->Delete(data);
+    }
 
     inline int device_id() const { return 0; }
     inline void set_stream_id(int stream_id) {}
@@ -17,6 +17,7 @@
 #include "core/common.h"
 #include "utils/cuda_device.h"
 #include "utils/cudnn_device.h"
+#include "utils/profiler.h"
 
 namespace dragon {
 
@@ -143,6 +144,7 @@ class CUDAContext {
         cudaMalloc(&data, nbytes);
         CHECK(data) << "\nMalloc cuda mem: " 
                     << nbytes << " bytes failed.";
+        if (Profiler::IsEnabled()) Profiler::allocated() += nbytes;
         return data;
     }
 
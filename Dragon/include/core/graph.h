@@ -14,6 +14,7 @@
 
 #include "core/common.h"
 #include "core/operator.h"
+#include "utils/thread.h"
 
 namespace dragon {
 
@@ -50,8 +51,21 @@ class GraphBase {
 
 class Graph : public GraphBase {
  public:
+    //  the tensors sharing a memory, placed at an offset of the arena
+    struct MemoryBlock {
+        vector<Tensor*> tensors;
+        size_t offset = 0, nbytes = 0;
+        int first = 0, last = 0;
+    };
+
+    struct MemoryPlan {
+        vector<MemoryBlock> blocks;
+        size_t naive_bytes = 0, planned_bytes = 0, live_bytes = 0;
+        bool applied = false;
+    };
+
     Graph(const GraphDef& meta_graph, Workspace* ws);
-    virtual ~Graph() { for (auto* op : ops_) delete op; }
+    virtual ~Graph();
 
     bool Create(
         const GraphDef&         optimized_graph,
@@ -65,15 +79,29 @@ class Graph : public GraphBase {
     GraphDef Prune(const GraphDef& meta_graph);
     GraphDef MakeUpdate(const GraphDef& meta_graph);
     GraphDef Share(const GraphDef& optimized_graph);
+    GraphDef Fold(const GraphDef& optimized_graph);
     void ShareGrads(GraphDef& optimized_graph);
 
     void RecomputingAware(
         const GraphDef&         optimized_graph,
         Workspace*              ws);
 
+    void PlanMemory(bool apply);
+    const MemoryPlan& GetMemoryPlan();
+
     inline Workspace* ws() const { return ws_; }
 
  protected:
+    void MakeSchedule();
+    int NumAllocatedOutputs();
+    bool IsMemoryPlanStale();
+    const vector<bool>& GetStage(
+        const string&           include,
+        const string&           exclude);
+    void RunParallel(
+        const vector<bool>&     stage,
+        const int               stream_id);
+
     void ForwardShareDyeing(string u, string ancestor);
     void ForwardPruneDyeing(
         string                  u,
@@ -86,6 +114,23 @@ class Graph : public GraphBase {
     Map<string, bool> visited_, colored_;
     Map<string, string> renamed_;
     Set<string> targets_;
+
+    //  the dependencies of ops, built at the creation
+    vector<vector<int> > successors_;
+    vector<int> num_parents_;
+    Map<string, vector<bool> > stages_;
+    bool has_mirror_stage_ = false;
+    unique_ptr<ThreadPool> thread_pool_;
+
+    //  the memory plan by the lifetimes of tensors
+    bool memory_planning_ = false;
+    MemoryPlan memory_plan_;
+    Map<Tensor*, MixedMemory*> planned_memory_;
+    Map<MixedMemory*, Tensor*> planned_owners_;
+    Map<Tensor*, size_t> max_nbytes_;
+    Set<Tensor*> excluded_;
+    int num_allocated_ = 0;
+    unique_ptr<MixedMemory> arena_;
 };
 
 GraphBase* NewGraph(
@@ -56,6 +56,9 @@ class MixedMemory {
 
     inline size_t nbytes() const { return nbytes_; }
     inline State state() const { return state_; }
+
+    //  the number of mutable accesses, i.e. the data may be changed
+    inline size_t version() const { return version_; }
     const Map<string, string> info() const;
 
     void ToCPU();
@@ -67,7 +70,7 @@ class MixedMemory {
     cnmlTensor_t cnml_mlu_tensor_ = nullptr;
     int own_cpu_ptr_ = 1, ptr_device_ = 0;
     State state_ = UNINITIALIZED;
-    size_t nbytes_ = 0;
+    size_t nbytes_ = 0, version_ = 0;
     TypeMeta meta_;
 };
 
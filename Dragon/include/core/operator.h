@@ -62,13 +62,21 @@ class OperatorBase {
     template <typename T>
     vector<T> Args(const string& name);
 
+    /*! \brief Record an event into the profiler */
+    void RecordProfile(int64_t start, int64_t nbytes);
+
     inline const Map<std::string, const Argument*>& args() { return args_; }
     inline const Argument& arg(const string& name) { return *(args_[name]); }
 
     typedef Map<string, vector<OperatorBase*> > RecomputeMap;
-    inline RecomputeMap& recompute_map() { return recompute_map_; }
-    void set_recompute_map(RecomputeMap recompute_map) {
-        recompute_map_ = recompute_map; 
+    inline RecomputeMap& recompute_map() {
+        if (!recompute_map_) recompute_map_.reset(new RecomputeMap());
+        return *recompute_map_;
+    }
+    //  the map is shared by all ops of a graph, copying it
+    //  into each op will cost O(N^2) for a graph with N ops
+    void set_recompute_map(shared_ptr<RecomputeMap> recompute_map) {
+        recompute_map_ = recompute_map;
     }
 
     inline const OperatorDef& def() const { return def_; }
@@ -83,7 +91,7 @@ class OperatorBase {
  protected:
     string phase_, anchor_;
     Map<std::string, const Argument*> args_;
-    Map<string, vector<OperatorBase*> > recompute_map_;
+    shared_ptr<RecomputeMap> recompute_map_;
     vector<Tensor*> inputs_, outputs_;
     OperatorDef def_;
     Workspace* ws_;
@@ -106,12 +114,20 @@ class Operator : public OperatorBase {
 
     void Run(int stream_id = 1) final {
         if (!allow_run_) return;
+        const bool profiling = Profiler::IsEnabled();
+        int64_t start = 0, nbytes = 0;
+        if (profiling) {
+            start = Profiler::Now();
+            nbytes = Profiler::allocated();
+        }
         if (allow_recompute_) MakeResource();
         ctx()->SwitchToDevice(stream_id);
         MemorySwitch();
         RunOnDevice();
         if (do_sync_) ctx()->FinishDeviceCompution();
         if (allow_recompute_) CleanResource();
+        if (profiling) RecordProfile(start,
+            Profiler::allocated() - nbytes);
     }
 
     virtual void ElimateCorruption();
@@ -249,7 +265,8 @@ DECLARE_REGISTRY(
     }
 
 #define INIT_MULTIPLIER(ptr_tensor, size) { \
-    ptr_tensor = ws()->CreateTensor("/share/multiplier"); \
+    ptr_tensor = ws()->CreateTensor( \
+        Workspace::ScratchName("/share/multiplier")); \
     if (size > ptr_tensor->count()) { \
         ptr_tensor->Reshape({ size }); \
         math::Set<T, Context>(size, dragon_cast<T, float>(1.f), \
@@ -120,6 +120,8 @@ class Tensor {
     inline bool is_corrupted() const { return is_corrupted_; }
     inline void Corrupt() { is_corrupted_ = true; }
 
+    inline bool is_shared() const { return is_shared_; }
+
     inline bool has_memory() const {
         return memory_ || ex_memory_ != nullptr;
     }
@@ -281,6 +283,16 @@ class Tensor {
         require_init_ = false;
     }
 
+    //  take the memory planned by the graph, and release the private one
+    //  the given memory will be deleted if it is too small for reshaping
+    inline void Replace(MixedMemory* mem) {
+        if (own_mem_) memory_.reset();
+        else if (!is_shared_ && ex_memory_ != mem) delete ex_memory_;
+        ex_memory_ = mem; capacity_ = mem ? mem->nbytes() : 0;
+        own_mem_ = is_shared_ = false;
+        require_init_ = false;
+    }
+
     inline void Reset() {
         size_ = capacity_ = 0;
         meta_ = TypeMeta();
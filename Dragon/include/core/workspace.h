@@ -80,8 +80,11 @@ class Workspace {
         bool                    use_remote = true) {
         string query = GetTensorName(name);
         //  search local workspace
-        if (tensor_map_.count(query) > 0)
-            return tensor_map_[query].get();
+        {
+            std::lock_guard<std::mutex> lock(tensor_mutex_);
+            auto it = tensor_map_.find(query);
+            if (it != tensor_map_.end()) return it->second.get();
+        }
         if (use_remote) {
             //  search remote workspace
             for (auto& it : ws_map_) {
@@ -101,12 +104,27 @@ class Workspace {
     inline Tensor* CreateTensor(const string& name) {
         Tensor* tensor = TryGetTensor(name);
         if (!tensor) {
-            tensor_map_[name] = unique_ptr<Tensor>(new Tensor(name));
-            return tensor_map_[name].get();
+            //  the ops of a graph might create tensors concurrently
+            std::lock_guard<std::mutex> lock(tensor_mutex_);
+            auto& new_tensor = tensor_map_[name];
+            if (!new_tensor) new_tensor.reset(new Tensor(name));
+            return new_tensor.get();
         }
         return tensor;
     }
 
+    //  the index of thread running the ops, 0 for the caller thread
+    static int& thread_slot() {
+        static thread_local int slot = 0;
+        return slot;
+    }
+
+    //  the scratch tensors (e.g. /share/cache) are private for each thread
+    static inline string ScratchName(const string& name) {
+        if (thread_slot() == 0) return name;
+        return name + ":" + std::to_string(thread_slot());
+    }
+
     inline Tensor* GetTensor(
         const string&           name,
         bool                    use_remote = true) {
@@ -123,6 +141,13 @@ class Workspace {
         tensor->Reset();
     }
 
+    inline void ReleaseTensor(const string& name) {
+        std::lock_guard<std::mutex> lock(tensor_mutex_);
+        CHECK(tensor_map_.count(name)) << "\nTensor(" << name << ") does not "
+                      << "belong to current workspace, could not be released.";
+        tensor_map_.erase(name);
+    }
+
     vector<string> GetTensors() {
         vector<string> names;
         //  search local workspace
@@ -181,7 +206,7 @@ class Workspace {
         const vector<size_t>&   segments) {
         TIndex nbytes = 0;
         for (auto& segment : segments) nbytes += (TIndex)segment;
-        Tensor* cache_t = CreateTensor("/share/cache");
+        Tensor* cache_t = CreateTensor(ScratchName("/share/cache"));
         cache_t->Reshape({ nbytes });
         vector<void*> Bcaches(segments.size());
         Bcaches[0] = cache_t->template mutable_data<uint8_t, Context>();
@@ -231,6 +256,17 @@ class Workspace {
        op_map_[key]->Run();
     }
 
+    inline void ReleasePersistentOp(const string& key) {
+        op_map_.erase(key);
+    }
+
+    inline int NumPersistentOps(const string& prefix = "") {
+        int num_ops = 0;
+        for (auto& kv : op_map_)
+            if (kv.first.compare(0, prefix.size(), prefix) == 0) num_ops++;
+        return num_ops;
+    }
+
     void RunOperator(const OperatorDef& meta_op) {
         string persistent_key;
         for (auto& arg : meta_op.arg()) {
@@ -266,6 +302,13 @@ class Workspace {
         graph_map_[graph_name]->Run(include, exclude, stream_id);
     }
 
+    inline GraphBase* GetGraph(const string& graph_name) {
+        if (!graph_map_.count(graph_name))
+            LOG(FATAL) << "Graph(" << graph_name
+                       << ") does not exist.";
+        return graph_map_[graph_name].get();
+    }
+
     vector<string> GetGraphs() {
         vector<string> names;
         for (auto& it : graph_map_) names.push_back(it.first);
@@ -292,6 +335,7 @@ class Workspace {
     GraphMap graph_map_;
     FillerMap filler_map_;
     ProxyMap proxy_map_;
+    std::mutex tensor_mutex_;
 };
 
 }    // namespace dragon
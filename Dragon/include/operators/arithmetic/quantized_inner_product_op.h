@@ -0,0 +1,53 @@
+// ------------------------------------------------------------
+// Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+//
+// Licensed under the BSD 2-Clause License.
+// You should have received a copy of the BSD 2-Clause License
+// along with the software. If not, See,
+//
+//      <https://opensource.org/licenses/BSD-2-Clause>
+//
+// -------------------------------------------------------------
+
+#ifndef DRAGON_OPERATORS_ARITHMETIC_QUANTIZED_INNER_PRODUCT_OP_H_
+#define DRAGON_OPERATORS_ARITHMETIC_QUANTIZED_INNER_PRODUCT_OP_H_
+
+#include "core/operator.h"
+
+namespace dragon {
+
+/*!
+ *  The int8 inner product with the int32 accumulation on CPU.
+ *
+ *  The quantization is identical to ``QuantizedConv2dOp``.
+ */
+template <class Context>
+class QuantizedInnerProductOp final : public Operator<Context> {
+ public:
+    QuantizedInnerProductOp(const OperatorDef& def, Workspace *ws)
+        : Operator<Context>(def, ws),
+          axis(OperatorBase::Arg<int>("axis", 1)),
+          num_output(OperatorBase::Arg<int>("num_output", 0)),
+          TransW(OperatorBase::Arg<bool>("TransW", true)),
+          x_scale(OperatorBase::Arg<float>("x_scale", 1.f)),
+          x_zero_point(OperatorBase::Arg<int>("x_zero_point", 0)) {}
+    USE_OPERATOR_FUNCTIONS;
+
+    void RunOnDevice() override;
+    template <typename T> void RunWithType();
+    template <typename T> void QuantizeWeights();
+
+    //  the memory and its version of the float and quantized weights
+    vector<std::pair<MixedMemory*, size_t> > Versions();
+
+ protected:
+    TIndex axis, num_output, TransW, M, K;
+    float x_scale;
+    int x_zero_point;
+    vector<std::pair<MixedMemory*, size_t> > versions;
+    Tensor* packed, *scales, *sums;
+};
+
+}    // namespace dragon
+
+#endif    // DRAGON_OPERATORS_ARITHMETIC_QUANTIZED_INNER_PRODUCT_OP_H_
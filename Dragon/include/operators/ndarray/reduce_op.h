@@ -16,22 +16,50 @@
 
 namespace dragon {
 
+/*!
+ *  Return the sorted axes to reduce, where the ``axes`` are preferred,
+ *  and the ``axis`` of -1 means all axes.
+ */
+inline vector<int> ReduceAxes(
+    const Tensor&           X,
+    const TIndex            axis,
+    const vector<int>&      axes) {
+    vector<int> reduce_axes;
+    if (axes.empty()) {
+        if (axis != -1) reduce_axes.push_back((int)axis);
+        else for (int i = 0; i < X.ndim(); i++) reduce_axes.push_back(i);
+    } else {
+        for (auto e : axes) {
+            const int i = e < 0 ? e + (int)X.ndim() : e;
+            CHECK(i >= 0 && i < X.ndim())
+                << "\nAxis(" << e << ") is out of the range of "
+                << "Tensor(" << X.name() << ") with dims " << X.DimString();
+            reduce_axes.push_back(i);
+        }
+    }
+    std::sort(reduce_axes.begin(), reduce_axes.end());
+    reduce_axes.erase(std::unique(reduce_axes.begin(),
+        reduce_axes.end()), reduce_axes.end());
+    return reduce_axes;
+}
+
 template <class Context>
 class ReduceOp final : public Operator<Context> {
  public:
     ReduceOp(const OperatorDef& def, Workspace* ws)
         : Operator<Context>(def, ws),
           axis(OperatorBase::Arg<int>("axis", -1)),
+          axes(OperatorBase::Args<int>("axes")),
           operation(OperatorBase::Arg<string>("operation", "NONE")),
           keep_dims(OperatorBase::Arg<bool>("keep_dims", false)) {}
     USE_OPERATOR_FUNCTIONS;
 
     void RunOnDevice() override;
-    template <typename T> void SumRunWithType();
-    template <typename T> void MeanRunWithType();
+    template <typename T> void RunWithType();
 
  protected:
-    TIndex axis, keep_dims, axis_dim, count, inner_dim;
+    TIndex axis, keep_dims;
+    vector<int> axes, dims, reduce_axes;
     string operation;
 };
 
@@ -41,15 +69,16 @@ class ReduceGradientOp final : public Operator<Context> {
     ReduceGradientOp(const OperatorDef& def, Workspace* ws)
         : Operator<Context>(def, ws),
           axis(OperatorBase::Arg<int>("axis", -1)),
+          axes(OperatorBase::Args<int>("axes")),
           operation(OperatorBase::Arg<string>("operation", "NONE")) {}
     USE_OPERATOR_FUNCTIONS;
 
     void RunOnDevice() override;
-    template <typename T> void SumRunWithType();
-    template <typename T> void MeanRunWithType();
+    template <typename T> void RunWithType();
 
  protected:
-    TIndex axis, axis_dim, count, inner_dim;
+    TIndex axis;
+    vector<int> axes, dims, reduce_axes;
     string operation;
 };
 
@@ -24,8 +24,11 @@ class AdamUpdateOp final : public UpdateOpBase<Context> {
     USE_OPERATOR_FUNCTIONS;
     USE_UPDATER_FUNCTIONS(Context);
 
+    void FetchParams() override;
     void ComputeRunWithFloat32() override;
     void ComputeRunWithFloat16() override;
+    //  only defined (and virtual) on CPU
+    void ComputeRunWithMultiTensors();
 
  protected:
     int t; float lr, beta1, beta2, eps;
@@ -18,12 +18,30 @@ namespace dragon {
 
 #ifdef WITH_MPI
 
+/*!
+ *  The statistics of the reduced buckets.
+ *
+ *  Each bucket records its size, the time from launching
+ *  to finishing (``elapsed``) and the time blocked by waiting
+ *  the communication (``blocked``).
+ */
+
+struct CollectiveBucketStat {
+    string name;
+    int num_tensors;
+    TIndex nbytes;
+    double elapsed, blocked;
+};
+
+vector<CollectiveBucketStat>* collective_bucket_stats();
+
 template <class Context>
 class CollectiveUpdateOp final : public Operator<Context> {
  public:
     CollectiveUpdateOp(const OperatorDef& def, Workspace* ws)
         : Operator<Context>(def, ws),
-          mode(OperatorBase::Arg<string>("mode", "UNKNOWN")) {
+          mode(OperatorBase::Arg<string>("mode", "UNKNOWN")),
+          bucket_size(OperatorBase::Arg<int>("bucket_size", 0)) {
          InitMPI();
          if (mode.find("NCCL") != string::npos) InitNCCL();
     }
@@ -48,6 +66,11 @@ class CollectiveUpdateOp final : public Operator<Context> {
         Tensor*                 tensor,
         MPI_Datatype            dtype);
 
+    vector<vector<Tensor*> > MakeBuckets();
+    void MPIAllReduceBuckets();
+    void MPIAllReduceAsync();
+    void MPIWait();
+
     template <typename T> void MPIBcast(
         Tensor*                 tensor,
         MPI_Datatype            dtype);
@@ -65,9 +88,18 @@ class CollectiveUpdateOp final : public Operator<Context> {
 #endif
 
  protected:
+#ifdef WITH_MPI_CUDA
+    typedef Context MPIContext;
+#else
+    typedef CPUContext MPIContext;
+#endif
+
     int comm_size, comm_rank, comm_root;
     int world_size, world_rank;
     string mode;
+    TIndex bucket_size;
+    Tensor flat_bucket;
+    shared_ptr<Tensor> async_bucket;
 
     MPI_Comm comm;
     MPI_Group group;
@@ -25,8 +25,11 @@ class SGDUpdateOp final : public UpdateOpBase<Context> {
     USE_OPERATOR_FUNCTIONS;
     USE_UPDATER_FUNCTIONS(Context);
 
+    void FetchParams() override;
     void ComputeRunWithFloat32() override;
     void ComputeRunWithFloat16() override;
+    //  only defined (and virtual) on CPU
+    void ComputeRunWithMultiTensors();
 
  protected:
     float old_lr, lr, momentum, correction;
@@ -16,8 +16,24 @@
 
 namespace dragon {
 
+/*!
+ *  The fused update of float32 params is only declared on CPU,
+ *  the other contexts update the params one by one.
+ */
+
+template <class Context>
+class MultiTensorUpdater {};
+
+template <>
+class MultiTensorUpdater<CPUContext> {
+ public:
+    virtual ~MultiTensorUpdater() {}
+    virtual void ComputeRunWithMultiTensors() = 0;
+};
+
 template <class Context>
-class UpdateOpBase : public Operator<Context> {
+class UpdateOpBase : public Operator<Context>,
+                     public MultiTensorUpdater<Context> {
  public:
     UpdateOpBase(const OperatorDef& def, Workspace* ws)
         : Operator<Context>(def, ws),
@@ -26,6 +42,8 @@ class UpdateOpBase : public Operator<Context> {
           slot(OperatorBase::Arg<string>("slot", "")),
           zero_grad(OperatorBase::Arg<bool>("zero_grad", true)) {
         CHECK(!slot.empty()) << "\nRequired a non-empty slot";
+        CHECK_EQ(InputSize(), OutputSize())
+            << "\nExcepted the same number of grads and params.";
     }
     USE_OPERATOR_FUNCTIONS;
 
@@ -35,6 +53,10 @@ class UpdateOpBase : public Operator<Context> {
     void RunOnDevice() override;
     template <typename T> void PreprocessRunWithType();
 
+    bool PreprocessMultiTensors();
+    bool RunWithMultiTensors();
+
+    virtual void FetchParams() {}
     virtual void ComputeRunWithFloat32() = 0;
     virtual void ComputeRunWithFloat16() = 0;
 
@@ -46,11 +68,24 @@ class UpdateOpBase : public Operator<Context> {
     float l2_decay, clip_thresh, scale_factor;
     string slot;
     bool zero_grad;
+    int idx;
+    vector<int> indices, counts;
+    vector<float> factors;
+    vector<float*> Xs, dXs;
 };
 
+template <> bool UpdateOpBase<CPUContext>::PreprocessMultiTensors();
+template <> bool UpdateOpBase<CPUContext>::RunWithMultiTensors();
+
 #define USE_UPDATER_FUNCTIONS(context) \
     using UpdateOpBase<context>::Param; \
-    using UpdateOpBase<context>::Slot
+    using UpdateOpBase<context>::Slot; \
+    using UpdateOpBase<context>::idx; \
+    using UpdateOpBase<context>::indices; \
+    using UpdateOpBase<context>::counts; \
+    using UpdateOpBase<context>::factors; \
+    using UpdateOpBase<context>::Xs; \
+    using UpdateOpBase<context>::dXs
 
 }    // namespace dragon 
 
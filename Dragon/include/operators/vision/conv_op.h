@@ -20,7 +20,8 @@ template <class Context>
 class Conv2dOp : public ConvOpBase<Context> {
  public:
     Conv2dOp(const OperatorDef& def, Workspace* ws)
-        : ConvOpBase<Context>(def, ws) {
+        : ConvOpBase<Context>(def, ws),
+          activation(OperatorBase::Arg<string>("activation", "")) {
         this->num_spatial_axes = 2;
         Setup();
     }
@@ -32,6 +33,10 @@ class Conv2dOp : public ConvOpBase<Context> {
 
     void RunOnDevice() override;
     template <typename T> void RunWithType();
+
+ protected:
+    //  the fused activation, i.e., ``RELU`` for the folded graphs
+    string activation;
 };
 
 template <class Context>
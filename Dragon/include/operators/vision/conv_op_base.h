@@ -18,6 +18,12 @@
 
 namespace dragon {
 
+//  the max bytes of the buffers to lower a batch of images, 0 to disable
+inline size_t& CONV_LOWERING_BYTES() {
+    static size_t nbytes = 64 * 1024 * 1024;
+    return nbytes;
+}
+
 template <class Context>
 class ConvOpBase : public Operator<Context> {
  public:
@@ -26,7 +32,8 @@ class ConvOpBase : public Operator<Context> {
           data_format(OperatorBase::Arg<string>("data_format", "NCHW")),
           padding(OperatorBase::Arg<string>("padding", "VALID")),
           num_output(OperatorBase::Arg<int>("num_output", 1)),
-          group(OperatorBase::Arg<int>("group", 1)) {
+          group(OperatorBase::Arg<int>("group", 1)),
+          engine(def.device_option().engine()) {
         output_dims_value = OperatorBase::Args<int>("output_shape");
         output_dims_desc = OperatorBase::Args<string>("output_shape_desc");
         if (data_format == "NCHW") spatial_axis = 2;
@@ -38,7 +45,7 @@ class ConvOpBase : public Operator<Context> {
 
  public:
     vector<TIndex> kernel_size, stride, pad, dilation;
-    string data_format, padding;
+    string data_format, padding, engine;
     vector<TIndex> input_shape, output_shape, bottom_shape, top_shape;
     vector<TIndex> weight_shape, bias_shape;
     TIndex num_output, group;
@@ -68,6 +75,29 @@ class ConvOpBase : public Operator<Context> {
 
     template <typename T> void Db(const T* dy, T* db);
 
+    /*! \brief The number of images lowered into a GEMM, 1 to run per image */
+    TIndex LoweringBatch();
+
+    template <typename T> void BatchedWx(TIndex n,
+        const T* x, const T* weights, T* y);
+
+    template <typename T> void BatchedDxDw(TIndex n,
+        const T* dy, const T* x, const T* weights, T* dx, T* dw);
+
+    /*!
+     *  \brief The output tile of Winograd, 0 to run without Winograd
+     *
+     *  The engine ``WINOGRAD`` selects it for all the eligible convs,
+     *  ``IM2COL`` disables it, otherwise it is selected automatically.
+     */
+    int WinogradTile(bool data_grad = false);
+
+    template <typename T> void WinogradWx(int tile,
+        const T* x, const T* weights, T* y);
+
+    template <typename T> void WinogradDx(int tile,
+        const T* dy, const T* weights, T* dx);
+
  private:
     template <typename T> void Im2Col(const T* im, T* col) {
         if (Input(0).ndim() == 4) {
@@ -116,6 +146,12 @@ DEFINE_ARGUMENTS_WITH_DESC(int, ConvOpBase, output_dims);
     using ConvOpBase<context>::Dx; \
     using ConvOpBase<context>::Dw; \
     using ConvOpBase<context>::Db; \
+    using ConvOpBase<context>::LoweringBatch; \
+    using ConvOpBase<context>::BatchedWx; \
+    using ConvOpBase<context>::BatchedDxDw; \
+    using ConvOpBase<context>::WinogradTile; \
+    using ConvOpBase<context>::WinogradWx; \
+    using ConvOpBase<context>::WinogradDx; \
     using ConvOpBase<context>::kernel_size; \
     using ConvOpBase<context>::stride; \
     using ConvOpBase<context>::pad; \
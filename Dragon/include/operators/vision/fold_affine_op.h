@@ -0,0 +1,65 @@
+// ------------------------------------------------------------
+// Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+//
+// Licensed under the BSD 2-Clause License.
+// You should have received a copy of the BSD 2-Clause License
+// along with the software. If not, See,
+//
+//      <https://opensource.org/licenses/BSD-2-Clause>
+//
+// -------------------------------------------------------------
+
+#ifndef DRAGON_OPERATORS_VISION_FOLD_AFFINE_OP_H_
+#define DRAGON_OPERATORS_VISION_FOLD_AFFINE_OP_H_
+
+#include "core/operator.h"
+
+namespace dragon {
+
+/*!
+ *  Fold the per-channel affine ops into the weights and bias of conv.
+ *
+ *  The inputs are [weights, bias (optional), params of ops...],
+ *  and the outputs are [folded weights, folded bias].
+ *
+ *  The ops could be ``BatchNorm``, ``FusedBatchNorm`` with the frozen stats,
+ *  ``Affine`` or ``BiasAdd``, which are inserted by the graph optimizer.
+ *
+ *  The folding is skipped if the inputs and outputs are not mutated since
+ *  the last run, which is detected by the versions of their memory.
+ */
+template <class Context>
+class FoldAffineOp final : public Operator<Context> {
+ public:
+    FoldAffineOp(const OperatorDef& def, Workspace* ws)
+        : Operator<Context>(def, ws),
+          data_format(OperatorBase::Arg<string>("data_format", "NCHW")),
+          has_bias(OperatorBase::Arg<bool>("has_bias", false)),
+          types(OperatorBase::Args<string>("types")),
+          modes(OperatorBase::Args<string>("modes")),
+          num_params(OperatorBase::Args<int>("num_params")),
+          eps(OperatorBase::Args<float>("eps")) {
+        CHECK_EQ(types.size(), num_params.size());
+        CHECK_EQ(types.size(), modes.size());
+        CHECK_EQ(types.size(), eps.size());
+    }
+    USE_OPERATOR_FUNCTIONS;
+
+    void RunOnDevice() override;
+    template <typename T> void RunWithType();
+
+    //  the memory and its version of each input and output
+    vector<std::pair<MixedMemory*, size_t> > Versions();
+
+ protected:
+    string data_format;
+    bool has_bias;
+    vector<string> types, modes;
+    vector<int> num_params;
+    vector<float> eps;
+    vector<std::pair<MixedMemory*, size_t> > versions;
+};
+
+}    // namespace dragon
+
+#endif    // DRAGON_OPERATORS_VISION_FOLD_AFFINE_OP_H_
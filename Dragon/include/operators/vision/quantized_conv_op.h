@@ -0,0 +1,54 @@
+// ------------------------------------------------------------
+// Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+//
+// Licensed under the BSD 2-Clause License.
+// You should have received a copy of the BSD 2-Clause License
+// along with the software. If not, See,
+//
+//      <https://opensource.org/licenses/BSD-2-Clause>
+//
+// -------------------------------------------------------------
+
+#ifndef DRAGON_OPERATORS_VISION_QUANTIZED_CONV_OP_H_
+#define DRAGON_OPERATORS_VISION_QUANTIZED_CONV_OP_H_
+
+#include "operators/vision/conv_op.h"
+
+namespace dragon {
+
+/*!
+ *  The int8 conv with the int32 accumulation on CPU.
+ *
+ *  The inputs are quantized by the calibrated ``x_scale`` and ``x_zero_point``,
+ *  while the weights are quantized for each output channel symmetrically,
+ *  and cached until the float weights are mutated.
+ */
+template <class Context>
+class QuantizedConv2dOp final : public Conv2dOp<Context> {
+ public:
+    QuantizedConv2dOp(const OperatorDef& def, Workspace* ws)
+        : Conv2dOp<Context>(def, ws),
+          x_scale(OperatorBase::Arg<float>("x_scale", 1.f)),
+          x_zero_point(OperatorBase::Arg<int>("x_zero_point", 0)) {
+        CHECK_EQ(group, 1) << "\nThe groups are not supported.";
+    }
+    USE_OPERATOR_FUNCTIONS;
+    USE_CONVOLUTION_FUNCTIONS(Context);
+
+    void RunOnDevice() override;
+    template <typename T> void RunWithType();
+    template <typename T> void QuantizeWeights();
+
+    //  the memory and its version of the float and quantized weights
+    vector<std::pair<MixedMemory*, size_t> > Versions();
+
+ protected:
+    float x_scale;
+    int x_zero_point;
+    vector<std::pair<MixedMemory*, size_t> > versions;
+    Tensor* packed, *scales, *sums;
+};
+
+}    // namespace dragon
+
+#endif    // DRAGON_OPERATORS_VISION_QUANTIZED_CONV_OP_H_
@@ -259,6 +259,39 @@ void Gemv(
     Context*                ctx,
     TensorProto_DataType    math_type = TensorProto_DataType_FLOAT);
 
+/******************** Level-3 (Int8) ********************/
+
+/*! \brief The bytes of B packed for the int8 GEMM */
+inline size_t Int8GemmPackedSize(const int N, const int K) {
+    return (size_t)((N + 15) / 16 * 16) * ((K + 3) / 4 * 4);
+}
+
+/*! \brief Pack the signed B[N, K] in blocks of 16 columns and 4 depths */
+template <class Context>
+void Int8GemmPack(
+    const int               N,
+    const int               K,
+    const int8_t*           B,
+    int8_t*                 packed,
+    Context*                ctx);
+
+/*!
+ *  \brief C[M, N] = A[M, K] * B[N, K]^T, accumulated in int32
+ *
+ *  A is unsigned with the leading dimension ``lda``, which could
+ *  be read till K rounded up to 4. B is signed and packed.
+ */
+template <class Context>
+void Int8Gemm(
+    const int               M,
+    const int               N,
+    const int               K,
+    const uint8_t*          A,
+    const int               lda,
+    const int8_t*           packed_B,
+    int*                    C,
+    Context*                ctx);
+
 }    // namespace math
 
 }    // namespace dragon
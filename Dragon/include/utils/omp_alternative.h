@@ -12,6 +12,13 @@
 #ifndef DRAGON_UTILS_OMP_ALTERNATIVE_H_
 #define DRAGON_UTILS_OMP_ALTERNATIVE_H_
 
+namespace dragon {
+
+//  the max number of threads for an op, 0 to use all processors
+inline int& INTRA_OP_THREADS() { static int threads = 0; return threads; }
+
+}
+
 #ifdef WITH_OMP
 
 #include <algorithm>
@@ -23,7 +30,9 @@ namespace dragon {
 
 inline int GET_OMP_THREADS(const int N) { 
    int threads = std::max(N / OMP_MIN_ITERATORS_PER_CORE, 1); 
-   return std::min(threads, omp_get_num_procs());
+   int max_threads = INTRA_OP_THREADS() > 0 ?
+       INTRA_OP_THREADS() : omp_get_num_procs();
+   return std::min(threads, max_threads);
 }
 
 }
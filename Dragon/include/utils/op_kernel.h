@@ -238,6 +238,28 @@ void Clip(
     T*                      y,
     Context*                ctx);
 
+/******************** arithmetic.quantize ********************/
+
+template <typename T, class Context>
+void Quantize(
+    const int               count,
+    const float             scale,
+    const int               zero_point,
+    const T*                x,
+    uint8_t*                y,
+    Context*                ctx);
+
+template <typename T, class Context>
+void QuantizeWeights(
+    const int               N,
+    const int               K,
+    const bool              transposed,
+    const T*                w,
+    float*                  scales,
+    int*                    sums,
+    int8_t*                 packed,
+    Context*                ctx);
+
 /******************** control_flow.compare ********************/
 
 template <typename T, class Context>
@@ -645,6 +667,28 @@ void SumGrad(
     T*                      dx,
     Context*                ctx);
 
+template <typename T, class Context>
+void Reduce(
+    const int               ndim,
+    const int*              dims,
+    const int               num_axes,
+    const int*              axes,
+    const string&           operation,
+    const T*                x,
+    T*                      y,
+    Context*                ctx);
+
+template <typename T, class Context>
+void ReduceGrad(
+    const int               ndim,
+    const int*              dims,
+    const int               num_axes,
+    const int*              axes,
+    const T                 coeff,
+    const T*                dy,
+    T*                      dx,
+    Context*                ctx);
+
 /******************** ndarray.repeat ********************/
 
 template <typename T, class Context>
@@ -782,6 +826,23 @@ void AdamUpdate(
     T*                      v,
     Context*                ctx);
 
+template <typename T, class Context>
+void MultiTensorAdamUpdate(
+    const int               num_tensors,
+    const int*              counts,
+    const float*            factors,
+    const float             l2_decay,
+    const float             lr,
+    const float             beta1,
+    const float             beta2,
+    const float             eps,
+    const bool              zero_grad,
+    T**                     g,
+    T**                     m,
+    T**                     v,
+    T**                     x,
+    Context*                ctx);
+
 /******************** update.nesterov_update ********************/
 
 template <typename T, class Context>
@@ -793,6 +854,20 @@ void NesterovUpdate(
     T*                      h,
     Context*                ctx);
 
+template <typename T, class Context>
+void MultiTensorNesterovUpdate(
+    const int               num_tensors,
+    const int*              counts,
+    const float*            factors,
+    const float             l2_decay,
+    const float             lr,
+    const float             momentum,
+    const bool              zero_grad,
+    T**                     g,
+    T**                     h,
+    T**                     x,
+    Context*                ctx);
+
 /******************** update.rmsprop_update ********************/
 
 template <typename T, class Context>
@@ -805,6 +880,21 @@ void RMSPropUpdate(
     T*                      h,
     Context*                ctx);
 
+template <typename T, class Context>
+void MultiTensorRMSPropUpdate(
+    const int               num_tensors,
+    const int*              counts,
+    const float*            factors,
+    const float             l2_decay,
+    const float             lr,
+    const float             decay,
+    const float             eps,
+    const bool              zero_grad,
+    T**                     g,
+    T**                     h,
+    T**                     x,
+    Context*                ctx);
+
 /******************** update.sgd_update ********************/
 
 template <typename T, class Context>
@@ -816,6 +906,20 @@ void SGDUpdate(
     T*                      h,
     Context*                ctx);
 
+template <typename T, class Context>
+void MultiTensorSGDUpdate(
+    const int               num_tensors,
+    const int*              counts,
+    const float*            factors,
+    const float             l2_decay,
+    const float             lr,
+    const float             momentum,
+    const bool              zero_grad,
+    T**                     g,
+    T**                     h,
+    T**                     x,
+    Context*                ctx);
+
 /******************** vision.bias_add ********************/
 
 template <typename T, class Context>
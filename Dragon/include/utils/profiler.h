@@ -0,0 +1,84 @@
+// ------------------------------------------------------------
+// Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+//
+// Licensed under the BSD 2-Clause License.
+// You should have received a copy of the BSD 2-Clause License
+// along with the software. If not, See,
+//
+//      <https://opensource.org/licenses/BSD-2-Clause>
+//
+// ------------------------------------------------------------
+
+#ifndef DRAGON_UTILS_PROFILER_H_
+#define DRAGON_UTILS_PROFILER_H_
+
+#include <atomic>
+#include <string>
+#include <vector>
+
+namespace dragon {
+
+/*!
+ *  The opt-in profiler of operators.
+ *
+ *  Each running op records an event into the global buffer,
+ *  and the events are grouped by the session, i.e.,
+ *  the name of running graph, or "eager" for the dispatched ops.
+ *
+ *  The costs are only a relaxed atomic load if disabled.
+ */
+class Profiler {
+ public:
+    struct Event {
+        std::string type, name, anchor, session, shapes;
+        int64_t start, duration, nbytes;
+        int thread;
+    };
+
+    static void Start();
+    static void Stop();
+    static void Reset();
+
+    static inline bool IsEnabled() {
+        return enabled().load(std::memory_order_relaxed);
+    }
+
+    /*! \brief Return the steady time in microseconds */
+    static int64_t Now();
+
+    static void Record(Event& event);
+
+    static std::vector<Event> Events();
+
+    /*! \brief The bytes allocated by this thread */
+    static inline int64_t& allocated() {
+        static thread_local int64_t nbytes = 0;
+        return nbytes;
+    }
+
+    /*! \brief The session of ops running on this thread */
+    static inline std::string& session() {
+        static thread_local std::string name;
+        return name;
+    }
+
+ private:
+    static std::atomic<bool>& enabled();
+};
+
+/*! \brief Set the session of this thread in a scope */
+class ProfilerSession {
+ public:
+    ProfilerSession(const std::string& name)
+        : previous_(Profiler::session()) {
+        Profiler::session() = name;
+    }
+    ~ProfilerSession() { Profiler::session() = previous_; }
+
+ private:
+    std::string previous_;
+};
+
+}    // namespace dragon
+
+#endif    // DRAGON_UTILS_PROFILER_H_
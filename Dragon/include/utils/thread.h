@@ -16,6 +16,9 @@
 #include <mutex>
 #include <condition_variable>
 #include <thread>
+#include <functional>
+#include <queue>
+#include <vector>
 
 namespace dragon {
 
@@ -69,6 +72,59 @@ class BaseThread {
     InterruptionPoint interruption_point;
 };
 
+class ThreadPool {
+ public:
+    typedef std::function<void()> Task;
+
+    //  the ``init`` is called with the index of workers, i.e. [1, num_threads]
+    ThreadPool(int num_threads, std::function<void(int)> init = nullptr)
+        : stop(false) {
+        for (int i = 0; i < num_threads; i++) {
+            workers.emplace_back([this, init, i]() {
+                if (init) init(i + 1);
+                while (true) {
+                    Task task;
+                    {
+                        std::unique_lock<std::mutex> lock(mutex);
+                        cond.wait(lock, [this]() {
+                            return stop || !tasks.empty(); });
+                        if (stop && tasks.empty()) return;
+                        task = std::move(tasks.front());
+                        tasks.pop();
+                    }
+                    task();
+                }
+            });
+        }
+    }
+
+    ~ThreadPool() {
+        {
+            std::unique_lock<std::mutex> lock(mutex);
+            stop = true;
+        }
+        cond.notify_all();
+        for (auto& worker : workers) worker.join();
+    }
+
+    void Schedule(Task task) {
+        {
+            std::unique_lock<std::mutex> lock(mutex);
+            tasks.push(std::move(task));
+        }
+        cond.notify_one();
+    }
+
+    inline int size() const { return (int)workers.size(); }
+
+ private:
+    bool stop;
+    std::mutex mutex;
+    std::condition_variable cond;
+    std::queue<Task> tasks;
+    std::vector<std::thread> workers;
+};
+
 }    // namespace dragon
 
 #endif    // DRAGON_UTILS_THREAD_H_
\ No newline at end of file
@@ -6,6 +6,7 @@
 #include "py_mpi.h"
 #include "py_io.h"
 #include "py_config.h"
+#include "py_profiler.h"
 
 DEFINE_TYPED_REGISTRY(TensorFetcherRegistry, TypeId, TensorFetcherBase);
 DEFINE_TYPED_REGISTRY(TensorFeederRegistry, TypeId, TensorFeederBase);
@@ -219,9 +220,12 @@ PyMethodDef* GetAllMethods() {
         PYFUNC(CreateGraphCC),
         PYFUNC(RunGraphCC),
         PYFUNC(GraphsCC),
+        PYFUNC(GetMemoryPlanCC),
         /****  AutoGrad  ****/
         PYFUNC(CreateGradientDefsCC),
         PYFUNC(RunGradientFlowCC),
+        PYFUNC(GetGradientFlowCacheStatsCC),
+        PYFUNC(ResetGradientFlowCacheCC),
         /****  Operator  ****/
         PYFUNC(RegisteredOperatorsCC),
         PYFUNC(NoGradientOperatorsCC),
@@ -229,6 +233,9 @@ PyMethodDef* GetAllMethods() {
         PYFUNC(RunOperatorsCC),
         PYFUNC(CreatePersistentOpCC),
         PYFUNC(RunPersistentOpCC),
+        PYFUNC(RegisterOperatorCC),
+        PYFUNC(ReleaseOperatorCC),
+        PYFUNC(RunRegisteredOperatorCC),
         /****  Tensor  ****/
         PYFUNC(HasTensorCC),
         PYFUNC(CreateTensorCC),
@@ -247,12 +254,14 @@ PyMethodDef* GetAllMethods() {
         PYFUNC(TensorToPyArrayCC),
         PYFUNC(TensorToPyArrayExCC),
         PYFUNC(ResetTensorCC),
+        PYFUNC(ReleaseTensorCC),
         PYFUNC(TensorsCC),
         /****  MPI  ****/
         PYFUNC(MPIInitCC),
         PYFUNC(MPIRankCC),
         PYFUNC(MPISizeCC),
         PYFUNC(MPICreateGroupCC),
+        PYFUNC(MPIGetBucketStatsCC),
         PYFUNC(MPIFinalizeCC),
         /****  CUDA  ****/
         PYFUNC(IsCUDADriverSufficientCC),
@@ -261,7 +270,19 @@ PyMethodDef* GetAllMethods() {
         PYFUNC(SnapshotCC),
         /****  Config ****/
         PYFUNC(SetLogLevelCC),
+        PYFUNC(SetIntraOpThreadsCC),
+        PYFUNC(SetConvLoweringLimitCC),
+        PYFUNC(SetCPUCacheLimitCC),
+        PYFUNC(EmptyCPUCacheCC),
+        PYFUNC(GetCPUAllocatorStatsCC),
+        PYFUNC(ResetCPUAllocatorStatsCC),
         PYFUNC(OnModuleExitCC),
+        /****  Profiler  ****/
+        PYFUNC(StartProfilerCC),
+        PYFUNC(StopProfilerCC),
+        PYFUNC(ResetProfilerCC),
+        PYFUNC(IsProfilerEnabledCC),
+        PYFUNC(GetProfilerEventsCC),
         PYENDFUNC,
     };
     return g_python_methods;
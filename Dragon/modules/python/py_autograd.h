@@ -14,6 +14,7 @@
 
 #include "dragon.h"
 #include "core/graph_gradient.h"
+#include "py_operator.h"
 
 PyObject* CreateGradientDefsCC(PyObject* self, PyObject* args) {
     PyObject* def_string = nullptr;
@@ -61,37 +62,414 @@ PyObject* CreateGradientDefsCC(PyObject* self, PyObject* args) {
     return pack;
 }
 
+/*!
+ *  The gradient flows are cached by the structure of forward ops.
+ *
+ *  The runtime tensors from ``TPool`` and the anchors from ``APool``
+ *  are renamed by the order of appearance, so that the iterations
+ *  with the same topology share the derived backward ops.
+ */
+
+#define CANONICAL_PREFIX "[Canonical]"
+#define GRADIENT_FLOW_CACHE_CAPACITY 64
+
+class GradientFlowNames {
+ public:
+    string Canonicalize(const string& name, bool is_anchor = false) {
+        //  Runtime tensors are formatted as "[TPool]scope/tensor:handle",
+        //  the suffixes (e.g. "_grad") are kept after the handle
+        string base = name, suffix;
+        if (!is_anchor) {
+            if (name.compare(0, 7, "[TPool]") != 0) return name;
+            size_t pos = name.find("/tensor:");
+            if (pos == string::npos) return name;
+            for (pos += 8; pos < name.size() && isdigit(name[pos]); pos++);
+            base = name.substr(0, pos); suffix = name.substr(pos);
+        }
+        if (!indices_.count(base)) {
+            indices_[base] = (int)names_.size();
+            names_.push_back(base);
+        }
+        return CANONICAL_PREFIX + std::to_string(indices_[base]) + "/" + suffix;
+    }
+
+    void Canonicalize(OperatorDef* op) {
+        op->set_name(Canonicalize(op->name(), true));
+        for (int i = 0; i < op->input_size(); i++)
+            *op->mutable_input(i) = Canonicalize(op->input(i));
+        for (int i = 0; i < op->output_size(); i++)
+            *op->mutable_output(i) = Canonicalize(op->output(i));
+        //  the arguments referring tensors, e.g. ``shape_like``
+        for (int i = 0; i < op->arg_size(); i++) {
+            Argument* arg = op->mutable_arg(i);
+            if (arg->name() == "anchor") {
+                *arg->mutable_s() = Canonicalize(arg->s(), true);
+                continue;
+            }
+            if (arg->has_s()) *arg->mutable_s() = Canonicalize(arg->s());
+            for (int j = 0; j < arg->strings_size(); j++)
+                *arg->mutable_strings(j) = Canonicalize(arg->strings(j));
+        }
+    }
+
+    string Restore(const string& name) {
+        static const size_t prefix_len = strlen(CANONICAL_PREFIX);
+        if (name.compare(0, prefix_len, CANONICAL_PREFIX) != 0) return name;
+        size_t pos = name.find('/', prefix_len);
+        int idx = std::stoi(name.substr(prefix_len, pos - prefix_len));
+        return names_[idx] + name.substr(pos + 1);
+    }
+
+    void Restore(OperatorDef* op) {
+        for (int i = 0; i < op->input_size(); i++)
+            *op->mutable_input(i) = Restore(op->input(i));
+        for (int i = 0; i < op->output_size(); i++)
+            *op->mutable_output(i) = Restore(op->output(i));
+        for (int i = 0; i < op->arg_size(); i++) {
+            Argument* arg = op->mutable_arg(i);
+            if (arg->has_s()) *arg->mutable_s() = Restore(arg->s());
+            for (int j = 0; j < arg->strings_size(); j++)
+                *arg->mutable_strings(j) = Restore(arg->strings(j));
+        }
+    }
+
+ private:
+    Map<string, int> indices_;
+    vector<string> names_;
+};
+
+class GradientFlowCache {
+ public:
+    GradientFlowCache() : hits_(0), misses_(0), uid_(0) {}
+
+    const GraphDef& Get(
+        const GraphDef&             fp_ops,
+        const vector<string>&       targets,
+        const vector<string>&       input_grads,
+        const vector<string>&       ignore_grads,
+        bool                        share_grads,
+        GradientFlowNames&          names) {
+        //  fingerprint the types, arguments and topology
+        GraphDef canonical_ops(fp_ops);
+        for (int i = 0; i < canonical_ops.op_size(); i++)
+            names.Canonicalize(canonical_ops.mutable_op(i));
+        vector<string> c_targets, c_input_grads, c_ignore_grads;
+        for (auto& e : targets) c_targets.push_back(names.Canonicalize(e));
+        for (auto& e : input_grads) c_input_grads.push_back(names.Canonicalize(e));
+        for (auto& e : ignore_grads) c_ignore_grads.push_back(names.Canonicalize(e));
+        string key = canonical_ops.SerializeAsString();
+        for (auto* v : { &c_targets, &c_input_grads, &c_ignore_grads }) {
+            key += '\n';
+            for (auto& e : *v) key += e + ';';
+        }
+        key += share_grads ? "\n1" : "\n0";
+        if (entries_.count(key)) {
+            //  move the hit flow to the back of eviction (i.e. LRU)
+            order_.erase(std::find(order_.begin(), order_.end(), key));
+            order_.push_back(key);
+            hits_++; return entries_[key].bp_ops;
+        }
+        //  derive the backward ops on the canonical names
+        misses_++;
+        Entry& entry = entries_[key];
+        GraphGradientMaker maker;
+        for (auto& grad : c_input_grads) maker.AddExternalGrad(grad);
+        for (auto& grad : c_ignore_grads) maker.AddIgnoreGrad(grad);
+        maker.Make(canonical_ops, c_targets, entry.bp_ops);
+        if (share_grads) maker.Share("/share/buffer/grads", entry.bp_ops);
+        //  keep the instances of backward ops across iterations
+        for (int i = 0; i < entry.bp_ops.op_size(); i++) {
+            OperatorDef* op = entry.bp_ops.mutable_op(i);
+            bool has_key = false;
+            for (auto& arg : op->arg())
+                if (arg.name() == "persistent_key") has_key = true;
+            if (has_key) continue;
+            Argument* arg = op->add_arg();
+            arg->set_name("persistent_key");
+            arg->set_s("/gradient_flow/" + std::to_string(uid_) +
+                "/op:" + std::to_string(i));
+            entry.persistent_keys.push_back(arg->s());
+        }
+        uid_++;
+        order_.push_back(key);
+        //  evict the least recently used flow and its backward ops
+        if (order_.size() > GRADIENT_FLOW_CACHE_CAPACITY) {
+            for (auto& e : entries_[order_.front()].persistent_keys)
+                ws()->ReleasePersistentOp(e);
+            entries_.erase(order_.front());
+            order_.pop_front();
+        }
+        return entry.bp_ops;
+    }
+
+    PyObject* Statistics() {
+        PyObject* stats = PyDict_New();
+        SetPyDictS2I(stats, "hits", hits_);
+        SetPyDictS2I(stats, "misses", misses_);
+        SetPyDictS2I(stats, "entries", (int)entries_.size());
+        SetPyDictS2I(stats, "collective_ops",
+            ws()->NumPersistentOps("/gradient_flow/collective/"));
+        return stats;
+    }
+
+    void Clear() {
+        for (auto& entry : entries_)
+            for (auto& e : entry.second.persistent_keys)
+                ws()->ReleasePersistentOp(e);
+        entries_.clear(); order_.clear();
+        hits_ = misses_ = 0;
+    }
+
+ private:
+    struct Entry {
+        GraphDef bp_ops;
+        vector<string> persistent_keys;
+    };
+    Map<string, Entry> entries_;
+    std::deque<string> order_;
+    int hits_, misses_, uid_;
+};
+
+GradientFlowCache* gradient_flow_cache() {
+    static GradientFlowCache cache;
+    return &cache;
+}
+
+/*!
+ *  The grads can be reduced by buckets during the backward pass.
+ *
+ *  Each bucket is launched by a registered collective op right after
+ *  the last op producing its grads, and all the launched buckets are
+ *  waited by another registered op at the end of the gradient flow.
+ *
+ *  Only the buckets having any grad produced by the backward pass are
+ *  launched, i.e. the pending grads of other optimizers are left intact.
+ *  The ranks agree on the launched buckets before running the flow,
+ *  and the grads not produced by this rank are reduced as zeros,
+ *  which keeps the collective ops identical across the ranks.
+ */
+
+class GradientBuckets {
+ public:
+    bool Parse(PyObject* py_collective) {
+        //  the collective is given as
+        //  (wait_handle, [(handle, grads), ...])
+        PyObject* py_buckets;
+        if (!PyArg_ParseTuple(py_collective, "iO!",
+                &wait_handle_, &PyList_Type, &py_buckets)) return false;
+        for (int i = 0; i < PyList_Size(py_buckets); i++) {
+            int handle; PyObject* py_grads;
+            if (!PyArg_ParseTuple(PyList_GetItem(py_buckets, i), "iO!",
+                    &handle, &PyList_Type, &py_grads)) return false;
+            handles_.push_back(handle);
+            grads_.push_back(vector<string>());
+            PyList_AsVecString(py_grads, grads_.back(), "");
+            for (auto& grad : grads_.back()) indices_[grad] = i;
+        }
+        return true;
+    }
+
+    void Plan(const vector<OperatorDef>& ops) {
+        //  find the last op producing the grads of each bucket
+        vector<int> last_producers(grads_.size(), -1);
+        produced_.assign(grads_.size(), Set<string>());
+        for (int i = 0; i < ops.size(); i++) {
+            for (auto& output : ops[i].output()) {
+                auto it = indices_.find(output);
+                if (it == indices_.end()) continue;
+                last_producers[it->second] = i;
+                produced_[it->second].insert(output);
+            }
+        }
+        //  a bucket is used if any rank produces its grads
+        vector<int> used(grads_.size(), 0);
+        for (int i = 0; i < grads_.size(); i++)
+            used[i] = last_producers[i] >= 0 ? 1 : 0;
+        AgreeOnUsed(used);
+        //  a bucket is launched after the previous one,
+        //  i.e. the order of launches will not depend on the used params
+        launches_.assign(ops.size(), vector<int>());
+        int last_launch = 0;
+        for (int i = 0; i < grads_.size(); i++) {
+            if (!used[i]) continue;
+            last_launch = std::max(last_launch, last_producers[i]);
+            launches_[last_launch].push_back(i);
+        }
+    }
+
+    bool Launch(int op_idx, GraphDef* exported) {
+        if (op_idx >= launches_.size()) return true;
+        for (auto bucket_idx : launches_[op_idx]) {
+            for (auto& grad : grads_[bucket_idx]) {
+                if (produced_[bucket_idx].count(grad)) continue;
+                if (!FillZeros(handles_[bucket_idx],
+                        grad, exported)) return false;
+            }
+            OperatorDef op;
+            if (!MakeCollectiveOp(handles_[bucket_idx], "bucket:" +
+                    std::to_string(bucket_idx), grads_[bucket_idx], op)) return false;
+            if (exported) exported->add_op()->CopyFrom(op);
+            ws()->RunOperator(op);
+            launched_.push_back(bucket_idx);
+        }
+        return true;
+    }
+
+    bool Wait(GraphDef* exported) {
+        if (launched_.empty()) return true;
+        OperatorDef op;
+        if (!MakeCollectiveOp(wait_handle_,
+                "wait", vector<string>(), op)) return false;
+        if (exported) exported->add_op()->CopyFrom(op);
+        ws()->RunOperator(op);
+        return true;
+    }
+
+    PyObject* Launched() {
+        PyObject* ret = PyList_New(launched_.size());
+        for (int i = 0; i < launched_.size(); i++)
+            SetPyList(ret, i, PyInt_FromLong(launched_[i]));
+        return ret;
+    }
+
+ private:
+    void AgreeOnUsed(vector<int>& used) {
+#ifdef WITH_MPI
+        //  the buckets share the communicator of the wait op
+        auto it = registered_operators().find(wait_handle_);
+        if (used.empty() || it == registered_operators().end()) return;
+        int64_t comm = 0;
+        for (auto& arg : it->second.arg())
+            if (arg.name() == "comm") comm = arg.i();
+        if ((MPI_Comm)comm == MPI_COMM_NULL) return;
+        MPI_Allreduce(MPI_IN_PLACE, used.data(), (int)used.size(),
+            MPI_INT, MPI_MAX, (MPI_Comm)comm);
+#endif
+    }
+
+    bool FillZeros(
+        int                         handle,
+        const string&               grad,
+        GraphDef*                   exported) {
+        //  the shape and type of grad are given by the param
+        const string param = grad.substr(0, grad.size() - 5);
+        auto it = registered_operators().find(handle);
+        if (it == registered_operators().end() || !ws()->HasTensor(param)) {
+            PyErr_SetString(PyExc_KeyError, ("Failed to fill the zeros "
+                "of unused grad: " + grad + ".").c_str());
+            return false;
+        }
+        Tensor* tensor = ws()->GetTensor(param);
+        OperatorDef op;
+        op.set_type("Fill"); op.set_name("bucket:zeros");
+        op.add_output(grad);
+        op.mutable_device_option()->CopyFrom(it->second.device_option());
+        Argument* arg = op.add_arg();
+        arg->set_name("dims");
+        for (auto dim : tensor->dims()) arg->add_ints((int)dim);
+        arg = op.add_arg();
+        arg->set_name("dtype");
+        arg->set_s(TypeMetaToString(tensor->meta()));
+        if (exported) exported->add_op()->CopyFrom(op);
+        ws()->RunOperator(op);
+        return true;
+    }
+
+    bool MakeCollectiveOp(
+        int                         handle,
+        const string&               suffix,
+        const vector<string>&       grads,
+        OperatorDef&                op) {
+        auto it = registered_operators().find(handle);
+        if (it == registered_operators().end()) {
+            PyErr_SetString(PyExc_KeyError,
+                "The collective operator has not been registered.");
+            return false;
+        }
+        op.CopyFrom(it->second);
+        op.clear_input(); op.clear_output(); op.clear_arg();
+        for (auto& grad : grads) { op.add_input(grad); op.add_output(grad); }
+        //  keep the flat buffers of buckets across iterations
+        for (auto& arg : it->second.arg())
+            if (arg.name() != "persistent_key") op.add_arg()->CopyFrom(arg);
+        Argument* arg = op.add_arg();
+        arg->set_name("persistent_key");
+        arg->set_s("/gradient_flow/collective/" +
+            std::to_string(handle) + "/" + suffix);
+        //  release the op and its buffers along with the handle
+        registered_persistent_ops()[handle].insert(arg->s());
+        return true;
+    }
+
+    int wait_handle_;
+    vector<int> handles_, launched_;
+    vector<vector<string> > grads_;
+    vector<Set<string> > produced_;
+    vector<vector<int> > launches_;
+    Map<string, int> indices_;
+};
+
 PyObject* RunGradientFlowCC(PyObject* self, PyObject* args) {
     PyObject* py_fp_ops, *py_targets;   
     PyObject* py_input_grads, *py_ignore_grads;
     PyObject* py_share_grads, *py_export_graph;
-    if (!PyArg_ParseTuple(args, "OOOOOO",
+    PyObject* py_collective = Py_None;
+    if (!PyArg_ParseTuple(args, "OOOOOO|O",
         &py_fp_ops, &py_targets,
             &py_input_grads, &py_ignore_grads,
-                &py_share_grads, &py_export_graph)) {
+                &py_share_grads, &py_export_graph, &py_collective)) {
         PyErr_SetString(PyExc_ValueError,
-            "Excepted a list of serialized input ops, targets, "
+            "Excepted the serialized or registered input ops, targets, "
             "input grads, ignore grads and whehter to share grads or log graph.");
         return nullptr;
     }
+    GradientBuckets buckets;
+    bool use_buckets = py_collective != Py_None;
+    if (use_buckets && !buckets.Parse(py_collective)) {
+        PyErr_SetString(PyExc_ValueError,
+            "Excepted the collective as (wait_handle, [(handle, grads), ...]).");
+        return nullptr;
+    }
     //  make & optm & run
     vector<string> targets, input_grads, ignore_grads;
     PyList_AsVecString(py_targets, targets, "");
     PyList_AsVecString(py_input_grads, input_grads, "");
     PyList_AsVecString(py_ignore_grads, ignore_grads, "");
     GraphDef fp_ops, bp_ops;
-    if (!fp_ops.ParseFromString(PyBytes_AsStringEx(py_fp_ops))) {
+    if (PyList_Check(py_fp_ops)) {
+        //  the registered ops are given as (handle, name, inputs, outputs)
+        for (int i = 0; i < PyList_Size(py_fp_ops); i++) {
+            int handle; char* name;
+            PyObject* py_inputs, *py_outputs;
+            if (!PyArg_ParseTuple(PyList_GetItem(py_fp_ops, i), "isO!O!",
+                    &handle, &name, &PyList_Type, &py_inputs,
+                        &PyList_Type, &py_outputs)) return nullptr;
+            if (!GetRegisteredOperator(handle, name, py_inputs,
+                    py_outputs, *fp_ops.add_op())) return nullptr;
+        }
+    } else if (!fp_ops.ParseFromString(PyBytes_AsStringEx(py_fp_ops))) {
         PyErr_SetString(PyExc_RuntimeError, 
             "Failed to parse the GraphDef of forward ops.");
         return nullptr;
     }
-    GraphGradientMaker maker;
-    for (auto& grad : input_grads) maker.AddExternalGrad(grad);
-    for (auto& grad : ignore_grads) maker.AddIgnoreGrad(grad);
-    maker.Make(fp_ops, targets, bp_ops);
     bool share_grads = PyObject_IsTrue(py_share_grads) ? true : false;
     bool export_graph = PyObject_IsTrue(py_export_graph) ? true : false;
-    if (share_grads) maker.Share("/share/buffer/grads", bp_ops);
+    GradientFlowNames names;
+    const GraphDef& cached_ops = gradient_flow_cache()->Get(fp_ops,
+        targets, input_grads, ignore_grads, share_grads, names);
+    vector<OperatorDef> ops(cached_ops.op_size());
+    for (int i = 0; i < cached_ops.op_size(); i++) {
+        ops[i].CopyFrom(cached_ops.op(i));
+        names.Restore(&ops[i]);
+    }
+    GraphDef* exported = export_graph ? &bp_ops : nullptr;
+    if (use_buckets) buckets.Plan(ops);
+    for (int i = 0; i < ops.size(); i++) {
+        if (export_graph) bp_ops.add_op()->CopyFrom(ops[i]);
+        ws()->RunOperator(ops[i]);
+        if (use_buckets && !buckets.Launch(i, exported)) return nullptr;
+    }
+    if (use_buckets && !buckets.Wait(exported)) return nullptr;
     if (export_graph) {
         Tensor* t = ws()->CreateTensor("/export/dynamic_graph/gradient_flow");
         t->Reshape({ 1 });
@@ -102,7 +480,17 @@ PyObject* RunGradientFlowCC(PyObject* self, PyObject* args) {
         data = t->mutable_data<string, CPUContext>();
         data[0] = fp_ops.SerializeAsString();
     }
-    for (auto& op : bp_ops.op()) ws()->RunOperator(op);
+    //  return the indices of launched buckets if necessary
+    if (use_buckets) return buckets.Launched();
+    Py_RETURN_TRUE;
+}
+
+PyObject* GetGradientFlowCacheStatsCC(PyObject* self, PyObject* args) {
+    return gradient_flow_cache()->Statistics();
+}
+
+PyObject* ResetGradientFlowCacheCC(PyObject* self, PyObject* args) {
+    gradient_flow_cache()->Clear();
     Py_RETURN_TRUE;
 }
 
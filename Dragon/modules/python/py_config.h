@@ -13,6 +13,9 @@
 #define DRAGON_PYTHON_PY_CONFIG_H_
 
 #include "dragon.h"
+#include "core/allocator.h"
+#include "operators/vision/conv_op_base.h"
+#include "utils/omp_alternative.h"
 
 inline PyObject* SetLogLevelCC(PyObject* self, PyObject* args) {
     char* cname;
@@ -25,4 +28,63 @@ inline PyObject* SetLogLevelCC(PyObject* self, PyObject* args) {
     Py_RETURN_TRUE;
 }
 
+inline PyObject* SetIntraOpThreadsCC(PyObject* self, PyObject* args) {
+    int num_threads;
+    if (!PyArg_ParseTuple(args, "i", &num_threads)) {
+        PyErr_SetString(PyExc_ValueError,
+            "Excepted the number of threads.");
+        return nullptr;
+    }
+    INTRA_OP_THREADS() = num_threads;
+    Py_RETURN_TRUE;
+}
+
+inline PyObject* SetConvLoweringLimitCC(PyObject* self, PyObject* args) {
+    long long nbytes;
+    if (!PyArg_ParseTuple(args, "L", &nbytes) || nbytes < 0) {
+        PyErr_SetString(PyExc_ValueError,
+            "Excepted the non-negative number of bytes.");
+        return nullptr;
+    }
+    CONV_LOWERING_BYTES() = (size_t)nbytes;
+    Py_RETURN_TRUE;
+}
+
+inline PyObject* SetCPUCacheLimitCC(PyObject* self, PyObject* args) {
+    long long nbytes;
+    if (!PyArg_ParseTuple(args, "L", &nbytes) || nbytes < 0) {
+        PyErr_SetString(PyExc_ValueError,
+            "Excepted the non-negative number of bytes.");
+        return nullptr;
+    }
+    CPUAllocator::Get()->SetCacheLimit((size_t)nbytes);
+    Py_RETURN_TRUE;
+}
+
+inline PyObject* EmptyCPUCacheCC(PyObject* self, PyObject* args) {
+    CPUAllocator::Get()->EmptyCache();
+    Py_RETURN_TRUE;
+}
+
+inline PyObject* GetCPUAllocatorStatsCC(PyObject* self, PyObject* args) {
+    auto SetItem = [](PyObject* dict, const char* key, PyObject* value) {
+        PyDict_SetItemString(dict, key, value); Py_XDECREF(value);
+    };
+    CPUAllocator::Stats stats = CPUAllocator::Get()->GetStats();
+    PyObject* py_stats = PyDict_New();
+    SetItem(py_stats, "bytes_in_use", PyLong_FromSize_t(stats.bytes_in_use));
+    SetItem(py_stats, "bytes_cached", PyLong_FromSize_t(stats.bytes_cached));
+    SetItem(py_stats, "peak", PyLong_FromSize_t(stats.peak_bytes_in_use));
+    SetItem(py_stats, "cache_limit", PyLong_FromSize_t(stats.cache_limit));
+    SetItem(py_stats, "num_allocs", PyLong_FromLongLong(stats.num_allocs));
+    SetItem(py_stats, "num_system_allocs",
+        PyLong_FromLongLong(stats.num_system_allocs));
+    return py_stats;
+}
+
+inline PyObject* ResetCPUAllocatorStatsCC(PyObject* self, PyObject* args) {
+    CPUAllocator::Get()->ResetStats();
+    Py_RETURN_TRUE;
+}
+
 #endif    // DRAGON_PYTHON_PY_CONFIG_H_
\ No newline at end of file
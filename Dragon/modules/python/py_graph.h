@@ -59,4 +59,45 @@ inline PyObject* GraphsCC(PyObject* self, PyObject* args) {
     return list;
 }
 
+inline PyObject* GetMemoryPlanCC(PyObject* self, PyObject* args) {
+    char* cname;
+    if (!PyArg_ParseTuple(args, "s", &cname)) {
+        PyErr_SetString(PyExc_ValueError,
+            "Excepted the graph name.");
+        return nullptr;
+    }
+    Graph* graph = dynamic_cast<Graph*>(ws()->GetGraph(cname));
+    if (graph == nullptr) {
+        PyErr_SetString(PyExc_RuntimeError,
+            "The memory plan is only available for the default graph.");
+        return nullptr;
+    }
+    auto SetItem = [](PyObject* dict, const char* key, PyObject* value) {
+        PyDict_SetItemString(dict, key, value); Py_XDECREF(value);
+    };
+    const Graph::MemoryPlan& plan = graph->GetMemoryPlan();
+    PyObject* blocks = PyList_New(plan.blocks.size());
+    for (int i = 0; i < plan.blocks.size(); i++) {
+        const Graph::MemoryBlock& block = plan.blocks[i];
+        PyObject* tensors = PyList_New(block.tensors.size());
+        for (int j = 0; j < block.tensors.size(); j++)
+            PyList_SetItem(tensors, j,
+                String_AsPyUnicode(block.tensors[j]->name()));
+        PyObject* py_block = PyDict_New();
+        SetItem(py_block, "tensors", tensors);
+        SetItem(py_block, "offset", PyLong_FromSize_t(block.offset));
+        SetItem(py_block, "nbytes", PyLong_FromSize_t(block.nbytes));
+        SetItem(py_block, "first", PyInt_FromLong(block.first));
+        SetItem(py_block, "last", PyInt_FromLong(block.last));
+        PyList_SetItem(blocks, i, py_block);
+    }
+    PyObject* py_plan = PyDict_New();
+    SetItem(py_plan, "naive_bytes", PyLong_FromSize_t(plan.naive_bytes));
+    SetItem(py_plan, "planned_bytes", PyLong_FromSize_t(plan.planned_bytes));
+    SetItem(py_plan, "live_bytes", PyLong_FromSize_t(plan.live_bytes));
+    SetItem(py_plan, "applied", PyBool_FromLong(plan.applied));
+    SetItem(py_plan, "blocks", blocks);
+    return py_plan;
+}
+
 #endif    // DRAGON_PYTHON_PY_GRAPH_H_
\ No newline at end of file
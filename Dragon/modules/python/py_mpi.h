@@ -17,6 +17,8 @@
 #ifdef WITH_MPI 
 #include <mpi/mpi.h>
 
+#include "operators/update/collective_update_op.h"
+
 inline PyObject* MPIInitCC(PyObject* self, PyObject* args) {
     int thread_type;
     MPI_Init_thread(NULL, NULL, MPI_THREAD_MULTIPLE, &thread_type);
@@ -115,6 +117,21 @@ inline PyObject* MPICreateGroupCC(PyObject* self, PyObject* args) {
     return ret;
 }
 
+inline PyObject* MPIGetBucketStatsCC(PyObject* self, PyObject* args) {
+    //  return the stats of reduced buckets and reset them
+    auto* stats = collective_bucket_stats();
+    PyObject* ret = PyList_New(stats->size());
+    for (int i = 0; i < stats->size(); i++) {
+        const auto& stat = (*stats)[i];
+        SetPyList(ret, i, Py_BuildValue("{s:s,s:i,s:L,s:d,s:d}",
+            "name", stat.name.c_str(), "num_tensors", stat.num_tensors,
+                "nbytes", (long long)stat.nbytes, "elapsed", stat.elapsed,
+                    "blocked", stat.blocked));
+    }
+    stats->clear();
+    return ret;
+}
+
 #else  // WITH_MPI
 
 #define MPI_NOT_IMPLEMENTED \
@@ -126,6 +143,7 @@ inline PyObject* MPIFinalizeCC(PyObject* self, PyObject* args) { MPI_NOT_IMPLEME
 inline PyObject* MPIRankCC(PyObject* self, PyObject* args) { MPI_NOT_IMPLEMENTED; }
 inline PyObject* MPISizeCC(PyObject* self, PyObject* args) { MPI_NOT_IMPLEMENTED; }
 inline PyObject* MPICreateGroupCC(PyObject* self, PyObject* args) { MPI_NOT_IMPLEMENTED; }
+inline PyObject* MPIGetBucketStatsCC(PyObject* self, PyObject* args) { MPI_NOT_IMPLEMENTED; }
 
 #endif // WITH_MPI
 
@@ -101,4 +101,107 @@ inline PyObject* RunPersistentOpCC(PyObject* self, PyObject* args) {
     Py_RETURN_TRUE;
 }
 
+/*!
+ *  The registered operators are run by names directly,
+ *  which avoids the serializing and parsing of OperatorDef.
+ */
+
+Map<int, OperatorDef>& registered_operators() {
+    static Map<int, OperatorDef> defs;
+    return defs;
+}
+
+/*!
+ *  The persistent ops derived from a registered operator,
+ *  which are released along with the operator.
+ */
+
+Map<int, Set<string> >& registered_persistent_ops() {
+    static Map<int, Set<string> > keys;
+    return keys;
+}
+
+inline PyObject* RegisterOperatorCC(PyObject* self, PyObject* args) {
+    PyObject* op_str;
+    if (!PyArg_ParseTuple(args, "S", &op_str)) {
+        PyErr_SetString(PyExc_ValueError,
+            "Excepted a serialized string of OperatorDef.");
+        return nullptr;
+    }
+    static int handle = 0;
+    OperatorDef& op_def = registered_operators()[handle];
+    if (!op_def.ParseFromString(PyBytes_AsStringEx(op_str))) {
+        registered_operators().erase(handle);
+        PyErr_SetString(PyExc_RuntimeError,
+            "Failed to parse the OperatorDef.");
+        return nullptr;
+    }
+    return PyInt_FromLong(handle++);
+}
+
+inline PyObject* ReleaseOperatorCC(PyObject* self, PyObject* args) {
+    int handle;
+    if (!PyArg_ParseTuple(args, "i", &handle)) {
+        PyErr_SetString(PyExc_ValueError,
+            "Excepted the handle of a registered operator.");
+        return nullptr;
+    }
+    registered_operators().erase(handle);
+    auto it = registered_persistent_ops().find(handle);
+    if (it != registered_persistent_ops().end()) {
+        for (auto& key : it->second) ws()->ReleasePersistentOp(key);
+        registered_persistent_ops().erase(it);
+    }
+    Py_RETURN_TRUE;
+}
+
+inline bool GetRegisteredOperator(
+    int                     handle,
+    const string&           name,
+    PyObject*               py_inputs,
+    PyObject*               py_outputs,
+    OperatorDef&            op_def) {
+    auto it = registered_operators().find(handle);
+    if (it == registered_operators().end()) {
+        PyErr_SetString(PyExc_KeyError,
+            "The operator has not been registered.");
+        return false;
+    }
+    op_def.CopyFrom(it->second);
+    op_def.set_name(name);
+    op_def.clear_input(); op_def.clear_output();
+    for (auto* py_names : { py_inputs, py_outputs }) {
+        for (int i = 0; i < PyList_Size(py_names); i++) {
+            const char* name = PyString_AsString(PyList_GetItem(py_names, i));
+            if (name == nullptr) {
+                PyErr_SetString(PyExc_TypeError,
+                    "Excepted the names of inputs and outputs as str.");
+                return false;
+            }
+            if (py_names == py_inputs) op_def.add_input(name);
+            else op_def.add_output(name);
+        }
+    }
+    return true;
+}
+
+inline PyObject* RunRegisteredOperatorCC(PyObject* self, PyObject* args) {
+    int handle; char* anchor;
+    PyObject* py_inputs, *py_outputs;
+    if (!PyArg_ParseTuple(args, "isO!O!", &handle, &anchor,
+            &PyList_Type, &py_inputs, &PyList_Type, &py_outputs)) {
+        PyErr_SetString(PyExc_ValueError,
+            "Excepted the handle of a registered operator, "
+            "anchor, list of inputs and outputs.");
+        return nullptr;
+    }
+    //  the op is constructed, run, and deconstructed once,
+    //  i.e. no states or buffers are kept across the unrelated calls
+    OperatorDef op_def;
+    if (!GetRegisteredOperator(handle, anchor,
+            py_inputs, py_outputs, op_def)) return nullptr;
+    ws()->RunOperator(op_def);
+    Py_RETURN_TRUE;
+}
+
 #endif    // DRAGON_PYTHON_PY_OPERATOR_H_
\ No newline at end of file
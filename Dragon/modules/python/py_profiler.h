@@ -0,0 +1,60 @@
+// ------------------------------------------------------------
+// Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+//
+// Licensed under the BSD 2-Clause License.
+// You should have received a copy of the BSD 2-Clause License
+// along with the software. If not, See,
+//
+//      <https://opensource.org/licenses/BSD-2-Clause>
+//
+// ------------------------------------------------------------
+
+#ifndef DRAGON_PYTHON_PY_PROFILER_H_
+#define DRAGON_PYTHON_PY_PROFILER_H_
+
+#include "dragon.h"
+#include "utils/profiler.h"
+
+inline PyObject* StartProfilerCC(PyObject* self, PyObject* args) {
+    Profiler::Start();
+    Py_RETURN_TRUE;
+}
+
+inline PyObject* StopProfilerCC(PyObject* self, PyObject* args) {
+    Profiler::Stop();
+    Py_RETURN_TRUE;
+}
+
+inline PyObject* ResetProfilerCC(PyObject* self, PyObject* args) {
+    Profiler::Reset();
+    Py_RETURN_TRUE;
+}
+
+inline PyObject* IsProfilerEnabledCC(PyObject* self, PyObject* args) {
+    return PyBool_FromLong(Profiler::IsEnabled());
+}
+
+inline PyObject* GetProfilerEventsCC(PyObject* self, PyObject* args) {
+    auto SetItem = [](PyObject* dict, const char* key, PyObject* value) {
+        PyDict_SetItemString(dict, key, value); Py_XDECREF(value);
+    };
+    vector<Profiler::Event> events = Profiler::Events();
+    PyObject* py_events = PyList_New(events.size());
+    for (int i = 0; i < events.size(); i++) {
+        const Profiler::Event& event = events[i];
+        PyObject* py_event = PyDict_New();
+        SetItem(py_event, "type", String_AsPyUnicode(event.type));
+        SetItem(py_event, "name", String_AsPyUnicode(event.name));
+        SetItem(py_event, "anchor", String_AsPyUnicode(event.anchor));
+        SetItem(py_event, "session", String_AsPyUnicode(event.session));
+        SetItem(py_event, "shapes", String_AsPyUnicode(event.shapes));
+        SetItem(py_event, "start", PyLong_FromLongLong(event.start));
+        SetItem(py_event, "duration", PyLong_FromLongLong(event.duration));
+        SetItem(py_event, "nbytes", PyLong_FromLongLong(event.nbytes));
+        SetItem(py_event, "thread", PyInt_FromLong(event.thread));
+        PyList_SetItem(py_events, i, py_event);
+    }
+    return py_events;
+}
+
+#endif    // DRAGON_PYTHON_PY_PROFILER_H_
@@ -311,6 +311,11 @@ inline PyObject* ResetTensorCC(PyObject* self, PyObject* args) {
     Py_RETURN_TRUE;
 }
 
+inline PyObject* ReleaseTensorCC(PyObject* self, PyObject* args) {
+    ws()->ReleaseTensor(ParseName(self, args));
+    Py_RETURN_TRUE;
+}
+
 inline PyObject* TensorsCC(PyObject* self, PyObject* args) {
     vector<string> tensors = ws()->GetTensors();
     PyObject* list = PyList_New(tensors.size());
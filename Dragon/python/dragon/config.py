@@ -44,6 +44,12 @@ option['debug_mode'] = False
 # Whether to share grads
 option['share_grads'] = True
 
+# Whether to plan the memory by the lifetimes of tensors
+option['plan_memory'] = False
+
+# Whether to fold the batch norms into the convolutions of inference graphs
+option['fold_batch_norm'] = False
+
 # Optional graph type
 option['graph_type'] = ''
 
@@ -57,6 +63,18 @@ option['export_meta_graph'] = ''
 # Whether to log the optimized graphs
 option['log_optimized_graph'] = False
 
+# The number of threads to run the independent ops of a graph
+option['inter_op_threads'] = 1
+
+# The max number of threads to run an op, 0 to use all processors
+option['intra_op_threads'] = 0
+
+# The max bytes of cached CPU memory, 0 to disable the caching
+option['cpu_cache_limit'] = 1 << 30
+
+# The max bytes to lower a batch of images for the CPU convolutions
+option['conv_lowering_limit'] = 64 << 20
+
 
 def EnableCPU():
     """Enable CPU mode globally.
@@ -225,6 +243,163 @@ def SetGraphType(graph_type=''):
     option['graph_type'] = graph_type
 
 
+def FoldBatchNorm(enabled=True):
+    """Enable to fold the batch norms into the convolutions globally.
+
+    The frozen ``BatchNorm``, ``FusedBatchNorm``, ``Affine`` and ``BiasAdd``
+    following a ``Conv2d`` are folded into its weights and bias,
+    and the trailing ``Relu`` is fused into it.
+
+    Only the inference graphs will be rewritten.
+
+    Parameters
+    ----------
+    enabled : boolean
+        Whether to enable folding.
+
+    Returns
+    -------
+    None
+
+    """
+    global option
+    option['fold_batch_norm'] = enabled
+
+
+def SetInterOpThreads(num_threads=1):
+    """Set the number of threads to run the independent ops of a graph.
+
+    The ops are scheduled by the dependencies if ``num_threads`` > 1,
+    which only takes effects on the CPU graphs created later.
+
+    Parameters
+    ----------
+    num_threads : int
+        The number of threads.
+
+    Returns
+    -------
+    None
+
+    """
+    global option
+    option['inter_op_threads'] = num_threads
+
+
+def GetInterOpThreads():
+    """Get the number of threads to run the independent ops of a graph.
+
+    Returns
+    -------
+    int
+        The number of threads.
+
+    """
+    return option['inter_op_threads']
+
+
+def SetIntraOpThreads(num_threads=0):
+    """Set the max number of OpenMP threads to run an op.
+
+    Set it to ``cores / inter_op_threads`` to avoid the over-subscription.
+
+    Parameters
+    ----------
+    num_threads : int
+        The number of threads. ``0`` to use all processors.
+
+    Returns
+    -------
+    None
+
+    """
+    global option
+    option['intra_op_threads'] = num_threads
+    SetIntraOpThreadsCC(num_threads)
+
+
+def GetIntraOpThreads():
+    """Get the max number of OpenMP threads to run an op.
+
+    Returns
+    -------
+    int
+        The number of threads.
+
+    """
+    return option['intra_op_threads']
+
+
+def SetConvLoweringLimit(nbytes=64 << 20):
+    """Set the max bytes to lower a batch of images for the CPU convolutions.
+
+    Multiple images are lowered into a GEMM if the spatial dims are small,
+    while the size of column buffers is limited by ``nbytes``.
+
+    Parameters
+    ----------
+    nbytes : int
+        The number of bytes. ``0`` to lower the images one by one.
+
+    Returns
+    -------
+    None
+
+    """
+    global option
+    option['conv_lowering_limit'] = nbytes
+    SetConvLoweringLimitCC(nbytes)
+
+
+def GetConvLoweringLimit():
+    """Get the max bytes to lower a batch of images for the CPU convolutions.
+
+    Returns
+    -------
+    int
+        The number of bytes.
+
+    """
+    return option['conv_lowering_limit']
+
+
+def SetCPUCacheLimit(nbytes=1 << 30):
+    """Set the max bytes of the freed CPU memory to cache.
+
+    The blocks are reused by the later allocations of the same size class,
+    and the largest blocks are released first if exceeding the limit.
+
+    Parameters
+    ----------
+    nbytes : int
+        The number of bytes. ``0`` to disable the caching.
+
+    Returns
+    -------
+    None
+
+    References
+    ----------
+    `workspace.GetAllocatorStats()`_ - How to get the statistics of allocator.
+
+    """
+    global option
+    option['cpu_cache_limit'] = nbytes
+    SetCPUCacheLimitCC(nbytes)
+
+
+def GetCPUCacheLimit():
+    """Get the max bytes of the freed CPU memory to cache.
+
+    Returns
+    -------
+    int
+        The number of bytes.
+
+    """
+    return option['cpu_cache_limit']
+
+
 def LogMetaGraph(enabled=True):
     """Enable to log meta graph globally.
 
@@ -20,6 +20,7 @@ _is_init = False
 _snapshot_ranks = []
 _parallel_groups = []
 _parallel_mode = 'MPI'
+_bucket_size = 25 * 1024 * 1024
 
 __all__ = [
     'Init',
@@ -33,6 +34,9 @@ __all__ = [
     'AllowParallel',
     'SetParallelMode',
     'GetParallelMode',
+    'SetBucketSize',
+    'GetBucketSize',
+    'GetBucketStats',
     'Finalize'
 ]
 
@@ -247,6 +251,66 @@ def GetParallelMode():
     return _parallel_mode
 
 
+def SetBucketSize(size):
+    """Set the size of buckets to reduce the grads.
+
+    The grads are coalesced into buckets of at most ``size`` bytes,
+    each bucket is reduced by a single collective communication.
+
+    Parameters
+    ----------
+    size : int
+        The size in bytes. Set ``0`` to reduce the grads one by one.
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    The default size is ``25MB``.
+
+    """
+    if size < 0:
+        raise ValueError('The bucket size should be non-negative, '
+                         'got {}.'.format(size))
+    global _bucket_size
+    _bucket_size = int(size)
+
+
+def GetBucketSize():
+    """Get the size of buckets to reduce the grads.
+
+    Returns
+    -------
+    int
+        The size in bytes.
+
+    """
+    global _bucket_size
+    return _bucket_size
+
+
+def GetBucketStats():
+    """Get the statistics of the reduced buckets.
+
+    The records are cleared after returning.
+
+    Returns
+    -------
+    list of dict
+        The ``name`` of first grad, ``num_tensors``, ``nbytes``,
+        ``elapsed`` and ``blocked`` time in milliseconds of each bucket.
+
+    References
+    ----------
+    The wrapper of ``MPIGetBucketStatsCC``.
+
+    """
+    _check_init()
+    return MPIGetBucketStatsCC()
+
+
 def Finalize():
     """Finalize the MPI env.
 
@@ -0,0 +1,194 @@
+# ------------------------------------------------------------
+# Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+#
+# Licensed under the BSD 2-Clause License.
+# You should have received a copy of the BSD 2-Clause License
+# along with the software. If not, See,
+#
+#      <https://opensource.org/licenses/BSD-2-Clause>
+#
+# ------------------------------------------------------------
+
+"""Profile the running operators of the backend.
+
+Each op records its type, name, input shapes, duration,
+and the bytes allocated while the profiler is enabled.
+
+The events are grouped by the session, i.e., the name of
+the running graph (``theano``, ``caffe``, ``tensorflow``, or the traced ``torch`` modules),
+or ``eager`` for the ops dispatched by the ``torch`` engines.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import json
+from collections import OrderedDict
+
+from dragon.import_c_apis import *
+
+__all__ = [
+    'Start',
+    'Stop',
+    'IsEnabled',
+    'Reset',
+    'GetEvents',
+    'Summary',
+    'Export',
+]
+
+
+def Start():
+    """Start to record the running operators.
+
+    Returns
+    -------
+    None
+
+    """
+    StartProfilerCC()
+
+
+def Stop():
+    """Stop to record the running operators.
+
+    The recorded events are kept until ``Reset``.
+
+    Returns
+    -------
+    None
+
+    """
+    StopProfilerCC()
+
+
+def IsEnabled():
+    """Whether the profiler is recording.
+
+    Returns
+    -------
+    boolean
+        ``True`` if enabled, otherwise ``False``.
+
+    """
+    return IsProfilerEnabledCC()
+
+
+def Reset():
+    """Clear the recorded events.
+
+    Returns
+    -------
+    None
+
+    """
+    ResetProfilerCC()
+
+
+def GetEvents():
+    """Return the recorded events.
+
+    Each event is a dict with keys ``type``, ``name``, ``anchor``, ``session``,
+    ``shapes``, ``start`` (us), ``duration`` (us), ``nbytes`` and ``thread``.
+
+    The ``anchor`` is shared by an op and its gradient ops,
+    which could be used to group the forward and backward costs.
+
+    Returns
+    -------
+    list of dict
+        The events in the order of finishing.
+
+    """
+    return GetProfilerEventsCC()
+
+
+def Summary(events=None, sort_by='total'):
+    """Return a table of the events aggregated by session and op type.
+
+    Parameters
+    ----------
+    events : list of dict or None
+        The events. If ``None``, use the recorded events.
+    sort_by : str
+        The column to sort the rows, ``total``, ``calls`` or ``nbytes``.
+
+    Returns
+    -------
+    str
+        The summary table.
+
+    Examples
+    --------
+    >>> dragon.profiler.Start()
+    >>> f()
+    >>> dragon.profiler.Stop()
+    >>> print(dragon.profiler.Summary())
+
+    """
+    if sort_by not in ('total', 'calls', 'nbytes'):
+        raise ValueError('Unknown column to sort: {}.'.format(sort_by))
+    if events is None: events = GetEvents()
+    sessions = OrderedDict()
+    for e in events:
+        stats = sessions.setdefault(e['session'], OrderedDict())
+        row = stats.setdefault(e['type'], {'calls': 0, 'total': 0, 'nbytes': 0})
+        row['calls'] += 1
+        row['total'] += e['duration']
+        row['nbytes'] += e['nbytes']
+    header = '{:<32s}{:>10s}{:>14s}{:>12s}{:>9s}{:>14s}'.format(
+        'Type', 'Calls', 'Total(ms)', 'Avg(ms)', '%', 'Alloc(MB)')
+    lines = []
+    for session, stats in sessions.items():
+        session_total = sum(row['total'] for row in stats.values())
+        lines.append('Session: {} ({} ops, {:.3f} ms)'.format(session,
+            sum(row['calls'] for row in stats.values()), session_total / 1e3))
+        lines.extend([header, '-' * len(header)])
+        rows = sorted(stats.items(), key=lambda kv: kv[1][sort_by], reverse=True)
+        for type, row in rows:
+            lines.append('{:<32s}{:>10d}{:>14.3f}{:>12.3f}{:>9.2f}{:>14.3f}'.format(
+                type, row['calls'], row['total'] / 1e3,
+                row['total'] / 1e3 / row['calls'],
+                100. * row['total'] / max(session_total, 1),
+                row['nbytes'] / 1024. / 1024.))
+        lines.append('')
+    return '\n'.join(lines)
+
+
+def Export(filename, events=None):
+    """Export the events into a timeline of Chrome Trace format.
+
+    The timeline could be viewed at ``chrome://tracing``,
+    where each session is shown as a process.
+
+    Parameters
+    ----------
+    filename : str
+        The path of the json file.
+    events : list of dict or None
+        The events. If ``None``, use the recorded events.
+
+    Returns
+    -------
+    None
+
+    """
+    if events is None: events = GetEvents()
+    trace_events, pids = [], OrderedDict()
+    origin = min([e['start'] for e in events]) if len(events) > 0 else 0
+    for e in events:
+        if e['session'] not in pids:
+            pids[e['session']] = len(pids)
+            trace_events.append({'name': 'process_name', 'ph': 'M',
+                'pid': pids[e['session']], 'args': {'name': e['session']}})
+        trace_events.append({
+            'name': e['type'], 'cat': 'operator', 'ph': 'X',
+            'ts': e['start'] - origin, 'dur': e['duration'],
+            'pid': pids[e['session']], 'tid': e['thread'],
+            'args': {'name': e['name'], 'anchor': e['anchor'],
+                     'shapes': e['shapes'], 'nbytes': e['nbytes']},
+        })
+    with open(filename, 'w') as f:
+        json.dump({'traceEvents': trace_events, 'displayTimeUnit': 'ms'}, f)
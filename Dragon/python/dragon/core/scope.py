@@ -180,10 +180,15 @@ class DeviceScope(object):
     >>> import dragon
     >>> with dragon.device_scope(device='gpu', id=0, use_cudnn=True):  a = ops.RandomUniform([2, 3])
 
+    The ``engine`` overrides ``use_cudnn``, e.g., ``WINOGRAD`` or ``IM2COL`` for the CPU convolutions.
+
+    >>> with dragon.device_scope(device='cpu', engine='WINOGRAD'): y = ops.Conv2d([x, w], num_output=64, kernel_size=3, pad=1)
+
     """
-    def __init__(self, device, id=0, use_cudnn=True):
+    def __init__(self, device, id=0, use_cudnn=True, engine=None):
         self.device = device.lower()
-        self.engine = 'CUDNN' if use_cudnn else 'DRAGON'
+        if engine is not None: self.engine = engine.upper()
+        else: self.engine = 'CUDNN' if use_cudnn else 'DRAGON'
         assert self.device in ['cpu', 'gpu', 'cuda']
         if self.device == 'cuda': self.device = 'gpu'
         self.id = id
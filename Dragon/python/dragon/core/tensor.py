@@ -13,6 +13,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import copy
 import numpy as np
 
 import dragon.core.workspace as ws
@@ -21,6 +22,42 @@ from dragon.core.utils import MakeOperatorDef
 from dragon.core.scope import GetOperatorName, GetTensorName
 
 
+class _Expression(object):
+    """The node of expressions, linked to the nodes of inputs.
+
+    Appending an op costs O(1) instead of copying the expressions of inputs,
+    all the ops are collected once if required, e.g. making the graph.
+
+    """
+    __slots__ = ('ops', 'parents')
+
+    def __init__(self, ops, parents=()):
+        self.ops, self.parents = ops, parents
+
+    def collect(self):
+        """Collect the ops of this node and all the ancestors.
+
+        Returns
+        -------
+        dict
+            The ops, keyed by the index.
+
+        """
+        ops, visited, stack = {}, set(), [self]
+        while len(stack) > 0:
+            node = stack.pop()
+            if id(node) in visited: continue
+            visited.add(id(node))
+            for op_idx, expr in node.ops.items():
+                if op_idx not in ops: ops[op_idx] = expr
+            stack.extend(node.parents)
+        return ops
+
+    def __deepcopy__(self, memo):
+        # flatten the chain, which may exceed the recursion limit
+        return _Expression(copy.deepcopy(self.collect(), memo))
+
+
 class Tensor(object):
     """
     Tensor is generally used to represent a n-dim array,
@@ -213,6 +250,9 @@ class Tensor(object):
     def expressions(self):
         """Return or Set the expressions.
 
+        The returned dict is collected from the linked expressions,
+        modify it and set back to take effects.
+
         Parameters
         ----------
         value : dict
@@ -224,13 +264,13 @@ class Tensor(object):
             The internal expressions that it has currently stored.
 
         """
-        if not hasattr(self,'_expressions'): self._expressions = {}
-        return self._expressions
+        expression = getattr(self, '_expression', None)
+        return expression.collect() if expression else {}
 
     @expressions.setter
     def expressions(self, value):
         assert isinstance(value, dict)
-        self._expressions = value
+        self._expression = _Expression(value) if value else None
 
     @property
     def name(self):
@@ -965,21 +1005,17 @@ class Tensor(object):
              [ 5.  5.  5.]]
 
         """
-        expressions = dict()
+        parents = []
 
         # 1. collect inputs
+        # the expressions are linked rather than copied
         if not isinstance(inputs, list): inputs = [inputs]
-        for input in inputs:
-            for op_idx, expr in input.expressions.items():
-                if not op_idx in expressions:
-                    expressions[op_idx] = expr
-
         if extra_inputs is not None:
             if not isinstance(extra_inputs, list): extra_inputs = [extra_inputs]
-            for input in extra_inputs:
-                for op_idx, expr in input.expressions.items():
-                    if not op_idx in expressions:
-                        expressions[op_idx] = expr
+        for input in inputs + (extra_inputs if extra_inputs else []):
+            expression = getattr(input, '_expression', None)
+            if expression and expression not in parents:
+                parents.append(expression)
 
         # 2. generate outputs
         outputs = []
@@ -1005,16 +1041,17 @@ class Tensor(object):
             device_option.engine = _ENGINE_SCOPE
         op_def = MakeOperatorDef(op_type, inputs_name, outputs_name, op_name,
                                  device_option=device_option, **kwargs)
-        expressions[op_idx] = op_def
+        expression = _Expression({op_idx: op_def}, tuple(parents))
 
         # 4. make outputs
         for idx, output in enumerate(outputs):
             # deliver expressions
-            output.expressions = expressions
+            output._expression = expression
             # deliver extra targets
             for input in inputs:
-                output.extra_targets = \
-                    output.extra_targets.union(input.extra_targets)
+                if input.extra_targets:
+                    output.extra_targets = \
+                        output.extra_targets.union(input.extra_targets)
             if extra_inputs is not None:
                 for input in extra_inputs:
                     output.extra_targets.add(input.name)
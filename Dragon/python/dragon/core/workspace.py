@@ -36,12 +36,22 @@ __all__ = [
     'ClearWorkspace',
     'CreateGraph',
     'RunGraph',
+    'GetMemoryPlan',
     'RunGradientFlow',
+    'GetGradientFlowCacheStats',
+    'ResetGradientFlowCache',
+    'GetAllocatorStats',
+    'ResetAllocatorStats',
+    'EmptyAllocatorCache',
     'RunOperator',
     'RunOperators',
     'CreatePersistentOp',
     'RunPersistentOp',
+    'RegisterOperator',
+    'ReleaseOperator',
+    'RunRegisteredOperator',
     'HasTensor',
+    'Tensors',
     'CreateTensor',
     'CreateFiller',
     'GetFillerType',
@@ -50,6 +60,7 @@ __all__ = [
     'FeedTensor',
     'FetchTensor',
     'ResetTensor',
+    'ReleaseTensor',
     'Snapshot',
     'Restore',
     'LogMetaGraph',
@@ -289,6 +300,75 @@ def RunPersistentOp(key, anchor, inputs, outputs):
     RunPersistentOpCC(key, anchor, inputs, outputs)
 
 
+def RegisterOperator(op_def):
+    """Register the operator in the VM backend.
+
+    The registered operator is run by names without the serialization.
+
+    Parameters
+    ----------
+    op_def : dragon_pb2.OperatorDef
+        The definition of operator.
+
+    Returns
+    -------
+    int
+        The handle of the registered operator.
+
+    References
+    ----------
+    The wrapper of ``RegisterOperatorCC``.
+
+    """
+    return RegisterOperatorCC(_stringify_proto(op_def))
+
+
+def ReleaseOperator(handle):
+    """Release the registered operator in the VM backend.
+
+    Parameters
+    ----------
+    handle : int
+        The handle of the registered operator.
+
+    Returns
+    -------
+    None
+
+    References
+    ----------
+    The wrapper of ``ReleaseOperatorCC``.
+
+    """
+    ReleaseOperatorCC(handle)
+
+
+def RunRegisteredOperator(handle, anchor, inputs, outputs):
+    """Create and Run the registered operator in the VM backend.
+
+    Parameters
+    ----------
+    handle : int
+        The handle of the registered operator.
+    anchor : str
+        The anchor to compute internal resources of op.
+    inputs : list of str
+        The inputs.
+    outputs : list of str
+        The outputs.
+
+    Returns
+    -------
+    None
+
+    References
+    ----------
+    The wrapper of ``RunRegisteredOperatorCC``.
+
+    """
+    RunRegisteredOperatorCC(handle, anchor, inputs, outputs)
+
+
 def HasTensor(tensor):
     """Query whether tensor has registered in current workspace.
 
@@ -310,6 +390,22 @@ def HasTensor(tensor):
     return HasTensorCC(_stringify_tensor(tensor))
 
 
+def Tensors():
+    """Return the name of tensors in current workspace.
+
+    Returns
+    -------
+    list of str
+        The name of tensors.
+
+    References
+    ----------
+    The wrapper of ``TensorsCC``.
+
+    """
+    return TensorsCC()
+
+
 def CreateTensor(tensor):
     """Create the tensor in the backend.
 
@@ -555,6 +651,28 @@ def ResetTensor(tensor):
     return ResetTensorCC(_stringify_tensor(tensor))
 
 
+def ReleaseTensor(tensor):
+    """Release the given tensor.
+
+    Note that the tensor will be ``DELETE`` from the workspace.
+
+    Parameters
+    ----------
+    tensor : Tensor or str
+        The tensor to release.
+
+    Returns
+    -------
+    None
+
+    References
+    ----------
+    The wrapper of ``ReleaseTensorCC``.
+
+    """
+    return ReleaseTensorCC(_stringify_tensor(tensor))
+
+
 def RunGraph(graph_name, inputs=(), outputs=[], stage=None, return_outputs=True):
     """Run the specific graph.
 
@@ -597,44 +715,152 @@ def RunGraph(graph_name, inputs=(), outputs=[], stage=None, return_outputs=True)
         else: return [outputs[i].get_value() for i in range(len(outputs))]
 
 
-def RunGradientFlow(input_flow, targets, input_grads=None, ignored_grads=None):
+def GetMemoryPlan(graph):
+    """Return the memory plan of the specific graph.
+
+    The tensors sharing a memory are placed as a block at an offset of the arena.
+
+    If the planning is disabled, the plan is analyzed from the last run.
+
+    Parameters
+    ----------
+    graph : str or dragon_pb2.GraphDef
+        The name or definition of the graph.
+
+    Returns
+    -------
+    dict
+        The ``naive_bytes``, ``planned_bytes``, peak ``live_bytes``,
+        whether the plan is ``applied``, and the list of ``blocks``.
+
+    References
+    ----------
+    `memonger.PlanMemory(*args, **kwargs)`_ - How to enable the memory planning.
+
+    """
+    if isinstance(graph, pb.GraphDef): graph = graph.name
+    return GetMemoryPlanCC(str(graph))
+
+
+def RunGradientFlow(input_flow, targets, input_grads=None,
+                    ignored_grads=None, collective=None):
     """Compute the gradients of given input flows.
 
     Parameters
     ----------
-    input_flow : list of OperatorDef or GraphDef
+    input_flow : list of OperatorDef, list of tuple or GraphDef
         The referring flows to generate gradient flows.
+        The registered operators are given as ``(handle, name, inputs, outputs)``.
     targets : list or str
         The solving targets, generate grads automatically.
     input_grads : None or list of str
         The input grads.
     ignored_grads : None or list of str
         The grads that are explicitly ignored.
+    collective : None or tuple
+        The buckets to reduce, given as ``(wait_handle, [(handle, grads), ...])``.
 
     Returns
     -------
-    None
+    None or list of int
+        The indices of launched buckets if ``collective`` is given.
 
     """
     if isinstance(input_flow, list):
-        graph_wrapper = pb.GraphDef()
-        graph_wrapper.op.extend(input_flow)
-        input_flow = graph_wrapper
-    if not isinstance(input_flow, pb.GraphDef):
+        if all(isinstance(op, tuple) for op in input_flow):
+            # the registered ops are passed without serialization
+            serialized_flow = input_flow
+        else:
+            graph_wrapper = pb.GraphDef()
+            graph_wrapper.op.extend(input_flow)
+            serialized_flow = _stringify_proto(graph_wrapper)
+    elif isinstance(input_flow, pb.GraphDef):
+        serialized_flow = _stringify_proto(input_flow)
+    else:
         raise TypeError('Excepted the type of input flow is either'
             'a list of OperatorDef or a GraphDef, got {}.'.format(type(input_flow)))
     from dragon.config import option, logger
     log_flow = True if option['log_optimized_graph'] or option['log_meta_graph'] else False
-    RunGradientFlowCC(_stringify_proto(input_flow), targets,
-                      input_grads if input_grads else [],
-                      ignored_grads if ignored_grads else [],
-                      option['share_grads'], log_flow)
+    launched = RunGradientFlowCC(serialized_flow, targets,
+                                 input_grads if input_grads else [],
+                                 ignored_grads if ignored_grads else [],
+                                 option['share_grads'], log_flow, collective)
     if log_flow:
         g_flow = pb.GraphDef()
         g_flow.ParseFromString(FetchTensor('/export/dynamic_graph/gradient_flow'))
         logger.info('>>>>>>>>>>>>>>>>>> Gradient Flow <<<<<<<<<<<<<<<<<<\n')
         logger.info(g_flow)
         logger.info('>>>>>>>>>>>>>>>>>> Gradient Flow <<<<<<<<<<<<<<<<<<\n')
+    if collective is not None: return launched
+
+
+def GetGradientFlowCacheStats():
+    """Return the statistics of the cached gradient flows.
+
+    The backward ops are derived once for each structure of forward ops,
+    and reused by the later flows with the same structure.
+
+    Returns
+    -------
+    dict
+        The ``hits``, ``misses``, number of ``entries``
+        and number of persistent ``collective_ops``.
+
+    """
+    return GetGradientFlowCacheStatsCC()
+
+
+def ResetGradientFlowCache():
+    """Reset the cached gradient flows and the statistics.
+
+    Returns
+    -------
+    None
+
+    """
+    ResetGradientFlowCacheCC()
+
+
+def GetAllocatorStats():
+    """Return the statistics of the CPU allocator.
+
+    The ``bytes_in_use``, ``bytes_cached`` and ``peak`` are counted by the size classes,
+    ``num_allocs`` counts the requests, while ``num_system_allocs`` counts the requests
+    missing the cache.
+
+    Returns
+    -------
+    dict
+        The statistics.
+
+    References
+    ----------
+    `config.SetCPUCacheLimit(*args, **kwargs)`_ - How to set the limit of cached bytes.
+
+    """
+    return GetCPUAllocatorStatsCC()
+
+
+def ResetAllocatorStats():
+    """Reset the counters and peak of the CPU allocator.
+
+    Returns
+    -------
+    None
+
+    """
+    ResetCPUAllocatorStatsCC()
+
+
+def EmptyAllocatorCache():
+    """Release the cached blocks of the CPU allocator.
+
+    Returns
+    -------
+    None
+
+    """
+    EmptyCPUCacheCC()
 
 
 def LogMetaGraph(meta_graph):
@@ -0,0 +1,122 @@
+# ------------------------------------------------------------
+# Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+#
+# Licensed under the BSD 2-Clause License.
+# You should have received a copy of the BSD 2-Clause License
+# along with the software. If not, See,
+#
+#      <https://opensource.org/licenses/BSD-2-Clause>
+#
+# ------------------------------------------------------------
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import time
+from threading import Thread, Lock
+
+
+class AutoScaler(Thread):
+    """AutoScaler adjusts the number of workers by the queue occupancy.
+
+    A stage is regarded as the bottleneck if its input queue is
+    nearly full while its output queue is nearly empty, and as
+    the redundant one if the occupancies are the other way around.
+
+    """
+    def __init__(self, batch, **kwargs):
+        """Construct a ``AutoScaler``.
+
+        Parameters
+        ----------
+        batch : DataBatch
+            The batch to monitor.
+        autoscale_interval : float
+            The interval(Seconds) between two decisions. Default is ``2.0``.
+        low_watermark : float
+            The occupancy regarded as nearly empty. Default is ``0.25``.
+        high_watermark : float
+            The occupancy regarded as nearly full. Default is ``0.75``.
+
+        """
+        super(AutoScaler, self).__init__()
+        self._batch = batch
+        self._interval = kwargs.get('autoscale_interval', 2.0)
+        self._low_watermark = kwargs.get('low_watermark', 0.25)
+        self._high_watermark = kwargs.get('high_watermark', 0.75)
+        self._num_samples = 10
+        self._statistics, self._lock = {}, Lock()
+        self.daemon = True
+
+    def occupancy(self):
+        """Return the average occupancy of each queue.
+
+        Returns
+        -------
+        dict
+            The occupancy of ``Q_level_1``, ``Q_level_2`` and ``Q_level_3``.
+
+        """
+        occupancy = {'Q_level_1': 0., 'Q_level_2': 0., 'Q_level_3': 0.}
+        for i in range(self._num_samples):
+            for name in occupancy.keys():
+                occupancy[name] += float(getattr(self._batch, name).qsize()) \
+                    / self._batch._capacity[name] / self._num_samples
+            time.sleep(self._interval / self._num_samples)
+        return occupancy
+
+    def decide(self, occupancy):
+        """Spawn or retire the workers of a stage.
+
+        Parameters
+        ----------
+        occupancy : dict
+            The occupancy of each queue.
+
+        Returns
+        -------
+        None
+
+        """
+        low = lambda name: occupancy[name] < self._low_watermark
+        high = lambda name: occupancy[name] > self._high_watermark
+        if high('Q_level_1') and low('Q_level_2'):
+            self._batch._spawn_transformer()
+        elif low('Q_level_1') and high('Q_level_2'):
+            self._batch._retire_transformer()
+        if high('Q_level_2') and low('Q_level_3'):
+            self._batch._spawn_fetcher()
+        elif low('Q_level_2') and high('Q_level_3'):
+            self._batch._retire_fetcher()
+
+    def statistics(self):
+        """Return the statistics of the last decision.
+
+        Returns
+        -------
+        dict
+            The statistics.
+
+        """
+        with self._lock:
+            return self._statistics.copy()
+
+    def run(self):
+        """Start the thread.
+
+        Returns
+        -------
+        None
+
+        """
+        try:
+            while True:
+                occupancy = self.occupancy()
+                self.decide(occupancy)
+                self._batch._join_retired()
+                with self._lock:
+                    self._statistics = {'occupancy': occupancy}
+        except NotImplementedError:
+            # ``Queue.qsize()`` is broken on Mac OS X
+            pass
@@ -13,8 +13,11 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import time
 import numpy as np
-from multiprocessing import Process
+from multiprocessing import Process, Event
+
+from .stage_counter import StageCounter
 
 
 class BlobFetcher(Process):
@@ -31,7 +34,7 @@ class BlobFetcher(Process):
         batch_size : int
             The size of a training batch.
         dtype : str
-            The data type of batch. Default is ``float32``.
+            The data type of batch, ``float32`` or ``float16``. Default is ``float32``.
         partition : boolean
             Whether to partition batch. Default is ``False``.
         prefetch : int
@@ -50,34 +53,85 @@ class BlobFetcher(Process):
         self._scale = kwargs.get('scale', 1.0)
         if self._partition:
             self._batch_size = int(self._batch_size / kwargs['group_size'])
+        # the pickling of a queued batch is deferred,
+        # recycle the blobs after the queue has been drained
+        self._pool_size = kwargs.get('prefetch', 5) * \
+            kwargs.get('num_readers', 1) + 1
+        self._pool, self._cursor = [], 0
+        self._counter = StageCounter()
+        self._retired = Event()
         self.Q_in = self.Q_out = None
         self.daemon = True
 
+    def blobs(self, im_shape, num_labels):
+        """Return the preallocated image and label blobs.
+
+        Parameters
+        ----------
+        im_shape : tuple
+            The ``HWC`` shape of images.
+        num_labels : int
+            The number of labels.
+
+        Returns
+        -------
+        tuple
+            The contiguous ``NCHW`` image blob and the label blob.
+
+        """
+        specs = [((self._batch_size, im_shape[2]) + tuple(im_shape[:2]), self._dtype),
+                 ((self._batch_size, num_labels), np.int64)]
+        if hasattr(self.Q_out, 'acquire'):
+            # write into the shared memory directly
+            blobs = self.Q_out.acquire(specs)
+            if blobs is not None: return blobs
+        if self._cursor == len(self._pool): self._pool.append(None)
+        blobs = self._pool[self._cursor]
+        if blobs is None or [blob.shape for blob in blobs] != \
+                [shape for shape, dtype in specs]:
+            blobs = tuple([np.empty(shape, dtype) for shape, dtype in specs])
+            self._pool[self._cursor] = blobs
+        self._cursor = (self._cursor + 1) % self._pool_size
+        return blobs
+
     def get(self):
         """Return a batch with image and label blob.
 
         Returns
         -------
         tuple
-            The blob of image and labels.
+            The blob of image and labels, and the tags of records.
 
         """
+        im, labels, tag = self._counter.get(self.Q_in)
+        tags = [tag]
+        im_blob, label_blob = self.blobs(im.shape, len(labels))
+        mean_values = np.array(self._mean_values).reshape((-1, 1, 1))
+
         # fill blobs
-        im, labels = self.Q_in.get()
-        im_blob = np.zeros(shape=([self._batch_size] + list(im.shape)), dtype=np.uint8)
-        label_blob = np.zeros((self._batch_size, len(labels)),  dtype=np.int64)
+        # mean subtraction & numerical scale are fused into the copy of each image
         for ix in range(0, self._batch_size):
-            im_blob[ix, :, :, :], label_blob[ix, :] = im, labels
-            if ix != self._batch_size - 1: im, labels = self.Q_in.get()
+            if len(self._mean_values) > 0:
+                np.subtract(im.transpose((2, 0, 1)), mean_values,
+                            out=im_blob[ix], casting='unsafe')
+            else: im_blob[ix] = im.transpose((2, 0, 1))
+            if self._scale != 1.0: im_blob[ix] *= self._scale
+            label_blob[ix] = labels
+            if ix != self._batch_size - 1:
+                im, labels, tag = self._counter.get(self.Q_in)
+                tags.append(tag)
 
-        # mean subtraction & numerical scale
-        im_blob = im_blob.astype(self._dtype)
-        if len(self._mean_values) > 0:
-            im_blob -= self._mean_values
-        if self._scale != 1.0:
-            im_blob *= self._scale
+        return im_blob, label_blob, tags
 
-        return im_blob.transpose((0, 3, 1, 2)), label_blob
+    def retire(self):
+        """Stop the process after finishing the current item.
+
+        Returns
+        -------
+        None
+
+        """
+        self._retired.set()
 
     def run(self):
         """Start the process.
@@ -87,5 +141,13 @@ class BlobFetcher(Process):
         None
 
         """
-        while True:
-            self.Q_out.put(self.get())
\ No newline at end of file
+        self._counter.start()
+        while not self._retired.is_set():
+            tic, wait = time.time(), self._counter.get_wait
+            blobs = self.get()
+            # exclude the time blocked on the input queue
+            self._counter.record(time.time() - tic - (self._counter.get_wait - wait))
+            self._counter.put(self.Q_out, blobs)
+        self._counter.stop()
+        # give back the slot of the last image
+        if hasattr(self.Q_in, 'release'): self.Q_in.release()
\ No newline at end of file
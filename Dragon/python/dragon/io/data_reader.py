@@ -13,7 +13,9 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import os
 import math
+import time
 import numpy as np
 import numpy.random as npr
 from multiprocessing import Process
@@ -21,6 +23,8 @@ from multiprocessing import Process
 import dragon.config as config
 from dragon.tools.db import LMDB
 
+from .stage_counter import StageCounter
+
 
 class DataReader(Process):
     """DataReader is deployed to queue encoded str from `LMDB`_.
@@ -43,6 +47,16 @@ class DataReader(Process):
             The number of chunks to split. Default is ``2048``.
         chunk_size : int
             The size(MB) of each chunk. Default is -1 (Refer ``num_chunks``).
+        read_batch : int
+            The number of records to read and queue together. Default is ``1`` (Disabled).
+        shuffle_mode : str
+            The shuffle mode, ``chunk`` or ``index``. Default is ``chunk``.
+        shuffle_window : int
+            The number of records to read in the ascending keys for ``index``. Default is ``256``.
+        offset : int
+            The number of records to skip at the beginning. Default is ``0``.
+        consumed : list of int
+            The offsets of records consumed after ``offset`` to skip.
 
         """
         super(DataReader, self).__init__()
@@ -52,10 +66,19 @@ class DataReader(Process):
         self._use_instance_chunk = kwargs.get('instance_chunk', False)
         self._num_chunks = kwargs.get('num_chunks', 2048)
         self._chunk_size = kwargs.get('chunk_size', -1)
+        self._read_batch = kwargs.get('read_batch', 1)
+        self._shuffle_mode = kwargs.get('shuffle_mode', 'chunk')
+        self._shuffle_window = kwargs.get('shuffle_window', 256)
 
         self._part_idx, self._num_parts = 0, 1
         self._cur_idx, self._cur_chunk_idx = 0, 0
+        self._offset = kwargs.get('offset', 0)
+        self._skipped = set(kwargs.get('consumed', []))
+        self._epoch, self._seeking = -1, False
         self._random_seed = config.GetRandomSeed()
+        # all parts share the permutation of ``index`` shuffle
+        self._shuffle_seed = config.GetRandomSeed()
+        self._counter = StageCounter()
 
         self.Q_out = None
         self.daemon = True
@@ -71,6 +94,22 @@ class DataReader(Process):
         """
         return self._db.value()
 
+    def elements(self):
+        """Get the values of records in the current chunk, and step the cursor.
+
+        Returns
+        -------
+        list of str
+            The encoded str, at most ``read_batch``.
+
+        """
+        num_records = min(self._read_batch, self._end_idx - self._cur_idx)
+        elements = self._db.values(num_records, str(self._end_idx).zfill(self._zfill))
+        self._cur_idx += len(elements)
+        # the range is exhausted if stopping at the metadata
+        if len(elements) < num_records: self._cur_idx = self._end_idx
+        return elements
+
     def redirect(self, target_idx):
         """Redirect to the target position.
 
@@ -85,26 +124,29 @@ class DataReader(Process):
 
         Notes
         -----
-        The redirection reopens the ``LMDB``.
+        The redirection reopens the ``LMDB``, unless reading records in batches.
 
         You can drop caches by ``echo 3 > /proc/sys/vm/drop_caches``.
 
         This will disturb getting stuck when ``Database Size`` >> ``RAM Size``.
 
         """
-        self._db.close()
-        self._db.open(self._source)
         self._cur_idx = target_idx
+        if self._seeking: return
+        if self._read_batch == 1:
+            self._db.close()
+            self._db.open(self._source)
         self._db.set(str(self._cur_idx).zfill(self._zfill))
 
     def reset(self):
-        """Reset the cursor and environment.
+        """Reset the cursor and environment, i.e. start a new epoch.
 
         Returns
         -------
         None
 
         """
+        self._epoch += 1
         if self._multiple_nodes or self._use_shuffle:
             if self._use_shuffle: self._perm = npr.permutation(self._num_shuffle_parts)
             self._cur_chunk_idx = 0
@@ -149,6 +191,166 @@ class DataReader(Process):
                 self._end_idx = min(self._num_entries, self._end_idx)
             self.redirect(self._start_idx)
 
+    def seek(self, offset):
+        """Step the cursor by the records, without reading the values.
+
+        The chunk permutations are drawn in the same order as reading,
+        which makes the cursor exactly the same as having read the records.
+
+        Parameters
+        ----------
+        offset : int
+            The number of records.
+
+        Returns
+        -------
+        None
+
+        """
+        if offset == 0: return
+        if self._use_shuffle and self._shuffle_mode == 'index':
+            part_size = len(range(self._part_idx, len(self._index), self._num_parts))
+            self._epoch, self._cur_idx = offset // part_size, offset % part_size
+            self._part = npr.RandomState(self._shuffle_seed + self._epoch).permutation(
+                len(self._index))[self._part_idx :: self._num_parts]
+            return
+        self._seeking = True
+        while offset > 0:
+            num_records = min(offset, self._end_idx - self._cur_idx)
+            self._cur_idx += num_records
+            offset -= num_records
+            if self._cur_idx >= self._end_idx:
+                if self._multiple_nodes or \
+                    self._use_shuffle: self.next_chunk()
+                else: self.reset()
+        self._seeking = False
+        self.redirect(self._cur_idx)
+
+    def tag(self, elements, epoch):
+        """Tag the elements with the part, offset and epoch.
+
+        The consumed records to skip are removed.
+
+        Parameters
+        ----------
+        elements : list of str
+            The encoded str.
+        epoch : int
+            The epoch of elements.
+
+        Returns
+        -------
+        list of tuple
+            The tagged elements.
+
+        """
+        tagged = []
+        for element in elements:
+            if self._offset in self._skipped:
+                self._skipped.remove(self._offset)
+            else:
+                tagged.append(((self._part_idx, self._offset, epoch), element))
+            self._offset += 1
+        return tagged
+
+    def emit(self, elements, latency):
+        """Queue the tagged elements.
+
+        Parameters
+        ----------
+        elements : list of tuple
+            The tagged elements.
+        latency : float
+            The latency(Seconds) of reading each element.
+
+        Returns
+        -------
+        None
+
+        """
+        for i in range(0, len(elements), self._read_batch):
+            self._counter.record(latency)
+            if self._read_batch > 1:
+                # ship the records as one message
+                self._counter.put(self.Q_out, elements[i : i + self._read_batch],
+                    len(elements[i : i + self._read_batch]))
+            else:
+                self._counter.put(self.Q_out, elements[i])
+
+    def load_index(self):
+        """Load the key index of database, which is built and cached if missing.
+
+        The index is cached as ``index.npy`` next to the database.
+
+        Returns
+        -------
+        numpy.ndarray
+            The keys in the ascending order.
+
+        """
+        index_file = os.path.join(self._source, 'index.npy')
+        data_file = os.path.join(self._source, 'data.mdb')
+        if os.path.exists(index_file) and \
+                os.path.getmtime(index_file) >= os.path.getmtime(data_file):
+            return np.load(index_file)
+        index = np.array(self._db.keys())
+        try:
+            # write to a temporary file, then rename it atomically,
+            # as other readers may build the index simultaneously
+            temp_file = '{}.{}.npy'.format(index_file[:-4], os.getpid())
+            np.save(temp_file, index)
+            os.rename(temp_file, index_file)
+        except (IOError, OSError):
+            # the directory of database is read-only
+            pass
+        return index
+
+    def next_window(self):
+        """Get the values of next window in the ``index`` shuffle.
+
+        Each epoch permutes all the keys with a shared seed,
+        and takes the records of this part by stride.
+
+        The keys of a window are sorted to read in the page locality,
+        while the values are returned in the permuted order.
+
+        Returns
+        -------
+        list of str
+            The encoded str.
+
+        """
+        if self._cur_idx >= len(self._part):
+            self._epoch += 1
+            self._cur_idx = 0
+            self._part = npr.RandomState(self._shuffle_seed + self._epoch).permutation(
+                len(self._index))[self._part_idx :: self._num_parts]
+        indices = self._part[self._cur_idx : self._cur_idx + self._shuffle_window]
+        self._cur_idx += len(indices)
+        order = np.argsort(indices)
+        values = self._db.getmulti(self._index[indices[order]])
+        elements = [None] * len(values)
+        for i, j in enumerate(order): elements[j] = values[i]
+        return elements
+
+    def run_index(self):
+        """Run the loop of ``index`` shuffle.
+
+        Returns
+        -------
+        None
+
+        """
+        self._index = self.load_index()
+        self._cur_idx, self._part = 0, []
+        self.seek(self._offset)
+        self._counter.start()
+        while True:
+            tic = time.time()
+            elements = self.next_window()
+            latency = (time.time() - tic) / max(len(elements), 1)
+            self.emit(self.tag(elements, self._epoch), latency)
+
     def run(self):
         """Start the process.
 
@@ -165,8 +367,14 @@ class DataReader(Process):
         self._db.open(self._source)
         self._zfill = self._db.zfill()
         self._num_entries = self._db.num_entries()
+        # exclude the metadata keys (``size``, ``zfill``)
+        for key in ('size', 'zfill'):
+            if self._db.get(key) is not None: self._num_entries -= 1
         self._epoch_size = int(self._num_entries/ self._num_parts + 1)
 
+        if self._use_shuffle and self._shuffle_mode == 'index':
+            return self.run_index()
+
         if self._use_shuffle:
             if self._chunk_size == 1:
                 # each chunk has at most 1 record [For Fully Shuffle]
@@ -198,12 +406,20 @@ class DataReader(Process):
 
         # init env
         self.reset()
+        self.seek(self._offset)
 
         # run
+        self._counter.start()
         while True:
-            self.Q_out.put(self.element())
-            self.next_record()
+            tic, epoch = time.time(), self._epoch
+            if self._read_batch > 1:
+                elements = self.elements()
+            else:
+                elements = [self.element()]
+                self.next_record()
             if self._cur_idx >= self._end_idx:
                 if self._multiple_nodes or \
                     self._use_shuffle: self.next_chunk()
-                else: self.reset()
\ No newline at end of file
+                else: self.reset()
+            latency = (time.time() - tic) / max(len(elements), 1)
+            self.emit(self.tag(elements, epoch), latency)
\ No newline at end of file
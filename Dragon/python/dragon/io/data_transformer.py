@@ -14,12 +14,14 @@ from __future__ import division
 from __future__ import print_function
 
 import sys
+import time
 import numpy as np
 import numpy.random as npr
-from multiprocessing import Process
+from multiprocessing import Process, Event
 
 import dragon.config as config
 import dragon.vm.caffe.proto.caffe_pb2 as pb
+from .stage_counter import StageCounter
 
 try:
     import cv2
@@ -32,6 +34,22 @@ except ImportError as e:
     print("Failed to import PIL. \nIt's OK if disabling color augmentation.".format(str(e)))
 
 
+def _luminance(ims):
+    # ITU-R 601-2 luma transform, the same as ``PIL.Image.convert('L')``
+    # all the intermediate integers are exact in float32
+    if ims.shape[3] == 1: return ims.copy()
+    luma = np.dot(ims.reshape((-1, 3)), np.array([19595, 38470, 7471], dtype=np.float32))
+    luma += 0x8000; luma *= 1.0 / 65536
+    return np.floor(luma, out=luma).reshape(ims.shape[:3] + (1,))
+
+
+def _blend(degenerate, ims, factor):
+    # interpolate in place, the same as ``PIL.Image.blend``
+    ims -= degenerate; ims *= factor; ims += degenerate
+    np.clip(ims, 0, 255, out=ims)
+    np.floor(ims, out=ims)
+
+
 class DataTransformer(Process):
     """DataTransformer is deployed to queue transformed images from `DataReader`_.
 
@@ -61,6 +79,8 @@ class DataTransformer(Process):
             Set to duplicate channels for gray. Default is ``False``.
         phase : str
             The phase of this operator, ``TRAIN`` or ``TEST``. Default is ``TRAIN``.
+        transform_batch : int
+            The number of images to transform together. Default is ``1`` (Disabled).
 
         """
         super(DataTransformer, self).__init__()
@@ -73,12 +93,22 @@ class DataTransformer(Process):
         self._max_random_scale = kwargs.get('max_random_scale', 1.0)
         self._force_color = kwargs.get('force_color', False)
         self._phase = kwargs.get('phase', 'TRAIN')
+        self._transform_batch = kwargs.get('transform_batch', 1)
         self._random_seed = config.GetRandomSeed()
+        # the random parameters are drawn from a local generator,
+        # which leaves the global state of numpy untouched
+        self._rng = npr.RandomState(self._random_seed)
+        # the generator is seeded by the step of each record,
+        # and the outputs are tagged with the step of this worker
+        self._rng_step, self._worker_idx = 0, 0
+        self._counter = StageCounter()
+        self._retired = Event()
+        self._pending = []
         self.Q_in = self.Q_out = None
         self.daemon = True
 
-    def get(self, serialized):
-        """Return image and labels from a serialized str.
+    def decode(self, serialized):
+        """Return the decoded image and labels from a serialized str.
 
         Parameters
         ----------
@@ -91,7 +121,6 @@ class DataTransformer(Process):
             The tuple image and labels.
 
         """
-        # decode
         datum = pb.Datum()
         datum.ParseFromString(serialized)
         im = np.fromstring(datum.data, np.uint8)
@@ -100,8 +129,27 @@ class DataTransformer(Process):
         else:
             im = im.reshape((datum.height, datum.width, datum.channels))
 
-        # random scale
-        random_scale = npr.uniform() * (
+        labels = []
+        if len(datum.labels) > 0: labels.extend(datum.labels)
+        else: labels.append(datum.label)
+
+        return im, labels
+
+    def random_scale(self, im):
+        """Return the image resized by a random scale.
+
+        Parameters
+        ----------
+        im : numpy.ndarray
+            The image.
+
+        Returns
+        -------
+        numpy.ndarray
+            The resized image.
+
+        """
+        random_scale = self._rng.uniform() * (
             self._max_random_scale - self._min_random_scale) \
                 + self._min_random_scale
         if random_scale != 1.0:
@@ -117,12 +165,43 @@ class DataTransformer(Process):
                 im = PIL.Image.fromarray(im)
                 im = im.resize(new_shape, PIL.Image.BILINEAR)
                 im = np.array(im)
+        return im
+
+    def _reseed(self):
+        # the state before transforming a record is reproduced by its step,
+        # which is much cheaper to carry along than the state itself
+        self._rng.seed((self._random_seed, self._rng_step))
+        self._rng_step += 1
+
+    def get(self, serialized):
+        """Return image and labels from a serialized str.
+
+        Parameters
+        ----------
+        serialized : str
+            The protobuf serialized str.
+
+        Returns
+        -------
+        tuple
+            The tuple image and labels.
+
+        """
+        self._reseed()
+
+        # decode
+        tic = time.time()
+        im, labels = self.decode(serialized)
+        self._counter.record(time.time() - tic)
+
+        # random scale
+        im = self.random_scale(im)
 
         # random crop
         if self._crop_size > 0:
             if self._phase == 'TRAIN':
-                h_off = npr.randint(im.shape[0] - self._crop_size + 1)
-                w_off = npr.randint(im.shape[1] - self._crop_size + 1)
+                h_off = self._rng.randint(im.shape[0] - self._crop_size + 1)
+                w_off = self._rng.randint(im.shape[1] - self._crop_size + 1)
             else:
                 h_off = int((im.shape[0] - self._crop_size) / 2)
                 w_off = int((im.shape[1] - self._crop_size) / 2)
@@ -131,7 +210,7 @@ class DataTransformer(Process):
 
         # random mirror
         if self._mirror:
-            if npr.randint(0, 2) > 0:
+            if self._rng.randint(0, 2) > 0:
                 im = im[:, ::-1, :]
 
         # gray transformation
@@ -143,9 +222,9 @@ class DataTransformer(Process):
         # color augmentation
         if self._color_aug:
             im = PIL.Image.fromarray(im)
-            delta_brightness = npr.uniform(-0.4, 0.4) + 1.0
-            delta_contrast = npr.uniform(-0.4, 0.4) + 1.0
-            delta_saturation = npr.uniform(-0.4, 0.4) + 1.0
+            delta_brightness = self._rng.uniform(-0.4, 0.4) + 1.0
+            delta_contrast = self._rng.uniform(-0.4, 0.4) + 1.0
+            delta_saturation = self._rng.uniform(-0.4, 0.4) + 1.0
             im = PIL.ImageEnhance.Brightness(im)
             im = im.enhance(delta_brightness)
             im = PIL.ImageEnhance.Contrast(im)
@@ -164,13 +243,134 @@ class DataTransformer(Process):
                     self._padding : self._padding + im.shape[1], :] = im
             im = pad_img
 
-        # labels
-        labels = []
-        if len(datum.labels) > 0: labels.extend(datum.labels)
-        else: labels.append(datum.label)
-
         return im, labels
 
+    def get_batch(self, serialized):
+        """Return images and labels from a batch of serialized str.
+
+        The random parameters are drawn in the same order as ``get()``,
+        the cropping and mirroring are taken as views of each image,
+        and the remaining transformations run on the stacked images.
+
+        Parameters
+        ----------
+        serialized : list of str
+            The protobuf serialized str.
+
+        Returns
+        -------
+        tuple
+            The images and labels.
+
+        """
+        ims, labels, deltas = [], [], []
+        for element in serialized:
+            self._reseed()
+            tic = time.time()
+            im, label = self.decode(element)
+            self._counter.record(time.time() - tic)
+            im = self.random_scale(im)
+
+            # random crop
+            if self._crop_size > 0:
+                if self._phase == 'TRAIN':
+                    h_off = self._rng.randint(im.shape[0] - self._crop_size + 1)
+                    w_off = self._rng.randint(im.shape[1] - self._crop_size + 1)
+                else:
+                    h_off = int((im.shape[0] - self._crop_size) / 2)
+                    w_off = int((im.shape[1] - self._crop_size) / 2)
+                im = im[h_off : h_off + self._crop_size,
+                        w_off : w_off + self._crop_size, :]
+
+            # random mirror
+            if self._mirror:
+                if self._rng.randint(0, 2) > 0:
+                    im = im[:, ::-1, :]
+
+            # color factors
+            if self._color_aug:
+                deltas.append([self._rng.uniform(-0.4, 0.4) + 1.0 for i in range(3)])
+
+            ims.append(im); labels.append(label)
+
+        if len(set([im.shape for im in ims])) > 1:
+            # fall back to transform the images one by one
+            return [self.transform(ims[ix : ix + 1], deltas[ix : ix + 1])[0]
+                for ix in range(len(ims))], labels
+
+        return self.transform(ims, deltas), labels
+
+    def transform(self, ims, deltas):
+        """Stack the images and apply the remaining transformations.
+
+        Parameters
+        ----------
+        ims : list of numpy.ndarray
+            The ``HWC`` images with the same shape.
+        deltas : list of list
+            The brightness, contrast and saturation factors of each image.
+
+        Returns
+        -------
+        numpy.ndarray
+            The ``NHWC`` images.
+
+        """
+        height, width, channels = ims[0].shape
+
+        # gray transformation
+        if self._force_color:
+            # duplicate to 3 channels by broadcasting
+            if channels == 1: channels = 3
+
+        # color augmentation
+        if self._color_aug:
+            stacked = np.empty((len(ims), height, width, channels), dtype=np.float32)
+            for ix, im in enumerate(ims): stacked[ix] = im
+            factors = np.array(deltas, dtype=np.float32).reshape((-1, 1, 1, 1, 3))
+            for ix in range(0, len(ims), 4):
+                # distort a few images at a time to stay in the cache
+                chunk, factor = stacked[ix : ix + 4], factors[ix : ix + 4]
+                # brightness: blend with the black
+                _blend(0, chunk, factor[..., 0])
+                # contrast: blend with the mean of luminance
+                mean = np.floor(_luminance(chunk).mean(axis=(1, 2, 3), dtype=np.float64) + 0.5)
+                _blend(mean.astype(np.float32).reshape((-1, 1, 1, 1)), chunk, factor[..., 1])
+                # saturation: blend with the luminance
+                _blend(_luminance(chunk), chunk, factor[..., 2])
+            ims = stacked
+
+        # padding
+        outputs = np.empty((len(ims),
+                            height + 2 * self._padding,
+                            width + 2 * self._padding,
+                            channels), dtype=np.uint8)
+        if self._padding > 0: outputs.fill(self._fill_value)
+        for ix in range(len(ims)):
+            outputs[ix, self._padding : self._padding + height,
+                        self._padding : self._padding + width, :] = ims[ix]
+
+        return outputs
+
+    def _next_serialized(self):
+        # the records queued together by DataReader are unpacked locally
+        # each record is tagged as (part, offset, epoch) to track the consumption
+        if len(self._pending) == 0:
+            element = self._counter.get(self.Q_in)
+            if not isinstance(element, list): return element
+            self._pending = element[::-1]
+        return self._pending.pop()
+
+    def retire(self):
+        """Stop the process after finishing the current item.
+
+        Returns
+        -------
+        None
+
+        """
+        self._retired.set()
+
     def run(self):
         """Start the process.
 
@@ -179,7 +379,22 @@ class DataTransformer(Process):
         None
 
         """
-        npr.seed(self._random_seed)
-        while True:
-            serialized = self.Q_in.get()
-            self.Q_out.put(self.get(serialized))
\ No newline at end of file
+        self._counter.start()
+        # finish the pending records before retiring
+        # the step before transforming is carried along the tags,
+        # which resumes the transforms from the next records
+        while not self._retired.is_set() or len(self._pending) > 0:
+            step = self._rng_step
+            if self._transform_batch > 1:
+                tags, serialized = zip(*[self._next_serialized()
+                    for i in range(self._transform_batch)])
+                ims, labels = self.get_batch(serialized)
+                for ix in range(len(labels)):
+                    rng = (self._worker_idx, step + ix)
+                    self._counter.put(self.Q_out, (ims[ix], labels[ix], tags[ix] + (rng,)))
+            else:
+                tag, serialized = self._next_serialized()
+                im, labels = self.get(serialized)
+                rng = (self._worker_idx, step)
+                self._counter.put(self.Q_out, (im, labels, tag + (rng,)))
+        self._counter.stop()
\ No newline at end of file
@@ -0,0 +1,201 @@
+# ------------------------------------------------------------
+# Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+#
+# Licensed under the BSD 2-Clause License.
+# You should have received a copy of the BSD 2-Clause License
+# along with the software. If not, See,
+#
+#      <https://opensource.org/licenses/BSD-2-Clause>
+#
+# ------------------------------------------------------------
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import ctypes
+import numpy as np
+from multiprocessing import Queue
+from multiprocessing.sharedctypes import RawArray
+
+
+# The alignment(Bytes) of each array in a slot
+_ALIGNMENT = 64
+
+# The tags to mark an element of the transported tuple
+_ARRAY, _OBJECT = 0, 1
+
+
+def _aligned(nbytes):
+    return (nbytes + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+class SharedBuffer(object):
+    """SharedBuffer is a ring-buffer transport on the shared memory.
+
+    It holds ``capacity`` pre-allocated slots, and only passes
+    the slot indices and array headers through the queues.
+
+    The ``ndarray`` elements of a item are copied into a free slot,
+    while the others are transported as normal pickled objects.
+
+    Items that exceed the ``slot_size`` fall back to the pickled path.
+
+    """
+    def __init__(self, capacity, slot_size):
+        """Construct a ``SharedBuffer``.
+
+        Parameters
+        ----------
+        capacity : int
+            The number of slots.
+        slot_size : int
+            The size(Bytes) of each slot.
+
+        """
+        self._capacity = capacity
+        self._slot_size = _aligned(slot_size)
+        self._storage = RawArray(ctypes.c_uint8,
+            self._capacity * self._slot_size)
+        self.Q_free = Queue(self._capacity)
+        self.Q_index = Queue(self._capacity)
+        for slot in range(self._capacity):
+            self.Q_free.put(slot)
+        self._array, self._holding, self._acquired = None, None, None
+
+    @classmethod
+    def from_example(cls, capacity, example):
+        """Construct a ``SharedBuffer`` fitting the example item.
+
+        Parameters
+        ----------
+        capacity : int
+            The number of slots.
+        example : tuple
+            The example item to infer the size of slots.
+
+        Returns
+        -------
+        SharedBuffer
+            The buffer.
+
+        """
+        slot_size = sum([_aligned(element.nbytes) for element in example
+            if isinstance(element, np.ndarray)])
+        return cls(capacity, max(slot_size, _ALIGNMENT))
+
+    def __getstate__(self):
+        # The cached array view is rebuilt in the child process
+        state = self.__dict__.copy()
+        state['_array'] = None
+        return state
+
+    def _view(self, offset, shape, dtype):
+        if self._array is None:
+            self._array = np.frombuffer(self._storage, dtype=np.uint8)
+        dtype = np.dtype(dtype)
+        count = int(np.prod(shape)) * dtype.itemsize
+        return self._array[offset : offset + count].view(dtype).reshape(shape)
+
+    def acquire(self, specs):
+        """Acquire a free slot to write the arrays in place.
+
+        The views should be passed to the next ``put()``.
+
+        Parameters
+        ----------
+        specs : list of tuple
+            The shape and data type of each array.
+
+        Returns
+        -------
+        tuple or None
+            The writable views, ``None`` if exceeding the slot.
+
+        """
+        nbytes = sum([_aligned(int(np.prod(shape)) * np.dtype(dtype).itemsize)
+            for shape, dtype in specs])
+        if nbytes > self._slot_size: return None
+        slot = self.Q_free.get()
+        offset, views = slot * self._slot_size, []
+        for shape, dtype in specs:
+            views.append(self._view(offset, shape, dtype))
+            offset += _aligned(views[-1].nbytes)
+        self._acquired = (slot, views)
+        return tuple(views)
+
+    def put(self, item):
+        """Put a item into the buffer.
+
+        Parameters
+        ----------
+        item : tuple
+            The item to put.
+
+        Returns
+        -------
+        None
+
+        """
+        if self._acquired is not None:
+            slot, views = self._acquired
+            self._acquired = None
+        else:
+            nbytes = sum([_aligned(element.nbytes) for element in item
+                if isinstance(element, np.ndarray)])
+            if nbytes > self._slot_size:
+                self.Q_index.put((-1, item))
+                return
+            slot, views = self.Q_free.get(), []
+        offset, headers = slot * self._slot_size, []
+        for element in item:
+            if isinstance(element, np.ndarray):
+                if not any([element is view for view in views]):
+                    self._view(offset, element.shape, element.dtype)[...] = element
+                headers.append((_ARRAY, (offset, element.shape, element.dtype.str)))
+                offset += _aligned(element.nbytes)
+            else:
+                headers.append((_OBJECT, element))
+        self.Q_index.put((slot, headers))
+
+    def get(self):
+        """Get a item from the buffer.
+
+        The returned arrays are views on the shared memory,
+        which stay valid until the next ``get()`` of this process.
+
+        Returns
+        -------
+        tuple
+            The item.
+
+        """
+        self.release()
+        slot, headers = self.Q_index.get()
+        if slot < 0: return headers
+        self._holding = slot
+        return tuple([self._view(*element) if tag == _ARRAY
+            else element for tag, element in headers])
+
+    def release(self):
+        """Release the slot held by the last ``get()``.
+
+        Returns
+        -------
+        None
+
+        """
+        if self._holding is not None:
+            self.Q_free.put(self._holding)
+            self._holding = None
+
+    def qsize(self):
+        """Return the number of ready items.
+
+        Returns
+        -------
+        int
+            The number of items.
+
+        """
+        return self.Q_index.qsize()
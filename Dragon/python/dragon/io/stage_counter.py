@@ -0,0 +1,221 @@
+# ------------------------------------------------------------
+# Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+#
+# Licensed under the BSD 2-Clause License.
+# You should have received a copy of the BSD 2-Clause License
+# along with the software. If not, See,
+#
+#      <https://opensource.org/licenses/BSD-2-Clause>
+#
+# ------------------------------------------------------------
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import math
+import time
+import ctypes
+import numpy as np
+from multiprocessing.sharedctypes import RawArray
+
+
+# The number of latency bins, i.e. [2^i, 2^(i+1)) microseconds
+_NUM_LATENCY_BINS = 24
+
+# The number of queue depth bins, i.e. [i/N, (i+1)/N) of the capacity
+_NUM_DEPTH_BINS = 10
+
+# The layout of counters
+_ITEMS, _GET_WAIT, _PUT_WAIT, _START, _STOP = range(5)
+_LATENCY = 5
+_DEPTH = _LATENCY + _NUM_LATENCY_BINS
+_SIZE = _DEPTH + _NUM_DEPTH_BINS
+
+
+class StageCounter(object):
+    """StageCounter accumulates the timings of a worker on the shared memory.
+
+    The worker records the time blocked on ``get()`` and ``put()``,
+    the latency of processing each item and the depth of its output queue,
+    which can be aggregated in the parent process without any messages.
+
+    """
+    def __init__(self):
+        """Construct a ``StageCounter``.
+
+        The ``capacity`` of output queue should be set to collect the depths.
+
+        """
+        self._storage = RawArray(ctypes.c_double, _SIZE)
+        self._array, self.capacity = None, None
+
+    def __getstate__(self):
+        # The cached array view is rebuilt in the child process
+        state = self.__dict__.copy()
+        state['_array'] = None
+        return state
+
+    @property
+    def array(self):
+        """Return the counters as a float64 array.
+
+        Returns
+        -------
+        numpy.ndarray
+            The counters.
+
+        """
+        if self._array is None:
+            self._array = np.frombuffer(self._storage, dtype=np.float64)
+        return self._array
+
+    @property
+    def get_wait(self):
+        """Return the time(Seconds) blocked on ``get()``.
+
+        Returns
+        -------
+        float
+            The blocked time.
+
+        """
+        return self.array[_GET_WAIT]
+
+    def start(self):
+        """Mark the worker as started.
+
+        Returns
+        -------
+        None
+
+        """
+        self.array[_START] = time.time()
+
+    def stop(self):
+        """Mark the worker as stopped.
+
+        Returns
+        -------
+        None
+
+        """
+        self.array[_STOP] = time.time()
+
+    def get(self, Q):
+        """Get a item from the queue and record the blocked time.
+
+        Parameters
+        ----------
+        Q : Queue or SharedBuffer
+            The input queue.
+
+        Returns
+        -------
+        object
+            The item.
+
+        """
+        tic = time.time()
+        item = Q.get()
+        self.array[_GET_WAIT] += time.time() - tic
+        return item
+
+    def put(self, Q, item, num_items=1):
+        """Put a item into the queue and record the blocked time.
+
+        Parameters
+        ----------
+        Q : Queue or SharedBuffer
+            The output queue.
+        item : object
+            The item.
+        num_items : int
+            The number of items packed in this item.
+
+        Returns
+        -------
+        None
+
+        """
+        if self.capacity is not None:
+            try:
+                depth = float(Q.qsize()) / self.capacity
+                self.array[_DEPTH + min(int(depth * _NUM_DEPTH_BINS),
+                    _NUM_DEPTH_BINS - 1)] += 1
+            except NotImplementedError:
+                # ``Queue.qsize()`` is broken on Mac OS X
+                self.capacity = None
+        tic = time.time()
+        Q.put(item)
+        self.array[_PUT_WAIT] += time.time() - tic
+        self.count(num_items)
+
+    def count(self, num_items=1):
+        """Count the processed items.
+
+        Parameters
+        ----------
+        num_items : int
+            The number of items.
+
+        Returns
+        -------
+        None
+
+        """
+        self.array[_ITEMS] += num_items
+
+    def record(self, latency):
+        """Record the latency of processing a item.
+
+        Parameters
+        ----------
+        latency : float
+            The latency(Seconds).
+
+        Returns
+        -------
+        None
+
+        """
+        ix = int(math.log(max(latency * 1e6, 1.), 2))
+        self.array[_LATENCY + min(ix, _NUM_LATENCY_BINS - 1)] += 1
+
+    @staticmethod
+    def aggregate(counters):
+        """Aggregate the counters of workers into the statistics of a stage.
+
+        Parameters
+        ----------
+        counters : list of StageCounter
+            The counters.
+
+        Returns
+        -------
+        dict
+            The statistics.
+
+        """
+        now, elapsed, total = time.time(), 0., np.zeros(_SIZE)
+        for counter in counters:
+            array = counter.array.copy()
+            if array[_START] == 0: continue
+            elapsed += (array[_STOP] if array[_STOP] > 0 else now) - array[_START]
+            total += array
+        stats = {'items': int(total[_ITEMS])}
+        elapsed = max(elapsed, 1e-8)
+        stats['get_wait'] = float(total[_GET_WAIT] / elapsed)
+        stats['put_wait'] = float(total[_PUT_WAIT] / elapsed)
+        stats['busy'] = max(1. - stats['get_wait'] - stats['put_wait'], 0.)
+        latency = total[_LATENCY : _DEPTH]
+        if latency.sum() > 0:
+            cdf = np.cumsum(latency) / latency.sum()
+            for q in (50, 90, 99):
+                # report the upper edge of bins in milliseconds
+                ix = int(np.searchsorted(cdf, q / 100.))
+                stats['latency_p{}'.format(q)] = 2. ** (ix + 1) / 1e3
+        depth = total[_DEPTH : _SIZE]
+        if depth.sum() > 0:
+            stats['depth'] = (depth / depth.sum()).tolist()
+        return stats
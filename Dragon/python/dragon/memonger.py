@@ -44,6 +44,51 @@ def IsGradsShared():
     return option['share_grads']
 
 
+def PlanMemory(enabled=True):
+    """Enable the memory planning globally.
+
+    The lifetimes of tensors are collected from the first run of a graph,
+    then the intermediate tensors are placed into an arena by the best-fit offsets.
+
+    Only the CPU graphs created later are planned,
+    and the intermediate tensors should not be fetched after running.
+
+    Parameters
+    ----------
+    enabled : boolean
+        Whether to plan the memory.
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    >>> import dragon.memonger as opt
+    >>> opt.PlanMemory()
+
+    References
+    ----------
+    `workspace.GetMemoryPlan(*args, **kwargs)`_ - How to query the planned memory.
+
+    """
+    from dragon.config import option
+    option['plan_memory'] = enabled
+
+
+def IsMemoryPlanned():
+    """Is the memory planned?
+
+    Returns
+    -------
+    boolean
+        ``True`` if planning the memory else ``False``.
+
+    """
+    from dragon.config import option
+    return option['plan_memory']
+
+
 def Drop(op_func, *args, **kwargs):
     """Drop(Share) the inputs for outputs.
 
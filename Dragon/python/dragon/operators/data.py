@@ -33,6 +33,10 @@ def LMDBData(**kwargs):
         The number of chunks to split. Default is ``2048``.
     chunk_size : int
         The size(MB) of each chunk. Default is -1 (Refer ``num_chunks``).
+    read_batch : int
+        The number of records to read and queue together. Default is ``1`` (Disabled).
+    shuffle_mode : str
+        The shuffle mode, ``chunk`` or ``index``. Default is ``chunk``.
     mean_values : list
         The mean value of each image channel.
     scale : float
@@ -59,6 +63,10 @@ def LMDBData(**kwargs):
         Whether to partition batch for parallelism. Default is ``False``.
     prefetch : int
         The prefetch count. Default is ``5``.
+    transport : str
+        The transport between stages, ``queue`` or ``shared_memory``.
+    state : dict
+        The state of iteration to resume, returned by ``DataBatch.state_dict()``.
 
     Returns
     -------
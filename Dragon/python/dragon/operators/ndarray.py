@@ -249,14 +249,18 @@ def Concat(inputs, axis=1, **kwargs):
 def Reduce(inputs, axis=-1, operation='NONE', keep_dims=False, **kwargs):
     """Reduce interface of NDArray.
 
+    The multiple axes are reduced in a single pass.
+
+    The gradients of ``MAX`` and ``MIN`` are shared by the elements equal to the output.
+
     Parameters
     ----------
     input : Tensor
         The input tensor.
-    axis : int
-        The axis to reduce. Default is ``-1`` (Compute along all axes).
+    axis : int or list of int
+        The axis or axes to reduce. Default is ``-1`` (Compute along all axes).
     operation : str
-        The operation, ``SUM`` or ``MEAN``. Default is ``NONE`` (Unknown).
+        The operation, ``SUM``, ``MEAN``, ``MAX`` or ``MIN``. Default is ``NONE`` (Unknown).
     keep_dims : boolean
         Whether to keep dims after computing.
 
@@ -268,12 +272,21 @@ def Reduce(inputs, axis=-1, operation='NONE', keep_dims=False, **kwargs):
     """
     CheckInputs(inputs, 1)
     arguments = ParseArguments(locals())
+    if isinstance(axis, (list, tuple)):
+        arguments['axis'], arguments['axes'] = -1, list(axis)
 
     output = Tensor.CreateOperator(nout=1, op_type='Reduce', **arguments)
 
     if inputs.shape is not None:
         output.shape = inputs.shape[:]
-        if axis == -1:
+        if isinstance(axis, (list, tuple)):
+            axes = [i + len(output.shape) if i < 0 else i for i in axis]
+            if keep_dims:
+                for i in axes: output.shape[i] = 1
+            else:
+                output.shape = [dim for i, dim in enumerate(
+                    output.shape) if i not in axes]
+        elif axis == -1:
             if keep_dims:
                 for i in range(len(output.shape)):
                     output.shape[i] = 1
@@ -292,8 +305,8 @@ def Sum(inputs, axis=-1, keep_dims=False, **kwargs):
     ----------
     input : Tensor
         The input tensor.
-    axis : int
-        The axis to compute. Default is ``-1`` (Along all axes).
+    axis : int or list of int
+        The axis or axes to compute. Default is ``-1`` (Along all axes).
     keep_dims : boolean
         Whether to keep dims after computing.
 
@@ -317,8 +330,8 @@ def Mean(inputs, axis=-1, keep_dims=False, **kwargs):
     ----------
     input : Tensor
         The input tensor.
-    axis : int
-        The axis to compute. Default is ``-1`` (Along all axes).
+    axis : int or list of int
+        The axis or axes to compute. Default is ``-1`` (Along all axes).
     keep_dims : boolean
         Whether to keep dims after computing.
 
@@ -31,6 +31,11 @@ def Conv2d(inputs, num_output, kernel_size,
 
     Set ``padding`` to  **VALID** will use the value of ``pad``.
 
+    The ``3x3`` convolutions of ``stride=1``, ``dilation=1`` and ``group=1`` run with Winograd on CPU,
+    if the ``engine`` of ``dragon.device_scope`` is ``WINOGRAD``, or selected automatically for the large outputs.
+
+    Set the ``engine`` to ``IM2COL`` to disable it.
+
     Parameters
     ----------
     inputs : list of Tensor
@@ -63,7 +63,7 @@ class LMDB(object):
         self._total_size = 0
         self._buffer = []
 
-    def open(self, database_path, mode='r'):
+    def open(self, database_path, mode='r', map_size=None):
         """Open the database.
 
         Parameters
@@ -71,7 +71,9 @@ class LMDB(object):
         database_path : str
             The path of the LMDB database.
         mode : str
-            The mode. ``r`` or ``w``.
+            The mode. ``r``, ``w`` or ``a``.
+        map_size : int
+            The size(Bytes) of memory map for writing. Default is ``None`` (Doubled if full).
 
         Returns
         -------
@@ -84,8 +86,13 @@ class LMDB(object):
             self._total_size = self.env.info()['map_size']
         if mode == 'w':
             assert not os.path.isdir(database_path), 'database path is not invalid'
-            self.env = lmdb.open(database_path, writemap=True)
-        self.txn = self.env.begin(write=(mode == 'w'))
+        if mode == 'a':
+            assert os.path.isdir(database_path), 'database path is not exist'
+        if mode in ('w', 'a'):
+            # the existing data will be kept if the map size is smaller
+            self.env = lmdb.open(database_path, writemap=True,
+                map_size=map_size if map_size else 10485760)
+        self.txn = self.env.begin(write=(mode != 'r'))
         self.cursor = self.txn.cursor()
 
     def zfill(self):
@@ -191,9 +198,70 @@ class LMDB(object):
         """
         if not self.cursor.next():
             self.cursor.first()
-        if self.key() == 'size' or self.key() == 'zfill':
+        if self.key() in (b'size', b'zfill'):
             self.next()
 
+    def values(self, num_values, end_key):
+        """Get the values from the current cursor, and step it.
+
+        The iteration stops before ``end_key``, i.e. the keys of
+        metadata (``size``, ``zfill``) are skipped by the range.
+
+        Parameters
+        ----------
+        num_values : int
+            The max number of values.
+        end_key : str
+            The key to stop at.
+
+        Returns
+        -------
+        list of str
+            The values.
+
+        """
+        values, end_key = [], wrapper_str(end_key)
+        for key, value in self.cursor.iternext():
+            if key >= end_key: break
+            values.append(value)
+            if len(values) == num_values:
+                self.cursor.next()
+                break
+        return values
+
+    def keys(self):
+        """Get all the keys except the metadata.
+
+        Returns
+        -------
+        list of str
+            The keys in the ascending order.
+
+        """
+        cursor = self.txn.cursor()
+        return [key for key in cursor.iternext(keys=True, values=False)
+                    if key not in (b'size', b'zfill')]
+
+    def getmulti(self, keys):
+        """Get the values of the specific keys.
+
+        The keys are expected in the ascending order,
+        so that the cursor seeks forward the adjacent pages.
+
+        Parameters
+        ----------
+        keys : list of str
+            The keys.
+
+        Returns
+        -------
+        list of str
+            The values.
+
+        """
+        cursor = self.txn.cursor()
+        return [cursor.get(key) for key in keys]
+
     def key(self):
         """Get the key under the current cursor.
 
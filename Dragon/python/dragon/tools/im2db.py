@@ -12,11 +12,14 @@
 import os
 import sys
 import time
+import random
 import shutil
 import argparse
 import cv2
+from itertools import chain
+from multiprocessing import Pool, cpu_count
 
-from dragon.tools.db import LMDB
+from dragon.tools.db import LMDB, wrapper_str
 from dragon.vm.caffe.proto import caffe_pb2
 
 
@@ -37,16 +40,77 @@ def resize_image(im, resize):
 
     """
     if im.shape[0] > im.shape[1]:
-        newsize = (resize, im.shape[0] * resize / im.shape[1])
+        newsize = (resize, im.shape[0] * resize // im.shape[1])
     else:
-        newsize = (im.shape[1] * resize / im.shape[0], resize)
+        newsize = (im.shape[1] * resize // im.shape[0], resize)
     im = cv2.resize(im, newsize)
     return im
 
 
+def encode_image(args):
+    """Read, resize and encode a image into the serialized datum.
+
+    Parameters
+    ----------
+    args : tuple
+        The path, label, root folder, resize and JPEG quality.
+
+    Returns
+    -------
+    str
+        The serialized datum.
+
+    """
+    path, label, root, resize, quality = args
+    img = cv2.imread(os.path.join(root, path))
+    if img is None:
+        raise ValueError('Failed to read the image: {}'.format(path))
+    if resize > 0:
+        img = resize_image(img, resize)
+    result, imgencode = cv2.imencode('.jpg', img,
+        [int(cv2.IMWRITE_JPEG_QUALITY), quality])
+
+    datum = caffe_pb2.Datum()
+    datum.height, datum.width, datum.channels = img.shape
+    datum.label = int(label)
+    datum.encoded = True
+    datum.data = imgencode.tobytes()
+    return datum.SerializeToString()
+
+
+def record_size(serialized, key_size, page_size=4096):
+    """Return the bytes of a record stored in LMDB.
+
+    The large records are stored in the overflow pages,
+    see ``mdb_node_add`` of LMDB for details.
+
+    Parameters
+    ----------
+    serialized : str
+        The serialized datum.
+    key_size : int
+        The size of key.
+    page_size : int
+        The size of page. Default is ``4096``.
+
+    Returns
+    -------
+    int
+        The estimated bytes.
+
+    """
+    node_size = 8 + key_size + len(serialized)
+    if node_size < (page_size - 16) // 2: return node_size
+    num_pages = (15 + len(serialized)) // page_size + 1
+    return 16 + key_size + num_pages * page_size
+
+
 def make_db(args):
     """Make the sequential database for images.
 
+    The images are encoded by a pool of workers, and written by
+    the main process in the order of list file.
+
     Parameters
     ----------
     database : str
@@ -63,60 +127,92 @@ def make_db(args):
         JPEG quality for encoding, 1-100. Default is ``95``.
     shuffle : boolean
         Whether to randomize the order in list file.
+    seed : int or None
+        The random seed for shuffling, which is required to resume.
+    num_workers : int
+        The number of encoding workers. Default is the number of CPUs.
+    commit_size : int
+        The number of records in a write transaction. Default is ``10000``.
+    map_size : int
+        The size(MB) of memory map. Default is ``0`` (Estimate by samples).
+    resume : boolean
+        Whether to resume a interrupted building.
 
     """
     if os.path.isfile(args.list) is False:
         raise ValueError('the path of image list is invalid.')
-    if os.path.isdir(args.database) is True:
+    if os.path.isdir(args.database) is True and not args.resume:
         raise ValueError('the database is already exist or invalid.')
+    if args.resume and args.shuffle and args.seed is None:
+        raise ValueError('the seed is required to resume a shuffled database.')
 
     print('start time: ', time.strftime("%a, %d %b %Y %H:%M:%S", time.gmtime()))
 
-    db = LMDB(max_commit=10000)
-    db.open(args.database, mode='w')
-
-    total_line = sum(1 for line in open(args.list))
-    count = 0
-    zfill_flag = '{0:0%d}' % (args.zfill)
-
-    encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), args.quality]
-
-    start_time = time.time()
-
     with open(args.list, 'r') as input_file:
         records = input_file.readlines()
         if args.shuffle:
-            import random
-            random.shuffle(records)
-
-        for record in records:
+            random.Random(args.seed).shuffle(records)
+    total_line = len(records)
+    tasks = [(record.split()[0], record.split()[1], args.root,
+              args.resize, args.quality) for record in records]
+
+    # the records are committed in order, so the number
+    # of entries is exactly the count of finished records
+    count, resume = 0, args.resume and os.path.isdir(args.database)
+    if resume:
+        db = LMDB()
+        db.open(args.database)
+        count, finished = db.num_entries(), db.get('size') is not None
+        db.close()
+        if finished:
+            print('the database is already finished.')
+            return
+        print('resume from the record {0}.'.format(count))
+
+    pool = None
+    num_workers = args.num_workers if args.num_workers > 0 else cpu_count()
+    if num_workers > 1: pool = Pool(num_workers)
+    imap = pool.imap if pool is not None else map
+
+    try:
+        # pre-size the memory map to avoid doubling
+        # the samples are the next records, which will be written first
+        samples, map_size = [], args.map_size << 20
+        if map_size == 0:
+            samples = list(imap(encode_image, tasks[count: count + 100]))
+            average_size = float(sum([record_size(sample, args.zfill)
+                for sample in samples])) / max(len(samples), 1)
+            map_size = int(average_size * total_line * 1.2) + (64 << 20)
+
+        db = LMDB(max_commit=args.commit_size)
+        db.open(args.database, mode='a' if resume else 'w', map_size=map_size)
+        zfill_flag = '{0:0%d}' % (args.zfill)
+
+        start_time = last_time = time.time()
+        start_count = count
+
+        for serialized in chain(samples,
+                imap(encode_image, tasks[count + len(samples):])):
+            db.put(zfill_flag.format(count), serialized)
             count += 1
-            if count % 10000 == 0:
-                now_time = time.time()
-                print('{0} / {1} in {2:.2f} sec'.format(
-                    count, total_line, now_time - start_time))
+            if count % args.commit_size == 0:
                 db.commit()
-
-            record = record.split()
-            path = record[0]
-            label = record[1]
-
-            img = cv2.imread(os.path.join(args.root, path))
-            if args.resize > 0:
-                img = resize_image(img, args.resize)
-            result, imgencode = cv2.imencode('.jpg', img, encode_param)
-
-            datum = caffe_pb2.Datum()
-            datum.height, datum.width, datum.channels = img.shape
-            datum.label = int(label)
-            datum.encoded = True
-            datum.data = imgencode.tostring()
-            db.put(zfill_flag.format(count - 1), datum.SerializeToString())
+                now_time = time.time()
+                print('{0} / {1} in {2:.2f} sec, {3:.2f} images/sec, eta {4:.2f} sec'.format(
+                    count, total_line, now_time - start_time,
+                    args.commit_size / (now_time - last_time),
+                    (total_line - count) * (now_time - start_time) / (count - start_count)))
+                last_time = now_time
+    finally:
+        # the workers are idle if all the records are written
+        if pool is not None:
+            pool.terminate()
+            pool.join()
 
     now_time = time.time()
     print('{0} / {1} in {2:.2f} sec'.format(count, total_line, now_time - start_time))
-    db.put('size', str(count))
-    db.put('zfill', str(args.zfill))
+    db.put('size', wrapper_str(str(count)))
+    db.put('zfill', wrapper_str(str(args.zfill)))
     db.commit()
     db.close()
 
@@ -137,6 +233,12 @@ def parse_args():
     parser.add_argument('--resize', type=int, default=0, help='The size of the shortest edge.')
     parser.add_argument('--quality', type=int, default=95, help='JPEG quality for encoding, 1-100.')
     parser.add_argument('--shuffle', type=bool, default=True, help='Whether to randomize the order in list file.')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='The random seed for shuffling, which is required to resume.')
+    parser.add_argument('--num_workers', type=int, default=0, help='The number of encoding workers.')
+    parser.add_argument('--commit_size', type=int, default=10000, help='The number of records in a transaction.')
+    parser.add_argument('--map_size', type=int, default=0, help='The size(MB) of memory map.')
+    parser.add_argument('--resume', action='store_true', help='Whether to resume a interrupted building.')
 
     if len(sys.argv) < 4:
         parser.print_help()
@@ -0,0 +1,168 @@
+# ------------------------------------------------------------
+# Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+#
+# Licensed under the BSD 2-Clause License.
+# You should have received a copy of the BSD 2-Clause License
+# along with the software. If not, See,
+#
+#      <https://opensource.org/licenses/BSD-2-Clause>
+#
+# ------------------------------------------------------------
+
+"""The post-training quantization of the inference graphs.
+
+The inputs of ``Conv2d`` and ``InnerProduct`` are calibrated on the samples,
+then these ops are replaced by the int8 ops accumulating into int32 on CPU.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import copy
+import numpy as np
+
+import dragon.core.workspace as ws
+from dragon.core.utils import MakeArgument
+
+
+_QUANTIZED_TYPES = {
+    'Conv2d': 'QuantizedConv2d',
+    'InnerProduct': 'QuantizedInnerProduct',
+}
+
+
+def _get_arg(op, name, default):
+    for arg in op.arg:
+        if arg.name == name:
+            if arg.HasField('i'): return arg.i
+            if arg.HasField('s'): return arg.s
+    return default
+
+
+def _quantizable(meta_graph, op):
+    if op.type not in _QUANTIZED_TYPES: return False
+    # The int8 kernels are only available on CPU
+    device_option = op.device_option if op.HasField('device_option') \
+        else meta_graph.device_option
+    if device_option.device_type != 0: return False
+    if op.type == 'Conv2d' and _get_arg(op, 'group', 1) != 1: return False
+    return True
+
+
+def _rename(meta_graph):
+    meta_graph.name = 'Graph_' + str(ws.CURRENT_GRAPH_IDX)
+    ws.CURRENT_GRAPH_IDX += 1
+
+
+class Calibrator(object):
+    """Collect the ranges of inputs for the quantizable ops.
+
+    The ranges are observed by running a copy of graph,
+    which keeps the inputs of quantizable ops alive.
+
+    Examples
+    --------
+    >>> f = theano.function(outputs=y)
+    >>> calibrator = Calibrator(f.meta_graph)
+    >>> for batch in samples:
+    >>>     f(batch); calibrator.update()
+    >>> graph_def = Quantize(f.meta_graph, calibrator.ranges)
+
+    """
+    def __init__(self, meta_graph):
+        """Construct a ``Calibrator``.
+
+        Parameters
+        ----------
+        meta_graph : dragon_pb2.GraphDef
+            The definition of the inference graph.
+
+        Returns
+        -------
+        Calibrator
+            The calibrator.
+
+        """
+        self._ranges = {}
+        self._targets = []
+        for op in meta_graph.op:
+            if _quantizable(meta_graph, op) and \
+                    op.input[0] not in self._targets:
+                self._targets.append(op.input[0])
+        # Disable the optimizations which could overwrite the inputs
+        self._graph_def = copy.deepcopy(meta_graph)
+        _rename(self._graph_def)
+        args = [arg for arg in self._graph_def.arg if arg.name not in
+                ('optimization_level', 'memory_planning', 'fold_batch_norm')]
+        del self._graph_def.arg[:]
+        self._graph_def.arg.extend(args)
+        self._graph_def.arg.add().CopyFrom(MakeArgument('optimization_level', 1))
+        self._graph_def.target.extend(self._targets)
+        ws.CreateGraph(self._graph_def)
+
+    def update(self):
+        """Run on the fed inputs and update the ranges.
+
+        The inputs should be fed before, e.g., by calling the function.
+
+        Returns
+        -------
+        None
+
+        """
+        ws.RunGraph(self._graph_def.name, return_outputs=False)
+        for target in self._targets:
+            values = ws.FetchTensor(target)
+            lo, hi = float(values.min()), float(values.max())
+            if target in self._ranges:
+                lo = min(lo, self._ranges[target][0])
+                hi = max(hi, self._ranges[target][1])
+            self._ranges[target] = (lo, hi)
+
+    @property
+    def ranges(self):
+        """Return the observed ranges.
+
+        Returns
+        -------
+        dict
+            The ``(min, max)`` of each input.
+
+        """
+        return dict(self._ranges)
+
+
+def Quantize(meta_graph, ranges):
+    """Create a graph running the quantizable ops with int8.
+
+    The inputs are quantized asymmetrically by the calibrated ranges,
+    while the weights are quantized symmetrically for each output channel.
+
+    Parameters
+    ----------
+    meta_graph : dragon_pb2.GraphDef
+        The definition of the inference graph.
+    ranges : dict
+        The ``(min, max)`` of inputs. See ``Calibrator.ranges``.
+
+    Returns
+    -------
+    dragon_pb2.GraphDef
+        The definition of the quantized graph, which has been created.
+
+    """
+    graph_def = copy.deepcopy(meta_graph)
+    _rename(graph_def)
+    for op in graph_def.op:
+        if not _quantizable(graph_def, op) or op.input[0] not in ranges: continue
+        # The range should contain zero to represent the paddings exactly
+        lo, hi = min(ranges[op.input[0]][0], 0.), max(ranges[op.input[0]][1], 0.)
+        scale = (hi - lo) / 255. if hi > lo else 1.
+        zero_point = int(np.clip(round(-lo / scale), 0, 255))
+        op.type = _QUANTIZED_TYPES[op.type]
+        op.arg.add().CopyFrom(MakeArgument('x_scale', float(scale)))
+        op.arg.add().CopyFrom(MakeArgument('x_zero_point', zero_point))
+    ws.CreateGraph(graph_def)
+    return graph_def
@@ -26,6 +26,8 @@ class DataLayer(Layer):
         The path of database. Refer `DataParameter.source`_.
     prefetch: int
         The prefetch count. Refer `DataParameter.prefetch`_.
+    transport : str
+        The transport between stages. Extension of `DataParameter`_.
     batch_size : int
         The size of a mini-batch. Refer `DataParameter.batch_size`_.
     phase : caffe_pb2.Phase
@@ -59,6 +61,7 @@ class DataLayer(Layer):
 
         self._param = {'source': param.source,
                        'prefetch': param.prefetch,
+                       'transport': param.transport,
                        'batch_size': param.batch_size,
                        'phase': {0: 'TRAIN', 1: 'TEST'}[int(LayerParameter.phase)],
                        'scale': transform_param.scale,
@@ -118,6 +118,7 @@ def GraphDef_Update(meta_graph, updater):
             parallel_arguments['comm'], parallel_arguments['group'] \
                 = mpi.CreateGroup(root=group[0], incl=group)
             parallel_arguments['root'] = group[0]
+            parallel_arguments['bucket_size'] = mpi.GetBucketSize()
         for k, v in parallel_arguments.items():
             meta_graph.arg.add().CopyFrom(MakeArgument(k, v))
 
@@ -151,12 +152,25 @@ def GraphDef_Opt(meta_graph):
 
     `memonger.share_grads(*args, **kwargs)`_ - How the enable gradients sharing.
 
+    `config.SetInterOpThreads(*args, **kwargs)`_ - How to run the independent ops in parallel.
+
+    `config.FoldBatchNorm(*args, **kwargs)`_ - How to fold the batch norms into the convolutions.
+
+    `memonger.PlanMemory(*args, **kwargs)`_ - How to enable the memory planning.
+
     """
 
     from dragon.config import option
     OX = 3 if option['share_grads'] else 2
     if option['debug_mode']: OX = 1
     meta_graph.arg.add().CopyFrom(MakeArgument('optimization_level', OX))
+    if option['fold_batch_norm'] and not option['debug_mode']:
+        meta_graph.arg.add().CopyFrom(MakeArgument('fold_batch_norm', True))
+    if option['inter_op_threads'] > 1:
+        meta_graph.arg.add().CopyFrom(MakeArgument(
+            'inter_op_threads', option['inter_op_threads']))
+    if option['plan_memory']:
+        meta_graph.arg.add().CopyFrom(MakeArgument('memory_planning', True))
     meta_graph.graph_type = option['graph_type']
 
 
@@ -323,8 +337,11 @@ def function(inputs=None, outputs=None, givens=None, updater=None):
     ws.CreateGraph(meta_graph)
 
     # return a lambda point to run this graph
-    return lambda *args, **kwargs: \
+    # the meta graph is attached for the queries, e.g. ``ws.GetMemoryPlan``
+    callback = lambda *args, **kwargs: \
         ws.RunGraph(meta_graph.name, (inputs, args), outputs, **kwargs)
+    callback.meta_graph = meta_graph
+    return callback
 
 
 def eval(self, feed_dict=None):
@@ -23,4 +23,5 @@ import dragon.vm.torch.cuda
 from dragon.vm.torch.ops import *
 import dragon.vm.torch.nn
 import dragon.vm.torch.optim
+import dragon.vm.torch.jit
 from dragon.vm.torch.autograd import no_grad, enable_grad, set_grad_enabled
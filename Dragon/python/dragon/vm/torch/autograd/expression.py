@@ -26,24 +26,79 @@ def _get_uid():
     return _EXPRESSION_UID - 1
 
 
+class Operator(object):
+    """The record of a registered operator in the expression.
+
+    It looks like a ``OperatorDef``, without the serialization.
+
+    The constant inputs are held, whose tensors are required by backward.
+
+    """
+    __slots__ = ('template', 'name', 'input', 'output', 'constants')
+
+    def __init__(self, template, name, inputs, outputs, constants=()):
+        self.template, self.name = template, name
+        self.input, self.output = inputs, outputs
+        self.constants = constants
+
+    @property
+    def type(self):
+        return self.template.type
+
+    def as_tuple(self):
+        return self.template.handle, self.name, self.input, self.output
+
+
 class Expression(object):
+    """The node of expressions, linked to the expressions of inputs.
+
+    Merging and appending cost O(1) instead of copying the ops of inputs,
+    all the ops are collected once at ``backward``.
+
+    """
+    __slots__ = ('_uid', '_op', '_parents')
+
     def __init__(self):
-        self._ops = dict()
+        self._uid = self._op = None
+        self._parents = ()
 
     def merge(self, expressions):
+        parents = []
         for e in expressions:
-            if e: self._ops.update(e._ops)
+            if e and e not in parents: parents.append(e)
+        self._parents = tuple(parents)
 
-    def append(self, op):
-        uid = _get_uid()
-        op_name = APool.get(op.type)
-        self._ops[uid] = op
-        self._ops[uid].name = op_name
+    def append(self, template, inputs, outputs, constants=()):
+        self._uid = _get_uid()
+        op_name = APool.get(template.type)
+        self._op = Operator(template, op_name, inputs, outputs, constants)
         return op_name
 
+    def empty(self):
+        return self._op is None and len(self._parents) == 0
+
+    def collect(self):
+        """Collect the ops of this node and all the ancestors.
+
+        Returns
+        -------
+        list of Operator
+            The ops sorted by the topology.
+
+        """
+        ops, visited, stack = [], set(), [self]
+        while len(stack) > 0:
+            e = stack.pop()
+            if id(e) in visited: continue
+            visited.add(id(e))
+            if e._op is not None: ops.append((e._uid, e._op))
+            stack.extend(e._parents)
+        # the uid is increasing along with the topology
+        return [op for uid, op in sorted(ops, key=lambda d: d[0])]
+
     def debug_str(self, name=''):
         external_inputs = set()
-        ordered_ops = sorted(self._ops.items(), key=lambda d: d[0])
+        ordered_ops = enumerate(self.collect())
         outputs = set()
         buffer0 = '-------------------Expressions-------------------\n'
         buffer1 = ''
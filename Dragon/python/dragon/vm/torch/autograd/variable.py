@@ -47,8 +47,7 @@ def backward(self, gradient=None):
 
     # 1. Expressions -> Forward-Ops
     # We should sort out the topology of these operators before using
-    all_expressions = sorted(self._expr._ops.items(), key=lambda d: d[0])
-    forward_ops = [v for k, v in all_expressions]
+    forward_ops = self._expr.collect()
 
     # 2. Forward-Ops + Targets + InputGrads + IgnoredGrads -> Backward-Ops
     targets = [self.name]; input_grads = []
@@ -61,7 +60,15 @@ def backward(self, gradient=None):
         input_grads.append(self.name + '_grad')
 
     # 3. Flow or Flow or Flow
-    ws.RunGradientFlow(forward_ops, targets, input_grads, ignored_grads)
+    # The buckets of grads are reduced along with the flow if necessary
+    from dragon.vm.torch.ops.update import _collective_buckets
+    collective, owners = _collective_buckets()
+    launched = ws.RunGradientFlow([op.as_tuple() for op in forward_ops],
+        targets, input_grads, ignored_grads, collective)
+    if collective is not None:
+        for idx in launched:
+            buckets, bucket_idx = owners[idx]
+            buckets.launched.add(bucket_idx)
 
     # 4. Release resources
     # We should release both the anchors and tensors
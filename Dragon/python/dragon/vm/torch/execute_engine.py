@@ -23,12 +23,17 @@ Note that not all operators can be re-written into the persistent mode,
 we found it non-trivial to hash float arguments.
 For those operators we still construct, run, and deconstruct them once.
 
+Both engines dispatch by names, i.e., the meta ops are registered
+into the backend once, so that no ``OperatorDef`` is serialized at each run.
+
 """
 
 from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from collections import OrderedDict
+
 import dragon as dg
 import dragon.core.utils as pb
 from dragon.config import option
@@ -40,6 +45,91 @@ from .tensor import RuntimeTensor
 from .tensor_pool import TPool
 
 
+class OperatorTemplate(object):
+    """OperatorTemplate registers a meta op into the backend.
+
+    The type, device option and arguments are cached in the backend,
+    the anchor, inputs and outputs are given by names at each run.
+
+    """
+    def __init__(self, meta_op):
+        self.meta_op, self.type = meta_op, meta_op.type
+        self.handle = dg.workspace.RegisterOperator(meta_op)
+
+    def __del__(self):
+        try:
+            dg.workspace.ReleaseOperator(self.handle)
+        except (AttributeError, TypeError):
+            # the modules have been released at exit
+            pass
+
+
+# The templates of ONCE ops, keyed by the type, ctx and arguments
+_ONCE_TEMPLATES = OrderedDict()
+_MAX_ONCE_TEMPLATES = 1024
+
+# The templates of PERSISTENT ops, keyed by the persistent key
+_PERSISTENT_TEMPLATES = dict()
+
+# The tracer to record the running ops, see ``torch.jit.trace``
+_TRACER = None
+
+
+def _hashable(value):
+    # distinguish 1 and 1.0, which lead to different arguments
+    if isinstance(value, (list, tuple)):
+        return tuple((type(v), v) for v in value)
+    return type(value), value
+
+
+def _get_once_template(op_type, ctx, kwargs):
+    try:
+        key = (op_type, ctx) + tuple(sorted(
+            (k, _hashable(v)) for k, v in kwargs.items()))
+        template = _ONCE_TEMPLATES.pop(key, None)
+        # move to the end as the most recently used
+        if template is not None: _ONCE_TEMPLATES[key] = template
+    except TypeError:
+        # e.g. the protobuf messages are not hashable
+        key = template = None
+    if template is None:
+        template = OperatorTemplate(pb.MakeOperatorDef(op_type, [], [], name='runtime',
+            device_option=CTX_TO_DEVICE_OPTION[ctx], **kwargs))
+        if key is not None:
+            _ONCE_TEMPLATES[key] = template
+            if len(_ONCE_TEMPLATES) > _MAX_ONCE_TEMPLATES:
+                _ONCE_TEMPLATES.popitem(last=False)
+    return template
+
+
+def _get_persistent_template(persistent_key, meta_op):
+    template = _PERSISTENT_TEMPLATES.get(persistent_key, None)
+    if template is None or template.meta_op is not meta_op:
+        # the op will be re-generated if the ctx or phase changed
+        template = OperatorTemplate(meta_op)
+        _PERSISTENT_TEMPLATES[persistent_key] = template
+    return template
+
+
+def SetTracer(tracer):
+    """Set the tracer to record the meta ops before running.
+
+    Parameters
+    ----------
+    tracer : object or None
+        The tracer implementing ``record(meta_op, inputs, outputs)``.
+
+    Returns
+    -------
+    object or None
+        The previous tracer.
+
+    """
+    global _TRACER
+    previous, _TRACER = _TRACER, tracer
+    return previous
+
+
 def RunOperator(inputs, outputs, meta, auto_grad=True, **kwargs):
     if not isinstance(inputs, list): inputs = [inputs]
     if not isinstance(outputs, list): outputs = [outputs]
@@ -61,24 +151,26 @@ def RunOperator(inputs, outputs, meta, auto_grad=True, **kwargs):
         outputs_name.append(outputs[ix].name)
 
     # + Engine Check
-    engine_type = meta[0]; persistent_key = None
+    engine_type = meta[0]; template = None
     if engine_type == 'ONCE':
-        # ++ OpType + CTX -> Op
+        # ++ OpType + CTX + Arguments -> Template
         op_type, ctx = meta[1:]
         if ctx is None: raise ValueError('Excepted a context, got None.')
-        op = pb.MakeOperatorDef(op_type, inputs_name, outputs_name, name='runtime',
-                                device_option=CTX_TO_DEVICE_OPTION[ctx], **kwargs)
+        template = _get_once_template(op_type, ctx, kwargs)
     elif engine_type == 'PERSISTENT':
         # ++ Key + Inputs + Outputs -> Op
+        # the template is only required by the auto-grad
         persistent_key, meta_op = meta[1:]
-        op = pb.MutableOperatorDef(meta_op, inputs_name, outputs_name)
     else:
         raise ValueError('Unknown executing engine: {}.'.format(engine_type))
 
     # + Auto-Grad
+    op_name = 'runtime'
     if len(inputs) > 0 and auto_grad:
         input_expressions = []
         if requires_grad:
+            if template is None:
+                template = _get_persistent_template(persistent_key, meta_op)
             ignored_grads = set()
             # ++ Trace outputs
             for input in inputs:
@@ -87,8 +179,8 @@ def RunOperator(inputs, outputs, meta, auto_grad=True, **kwargs):
                     ignored_grads = ignored_grads.union(input._ignored_grads)
             expression = Expression()
             expression.merge(input_expressions)
-            op_name = expression.append(op)
-            op.name = op_name
+            op_name = expression.append(template, inputs_name, outputs_name,
+                tuple(input for input in inputs if input._constant))
             for ix in range(len(outputs)):
                 outputs[ix]._requires_grad = True
                 outputs[ix]._expr = expression
@@ -102,16 +194,24 @@ def RunOperator(inputs, outputs, meta, auto_grad=True, **kwargs):
     # + Run
     if option['log_optimized_graph'] or option['log_meta_graph']:
         from dragon.config import logger
+        op = pb.MutableOperatorDef(meta_op if template is None
+            else template.meta_op, inputs_name, outputs_name)
+        op.name = op_name
         logger.info('>>>>>>>>>>>>>>>>>> Forward Flow <<<<<<<<<<<<<<<<<<\n')
         logger.info(op)
 
+    if _TRACER is not None:
+        _TRACER.record(meta_op if template is None else
+            template.meta_op, inputs_name, outputs_name)
+
     if engine_type == 'ONCE':
-        dg.workspace.RunOperator(op)
+        dg.workspace.RunRegisteredOperator(template.handle,
+            op_name, inputs_name, outputs_name)
     elif engine_type == 'PERSISTENT':
         dg.workspace.RunPersistentOp(persistent_key,
-            op.name, inputs_name, outputs_name)
+            op_name, inputs_name, outputs_name)
 
     # + Returns
     if len(outputs) > 1: return outputs
     elif len(outputs) == 1: return outputs[0]
-    else: return None
\ No newline at end of file
+    else: return None
@@ -0,0 +1,231 @@
+# ------------------------------------------------------------
+# Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+#
+# Licensed under the BSD 2-Clause License.
+# You should have received a copy of the BSD 2-Clause License
+# along with the software. If not, See,
+#
+#      <https://opensource.org/licenses/BSD-2-Clause>
+#
+# ------------------------------------------------------------
+
+"""Capture the ops of a forward pass into a static graph.
+
+The dynamic engines dispatch each op from Python at every run,
+which costs much more than the computation of the small ops.
+
+We record the meta ops of a forward pass once, rename the tensors
+into the graph-private names, and create a ``GraphDef`` in the backend,
+which will be pruned and shared by the graph optimizer.
+Replaying it only requires to feed the inputs and fetch the outputs.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import dragon as dg
+import dragon.core.utils as pb_utils
+import dragon.protos.dragon_pb2 as pb
+from dragon.config import option
+from dragon.core.scope import GetOperatorName
+
+from dragon.vm.torch import execute_engine
+from dragon.vm.torch.autograd.grad_mode import no_grad
+from dragon.vm.torch.tensor import Tensor, RuntimeTensor
+from dragon.vm.torch.tensor_pool import TPool
+
+
+def _copy(src, dst, ctx):
+    # The template of ``Copy`` is shared with the ONCE engine
+    template = execute_engine._get_once_template('Copy', tuple(ctx), {})
+    dg.workspace.RunRegisteredOperator(template.handle, 'runtime', [src], [dst])
+
+
+class _Tracer(object):
+    """Record the meta ops and rename the tensors for a graph.
+
+    The example inputs are renamed to ``<graph>/input:i``,
+    the outputs of ops are renamed to ``<graph>/tensor:i``,
+    and the parameters and buffers of the module keep their names.
+
+    The other external tensors (e.g. the scalars or arrays created in ``forward``)
+    are snapshot into ``<graph>/constant:i``, as their names might be reused later.
+    So are the dynamic arguments (e.g. ``shape_desc`` of ``Reshape``),
+    which are fed into the shared tensors of eager modules at each call.
+
+    """
+    def __init__(self, graph_name, inputs, states):
+        self.graph_name, self.states = graph_name, states
+        self.ops, self.names, self.num_tensors = [], {}, 0
+        self.input_names = []
+        for ix, input in enumerate(inputs):
+            name = '{}/input:{}'.format(graph_name, ix)
+            _copy(input.name, name, input._ctx)
+            self.names[input.name] = name
+            self.input_names.append(name)
+
+    def _new_name(self, kind):
+        self.num_tensors += 1
+        return '{}/{}:{}'.format(self.graph_name, kind, self.num_tensors - 1)
+
+    def _snapshot(self, name, device_option):
+        constant = self._new_name('constant')
+        snapshot = pb_utils.MakeOperatorDef('Copy', [name], [constant],
+            device_option=device_option)
+        snapshot.device_option.ClearField('engine')
+        dg.workspace.RunOperator(snapshot)
+        return constant
+
+    def _rename_input(self, name, device_option):
+        if name in self.names: return self.names[name]
+        if name in self.states: return name
+        self.names[name] = self._snapshot(name, device_option)
+        return self.names[name]
+
+    def _rename_arguments(self, op):
+        # the arguments are always fed on cpu, and are not cached by names,
+        # as the same module could feed different values in one forward
+        device_option = execute_engine.CTX_TO_DEVICE_OPTION[('CPU', 0)]
+        for arg in op.arg:
+            if not arg.name.endswith(('_desc', '_descs')): continue
+            if arg.HasField('s') and arg.s:
+                arg.s = self._snapshot(arg.s, device_option)
+            names = [self._snapshot(name, device_option) for name in arg.strings]
+            del arg.strings[:]; arg.strings.extend(names)
+
+    def _rename_output(self, name):
+        # the in-place outputs are also renamed, as the graph optimizer
+        # requires each tensor to be produced once, and will share them later
+        if name in self.states: return name
+        self.names[name] = self._new_name('tensor')
+        return self.names[name]
+
+    def record(self, meta_op, inputs, outputs):
+        """Record a running op.
+
+        Parameters
+        ----------
+        meta_op : dragon_pb2.OperatorDef
+            The meta op.
+        inputs : list of str
+            The name of inputs.
+        outputs : list of str
+            The name of outputs.
+
+        Returns
+        -------
+        None
+
+        """
+        device_option = meta_op.device_option
+        op = pb_utils.MutableOperatorDef(meta_op,
+            [self._rename_input(name, device_option) for name in inputs],
+            [self._rename_output(name) for name in outputs])
+        # the persistent key is meaningless for the graph
+        arguments = [arg for arg in op.arg if arg.name != 'persistent_key']
+        op.ClearField('arg'); op.arg.extend(arguments)
+        self._rename_arguments(op)
+        _, op.name = GetOperatorName()
+        self.ops.append(op)
+
+    def target(self, output):
+        return self._rename_input(output.name,
+            execute_engine.CTX_TO_DEVICE_OPTION[tuple(output._ctx)])
+
+
+class TracedModule(object):
+    """The static graph captured from a module.
+
+    The returned outputs are new tensors which do not require grad.
+
+    The control flows and shapes of ``forward`` are frozen,
+    inputs should have the same shapes as the example inputs.
+
+    """
+    def __init__(self, module, example_inputs):
+        if isinstance(example_inputs, Tensor):
+            example_inputs = (example_inputs,)
+        self.module = module
+        self._input_shapes = [tuple(x.shape) for x in example_inputs]
+
+        meta_graph = pb.GraphDef()
+        meta_graph.name = 'Graph_' + str(dg.workspace.CURRENT_GRAPH_IDX)
+        dg.workspace.CURRENT_GRAPH_IDX += 1
+        states = set(t.name for t in module.state_dict().values())
+        tracer = _Tracer(meta_graph.name, example_inputs, states)
+
+        previous = execute_engine.SetTracer(tracer)
+        try:
+            with no_grad():
+                outputs = module(*example_inputs)
+        finally:
+            execute_engine.SetTracer(previous)
+
+        self._return_tuple = isinstance(outputs, (tuple, list))
+        if not self._return_tuple: outputs = [outputs]
+        self._input_names = tracer.input_names
+        self._outputs = [(tracer.target(y), y._dtype, tuple(y._ctx)) for y in outputs]
+
+        meta_graph.op.extend(tracer.ops)
+        meta_graph.target.extend([e[0] for e in self._outputs])
+        OX = 3 if option['share_grads'] else 2
+        if option['debug_mode']: OX = 1
+        meta_graph.arg.add().CopyFrom(pb_utils.MakeArgument('optimization_level', OX))
+        if option['fold_batch_norm'] and not option['debug_mode']:
+            meta_graph.arg.add().CopyFrom(pb_utils.MakeArgument('fold_batch_norm', True))
+        if option['inter_op_threads'] > 1:
+            meta_graph.arg.add().CopyFrom(pb_utils.MakeArgument(
+                'inter_op_threads', option['inter_op_threads']))
+        if option['plan_memory']:
+            meta_graph.arg.add().CopyFrom(pb_utils.MakeArgument('memory_planning', True))
+        meta_graph.arg.add().CopyFrom(pb_utils.MakeArgument(
+            'phase', 'TRAIN' if module.training else 'TEST'))
+        dg.workspace.CreateGraph(meta_graph)
+        self.graph_def = meta_graph
+
+    def __call__(self, *inputs):
+        if len(inputs) != len(self._input_names):
+            raise ValueError('Excepted {} inputs, got {}.'.format(
+                len(self._input_names), len(inputs)))
+        for ix, input in enumerate(inputs):
+            if tuple(input.shape) != self._input_shapes[ix]:
+                raise ValueError('Input({}) was traced with the shape of {}, '
+                    'got {}.'.format(ix, self._input_shapes[ix], tuple(input.shape)))
+            _copy(input.name, self._input_names[ix], input._ctx)
+        dg.workspace.RunGraph(self.graph_def.name, return_outputs=False)
+        outputs = []
+        for name, dtype, ctx in self._outputs:
+            outputs.append(RuntimeTensor(TPool.get('detach'), dtype=dtype, ctx=ctx))
+            _copy(name, outputs[-1].name, ctx)
+        return tuple(outputs) if self._return_tuple else outputs[0]
+
+
+def trace(module, example_inputs):
+    """Trace a module and return a callable static graph.
+
+    The ops of the forward pass are recorded once,
+    then created as a graph with the optimizations.
+
+    Parameters
+    ----------
+    module : vm.torch.nn.Module
+        The module to trace.
+    example_inputs : vm.torch.Tensor or tuple of vm.torch.Tensor
+        The inputs of the forward pass.
+
+    Returns
+    -------
+    TracedModule
+        The callable static graph.
+
+    Examples
+    --------
+    >>> m = torch.vision.models.resnet18().eval()
+    >>> x = torch.from_numpy(np.ones((1, 3, 224, 224), dtype='float32'))
+    >>> traced = torch.jit.trace(m, x)
+    >>> y = traced(x)
+
+    """
+    return TracedModule(module, example_inputs)
@@ -366,6 +366,7 @@ class Module(object):
         return RunOperator(inputs, outputs, meta, auto_grad=auto_grad)
 
     def train(self, mode=True):
+        self.training = mode
         for module in self.children():
             module.train(mode)
         return self
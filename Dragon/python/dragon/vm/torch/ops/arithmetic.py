@@ -14,16 +14,29 @@ from __future__ import division
 from __future__ import print_function
 
 from dragon.vm.torch.tensor import Tensor
-from dragon.vm.torch.ops.primitive import MakeContext, WrapScalar
+from dragon.vm.torch.execute_engine import RunOperator
+from dragon.vm.torch.ops.primitive import MakeContext, WrapScalar, ScalarArguments
 from dragon.vm.torch.ops.factory import get_module
 from dragon.vm.torch.ops.modules.arithmetic import Fundamental, Log
 
 
+def _scalar_fundamental(input, value, op, out=None):
+    # ``Pow`` can not be computed inplace
+    if out is input: return None
+    arguments = ScalarArguments(op, value, input._dtype)
+    if arguments is None: return None
+    ctx = MakeContext(inputs=[input])
+    outputs = [out] if out else [(input._dtype, ctx)]
+    return RunOperator([input], outputs, ('ONCE', 'Pow', ctx), **arguments)
+
+
 def _fundamental(input, value, op='Add', out=None):
     if not isinstance(value, Tensor):
         if not isinstance(value, (int, float)):
             raise TypeError('Type of value should be numerical, got {}.'
                     .format(type(value)))
+        output = _scalar_fundamental(input, value, op, out)
+        if output is not None: return output
         value = WrapScalar(value, input._dtype, input._ctx)
     ctx = MakeContext(inputs=[input, value])
     key = 'torch/ops/{}/{}:{}'.format(op.lower(), ctx[0].lower(), ctx[1])
@@ -36,6 +49,8 @@ def _rfundamental(input, value, op='RAdd', out=None):
         if not isinstance(value, (int, float)):
             raise TypeError('Type of value should be numerical, got {}.'
                     .format(type(value)))
+        output = _scalar_fundamental(input, value, op, out)
+        if output is not None: return output
         value = WrapScalar(value, input._dtype, input._ctx)
 
     ctx = MakeContext(inputs=[input, value])
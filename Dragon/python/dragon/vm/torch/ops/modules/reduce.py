@@ -44,6 +44,9 @@ class Reduce(BaseModule):
                 'keep_dims': self.keep_dims
             }
         }
+        if isinstance(self.axis, (list, tuple)):
+            self.op_meta['arguments']['axis'] = -1
+            self.op_meta['arguments']['axes'] = list(self.axis)
 
     def forward(self, x, y):
         inputs = [x]; self.unify_devices(inputs)
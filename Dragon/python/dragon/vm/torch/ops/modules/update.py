@@ -13,7 +13,12 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import numpy as np
 import dragon.core.mpi as mpi
+import dragon.core.utils as pb_utils
+
+from dragon.vm.torch.constants import CTX_TO_DEVICE_OPTION
+from dragon.vm.torch.execute_engine import OperatorTemplate
 from dragon.vm.torch.ops.modules.base import BaseModule
 
 
@@ -34,7 +39,7 @@ class Update(BaseModule):
     def register_op(self):
         self.op_meta = {
             'op_type': self.op_type,
-            'n_inputs': 1, 'n_outputs': 1,
+            'n_inputs': 1, 'n_outputs': 1, # Ignore
             'arguments': {
                 'lr_mult': self.lr_mult,
                 'decay_mult': self.decay_mult,
@@ -42,9 +47,9 @@ class Update(BaseModule):
             }
         }
 
-    def forward(self, param, grad):
-        self.unify_devices([param, grad])
-        return self.run([grad], [param], auto_grad=False)
+    def forward(self, params, grads):
+        self.unify_devices(params + grads)
+        return self.run(grads, params, auto_grad=False)
 
 
 class Collective(BaseModule):
@@ -53,6 +58,7 @@ class Collective(BaseModule):
         self.mode = kwargs.get('mode', None)
         if self.mode is None:
             raise ValueError('Got invalid collective mode: {}'.format(self.mode))
+        self.bucket_size = kwargs.get('bucket_size', 0)
         self.register_arguments()
         self.register_op()
 
@@ -74,9 +80,65 @@ class Collective(BaseModule):
                 'comm': mpi_comm,
                 'group': mpi_group,
                 'root': group[0], # Assume the 1st node of group as root
+                'bucket_size': self.bucket_size,
             }
         }
 
     def forward(self, grads):
         self.unify_devices(grads)
-        return self.run(grads, grads, auto_grad=False)
\ No newline at end of file
+        return self.run(grads, grads, auto_grad=False)
+
+
+class GradientBuckets(object):
+    """Reduce the grads by buckets during the backward pass.
+
+    The grads are coalesced into buckets of at most ``bucket_size`` bytes
+    in the reverse order of params, i.e. the order of being produced.
+
+    Each bucket is launched as soon as all of its grads are produced,
+    and waited at the end of the backward pass.
+
+    Only the buckets having any grad produced by some rank are launched,
+    in order, while the grads not produced are reduced as zeros.
+    The others are left to be reduced by the step of their optimizer.
+
+    """
+    def __init__(self, params, ctx, bucket_size):
+        idx, group = mpi.AllowParallel()
+        if idx == -1:
+            raise RuntimeError('The mpi node({}) dost not in '
+                'parallel groups. \nSet it using mpi.Parallel([..]).'.format(mpi.Rank()))
+        mpi_comm, mpi_group = mpi.CreateGroup(root=group[0], incl=group)
+        arguments = {'comm': mpi_comm, 'group': mpi_group, 'root': group[0]}
+        device_option = CTX_TO_DEVICE_OPTION[tuple(ctx)]
+        self._launch_op, self._wait_op = [OperatorTemplate(
+            pb_utils.MakeOperatorDef('CollectiveUpdate', [], [],
+                device_option=device_option, mode=mode, **arguments))
+                    for mode in ('MPI_IALLREDUCE', 'MPI_WAIT')]
+        self.buckets = []; nbytes = 0
+        for p in reversed(params):
+            size = p.numel() * np.dtype(p.dtype).itemsize
+            if len(self.buckets) == 0 or nbytes + size > bucket_size \
+                    or self.buckets[-1][0].dtype != p.dtype:
+                self.buckets.append([]); nbytes = 0
+            self.buckets[-1].append(p); nbytes += size
+        self.collective = [(self._launch_op.handle,
+            [p.name + '_grad' for p in bucket]) for bucket in self.buckets]
+        self.launched, self.reduced = set(), set()
+
+    @property
+    def wait_handle(self):
+        return self._wait_op.handle
+
+    def reduced_params(self):
+        """Return the ids of params whose grads are reduced, and reset them."""
+        reduced = self.reduced
+        for idx in self.launched:
+            reduced.update(id(p) for p in self.buckets[idx])
+        self.launched, self.reduced = set(), set()
+        return reduced
+
+    def pending_params(self, params):
+        """Return the params whose grads are not reduced yet."""
+        reduced = self.reduced_params()
+        return [p for p in params if id(p) not in reduced]
@@ -72,6 +72,8 @@ def _fill(input, shape, value):
 def _reduce(input, operation, dim=None, keepdim=False, out=None):
     ctx = MakeContext(inputs=[input])
     if dim is None: dim = -1; keepdim = False
+    elif isinstance(dim, (list, tuple)):
+        dim = sorted(set(CanonicalAxis(input, d) for d in dim))
     elif dim < 0: dim = CanonicalAxis(input, dim)
     key = 'torch/ops/{}/{}:{}/dim[{}]/keep_dims:{}'.format(operation.lower(),
         ctx[0].lower(), ctx[1], dim, int(keepdim))
@@ -98,8 +100,8 @@ def mean(input, dim=None, keepdim=False, out=None):
     ----------
     input : vm.torch.Tensor
         The input tensor.
-    dim : int or None
-        The axis of tensor to compute mean value.
+    dim : int, tuple of int or None
+        The axis or axes of tensor to compute mean value.
     keepdim : boolean
         Whether the output tensor has dim retained or not.
     out : vm.torch.Tensor or None
@@ -121,8 +123,8 @@ def sum(input, dim=None, keepdim=False, out=None):
     ----------
     input : vm.torch.Tensor
         The input tensor.
-    dim : int or None
-        The axis of tensor to compute sum value.
+    dim : int, tuple of int or None
+        The axis or axes of tensor to compute sum value.
     keepdim : boolean
         Whether the output tensor has dim retained or not.
     out : vm.torch.Tensor or None
@@ -13,11 +13,23 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import math
+import weakref
+from collections import OrderedDict
+
 import numpy as np
 import dragon as dg
 from dragon.vm.torch.tensor import *
 
 
+# The scalars are fed once and kept by a LRU cache
+_SCALAR_TENSORS = OrderedDict()
+_MAX_SCALAR_TENSORS = 1024
+
+# The evicted scalars still used by the recorded ops
+_EVICTED_SCALARS = dict()
+
+
 def CheckDataType(inputs, dtypes=None):
     if isinstance(inputs, Tensor): inputs = [inputs]
     if not isinstance(dtypes, (tuple, list)): dtypes = [dtypes]
@@ -62,20 +74,71 @@ def MakeContext(inputs=(), outputs=(), meta=None):
     return type, device_id
 
 
+def _release_scalar(key, name):
+    def release(ref):
+        if _EVICTED_SCALARS.get(key, None) is ref:
+            del _EVICTED_SCALARS[key]
+            try:
+                # the tensor could have been reset along with the workspace
+                if dg.workspace.HasTensor(name):
+                    dg.workspace.ReleaseTensor(name)
+            except (AttributeError, TypeError):
+                # the modules have been released at exit
+                pass
+    return release
+
+
 def WrapScalar(scalar, dtype, ctx):
-    # We use (DType + Value) to hash different scalars
-    # Setting a Tensor with same DType and shape will not deconstruct it
-    value = np.array([scalar], dtype=dtype)
+    # We use (DType + Value + Device) to hash different scalars
+    # The string of value distinguishes the ``-0.0`` and ``nan``
     if 'float' in dtype: scalar = float(scalar)
     if 'int' in dtype: scalar = int(scalar)
-    t = dg.Tensor('/share/scalar/{}/{}'.format(
-        dtype, str(scalar))).Variable()
-    t.set_value(value)
-    t = Tensor(dg_tensor=t.name, dtype=dtype, ctx=ctx, own_storage=False)
-    t.requires_grad = False
+    key = (dtype, str(scalar), tuple(ctx))
+    t = _SCALAR_TENSORS.pop(key, None)
+    if t is None:
+        # revive the evicted scalar if it is still alive
+        ref = _EVICTED_SCALARS.pop(key, None)
+        t = ref() if ref is not None else None
+    if t is not None:
+        # move to the end as the most recently used
+        _SCALAR_TENSORS[key] = t
+        return t
+    name = '/share/scalar/{}:{}/{}/{}'.format(
+        ctx[0].lower(), ctx[1], dtype, key[1])
+    dg.workspace.FeedTensor(name, np.array([scalar], dtype=dtype))
+    t = Tensor(dg_tensor=name, dtype=dtype, ctx=ctx, own_storage=False)
+    t.requires_grad, t._constant = False, True
+    _SCALAR_TENSORS[key] = t
+    if len(_SCALAR_TENSORS) > _MAX_SCALAR_TENSORS:
+        # the recorded ops could still use the least recently used scalar,
+        # release its tensor after the wrapper is collected
+        e_key, e_t = _SCALAR_TENSORS.popitem(last=False)
+        _EVICTED_SCALARS[e_key] = weakref.ref(
+            e_t, _release_scalar(e_key, e_t.name))
     return t
 
 
+def ScalarArguments(op_type, scalar, dtype):
+    # The fundamental ops of a float tensor and a finite scalar are computed
+    # by the arguments of ``Pow``, i.e. ``y = x * scale + shift``
+    if dtype not in ('float16', 'float32'): return None
+    scalar = float(scalar)
+    if not np.isfinite(scalar): return None
+    if op_type in ('Add', 'RAdd'): scale, shift = 1., scalar
+    elif op_type == 'Sub': scale, shift = 1., -scalar
+    elif op_type == 'RSub': scale, shift = -1., scalar
+    # ``x * 0`` is not folded, which should propagate the ``nan`` and ``inf``
+    elif op_type in ('Mul', 'RMul') and scalar != 0: scale, shift = scalar, 0.
+    # ``x / scalar`` equals to ``x * (1 / scalar)`` only if the reciprocal
+    # is exact, i.e. a power of two representable by the float argument
+    elif op_type == 'Div' and scalar != 0 and \
+            abs(math.frexp(scalar)[0]) == 0.5 and \
+                -126 <= 1 - math.frexp(scalar)[1] <= 127:
+        scale, shift = 1. / scalar, 0.
+    else: return None
+    return {'scale': scale, 'shift': shift, 'power': 1.}
+
+
 def CanonicalAxis(input, dim):
     ndim = input.ndimension()
     while dim < 0: dim += ndim
@@ -13,29 +13,80 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import weakref
+
 import dragon.core.mpi as mpi
 
 from dragon.vm.torch.ops.primitive import MakeContext
 from dragon.vm.torch.ops.factory import get_module
-from dragon.vm.torch.ops.modules.update import Update, Collective
+from dragon.vm.torch.ops.modules.update import \
+    Update, Collective, GradientBuckets
+
+
+# The buckets to reduce the grads during the backward pass
+_GRADIENT_BUCKETS = []
 
 
 def _allreduce(grads):
     if not mpi.Is_Init(): return
     if not isinstance(grads, (list, tuple)): grads = [grads]
+    if len(grads) == 0: return
     ctx = MakeContext(inputs=grads)
     mode = mpi.GetParallelMode() + '_ALLREDUCE'
-    key = 'torch/ops/collective/{}:{}/{}'.format(
-        ctx[0].lower(), ctx[1], mode.lower())
-    module = get_module(Collective, key, ctx, mode=mode)
+    bucket_size = mpi.GetBucketSize()
+    key = 'torch/ops/collective/{}:{}/{}/{}'.format(
+        ctx[0].lower(), ctx[1], mode.lower(), bucket_size)
+    module = get_module(Collective, key, ctx,
+        mode=mode, bucket_size=bucket_size)
     return module.forward(grads)
 
 
-def _update(param, grad, op_type, slot,
+def _bucket_grads(params):
+    """Create the buckets to reduce the grads of params in backward.
+
+    Only the grads of MPI mode can be reduced by buckets.
+
+    """
+    if not mpi.Is_Init() or mpi.GetParallelMode() != 'MPI': return None
+    if mpi.GetBucketSize() <= 0: return None
+    buckets = GradientBuckets(params,
+        MakeContext(inputs=params), mpi.GetBucketSize())
+    # the buckets are released along with the optimizer
+    _GRADIENT_BUCKETS.append(weakref.ref(buckets))
+    return buckets
+
+
+def _collective_buckets():
+    """Return the collective of buckets for the backward pass.
+
+    Returns
+    -------
+    tuple or None
+        The ``(wait_handle, [(handle, grads), ...])``.
+    list
+        The ``(buckets, index)`` of each launched bucket.
+
+    """
+    global _GRADIENT_BUCKETS
+    active = [e() for e in _GRADIENT_BUCKETS]
+    _GRADIENT_BUCKETS = [weakref.ref(e) for e in active if e is not None]
+    active = [e for e in active if e is not None]
+    if len(active) == 0: return None, []
+    collective, owners = [], []
+    for buckets in active:
+        collective.extend(buckets.collective)
+        owners.extend((buckets, i) for i in range(len(buckets.collective)))
+    return (buckets.wait_handle, collective), owners
+
+
+def _update(params, grads, op_type, slot,
             lr_mult=1.0, decay_mult=1.0):
-    ctx = MakeContext(inputs=[param])
-    key = 'torch/ops/{}/{}:{}/{}/{}'.format(op_type.lower(),
-        ctx[0].lower(),ctx[1], slot, param.name)
+    if not isinstance(params, (list, tuple)): params = [params]
+    if not isinstance(grads, (list, tuple)): grads = [grads]
+    ctx = MakeContext(inputs=params)
+    # the params of a group on the same device are updated by one op
+    key = 'torch/ops/{}/{}:{}/{}'.format(op_type.lower(),
+        ctx[0].lower(),ctx[1], slot)
     module = get_module(Update, key, ctx, op_type=op_type,
             lr_mult=lr_mult, decay_mult=decay_mult, slot=slot)
-    return module.forward(param, grad)
\ No newline at end of file
+    return module.forward(params, grads)
@@ -22,9 +22,11 @@ from collections import defaultdict
 
 import numpy as np
 import dragon as dg
+import dragon.core.mpi as mpi
 
 from dragon.vm.torch.tensor import Tensor
-from dragon.vm.torch.ops.update import _allreduce, _update
+from dragon.vm.torch.ops.creation import zeros_like
+from dragon.vm.torch.ops.update import _allreduce, _bucket_grads, _update
 
 
 _OPTIMIZER_GROUP_UID = 0
@@ -56,6 +58,8 @@ class Optimizer(object):
             self.add_param_group(param_group)
         self._update_type = None
         self._mutable_parameters = {}
+        self._fed_parameters = defaultdict(dict)
+        self._grad_flows = {}
 
     def __repr__(self):
         format_string = self.__class__.__name__ + ' ('
@@ -70,16 +74,84 @@ class Optimizer(object):
 
     def feed_parameters(self, group):
         param_temp = group['slot'] + '/{}'
+        last_fed = self._fed_parameters[group['slot']]
         for k, v in group.items():
             if k in self._mutable_parameters:
+                name = param_temp.format(self._mutable_parameters[k])
+                # skip the values which are not changed since the last step
+                if last_fed.get(k, None) == v and \
+                    dg.workspace.HasTensor(name): continue
                 # convert all defaults as float32 for convenience
-                dg.workspace.FeedTensor(param_temp.format(
-                    self._mutable_parameters[k]),
-                        np.array([v], dtype=np.float32))
+                dg.workspace.FeedTensor(name, np.array([v], dtype=np.float32))
+                last_fed[k] = v
+
+    def _collect_grads(self, group):
+        """Collect the params and grads of a group by devices.
+
+        Under MPI, the params without grads are reduced with zeros
+        to match the collective of other ranks, but not updated.
+
+        Parameters
+        ----------
+        group : dict
+            The param group.
+
+        Returns
+        -------
+        list of tuple
+            The ``(params, grads, buckets, zeros)`` of each device.
+
+        """
+        # the cached flows are expired if the params of group are changed,
+        # or any grad filled by zeros is produced by the backward pass
+        # the ids are unique, as the cached flows keep the params alive
+        key = tuple(id(p) for p in group['params'])
+        cached = self._grad_flows.get(group['slot'], None)
+        if cached is not None and cached[0] == key and not any(
+            dg.workspace.HasTensor(name) for name in cached[2]): return cached[1]
+        flows = {}; complete = True; zero_names = []
+        for p in group['params']:
+            g_name = p.name + '_grad'
+            # all the ranks should reduce the same grads,
+            # the grads of unused params are reduced as zeros
+            use_zeros = not dg.workspace.HasTensor(g_name)
+            if use_zeros and not mpi.Is_Init():
+                complete = False; continue
+            ctx_key = tuple(p._ctx)
+            if ctx_key not in flows: flows[ctx_key] = ([], [], set())
+            if use_zeros:
+                # fill a placeholder, as the grad could be produced later
+                g = Tensor(dg_tensor=g_name + '/zeros')
+                g._own_storage = False; g._ctx = p._ctx
+                zeros_like(p, out=g)
+                zero_names.append(g_name); flows[ctx_key][2].add(id(p))
+            else:
+                g = Tensor(dg_tensor=g_name)
+                g._own_storage = False; g._ctx = p._ctx
+            flows[ctx_key][0].append(p); flows[ctx_key][1].append(g)
+        flows = [(params, grads, None, zeros) for params, grads, zeros
+            in [flows[ctx_key] for ctx_key in sorted(flows.keys())]]
+        # reuse the wrappers once all the grads have been created
+        if complete:
+            # the next backward passes will reduce the grads by buckets
+            flows = [(params, grads, _bucket_grads(params), zeros)
+                for params, grads, _, zeros in flows]
+            self._grad_flows[group['slot']] = (key, flows, zero_names)
+            # the grads reduced by the expired buckets are not reduced again
+            if cached is not None:
+                reduced = set()
+                for _, _, buckets, _ in cached[1]:
+                    if buckets is not None: reduced.update(buckets.reduced_params())
+                for _, _, buckets, _ in flows:
+                    if buckets is not None: buckets.reduced = reduced
+        return flows
 
     def _run_update_ops(self, group):
         """Generate & Run UpdateOps.
 
+        The params of a group sharing the same device
+        will be updated by a single fused op.
+
         Parameters
         ----------
         group : dict
@@ -91,23 +163,27 @@ class Optimizer(object):
 
         """
         # Collect params and grads
-        params = []; grads = []
-        for p in group['params']:
-            g_name = p.name + '_grad'
-            if not dg.workspace.HasTensor(g_name): continue
-            g = Tensor(dg_tensor=g_name)
-            g._own_storage = False; g._ctx = p._ctx
-            params.append(p); grads.append(g)
+        flows = self._collect_grads(group)
 
         # Feed optimizer parameters to workspace
         self.feed_parameters(group)
 
-        # Run a all-reduce op to accumulate grads if necessary
-        _allreduce(grads)
-
-        # Run regular update ops
-        for p, g in zip(params, grads):
-            _update(p, g, op_type=self._update_type,
+        for params, grads, buckets, zeros in flows:
+            # Run a all-reduce op to accumulate grads if necessary
+            # Skip the grads which have been reduced by the buckets
+            if buckets is not None:
+                pending = set(id(p) for p in buckets.pending_params(params))
+                _allreduce([g for p, g in zip(params, grads) if id(p) in pending])
+            else: _allreduce(grads)
+
+            # Skip the params without grads, which are only reduced
+            if len(zeros) > 0:
+                params, grads = [p for p in params if id(p) not in zeros], \
+                    [g for p, g in zip(params, grads) if id(p) not in zeros]
+                if len(params) == 0: continue
+
+            # Run a fused update op for the params of this device
+            _update(params, grads, op_type=self._update_type,
                 slot=group['slot'],
                 lr_mult=group.get('lr_mult', 1.0),
                 decay_mult=group.get('decay_mult', 1.0))
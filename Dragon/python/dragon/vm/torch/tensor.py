@@ -58,6 +58,9 @@ class Tensor(object):
         self._static_shape = None
         # Owned by the grad required variables
         self._expr = self._ignored_grads = None
+        # Owned by the cached constants(i.e. scalars)
+        # They are kept alive by the recorded ops using them
+        self._constant = False
 
         # Constructor
         if len(args) == 0:
@@ -923,8 +926,8 @@ class Tensor(object):
 
         Parameters
         ----------
-        dim : int or None
-            The axis of tensor to compute mean value.
+        dim : int, tuple of int or None
+            The axis or axes of tensor to compute mean value.
         keepdim : boolean
             Whether the output tensor has dim retained or not.
 
@@ -941,8 +944,8 @@ class Tensor(object):
 
         Parameters
         ----------
-        dim : int or None
-            The axis of tensor to compute sum value.
+        dim : int, tuple of int or None
+            The axis or axes of tensor to compute sum value.
         keepdim : boolean
             Whether the output tensor has dim retained or not.
 
@@ -1175,7 +1178,7 @@ class Tensor(object):
 
     @property
     def grad_fn(self):
-        return True if self._expr and len(self._expr._ops) > 0 else None
+        return True if self._expr and not self._expr.empty() else None
 
     def backward(self, gradient=None):
         raise NotImplementedError('Refer torch.autograd.variable.backward().')
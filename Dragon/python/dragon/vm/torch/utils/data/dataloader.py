@@ -34,7 +34,8 @@ class _DataLoaderIter(object):
 
 class DataLoader(object):
     def __init__(self, dataset, batch_size=1, shuffle=False,
-                 partition=False, multiple_nodes=False, num_chunks=2048, chunk_size=-1):
+                 partition=False, multiple_nodes=False, num_chunks=2048, chunk_size=-1,
+                 transport='queue', autoscale=False, shuffle_mode='chunk', state=None):
         """A MPI-Aware DataLoader. Forked from ``dragon.io``.
 
         Parameters
@@ -53,6 +54,14 @@ class DataLoader(object):
             The number of chunks to split. Default is ``2048``.
         chunk_size : int
             The size(MB) of each chunk. Default is -1 (Refer ``num_chunks``).
+        transport : str
+            The transport between stages, ``queue`` or ``shared_memory``.
+        autoscale : boolean
+            Whether to adjust the number of transformers and fetchers adaptively.
+        shuffle_mode : str
+            The shuffle mode, ``chunk`` or ``index``.
+        state : dict
+            The state of iteration to resume, returned by ``state_dict()``.
 
         """
         self.dataset = dataset
@@ -72,6 +81,10 @@ class DataLoader(object):
             'transform': dataset.transform,
             'color_space': dataset.color_space,
             'num_transformers': n_transformers,
+            'transport': transport,
+            'autoscale': autoscale,
+            'shuffle_mode': shuffle_mode,
+            'state': state,
         })
 
     def __iter__(self):
@@ -84,4 +97,11 @@ class DataLoader(object):
         return self.batch.get()
 
     def get(self):
-        return self.batch.get()
\ No newline at end of file
+        return self.batch.get()
+
+    @property
+    def epoch(self):
+        return self.batch.epoch
+
+    def state_dict(self):
+        return self.batch.state_dict()
\ No newline at end of file
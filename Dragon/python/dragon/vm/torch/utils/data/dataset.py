@@ -44,7 +44,9 @@ class _LMDBStream(object):
         atexit.register(cleanup)
 
     def get(self):
-        return self.Q.get()
+        # drop the tag of record
+        im, labels, tag = self.Q.get()
+        return im, labels
 
     def next(self):
         return self.get()
@@ -13,13 +13,22 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import math
 import time
 import pprint
+import random
+import numpy as np
+import numpy.random as npr
+from threading import Lock
 from multiprocessing import Queue
 
 import dragon.core.mpi as mpi
+from dragon.tools.db import LMDB
 
 from dragon.io.data_reader import DataReader
+from dragon.io.shared_buffer import SharedBuffer
+from dragon.io.autoscaler import AutoScaler
+from dragon.io.stage_counter import StageCounter
 from .data_transformer import DataTransformer
 from .blob_fetcher import BlobFetcher
 
@@ -74,6 +83,28 @@ class DataBatch(object):
             Whether to partition batch. Default is ``False``.
         prefetch : int
             The prefetch count. Default is ``5``.
+        read_batch : int
+            The number of records to read and queue together. Default is ``1`` (Disabled).
+        shuffle_mode : str
+            The shuffle mode, ``chunk`` or ``index``. Default is ``chunk``.
+        shuffle_window : int
+            The number of records to read in the ascending keys for ``index``. Default is ``256``.
+        transport : str
+            The transport between stages, ``queue`` or ``shared_memory``.
+        autoscale : boolean
+            Whether to adjust the number of workers adaptively. Default is ``False``.
+        min_transformers : int
+            The min number of transformers for autoscaling. Default is ``1``.
+        max_transformers : int
+            The max number of transformers. Default is ``3``.
+        min_fetchers : int
+            The min number of fetchers for autoscaling. Default is ``1``.
+        max_fetchers : int
+            The max number of fetchers for autoscaling. Default is ``3``.
+        autoscale_interval : float
+            The interval(Seconds) between two decisions. Default is ``2.0``.
+        state : dict
+            The state of iteration to resume, returned by ``state_dict()``.
 
         """
         super(DataBatch, self).__init__()
@@ -94,6 +125,11 @@ class DataBatch(object):
         self._num_transformers = kwargs.get('num_transformers', -1)
         self._max_transformers = kwargs.get('max_transformers', 3)
         self._num_fetchers = kwargs.get('num_fetchers', 1)
+        self._transport = kwargs.get('transport', 'queue')
+        self._autoscale = kwargs.get('autoscale', False)
+        self._min_transformers = kwargs.get('min_transformers', 1)
+        self._min_fetchers = kwargs.get('min_fetchers', 1)
+        self._max_fetchers = kwargs.get('max_fetchers', 3)
 
         # io-aware policy
         if self._num_transformers == -1:
@@ -113,12 +149,30 @@ class DataBatch(object):
             self._batch_size = int(self._batch_size / kwargs['group_size'])
 
         # init queues
-        self.Q_level_1 = Queue(self._prefetch * self._num_readers * self._batch_size)
-        self.Q_level_2 = Queue(self._prefetch * self._num_readers * self._batch_size)
-        self.Q_level_3 = Queue(self._prefetch * self._num_readers)
+        self._capacity = {
+            'Q_level_1': int(math.ceil(float(self._prefetch * self._num_readers *
+                self._batch_size) / kwargs.get('read_batch', 1))),
+            'Q_level_2': self._prefetch * self._num_readers * self._batch_size,
+            'Q_level_3': self._prefetch * self._num_readers,
+        }
+        self.Q_level_1 = Queue(self._capacity['Q_level_1'])
+        if self._transport == 'shared_memory':
+            # pass the images through the pre-allocated slots
+            im, labels = self.example(**kwargs)
+            if len(im.shape) == 4: im = im[0]
+            im_blob = np.empty([self._batch_size] + list(im.shape), dtype=np.float32)
+            label_blob = np.empty((self._batch_size, len(labels)), dtype=np.int64)
+            self.Q_level_2 = SharedBuffer.from_example(
+                self._prefetch * self._num_readers * self._batch_size, (im,))
+            self.Q_level_3 = SharedBuffer.from_example(
+                self._prefetch * self._num_readers + 1, (im_blob, label_blob))
+        else:
+            self.Q_level_2 = Queue(self._capacity['Q_level_2'])
+            self.Q_level_3 = Queue(self._capacity['Q_level_3'])
 
         # init readers
-        self._readers = []
+        self._readers, self._cursors = [], {}
+        state = kwargs.get('state', None)
         for i in range(self._num_readers):
             self._readers.append(DataReader(**kwargs))
             self._readers[-1].Q_out = self.Q_level_1
@@ -135,29 +189,51 @@ class DataBatch(object):
             self._readers[i]._num_parts = num_parts
             self._readers[i]._part_idx = part_idx
             self._readers[i]._random_seed += part_idx
+            self._readers[i]._counter.capacity = self._capacity['Q_level_1']
+
+            # resume the iteration of this part
+            cursor = {'offset': 0, 'consumed': {}, 'epoch': 0}
+            if state is not None:
+                if state['num_parts'] != num_parts:
+                    raise ValueError('The state of {} parts can not resume {} parts.'
+                        .format(state['num_parts'], num_parts))
+                cursor['offset'] = state['readers'][part_idx]['offset']
+                cursor['epoch'] = state['readers'][part_idx]['epoch']
+                # the reader skips the consumed records
+                cursor['consumed'] = dict([(offset, (None, None)) for offset
+                    in state['readers'][part_idx]['consumed']])
+                self._readers[i]._offset = cursor['offset']
+                self._readers[i]._skipped = set(cursor['consumed'].keys())
+            self._cursors[part_idx] = cursor
+            self._num_parts = num_parts
             self._readers[i].start()
             time.sleep(0.1)
 
-        # init transformers
-        self._transformers = []
-        for i in range(self._num_transformers):
-            transformer = DataTransformer(**kwargs)
-            transformer._random_seed += (i + local_rank * self._num_transformers)
-            transformer.Q_in = self.Q_level_1
-            transformer.Q_out = self.Q_level_2
-            transformer.start()
-            self._transformers.append(transformer)
-            time.sleep(0.1)
+        # init transformers & blob fetchers
+        self._kwargs = kwargs
+        self._group_size, self._local_rank = group_size, local_rank
+        self._transformers, self._fetchers, self._retired = [], [], []
+        # the generator steps of transformers after the consumed records
+        self._rng_steps = {} if state is None else \
+            dict(state.get('transformers', {}))
+        # the workers are spawned or retired by the autoscaler thread
+        self._workers_lock, self._closed = Lock(), False
+        # the counters of retired workers which have been joined
+        self._joined_counters = []
+        self._num_spawned = {DataTransformer: 0, BlobFetcher: 0}
+        for i in range(self._num_transformers): self._spawn_transformer()
+        for i in range(self._num_fetchers): self._spawn_fetcher()
 
-        # init blob fetchers
-        self._fetchers = []
-        for i in range(self._num_fetchers):
-            fetcher = BlobFetcher(**kwargs)
-            fetcher.Q_in = self.Q_level_2
-            fetcher.Q_out = self.Q_level_3
-            fetcher.start()
-            self._fetchers.append(fetcher)
-            time.sleep(0.1)
+        # init counter of the trainer
+        self._counter = StageCounter()
+        self._counter.start()
+        self._last_stats = (time.time(), {})
+
+        # init autoscaler
+        self._autoscaler = None
+        if self._autoscale:
+            self._autoscaler = AutoScaler(self, **kwargs)
+            self._autoscaler.start()
 
         # prevent to echo multiple nodes
         if local_rank == 0: self.echo()
@@ -167,10 +243,16 @@ class DataBatch(object):
                     process.terminate()
                     process.join()
             from dragon.config import logger
-            terminate(self._fetchers)
+            # stop the autoscaler from spawning during the termination
+            with self._workers_lock:
+                self._closed = True
+                fetchers, transformers = self._fetchers[:], self._transformers[:]
+                retired = self._retired[:]
+            terminate(fetchers)
             if local_rank == 0: logger.info('Terminating BlobFetcher ......')
-            terminate(self._transformers)
+            terminate(transformers)
             if local_rank == 0: logger.info('Terminating DataTransformer ......')
+            terminate(retired)
             terminate(self._readers)
             if local_rank == 0: logger.info('Terminating DataReader......')
         import atexit
@@ -179,13 +261,231 @@ class DataBatch(object):
     def get(self):
         """Get a batch.
 
+        If using the ``shared_memory`` transport, the returned blobs
+        are valid until the next call.
+
         Returns
         -------
         tuple
             The batch, representing data and labels respectively.
 
         """
-        return self.Q_level_3.get()
+        im_blob, label_blob, tags = self._counter.get(self.Q_level_3)
+        self._counter.count()
+        self._consume(tags)
+        return im_blob, label_blob
+
+    @property
+    def epoch(self):
+        """Return the current epoch.
+
+        All the records of previous epochs have been consumed,
+        i.e. the value increases at the epoch boundaries.
+
+        Returns
+        -------
+        int
+            The epoch.
+
+        """
+        return min([cursor['epoch'] for cursor in self._cursors.values()])
+
+    def state_dict(self):
+        """Return the state of iteration.
+
+        The state contains the offset of records consumed contiguously
+        and the offsets of those consumed out of order for each reader,
+        which could be pickled along with ``workspace.Snapshot``.
+
+        The readers will seek to the offset without reading,
+        and the chunk permutations are reproduced by the random seed.
+
+        The generator step of each transformer after its last record
+        consumed contiguously is also contained to resume the transforms,
+        as each record is transformed by the generators seeded by its step.
+
+        Returns
+        -------
+        dict
+            The state.
+
+        """
+        return {'num_parts': self._num_parts,
+                'epoch': self.epoch,
+                'readers': dict([(part_idx, {
+                    'offset': cursor['offset'],
+                    'epoch': cursor['epoch'],
+                    'consumed': sorted(cursor['consumed'].keys()),
+                }) for part_idx, cursor in self._cursors.items()]),
+                'transformers': dict(self._rng_steps)}
+
+    def _consume(self, tags):
+        # advance the offset over the contiguous consumed records
+        for part_idx, offset, epoch, rng in tags:
+            cursor = self._cursors[part_idx]
+            if offset < cursor['offset']: continue
+            cursor['consumed'][offset] = (epoch, rng)
+            while cursor['offset'] in cursor['consumed']:
+                epoch, rng = cursor['consumed'].pop(cursor['offset'])
+                if epoch is not None: cursor['epoch'] = epoch
+                # the records of a transformer could be consumed out of order
+                # across the parts, never move its step backward
+                if rng is not None: self._rng_steps[rng[0]] = \
+                    max(self._rng_steps.get(rng[0], 0), rng[1] + 1)
+                cursor['offset'] += 1
+
+    def stats(self):
+        """Return the statistics of stages.
+
+        Each stage reports the number of items, the throughput(Items/s)
+        since the last call, the fraction of time blocked on ``get()``
+        and ``put()``, the latency percentiles(ms) of processing a item,
+        and the histogram of its output queue depth.
+
+        The ``trainer`` is regarded as the stage consuming batches,
+        and the ``bottleneck`` is the busiest stage that stalls it.
+
+        Returns
+        -------
+        dict
+            The statistics.
+
+        """
+        with self._workers_lock:
+            now, counters = time.time(), [(type(worker), worker._counter)
+                for worker in self._readers + self._transformers +
+                    self._fetchers + self._retired] + self._joined_counters
+            stats = {'n_readers': len(self._readers),
+                     'n_transformers': len(self._transformers),
+                     'n_fetchers': len(self._fetchers)}
+        last_time, last_items = self._last_stats
+        for name, cls in (('reader', DataReader),
+                          ('transformer', DataTransformer),
+                          ('fetcher', BlobFetcher)):
+            stats[name] = StageCounter.aggregate([counter
+                for worker_cls, counter in counters if worker_cls is cls])
+            stats[name]['throughput'] = (stats[name]['items'] -
+                last_items.get(name, 0)) / max(now - last_time, 1e-8)
+        stats['trainer'] = StageCounter.aggregate([self._counter])
+        self._last_stats = (now, dict([(name, stats[name]['items'])
+            for name in ('reader', 'transformer', 'fetcher')]))
+
+        # attribute the stall of trainer to the busiest stage
+        if stats['trainer']['get_wait'] < 0.05: stats['bottleneck'] = 'trainer'
+        else: stats['bottleneck'] = max(('reader', 'transformer', 'fetcher'),
+                                        key=lambda name: stats[name]['busy'])
+
+        if self._autoscaler is not None:
+            stats.update(self._autoscaler.statistics())
+        else:
+            try:
+                stats['occupancy'] = dict([(name, float(getattr(self, name).qsize())
+                    / self._capacity[name]) for name in self._capacity.keys()])
+            except NotImplementedError:
+                # ``Queue.qsize()`` is broken on Mac OS X
+                pass
+        return stats
+
+    def add_summary(self, writer, global_step):
+        """Write the statistics of stages into a ``ScalarSummary``.
+
+        Parameters
+        ----------
+        writer : ScalarSummary
+            The scalar writer.
+        global_step : int
+            The time step of this summary.
+
+        Returns
+        -------
+        None
+
+        """
+        stats = self.stats()
+        for name in ('reader', 'transformer', 'fetcher', 'trainer'):
+            for key, value in stats[name].items():
+                if isinstance(value, list): continue
+                writer.add_summary(('io/{}/{}'.format(name, key), value), global_step)
+        for name, value in stats.get('occupancy', {}).items():
+            writer.add_summary(('io/occupancy/{}'.format(name), value), global_step)
+
+    def _spawn(self, cls, Q_in, Q_out):
+        i = self._num_spawned[cls]
+        self._num_spawned[cls] += 1
+        worker = cls(**self._kwargs)
+        worker.Q_in, worker.Q_out = Q_in, Q_out
+        worker._counter.capacity = self._capacity[
+            'Q_level_2' if cls is DataTransformer else 'Q_level_3']
+        if cls is DataTransformer:
+            if self._autoscale:
+                # interleave the seeds of nodes as the number is unbounded
+                worker._random_seed += (i * self._group_size + self._local_rank)
+            else:
+                worker._random_seed += (i + self._local_rank * self._num_transformers)
+            worker._worker_idx, worker._rng_step = i, self._rng_steps.get(i, 0)
+        worker.start()
+        time.sleep(0.1)
+        return worker
+
+    def _spawn_transformer(self):
+        with self._workers_lock:
+            if self._closed: return
+            if len(self._transformers) >= self._max_transformers: return
+            self._transformers.append(self._spawn(
+                DataTransformer, self.Q_level_1, self.Q_level_2))
+
+    def _spawn_fetcher(self):
+        with self._workers_lock:
+            if self._closed: return
+            if len(self._fetchers) >= max(self._max_fetchers, self._num_fetchers): return
+            self._fetchers.append(self._spawn(
+                BlobFetcher, self.Q_level_2, self.Q_level_3))
+
+    def _retire_transformer(self):
+        with self._workers_lock:
+            if self._closed: return
+            if len(self._transformers) <= self._min_transformers: return
+            self._transformers[-1].retire()
+            self._retired.append(self._transformers.pop())
+
+    def _retire_fetcher(self):
+        with self._workers_lock:
+            if self._closed: return
+            if len(self._fetchers) <= self._min_fetchers: return
+            self._fetchers[-1].retire()
+            self._retired.append(self._fetchers.pop())
+
+    def _join_retired(self):
+        # join the retired workers which have exited,
+        # while their counters are kept for the statistics
+        with self._workers_lock:
+            for worker in [w for w in self._retired if not w.is_alive()]:
+                worker.join()
+                self._joined_counters.append((type(worker), worker._counter))
+                self._retired.remove(worker)
+
+    def example(self, **kwargs):
+        """Transform the first record as an example.
+
+        Returns
+        -------
+        tuple
+            The image and labels.
+
+        """
+        db = LMDB()
+        db.open(kwargs.get('source', ''))
+        # seek to the first record
+        db.zfill()
+        # the transforms draw from the global generators,
+        # restore them to keep the random stream of the caller
+        states = random.getstate(), npr.get_state()
+        try:
+            example = DataTransformer(**kwargs).get(db.value())
+        finally:
+            random.setstate(states[0]); npr.set_state(states[1])
+            db.close()
+        return example
 
     def echo(self):
         """Print I/O Information.
@@ -201,6 +501,8 @@ class DataBatch(object):
         params = {'queue_size': self._prefetch,
                   'n_readers': self._num_readers,
                   'n_transformers': self._num_transformers,
-                  'n_fetchers': self._num_fetchers}
+                  'n_fetchers': self._num_fetchers,
+                  'transport': self._transport,
+                  'autoscale': self._autoscale}
         pprint.pprint(params)
         print('---------------------------------------------------------')
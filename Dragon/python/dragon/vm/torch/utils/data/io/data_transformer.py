@@ -13,12 +13,15 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import time
+import random
 import numpy as np
 import numpy.random as npr
-from multiprocessing import Process
+from multiprocessing import Process, Event
 
 import dragon.config as config
 import dragon.vm.caffe.proto.caffe_pb2 as pb
+from dragon.io.stage_counter import StageCounter
 
 try:
     import cv2
@@ -50,6 +53,12 @@ class DataTransformer(Process):
         self.color_space = color_space
         self.pack = pack
         self._random_seed = config.GetRandomSeed()
+        # the generators are seeded by the step of each record,
+        # and the outputs are tagged with the step of this worker
+        self._rng_step, self._worker_idx = 0, 0
+        self._counter = StageCounter()
+        self._retired = Event()
+        self._pending = []
         self.Q_in = self.Q_out = None
         self.daemon = True
 
@@ -84,6 +93,25 @@ class DataTransformer(Process):
         else: labels.append(datum.label)
         return self.transform(im), labels
 
+    def _next_serialized(self):
+        # the records queued together by DataReader are unpacked locally
+        # each record is tagged as (part, offset, epoch) to track the consumption
+        if len(self._pending) == 0:
+            element = self._counter.get(self.Q_in)
+            if not isinstance(element, list): return element
+            self._pending = element[::-1]
+        return self._pending.pop()
+
+    def retire(self):
+        """Stop the process after finishing the current item.
+
+        Returns
+        -------
+        None
+
+        """
+        self._retired.set()
+
     def run(self):
         """Start the process.
 
@@ -92,14 +120,25 @@ class DataTransformer(Process):
         None
 
         """
-        npr.seed(self._random_seed)
-        while True:
-            serialized = self.Q_in.get()
+        self._counter.start()
+        # finish the pending records before retiring
+        # the step before transforming is carried along the tags,
+        # which resumes the transforms from the next records
+        while not self._retired.is_set() or len(self._pending) > 0:
+            tag, serialized = self._next_serialized()
+            tic = time.time()
+            # the transforms draw from both of the global generators
+            random.seed((self._random_seed << 32) + self._rng_step)
+            npr.seed((self._random_seed, self._rng_step))
+            tag += ((self._worker_idx, self._rng_step),)
+            self._rng_step += 1
             im, label = self.get(serialized)
+            self._counter.record(time.time() - tic)
             if len(im.shape) == 4 and not self.pack:
                 for ix in range(im.shape[0]):
-                    self.Q_out.put((im[ix], label))
+                    self._counter.put(self.Q_out, (im[ix], label, tag))
             else:
                 if len(im.shape) == 3 and self.pack:
                     im = np.expand_dims(im, axis=0)
-                self.Q_out.put((im, label))
\ No newline at end of file
+                self._counter.put(self.Q_out, (im, label, tag))
+        self._counter.stop()
\ No newline at end of file
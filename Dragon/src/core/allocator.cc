@@ -0,0 +1,135 @@
+#include <cstdlib>
+
+#include "core/allocator.h"
+
+namespace dragon {
+
+#define CPU_ALLOCATOR_ALIGNMENT 64
+
+CPUAllocator::CPUAllocator()
+    : bytes_in_use_(0), bytes_cached_(0), peak_bytes_in_use_(0),
+      cache_limit_((size_t)1 << 30),
+      num_allocs_(0), num_system_allocs_(0) {}
+
+CPUAllocator* CPUAllocator::Get() {
+    //  leaked intentionally, the tensors might be released after exit
+    static CPUAllocator* allocator = new CPUAllocator();
+    return allocator;
+}
+
+size_t CPUAllocator::RoundSize(size_t nbytes) {
+    if (nbytes <= CPU_ALLOCATOR_ALIGNMENT)
+        return CPU_ALLOCATOR_ALIGNMENT;
+    size_t power = 1;
+    while (power <= nbytes / 2) power <<= 1;
+    //  4 classes per power of two, i.e., wasting at most 25%
+    size_t step = std::max(power / 4,
+        (size_t)CPU_ALLOCATOR_ALIGNMENT);
+    return (nbytes + step - 1) / step * step;
+}
+
+void* CPUAllocator::SystemNew(size_t nbytes) {
+    void* data = nullptr;
+#ifdef _MSC_VER
+    data = _aligned_malloc(nbytes, CPU_ALLOCATOR_ALIGNMENT);
+#else
+    if (posix_memalign(&data,
+        CPU_ALLOCATOR_ALIGNMENT, nbytes) != 0) data = nullptr;
+#endif
+    num_system_allocs_++;
+    return data;
+}
+
+void CPUAllocator::SystemDelete(void* ptr) {
+#ifdef _MSC_VER
+    _aligned_free(ptr);
+#else
+    free(ptr);
+#endif
+}
+
+void CPUAllocator::ReleaseCache(size_t nbytes) {
+    //  release the largest blocks first
+    while (bytes_cached_ > nbytes && !free_blocks_.empty()) {
+        auto it = std::prev(free_blocks_.end());
+        SystemDelete(it->second.back());
+        bytes_cached_ -= it->first;
+        it->second.pop_back();
+        if (it->second.empty()) free_blocks_.erase(it);
+    }
+}
+
+void* CPUAllocator::New(size_t nbytes) {
+    std::lock_guard<std::mutex> lock(mutex_);
+    size_t size = RoundSize(nbytes);
+    void* data = nullptr;
+    auto it = free_blocks_.find(size);
+    if (it != free_blocks_.end()) {
+        data = it->second.back();
+        it->second.pop_back();
+        if (it->second.empty()) free_blocks_.erase(it);
+        bytes_cached_ -= size;
+    } else {
+        data = SystemNew(size);
+        if (data == nullptr && bytes_cached_ > 0) {
+            //  release on the memory pressure and try again
+            ReleaseCache(0);
+            data = SystemNew(size);
+        }
+        CHECK(data) << "\nMalloc mem: " << nbytes << " bytes failed.";
+    }
+    blocks_[data] = size;
+    bytes_in_use_ += size;
+    peak_bytes_in_use_ = std::max(peak_bytes_in_use_, bytes_in_use_);
+    num_allocs_++;
+    return data;
+}
+
+void CPUAllocator::Delete(void* ptr) {
+    if (ptr == nullptr) return;
+    std::lock_guard<std::mutex> lock(mutex_);
+    auto it = blocks_.find(ptr);
+    CHECK(it != blocks_.end())
+        << "\nDelete a mem not allocated by the CPUAllocator.";
+    size_t size = it->second;
+    blocks_.erase(it);
+    bytes_in_use_ -= size;
+    if (size > cache_limit_) {
+        SystemDelete(ptr);
+        return;
+    }
+    ReleaseCache(cache_limit_ - size);
+    free_blocks_[size].push_back(ptr);
+    bytes_cached_ += size;
+}
+
+void CPUAllocator::EmptyCache() {
+    std::lock_guard<std::mutex> lock(mutex_);
+    ReleaseCache(0);
+}
+
+void CPUAllocator::SetCacheLimit(size_t nbytes) {
+    std::lock_guard<std::mutex> lock(mutex_);
+    cache_limit_ = nbytes;
+    ReleaseCache(cache_limit_);
+}
+
+CPUAllocator::Stats CPUAllocator::GetStats() {
+    std::lock_guard<std::mutex> lock(mutex_);
+    Stats stats;
+    stats.bytes_in_use = bytes_in_use_;
+    stats.bytes_cached = bytes_cached_;
+    stats.peak_bytes_in_use = peak_bytes_in_use_;
+    stats.cache_limit = cache_limit_;
+    stats.num_allocs = num_allocs_;
+    stats.num_system_allocs = num_system_allocs_;
+    return stats;
+}
+
+void CPUAllocator::ResetStats() {
+    std::lock_guard<std::mutex> lock(mutex_);
+    peak_bytes_in_use_ = bytes_in_use_;
+    num_allocs_ = num_system_allocs_ = 0;
+}
+
+}    // namespace dragon
@@ -1,3 +1,5 @@
+#include <atomic>
+
 #include "core/operator_schema.h"
 #include "core/graph.h"
 #include "core/graph_gradient.h"
@@ -262,6 +264,210 @@ GraphDef Graph::Share(const GraphDef& optimized_graph) {
     return g;
 }
 
+namespace {
+
+const Argument* FindArg(const OperatorDef& op, const string& name) {
+    for (auto& arg : op.arg()) if (arg.name() == name) return &arg;
+    return nullptr;
+}
+
+int IntArg(const OperatorDef& op, const string& name, int default_value) {
+    const Argument* arg = FindArg(op, name);
+    return arg && arg->has_i() ? arg->i() : default_value;
+}
+
+float FloatArg(const OperatorDef& op, const string& name, float default_value) {
+    const Argument* arg = FindArg(op, name);
+    if (arg && arg->has_f()) return arg->f();
+    return arg && arg->has_i() ? (float)arg->i() : default_value;
+}
+
+string StringArg(const OperatorDef& op, const string& name,
+                 const string& default_value) {
+    const Argument* arg = FindArg(op, name);
+    return arg && arg->has_s() ? arg->s() : default_value;
+}
+
+bool IsChannelAxis(int axis, const string& data_format) {
+    if (data_format == "NCHW") return axis == 1;
+    return axis == -1 || axis == 3;
+}
+
+//  whether the op could be folded into the preceding conv
+bool IsFoldable(
+    const OperatorDef&          op,
+    const string&               data_format,
+    const string&               phase) {
+    if (op.output_size() != 1) return false;
+    if (op.type() == "BatchNorm" || op.type() == "FusedBatchNorm") {
+        int use_stats = IntArg(op, "use_stats", -1);
+        if (use_stats == 0 || (use_stats == -1 && phase != "TEST"))
+            return false;
+        if (op.input_size() < (op.type() == "BatchNorm" ? 3 : 5))
+            return false;
+        return IsChannelAxis(IntArg(op, "axis", -1), data_format);
+    } else if (op.type() == "Affine") {
+        int num_axes = IntArg(op, "num_axes", 1);
+        if (num_axes > 1 || (num_axes == -1 && data_format == "NCHW"))
+            return false;
+        return op.input_size() >= 2 &&
+            IsChannelAxis(IntArg(op, "axis", 1), data_format);
+    } else if (op.type() == "BiasAdd") {
+        return op.input_size() == 2 &&
+            StringArg(op, "data_format", "NCHW") == data_format;
+    }
+    return false;
+}
+
+bool Reads(const OperatorDef& op, const string& v) {
+    for (auto& u : op.input()) if (u == v) return true;
+    return false;
+}
+
+bool Writes(const OperatorDef& op, const string& v) {
+    for (auto& u : op.output()) if (u == v) return true;
+    return false;
+}
+
+}  // namespace
+
+GraphDef Graph::Fold(const GraphDef& optimized_graph) {
+    //  the weights are updated in the training graphs
+    for (auto& op : optimized_graph.op())
+        if (op.type().find("Gradient") != string::npos)
+            return optimized_graph;
+    const int num_ops = optimized_graph.op_size();
+    Set<string> targets;
+    for (auto& target : optimized_graph.target()) targets.insert(target);
+
+    //  the only op reading the value written by the i-th op
+    auto SoleReader = [&](int i, const string& v) {
+        int reader = -1;
+        for (int j = i + 1; j < num_ops; j++) {
+            const OperatorDef& op = optimized_graph.op(j);
+            if (Reads(op, v)) {
+                if (reader != -1) return -1;
+                reader = j;
+            }
+            if (Writes(op, v)) return reader;
+        }
+        return targets.count(v) ? -1 : reader;
+    };
+
+    vector<bool> removed(num_ops, false);
+    vector<string> folded;
+    Map<int, vector<OperatorDef> > rewritten;
+    for (int i = 0; i < num_ops; i++) {
+        const OperatorDef& conv = optimized_graph.op(i);
+        if (removed[i] || (conv.type() != "Conv2d" &&
+            conv.type() != "QuantizedConv2d")) continue;
+        const string data_format = StringArg(conv, "data_format", "NCHW");
+
+        //  search the chain: conv -> (bn | affine | bias)* -> relu?
+        vector<int> chain; bool relu = false;
+        string y = conv.output(0); int last = i;
+        while (true) {
+            int j = SoleReader(last, y);
+            if (j == -1) break;
+            const OperatorDef& op = optimized_graph.op(j);
+            if (op.input(0) != y) break;
+            if (op.type() == "Relu" && op.output_size() == 1 &&
+                    FloatArg(op, "slope", 0.f) == 0.f) relu = true;
+            else if (!IsFoldable(op, data_format, phase_)) break;
+            chain.push_back(j); last = j; y = op.output(0);
+            if (relu) break;
+        }
+        if (chain.empty()) continue;
+
+        //  the others between the chain could not touch the final output,
+        //  neither could they write the params of the chain
+        Set<int> in_chain(chain.begin(), chain.end());
+        Set<string> params;
+        for (auto j : chain) {
+            const OperatorDef& op = optimized_graph.op(j);
+            for (int k = 1; k < op.input_size(); k++)
+                params.insert(op.input(k));
+        }
+        bool valid = true;
+        for (int j = i + 1; j < last && valid; j++) {
+            if (in_chain.count(j)) continue;
+            const OperatorDef& op = optimized_graph.op(j);
+            if (Reads(op, y) || Writes(op, y)) valid = false;
+            for (auto& v : op.output())
+                if (params.count(v)) valid = false;
+        }
+        if (!valid) continue;
+
+        OperatorDef new_conv(conv);
+        new_conv.set_output(0, y);
+        if (relu) {
+            Argument* arg = new_conv.add_arg();
+            arg->set_name("activation"); arg->set_s("RELU");
+        }
+        const int num_affine = (int)chain.size() - (relu ? 1 : 0);
+        if (num_affine > 0) {
+            //  fold the params at runtime, as the weights are loaded lazily
+            const string prefix = "/mnt/" + (conv.name().empty() ?
+                conv.output(0) : conv.name()) + "/folded/";
+            OperatorDef fold;
+            fold.set_type("FoldAffine");
+            fold.set_name(conv.name() + "/fold");
+            fold.add_input(conv.input(1));
+            const bool has_bias = conv.input_size() > 2 &&
+                conv.input(2) != "ignore";
+            if (has_bias) fold.add_input(conv.input(2));
+            Argument types, modes, num_params, eps;
+            types.set_name("types"); modes.set_name("modes");
+            num_params.set_name("num_params"); eps.set_name("eps");
+            for (int k = 0; k < num_affine; k++) {
+                const OperatorDef& op = optimized_graph.op(chain[k]);
+                for (int p = 1; p < op.input_size(); p++)
+                    fold.add_input(op.input(p));
+                types.add_strings(op.type());
+                modes.add_strings(StringArg(op, "mode", "DEFAULT"));
+                num_params.add_ints(op.input_size() - 1);
+                eps.add_floats(FloatArg(op, "eps", 1e-5f));
+            }
+            fold.add_output(prefix + "weights");
+            fold.add_output(prefix + "bias");
+            Argument* arg = fold.add_arg();
+            arg->set_name("data_format"); arg->set_s(data_format);
+            arg = fold.add_arg();
+            arg->set_name("has_bias"); arg->set_b(has_bias);
+            fold.add_arg()->CopyFrom(types);
+            fold.add_arg()->CopyFrom(modes);
+            fold.add_arg()->CopyFrom(num_params);
+            fold.add_arg()->CopyFrom(eps);
+            if (conv.has_device_option())
+                fold.mutable_device_option()->CopyFrom(conv.device_option());
+            new_conv.set_input(1, fold.output(0));
+            if (new_conv.input_size() > 2) new_conv.set_input(2, fold.output(1));
+            else new_conv.add_input(fold.output(1));
+            rewritten[i].push_back(fold);
+            //  the folded params are reused by the following runs,
+            //  keep them out of the memory planning as the targets
+            folded.push_back(fold.output(0));
+            folded.push_back(fold.output(1));
+        }
+        rewritten[i].push_back(new_conv);
+        removed[i] = true;
+        for (auto j : chain) removed[j] = true;
+    }
+
+    //  done!
+    GraphDef g;
+    g.CopyFrom(optimized_graph); g.clear_op();
+    for (int i = 0; i < num_ops; i++) {
+        if (rewritten.count(i)) {
+            for (auto& op : rewritten[i]) g.add_op()->CopyFrom(op);
+        } else if (!removed[i]) {
+            g.add_op()->CopyFrom(optimized_graph.op(i));
+        }
+    }
+    for (auto& v : folded) g.add_target(v);
+    return g;
+}
+
 void Graph::ShareGrads(GraphDef& optimized_graph) {
     GraphDef forward_ops, backward_ops;
     vector<string> targets;
@@ -280,7 +486,9 @@ GraphDef Graph::MakeUpdate(const GraphDef& meta_graph) {
     collective_op.set_type("CollectiveUpdate");
 
     //  make update ops
+    //  the targets with the same type and arguments are fused into one op
     vector<OperatorDef> update_ops;
+    Map<string, int> fused_indices;
     for (int i = 0; i < meta_graph.u_target_size(); i++) {
         UpdateTarget target = meta_graph.u_target(i);
         vector<string> missing_tensors;
@@ -291,16 +499,20 @@ GraphDef Graph::MakeUpdate(const GraphDef& meta_graph) {
             }
         }
         if (missing_tensors.size() == 0) {
-            vector<Argument> args;
-            for (auto& arg : target.arg()) args.push_back(arg);
-            OperatorDef op_def = MakeOperatorDef(target.type(),
-                                                 target.name(),
-                          vector<string>({ target.tensor(1) }),  // dx
-                          vector<string>({ target.tensor(0) })); // x
+            string key = target.type();
+            for (auto& arg : target.arg()) key += arg.SerializeAsString();
+            if (!fused_indices.count(key)) {
+                fused_indices[key] = (int)update_ops.size();
+                OperatorDef op_def = MakeOperatorDef(target.type(),
+                    target.name(), vector<string>(), vector<string>());
+                op_def.mutable_arg()->CopyFrom(target.arg());
+                update_ops.push_back(op_def);
+            }
+            OperatorDef& op_def = update_ops[fused_indices[key]];
+            op_def.add_input(target.tensor(1));   // dx
+            op_def.add_output(target.tensor(0));  // x
             collective_op.add_input(target.tensor(1));
             collective_op.add_output(target.tensor(1));
-            op_def.mutable_arg()->CopyFrom(target.arg());
-            update_ops.push_back(op_def);
         } else {
             LOG(INFO) << "Missing tensors. Skip update Tensor("
                       << target.tensor(0) << ")";
@@ -325,6 +537,8 @@ GraphDef Graph::MakeUpdate(const GraphDef& meta_graph) {
                 op_def.add_arg()->CopyFrom(this->args_["comm"]);
                 op_def.add_arg()->CopyFrom(this->args_["group"]);
                 op_def.add_arg()->CopyFrom(this->args_["root"]);
+                if (this->args_.count("bucket_size"))
+                    op_def.add_arg()->CopyFrom(this->args_["bucket_size"]);
             } else {
                 LOG(FATAL) << "MPI was not initialized.";
             }
@@ -361,6 +575,8 @@ bool Graph::Create(const GraphDef& optimized_graph, Workspace* ws) {
         Argument arg; arg.set_name("recomputing_aware");
         arg.set_b(true); op_def.add_arg()->CopyFrom(arg);
         OperatorBase* op = CreateOperator(op_def, ws);
+        //  the phase is fixed for the graph
+        op->SwitchToPhase(phase_);
         ops_.push_back(op);
     }
     return true;
@@ -368,7 +584,10 @@ bool Graph::Create(const GraphDef& optimized_graph, Workspace* ws) {
 
 void Graph::RecomputingAware(const GraphDef& optimized_graph, Workspace* ws) {
     GraphDef fake_graph(optimized_graph);
-    Map<string, vector<OperatorBase*> > fake_recompute_map, recompute_map;
+    Map<string, vector<OperatorBase*> > fake_recompute_map;
+    shared_ptr<OperatorBase::RecomputeMap> recompute_map_ptr(
+        new OperatorBase::RecomputeMap());
+    auto& recompute_map = *recompute_map_ptr;
     Map<string, string> rename_map;
     Map<string, Set<string> > hash_map;
     Map<string, int> multi_use_count;
@@ -392,9 +611,13 @@ void Graph::RecomputingAware(const GraphDef& optimized_graph, Workspace* ws) {
             rename_map[op->output(0)] = op->input(0);
             *op->mutable_output(0) = op->input(0);
             ops_[i]->Input(0).Corrupt();    //  mark as a flag
+            has_mirror_stage_ = true;
         }
     }
 
+    //  the recompute map is only queried by the corrupted inputs
+    if (!has_mirror_stage_) return;
+
     //  sub-graph aware
     for (int i = 0; i < ops_.size(); i++) {
         if (ops_[i]->type().find("Gradient") != string::npos) continue;
@@ -424,11 +647,12 @@ void Graph::RecomputingAware(const GraphDef& optimized_graph, Workspace* ws) {
     }
 
     //  apply map
-    for (auto& ops : ops_) ops->set_recompute_map(recompute_map);
+    for (auto& ops : ops_) ops->set_recompute_map(recompute_map_ptr);
 }
 
 Graph::Graph(const GraphDef& meta_graph, Workspace* ws)
     : GraphBase(meta_graph, ws) {
+    if (this->args_.count("phase")) phase_ = this->args_["phase"].s();
     GraphDef optimized_graph;
     if (meta_graph.u_target_size() > 0) {
         //  check if existing any update requests
@@ -439,8 +663,12 @@ Graph::Graph(const GraphDef& meta_graph, Workspace* ws)
         int OX = 3;  // defaults: O3
         if (this->args_.count("optimization_level"))
             OX = this->args_["optimization_level"].i();
+        bool fold_batch_norm = false;
+        if (this->args_.count("fold_batch_norm"))
+            fold_batch_norm = this->args_["fold_batch_norm"].b();
         optimized_graph = meta_graph;
         if (OX >= 1) optimized_graph = Prune(meta_graph);
+        if (fold_batch_norm) optimized_graph = Fold(optimized_graph);
         if (OX >= 2) optimized_graph = Share(optimized_graph);
         if (OX >= 3) ShareGrads(optimized_graph);
     }
@@ -457,23 +685,458 @@ Graph::Graph(const GraphDef& meta_graph, Workspace* ws)
 
     //  recomputing-aware
     RecomputingAware(optimized_graph, ws);
+
+    //  scheduling for the independent ops
+    MakeSchedule();
+
+    //  the memory is planned after the first run
+    for (auto& target : optimized_graph.target())
+        targets_.insert(target);
+    for (auto& g_target : optimized_graph.g_target())
+        targets_.insert(g_target.wrt() + "_grad");
+    if (this->args_.count("memory_planning"))
+        memory_planning_ = this->args_["memory_planning"].b();
+    if (memory_planning_ && thread_pool_) {
+        LOG(WARNING) << "The lifetimes of tensors are ambiguous "
+                     << "for parallel ops, skip the memory planning.";
+        memory_planning_ = false;
+    }
+    for (auto* op : ops_) {
+        //  the arena is allocated on CPU currently
+        if (op->def().device_option().device_type() != 0)
+            memory_planning_ = false;
+    }
 }
 
-bool Graph::Run(
+Graph::~Graph() {
+    //  detach the tensors from the arena before releasing it
+    for (auto& kv : planned_memory_)
+        if (kv.first->memory() == kv.second) kv.first->Replace(nullptr);
+    for (auto* op : ops_) delete op;
+}
+
+namespace {
+
+//  the tensors referred by arguments, e.g. ``shape_like``
+vector<Tensor*> ArgumentTensors(OperatorBase* op, Workspace* ws) {
+    vector<Tensor*> tensors;
+    for (auto& arg : op->def().arg()) {
+        vector<string> names(arg.strings().begin(), arg.strings().end());
+        if (arg.has_s()) names.push_back(arg.s());
+        for (auto& name : names) {
+            Tensor* x = ws->TryGetTensor(name);
+            if (x) tensors.push_back(x);
+        }
+    }
+    return tensors;
+}
+
+}  // namespace
+
+void Graph::MakeSchedule() {
+    int num_threads = 1;
+    if (this->args_.count("inter_op_threads"))
+        num_threads = this->args_["inter_op_threads"].i();
+    //  the recomputing shares the buffers of mirror stage
+    if (num_threads <= 1 || has_mirror_stage_) return;
+    for (auto* op : ops_) {
+        //  the device contexts and python ops are not thread-safe
+        if (op->def().device_option().device_type() != 0 ||
+                op->type() == "Run" || op->type() == "Template") return;
+    }
+
+    //  the views share the memory of inputs at runtime,
+    //  i.e. the hazards are tracked by the groups of aliases
+    static Set<string> ViewOps = {
+        "Reshape", "Flatten", "Squeeze", "ExpandDims",
+    };
+    Map<Tensor*, Tensor*> aliases;
+    auto alias_root = [&aliases](Tensor* t) {
+        while (aliases.count(t)) t = aliases[t];
+        return t;
+    };
+    for (auto* op : ops_) {
+        if (!ViewOps.count(op->type())) continue;
+        Tensor* x = alias_root(&op->Input(0));
+        Tensor* y = alias_root(op->Output(0));
+        if (x != y) aliases[y] = x;
+    }
+
+    //  build the dependencies by the read/write hazards of tensors
+    Map<Tensor*, int> last_writer;
+    Map<Tensor*, vector<int> > last_readers;
+    Map<string, int> last_anchor;
+    vector<int> since_barrier;
+    int last_barrier = -1;
+    successors_.assign(ops_.size(), vector<int>());
+    num_parents_.assign(ops_.size(), 0);
+    for (int i = 0; i < ops_.size(); i++) {
+        auto* op = ops_[i];
+        Set<int> parents;
+        vector<Tensor*> reads = ArgumentTensors(op, ws());
+        for (int j = 0; j < op->InputSize(); j++) {
+            Tensor* x = &op->Input(j);
+            if (x->name() != "ignore") reads.push_back(x);
+        }
+        for (auto*& x : reads) x = alias_root(x);
+        for (auto* x : reads) {
+            if (last_writer.count(x)) parents.insert(last_writer[x]);
+            last_readers[x].push_back(i);
+        }
+        for (int j = 0; j < op->OutputSize(); j++) {
+            Tensor* y = op->Output(j);
+            if (y->name() == "ignore") continue;
+            y = alias_root(y);
+            if (last_writer.count(y)) parents.insert(last_writer[y]);
+            for (auto reader : last_readers[y]) parents.insert(reader);
+            last_writer[y] = i; last_readers[y].clear();
+        }
+        //  the gradient ops share the resources with forward ops by anchor
+        if (last_anchor.count(op->anchor()))
+            parents.insert(last_anchor[op->anchor()]);
+        last_anchor[op->anchor()] = i;
+        //  the collective and update ops keep the original order
+        if (op->type().find("MPI") != string::npos ||
+                op->type().find("Collective") != string::npos ||
+                op->type().find("Update") != string::npos) {
+            for (auto e : since_barrier) parents.insert(e);
+            since_barrier.clear();
+            last_barrier = i;
+        } else {
+            if (last_barrier >= 0) parents.insert(last_barrier);
+            since_barrier.push_back(i);
+        }
+        parents.erase(i);
+        num_parents_[i] = (int)parents.size();
+        for (auto parent : parents) successors_[parent].push_back(i);
+    }
+
+    thread_pool_.reset(new ThreadPool(num_threads, [](int slot) {
+        Workspace::thread_slot() = slot; }));
+}
+
+const vector<bool>& Graph::GetStage(
     const string&               include,
-    const string&               exclude,
-    const int                   stream_id) {
-    LOG(DEBUG) << "Run Graph: " << name();
-    for (auto op : ops_) {
+    const string&               exclude) {
+    string key = include + "/" + exclude;
+    auto it = stages_.find(key);
+    if (it != stages_.end()) return it->second;
+    vector<bool> stage(ops_.size(), true);
+    for (int i = 0; i < ops_.size(); i++) {
         if (!include.empty())
-            if (op->type().find(include) == string::npos) continue;
+            if (ops_[i]->type().find(include) == string::npos)
+                stage[i] = false;
         if (!exclude.empty())
-            if (op->type().find(exclude) != string::npos) continue;
-        op->SwitchToPhase(this->args_["phase"].s());
+            if (ops_[i]->type().find(exclude) != string::npos)
+                stage[i] = false;
+    }
+    return stages_[key] = stage;
+}
+
+namespace {
+
+struct ScheduleState {
+    vector<OperatorBase*>* ops;
+    vector<vector<int> >* successors;
+    const vector<bool>* stage;
+    ThreadPool* thread_pool;
+    int stream_id;
+    string session;
+    unique_ptr<std::atomic<int>[]> num_pending;
+    std::atomic<int> num_remaining;
+    std::mutex mutex;
+    std::condition_variable finished;
+};
+
+void ScheduleOp(shared_ptr<ScheduleState> state, int i) {
+    auto* op = (*state->ops)[i];
+    if ((*state->stage)[i]) {
+        ProfilerSession session(state->session);
         LOG(DEBUG) << "$ Before Operator: " << op->name();
-        op->Run(stream_id);
+        op->Run(state->stream_id);
         LOG(DEBUG) << "$ After Operator: " << op->name();
     }
+    //  the ops are ready if all parents finished
+    for (auto j : (*state->successors)[i])
+        if (--state->num_pending[j] == 0)
+            state->thread_pool->Schedule(
+                [state, j]() { ScheduleOp(state, j); });
+    if (--state->num_remaining == 0) {
+        std::lock_guard<std::mutex> lock(state->mutex);
+        state->finished.notify_all();
+    }
+}
+
+}  // namespace
+
+void Graph::RunParallel(
+    const vector<bool>&         stage,
+    const int                   stream_id) {
+    if (ops_.empty()) return;
+    shared_ptr<ScheduleState> state(new ScheduleState());
+    state->ops = &ops_;
+    state->successors = &successors_;
+    state->stage = &stage;
+    state->thread_pool = thread_pool_.get();
+    state->stream_id = stream_id;
+    state->session = name();
+    state->num_pending.reset(new std::atomic<int>[ops_.size()]);
+    for (int i = 0; i < ops_.size(); i++)
+        state->num_pending[i] = num_parents_[i];
+    state->num_remaining = (int)ops_.size();
+    for (int i = 0; i < ops_.size(); i++)
+        if (num_parents_[i] == 0) thread_pool_->Schedule(
+            [state, i]() { ScheduleOp(state, i); });
+    std::unique_lock<std::mutex> lock(state->mutex);
+    state->finished.wait(lock, [&state]() {
+        return state->num_remaining == 0; });
+}
+
+void Graph::PlanMemory(bool apply) {
+    //  collect the lifetimes of tensors in the order of ops
+    //  the tensors read before written are fed or updated outside
+    Map<Tensor*, std::pair<int, int> > lifetimes;
+    Set<Tensor*> externals, consumed;
+    vector<Tensor*> tensors;
+    for (int i = 0; i < ops_.size(); i++) {
+        auto* op = ops_[i];
+        for (int j = 0; j < op->InputSize(); j++) {
+            Tensor* x = &op->Input(j);
+            if (x->name() == "ignore") continue;
+            if (!lifetimes.count(x)) {
+                if (!externals.count(x)) tensors.push_back(x);
+                externals.insert(x);
+            } else {
+                lifetimes[x].second = i;
+                consumed.insert(x);
+            }
+        }
+        for (auto* x : ArgumentTensors(op, ws())) {
+            if (lifetimes.count(x)) {
+                lifetimes[x].second = i;
+                consumed.insert(x);
+            }
+        }
+        for (int j = 0; j < op->OutputSize(); j++) {
+            Tensor* y = op->Output(j);
+            if (y->name() == "ignore" || externals.count(y)) continue;
+            if (!lifetimes.count(y)) {
+                lifetimes[y] = std::make_pair(i, i);
+                tensors.push_back(y);
+            } else {
+                lifetimes[y].second = i;
+            }
+        }
+    }
+
+    //  the recomputed ops of mirror stage will run again in backward
+    //  keep their inputs and outputs alive until the end
+    if (has_mirror_stage_) {
+        Set<OperatorBase*> recomputed;
+        for (auto& kv : ops_[0]->recompute_map())
+            for (auto* op : kv.second) recomputed.insert(op);
+        int last = (int)ops_.size() - 1;
+        for (auto* op : ops_) {
+            if (!recomputed.count(op)) continue;
+            for (int j = 0; j < op->InputSize(); j++)
+                if (lifetimes.count(&op->Input(j)))
+                    lifetimes[&op->Input(j)].second = last;
+            for (int j = 0; j < op->OutputSize(); j++)
+                if (lifetimes.count(op->Output(j)))
+                    lifetimes[op->Output(j)].second = last;
+        }
+    }
+
+    //  the corrupted tensors are held by the buffers of mirror stage
+    for (int i = 0; i < WORKSPACE_MAX_CORRUPTED_SIZE; i++) {
+        tensors.push_back(ws()->GetTensor(
+            "/opt/mirror_stage/buffer_" + std::to_string(i)));
+        externals.insert(tensors.back());
+    }
+
+    //  the targets are fetched after running
+    Set<Tensor*> targets;
+    for (auto& target : targets_)
+        if (ws()->HasTensor(target)) targets.insert(ws()->GetTensor(target));
+
+    //  group the tensors sharing a memory (e.g. reshape)
+    //  the block is unavailable if any tensor can not be planned
+    Map<MixedMemory*, int> block_indices;
+    vector<MemoryBlock> blocks;
+    vector<bool> plannable;
+    for (auto* t : tensors) {
+        MixedMemory* mem = t->memory();
+        if (mem == nullptr) continue;
+        if (!block_indices.count(mem)) {
+            block_indices[mem] = (int)blocks.size();
+            blocks.push_back(MemoryBlock());
+            blocks.back().first = INT_MAX;
+            plannable.push_back(true);
+        }
+        int idx = block_indices[mem];
+        MemoryBlock& block = blocks[idx];
+        block.tensors.push_back(t);
+        if (externals.count(t) || !consumed.count(t) ||
+                targets.count(t) || excluded_.count(t) ||
+                    t->is_corrupted() || t->meta().ctor() ||
+                        t->nbytes() == 0) {
+            plannable[idx] = false;
+            continue;
+        }
+        size_t& nbytes = max_nbytes_[t];
+        nbytes = std::max(nbytes, t->nbytes());
+        block.nbytes = std::max(block.nbytes, nbytes);
+        block.first = std::min(block.first, lifetimes[t].first);
+        block.last = std::max(block.last, lifetimes[t].second);
+    }
+
+    //  the sharing tensors refer to the memory of an owner
+    MemoryPlan plan;
+    for (int i = 0; i < blocks.size(); i++) {
+        int num_owners = 0;
+        for (auto* t : blocks[i].tensors)
+            if (!t->is_shared()) num_owners++;
+        if (!plannable[i] || num_owners != 1) continue;
+        //  align the blocks by 64 bytes
+        blocks[i].nbytes = (blocks[i].nbytes + 63) / 64 * 64;
+        plan.naive_bytes += blocks[i].nbytes;
+        plan.blocks.push_back(blocks[i]);
+    }
+
+    //  the peak of living bytes, i.e. the lower bound of the arena
+    vector<int64_t> delta(ops_.size() + 1, 0);
+    for (auto& block : plan.blocks) {
+        delta[block.first] += block.nbytes;
+        delta[block.last + 1] -= block.nbytes;
+    }
+    int64_t living = 0;
+    for (auto e : delta) {
+        living += e;
+        plan.live_bytes = std::max(plan.live_bytes, (size_t)living);
+    }
+
+    //  best-fit packing: place the larger blocks first,
+    //  then search the smallest gap between the overlapped blocks
+    auto& planned = plan.blocks;
+    std::stable_sort(planned.begin(), planned.end(),
+        [](const MemoryBlock& a, const MemoryBlock& b) {
+            return a.nbytes > b.nbytes; });
+    for (int i = 0; i < planned.size(); i++) {
+        auto& block = planned[i];
+        vector<std::pair<size_t, size_t> > overlapped;
+        for (int j = 0; j < i; j++) {
+            if (planned[j].last < block.first ||
+                    block.last < planned[j].first) continue;
+            overlapped.push_back(std::make_pair(
+                planned[j].offset, planned[j].nbytes));
+        }
+        std::sort(overlapped.begin(), overlapped.end());
+        size_t offset = 0, best_offset = 0, best_gap = SIZE_MAX;
+        for (auto& e : overlapped) {
+            if (e.first > offset) {
+                size_t gap = e.first - offset;
+                if (gap >= block.nbytes && gap < best_gap) {
+                    best_gap = gap; best_offset = offset;
+                }
+            }
+            offset = std::max(offset, e.first + e.second);
+        }
+        block.offset = best_gap == SIZE_MAX ? offset : best_offset;
+        plan.planned_bytes = std::max(plan.planned_bytes,
+            block.offset + block.nbytes);
+    }
+
+    if (apply) {
+        //  copy the living data into the new arena,
+        //  as the stages of graph (e.g. forward and backward) run separately
+        unique_ptr<MixedMemory> arena(new MixedMemory(
+            TypeMeta::Make<uint8_t>(), plan.planned_bytes));
+        uint8_t* arena_ptr = plan.planned_bytes == 0 ? nullptr :
+            (uint8_t*)arena->mutable_cpu_data();
+        planned_memory_.clear();
+        planned_owners_.clear();
+        for (auto& block : planned) {
+            MixedMemory* view = new MixedMemory(
+                TypeMeta::Make<uint8_t>(), block.nbytes);
+            view->set_cpu_data(arena_ptr + block.offset, block.nbytes);
+            MixedMemory* mem = block.tensors[0]->memory();
+            if (mem->state() != MixedMemory::UNINITIALIZED)
+                memcpy(arena_ptr + block.offset, mem->cpu_data(),
+                    std::min(block.nbytes, mem->nbytes()));
+            for (auto* t : block.tensors) {
+                if (t->is_shared()) continue;
+                t->Replace(view);
+                planned_owners_[view] = t;
+            }
+            for (auto* t : block.tensors) {
+                if (t->is_shared()) t->Share(view);
+                planned_memory_[t] = view;
+            }
+        }
+        arena_ = std::move(arena);
+        num_allocated_ = NumAllocatedOutputs();
+        plan.applied = true;
+    }
+    memory_plan_ = plan;
+}
+
+int Graph::NumAllocatedOutputs() {
+    int num_allocated = 0;
+    for (auto* op : ops_)
+        for (int j = 0; j < op->OutputSize(); j++)
+            if (op->Output(j)->memory()) num_allocated++;
+    return num_allocated;
+}
+
+bool Graph::IsMemoryPlanStale() {
+    if (!memory_plan_.applied) return true;
+    bool stale = false;
+    for (auto& kv : planned_memory_) {
+        Tensor* t = kv.first;
+        if (t->memory() == kv.second) continue;
+        //  the tensor moves out if the planned memory is too small,
+        //  otherwise it is taken by others, e.g. another graph
+        if (t->nbytes() <= max_nbytes_[t]) excluded_.insert(t);
+        stale = true;
+    }
+    //  the memory is deleted if the owner moves out for a larger size,
+    //  the sharing tensors not running again should follow the owner
+    for (auto& kv : planned_memory_) {
+        Tensor* t = kv.first;
+        Tensor* owner = planned_owners_[kv.second];
+        if (t == owner || t->memory() != kv.second ||
+                owner->memory() == kv.second) continue;
+        if (owner->memory()) t->Share(owner->memory());
+        else t->Replace(nullptr);
+    }
+    //  the outputs of ops not running in the previous stages
+    return stale || NumAllocatedOutputs() != num_allocated_;
+}
+
+const Graph::MemoryPlan& Graph::GetMemoryPlan() {
+    //  analyze the memory of last run if not planned
+    if (!memory_plan_.applied) PlanMemory(false);
+    return memory_plan_;
+}
+
+bool Graph::Run(
+    const string&               include,
+    const string&               exclude,
+    const int                   stream_id) {
+    LOG(DEBUG) << "Run Graph: " << name();
+    ProfilerSession session(name());
+    const vector<bool>& stage = GetStage(include, exclude);
+    if (thread_pool_) {
+        RunParallel(stage, stream_id);
+        return true;
+    }
+    for (int i = 0; i < ops_.size(); i++) {
+        if (!stage[i]) continue;
+        LOG(DEBUG) << "$ Before Operator: " << ops_[i]->name();
+        ops_[i]->Run(stream_id);
+        LOG(DEBUG) << "$ After Operator: " << ops_[i]->name();
+    }
+    if (memory_planning_ && IsMemoryPlanStale()) PlanMemory(true);
     return true;
 }
 
@@ -74,22 +74,23 @@ const void* MixedMemory::cnml_data() {
 
 void* MixedMemory::mutable_cpu_data() {
     ToCPU();
-    state_ = STATE_AT_CPU;
+    state_ = STATE_AT_CPU; version_++;
     return cpu_ptr_;
 }
 
 void* MixedMemory::mutable_cuda_data() {
     ToCUDA();
-    state_ = STATE_AT_CUDA;
+    state_ = STATE_AT_CUDA; version_++;
     return cuda_ptr_;
 }
 
 void* MixedMemory::mutable_cnml_data() {
-    state_ = STATE_AT_CNML;
+    state_ = STATE_AT_CNML; version_++;
     return cnml_ptr_;
 }
 
 void MixedMemory::set_cpu_data(void* cpu_ptr, size_t nbytes) {
+    version_++;
     bool use_cudahost_mem = false;
 #ifdef WITH_CUDA_HOST_MEM
     use_cudahost_mem = true;
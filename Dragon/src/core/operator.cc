@@ -108,6 +108,23 @@ void OperatorBase::MutableOp(const OperatorDef& def) {
         if (arg.name() == "anchor") anchor_ = arg.s();
 }
 
+void OperatorBase::RecordProfile(int64_t start, int64_t nbytes) {
+    Profiler::Event event;
+    event.type = type();
+    event.name = name();
+    //  the gradient ops share the anchor of their forward op
+    event.anchor = anchor();
+    event.session = Profiler::session();
+    for (int i = 0; i < inputs_.size(); i++) {
+        if (i > 0) event.shapes += ", ";
+        event.shapes += inputs_[i]->DimString();
+    }
+    event.start = start;
+    event.duration = Profiler::Now() - start;
+    event.nbytes = nbytes;
+    Profiler::Record(event);
+}
+
 OperatorBase* CreateOperator(
     const OperatorDef&          def,
     Workspace*                  ws) {
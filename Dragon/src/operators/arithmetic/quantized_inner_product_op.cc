@@ -0,0 +1,120 @@
+#include "core/workspace.h"
+#include "utils/filler.h"
+#include "utils/op_kernel.h"
+#include "utils/math_functions.h"
+#include "utils/omp_alternative.h"
+#include "operators/arithmetic/quantized_inner_product_op.h"
+
+namespace dragon {
+
+template <class Context>
+vector<std::pair<MixedMemory*, size_t> > QuantizedInnerProductOp<Context>::Versions() {
+    MixedMemory* w = Input(1).memory(), *q = packed->memory();
+    return vector<std::pair<MixedMemory*, size_t> >({
+        { w, w ? w->version() : 0 }, { q, q ? q->version() : 0 } });
+}
+
+template <class Context> template <typename T>
+void QuantizedInnerProductOp<Context>::QuantizeWeights() {
+    //  skip if neither the float nor the quantized are mutated,
+    //  where the latter could be shared by the ops of other graphs
+    packed = ws()->CreateTensor("/mnt/" + anchor() + "/quantized/weights");
+    if (Versions() == versions) return;
+
+    const int N = (int)num_output;
+    scales = ws()->CreateTensor("/mnt/" + anchor() + "/quantized/scales");
+    sums = ws()->CreateTensor("/mnt/" + anchor() + "/quantized/sums");
+    packed->Reshape({ (TIndex)math::Int8GemmPackedSize(N, (int)K) });
+    scales->Reshape({ N }); sums->Reshape({ N });
+
+    //  W: [num_output, K] if TransW, else [K, num_output]
+    kernel::QuantizeWeights<T, Context>(N, (int)K, !TransW,
+        Input(1).template data<T, Context>(),
+            scales->template mutable_data<float, Context>(),
+                sums->template mutable_data<int, Context>(),
+                    (int8_t*)packed->template mutable_data<uint8_t, Context>(),
+                        ctx());
+    versions = Versions();
+}
+
+template <class Context> template <typename T>
+void QuantizedInnerProductOp<Context>::RunWithType() {
+    vector<TIndex> weight_shape = TransW ?
+        vector<TIndex>({ num_output, K }) : vector<TIndex>({ K, num_output });
+    vector<TIndex> bias_shape(1, num_output);
+    TENSOR_FILL(Input(1), weight_shape);
+    if (InputSize() > 2) TENSOR_FILL(Input(2), bias_shape);
+    CHECK(Input(1).ndim() == 2 && Input(1).dim(TransW ? 1 : 0) == K)
+        << "\nWeights should shape as [num_output, dim].\n"
+        << "Input dims are (" << M << ", " << K << ").\n"
+        << "Weights dims are " << Input(1).DimString();
+    QuantizeWeights<T>();
+
+    const int N = (int)num_output, ldr = ((int)K + 3) / 4 * 4;
+    //  the segments are aligned by 64 bytes
+    auto align = [](size_t nbytes) { return (nbytes + 63) / 64 * 64; };
+    auto buffers = ws()->template caches<Context>({
+        align((size_t)M * ldr), align((size_t)M * N * sizeof(int)),
+            N * 2 * sizeof(float) });
+    auto* Qdata = (uint8_t*)buffers[0];
+    auto* Cdata = (int*)buffers[1];
+    auto* alpha = (float*)buffers[2], *beta = alpha + N;
+
+    //  y = alpha * (x_q * w_q) + beta
+    auto* Sdata = scales->template data<float, Context>();
+    auto* Zdata = sums->template data<int, Context>();
+    auto* Bdata = InputSize() > 2 ?
+        Input(2).template data<T, Context>() : nullptr;
+    for (int k = 0; k < N; k++) {
+        alpha[k] = x_scale * Sdata[k];
+        beta[k] = (Bdata ? Bdata[k] : 0.f) - alpha[k] * x_zero_point * Zdata[k];
+    }
+
+    //  the rows are padded to the multiple of 4 by the zero point
+    auto* Xdata = Input(0).template data<T, Context>();
+    if (K == ldr) {
+        kernel::Quantize<T, Context>((int)(M * K),
+            x_scale, x_zero_point, Xdata, Qdata, ctx());
+    } else {
+        for (int i = 0; i < M; i++) {
+            uint8_t* q = Qdata + (size_t)i * ldr;
+            kernel::Quantize<T, Context>((int)K, x_scale,
+                x_zero_point, Xdata + i * K, q, ctx());
+            for (int k = (int)K; k < ldr; k++) q[k] = (uint8_t)x_zero_point;
+        }
+    }
+
+    auto* Pdata = (const int8_t*)packed->template data<uint8_t, Context>();
+    math::Int8Gemm<Context>((int)M, N, (int)K,
+        Qdata, ldr, Pdata, Cdata, ctx());
+
+    auto* Ydata = Output(0)->template mutable_data<T, Context>();
+#ifdef WITH_OMP
+    #pragma omp parallel for num_threads(GET_OMP_THREADS(M * N))
+#endif
+    for (int i = 0; i < M; i++)
+        for (int k = 0; k < N; k++)
+            Ydata[i * N + k] = alpha[k] * Cdata[i * N + k] + beta[k];
+}
+
+template <class Context>
+void QuantizedInnerProductOp<Context>::RunOnDevice() {
+    TIndex _axis_ = axis < 0 ? axis + Input(0).ndim() : axis;
+    M = Input(0).count(0, _axis_), K = Input(0).count(_axis_);
+
+    vector<TIndex> output_dims(_axis_ + 1);
+    for (int i = 0; i < _axis_ + 1; i++)
+        output_dims[i] = i < _axis_ ?
+            Input(0).dim(i) : num_output;
+    Output(0)->Reshape(output_dims);
+
+    if (XIsType(Input(0), float)) RunWithType<float>();
+    else LOG(FATAL) << DTypeHelper(Input(0), { "float32" });
+}
+
+DEPLOY_CPU(QuantizedInnerProduct);
+OPERATOR_SCHEMA(QuantizedInnerProduct).NumInputs(2, 3).NumOutputs(1);
+
+NO_GRADIENT(QuantizedInnerProduct);
+
+}    // namespace dragon
@@ -49,7 +49,8 @@ void SmoothL1LossOp<Context>::RunOnDevice() {
     Output(0)->Reshape({ 1 });
 
     diff = ws()->CreateTensor("/mnt/" + anchor() + "/smoothl1_loss/diff");
-    error = ws()->CreateTensor("/share/smoothl1_loss_error");
+    error = ws()->CreateTensor(
+        Workspace::ScratchName("/share/smoothl1_loss_error"));
     diff->ReshapeLike(Input(0));
     error->ReshapeLike(Input(0));
 
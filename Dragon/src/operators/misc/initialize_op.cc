@@ -51,7 +51,7 @@ void FillOp<Context>::RunOnDevice() {
     }
     Output(0)->Reshape(output_shape);
     if (dtype == "float32") RunWithType<float>();
-    else if (dtype == "float32") RunWithType<float16>();
+    else if (dtype == "float16") RunWithType<float16>();
     else if (dtype == "int32") RunWithType<int>();
     else if (dtype == "int64") RunWithType<int64_t>();
     else LOG(FATAL) << DTypeHelper(dtype,
@@ -6,50 +6,30 @@
 namespace dragon {
 
 template <class Context> template <typename T>
-void ReduceOp<Context>::SumRunWithType() {
+void ReduceOp<Context>::RunWithType() {
     auto* Xdata = Input(0).template data<T, Context>();
     auto* Ydata = Output(0)->template mutable_data<T, Context>();
-    if (axis == -1) {
-        DECLARE_MULTIPLIER(multiplier, Input(0).count());
-        T result_host;
-        math::Dot<T, Context>(Input(0).count(),
-            multiplier, Xdata, &result_host, ctx());
-        ctx()->template Copy<T, Context, CPUContext>(
-            1, Ydata, &result_host);
-    } else {
-        kernel::Sum<T, Context>(count,
-            axis_dim, inner_dim, Xdata, Ydata, ctx());
-    }
-}
-
-template <class Context> template <typename T>
-void ReduceOp<Context>::MeanRunWithType() {
-    SumRunWithType<T>();
-    auto* Ydata = Output(0)->template mutable_data<T, Context>();
-    T coeff = axis != -1 ? 1.0 / axis_dim : 1.0 / Input(0).count();
-    math::Scal<T, Context>(Output(0)->count(), coeff, Ydata, ctx());
+    kernel::Reduce<T, Context>((int)dims.size(), dims.data(),
+        (int)reduce_axes.size(), reduce_axes.data(),
+            operation, Xdata, Ydata, ctx());
 }
 
 template <class Context>
 void ReduceOp<Context>::RunOnDevice() {
-    if (axis != -1) {
-        count = Input(0).count() / Input(0).dim(axis);
-        axis_dim = Input(0).dim(axis);
-    }
-    inner_dim = Input(0).count(axis + 1);
-    vector<TIndex> dims = Input(0).dims();
-    if (!keep_dims) {
-        if (axis != -1) dims.erase(dims.begin() + axis);
-        else dims = vector<TIndex>();
-    } else {
-        if (axis != -1) dims[axis] = 1;
-        else dims = vector<TIndex>(Input(0).ndim(), 1);
+    reduce_axes = ReduceAxes(Input(0), axis, axes);
+    dims.assign(Input(0).dims().begin(), Input(0).dims().end());
+    vector<TIndex> y_dims;
+    for (int i = 0, j = 0; i < Input(0).ndim(); i++) {
+        const bool is_reduced = j < reduce_axes.size() && reduce_axes[j] == i;
+        if (is_reduced) j++;
+        if (!is_reduced) y_dims.push_back(Input(0).dim(i));
+        else if (keep_dims) y_dims.push_back(1);
     }
-    Output(0)->Reshape(dims);
+    Output(0)->Reshape(y_dims);
 
     if (XIsType(Input(0), float)) {
-        if (operation == "SUM") SumRunWithType<float>();
-        else if (operation == "MEAN") MeanRunWithType<float>();
+        if (operation == "SUM" || operation == "MEAN" ||
+                operation == "MAX" || operation == "MIN") RunWithType<float>();
         else LOG(FATAL) << "Unknown operation: [" << operation << "].";
     } else LOG(FATAL) << DTypeHelper(Input(0), { "float32" });
 }
@@ -61,46 +41,46 @@ DEPLOY_CUDA(Reduce);
 OPERATOR_SCHEMA(Reduce).NumInputs(1).NumOutputs(1);
 
 template <class Context> template <typename T>
-void ReduceGradientOp<Context>::SumRunWithType() {
+void ReduceGradientOp<Context>::RunWithType() {
+    const int ndim = (int)dims.size(), num_axes = (int)reduce_axes.size();
+    auto* dYdata = Input(-1).template data<T, Context>();
     auto* dXdata = Output(0)->template mutable_data<T, Context>();
-    if (axis == -1) {
-        auto* dYdata = Input(-1).template data<T, CPUContext>();
-        math::Set<T, Context>(Output(0)->count(),
-            dYdata[0], dXdata, ctx());
-    } else {
-        auto* dYdata = Input(-1).template data<T, Context>();
-        kernel::SumGrad<T, Context>(count,
-            axis_dim, inner_dim, 1.0, dYdata, dXdata, ctx());
-    }
-}
-
-template <class Context> template <typename T>
-void ReduceGradientOp<Context>::MeanRunWithType() {
-    auto* dXdata = Output(0)->template mutable_data<T, Context>();
-    if (axis == -1) {
-        auto* dYdata = Input(-1).template data<T, CPUContext>();
-        math::Set<T, Context>(Output(0)->count(),
-            dYdata[0] / Input(0).count(), dXdata, ctx());
-    } else {
-        auto* dYdata = Input(-1).template data<T, Context>();
-        kernel::SumGrad<T, Context>(count,
-            axis_dim, inner_dim, 1.0 / axis_dim,
-                dYdata, dXdata, ctx());
+    if (operation == "SUM" || operation == "MEAN") {
+        TIndex reduce_dim = 1;
+        for (auto i : reduce_axes) reduce_dim *= Input(0).dim(i);
+        const T coeff = operation == "MEAN" ? T(1) / reduce_dim : T(1);
+        kernel::ReduceGrad<T, Context>(ndim, dims.data(),
+            num_axes, reduce_axes.data(), coeff, dYdata, dXdata, ctx());
+        return;
     }
+    //  the grads of max (or min) are shared by the equal elements
+    auto* Xdata = Input(0).template data<T, Context>();
+    auto* Ydata = Input(1).template data<T, Context>();
+    auto WSdata = ws()->template caches<T, Context>(
+        { Input(0).count(), Input(1).count() });
+    kernel::ReduceGrad<T, Context>(ndim, dims.data(),
+        num_axes, reduce_axes.data(), T(1), Ydata, dXdata, ctx());
+    kernel::Equal<T, Context>(Input(0).count(),
+        Xdata, dXdata, WSdata[0], ctx());
+    kernel::Reduce<T, Context>(ndim, dims.data(), num_axes,
+        reduce_axes.data(), "SUM", WSdata[0], WSdata[1], ctx());
+    math::Div<T, Context>(Input(1).count(),
+        dYdata, WSdata[1], WSdata[1], ctx());
+    kernel::ReduceGrad<T, Context>(ndim, dims.data(),
+        num_axes, reduce_axes.data(), T(1), WSdata[1], dXdata, ctx());
+    math::Mul<T, Context>(Input(0).count(),
+        WSdata[0], dXdata, dXdata, ctx());
 }
 
 template <class Context>
 void ReduceGradientOp<Context>::RunOnDevice() {
-    if (axis != -1) {
-        count = Input(0).count() / Input(0).dim(axis);
-        axis_dim = Input(0).dim(axis);
-    }
-    inner_dim = Input(0).count(axis + 1);
+    reduce_axes = ReduceAxes(Input(0), axis, axes);
+    dims.assign(Input(0).dims().begin(), Input(0).dims().end());
     Output(0)->ReshapeLike(Input(0));
 
     if (XIsType(Input(0), float)) {
-        if (operation == "SUM") SumRunWithType<float>();
-        else if (operation == "MEAN") MeanRunWithType<float>();
+        if (operation == "SUM" || operation == "MEAN" ||
+                operation == "MAX" || operation == "MIN") RunWithType<float>();
         else LOG(FATAL) << "Unknown operation: [" << operation << "].";
     } else LOG(FATAL) << DTypeHelper(Input(0), { "float32" });
 }
@@ -109,15 +89,21 @@ DEPLOY_CPU(ReduceGradient);
 #ifdef WITH_CUDA
 DEPLOY_CUDA(ReduceGradient);
 #endif
-OPERATOR_SCHEMA(ReduceGradient).NumInputs(2).NumOutputs(1);
+OPERATOR_SCHEMA(ReduceGradient).NumInputs(2, 3).NumOutputs(1);
 
 class GetReduceGradient final : public GradientMakerBase {
  public:
     GRADIENT_MAKER_CTOR(GetReduceGradient);
     vector<OperatorDef> MakeDefs() override {
+        //  the output is only required by the grads of max (or min)
+        string operation;
+        for (auto& arg : def.arg())
+            if (arg.name() == "operation") operation = arg.s();
+        vector<string> inputs {I(0), GO(0)};
+        if (operation == "MAX" || operation == "MIN")
+            inputs.insert(inputs.begin() + 1, O(0));
         return SingleDef(def.type() + "Gradient", "",
-            vector<string> {I(0), GO(0)},
-            vector<string> {GI(0)});
+            inputs, vector<string> {GI(0)});
     }
 };
 REGISTER_GRADIENT(Reduce, GetReduceGradient);
@@ -5,21 +5,25 @@
 namespace dragon {
 
 template <class Context>
-void AdamUpdateOp<Context>::ComputeRunWithFloat32() {
-    Tensor* m = ws()->CreateTensor("/mnt/" + Slot() + "/adam/m");
-    Tensor* v = ws()->CreateTensor("/mnt/" + Slot() + "/adam/v");
-    m->ReshapeLike(Input(0));
-    v->ReshapeLike(Input(0));
-
+void AdamUpdateOp<Context>::FetchParams() {
     t++;
     beta1 = Param("beta1"), beta2 = Param("beta2"), eps = Param("eps");
     float coeff = sqrt(1. - pow(beta2, t)) / (1. - pow(beta1, t));
     lr = Param("base_lr") * coeff * this->lr_mult;
-    auto* dXdata = Input(0).template mutable_data<float, Context>();
+}
+
+template <class Context>
+void AdamUpdateOp<Context>::ComputeRunWithFloat32() {
+    Tensor* m = ws()->CreateTensor("/mnt/" + Slot() + "/adam/m");
+    Tensor* v = ws()->CreateTensor("/mnt/" + Slot() + "/adam/v");
+    m->ReshapeLike(Input(idx));
+    v->ReshapeLike(Input(idx));
+
+    auto* dXdata = Input(idx).template mutable_data<float, Context>();
     auto* Mdata = m->mutable_data<float, Context>(ctx());
     auto* Vdata = v->mutable_data<float, Context>(ctx());
 
-    kernel::AdamUpdate<float, Context>(Input(0).count(),
+    kernel::AdamUpdate<float, Context>(Input(idx).count(),
         lr, beta1, beta2, eps, dXdata, Mdata, Vdata, ctx());
 }
 
@@ -27,33 +31,45 @@ template <class Context>
 void AdamUpdateOp<Context>::ComputeRunWithFloat16() {
     Tensor* m = ws()->CreateTensor("/mnt/" + Slot() + "/adam/m");
     Tensor* v = ws()->CreateTensor("/mnt/" + Slot() + "/adam/v");
-    m->ReshapeLike(Input(0));
-    v->ReshapeLike(Input(0));
+    m->ReshapeLike(Input(idx));
+    v->ReshapeLike(Input(idx));
 
-    t++;
-    beta1 = Param("beta1"), beta2 = Param("beta2"), eps = Param("eps");
-    float coeff = sqrt(1. - pow(beta2, t)) / (1. - pow(beta1, t));
-    lr = Param("base_lr") * coeff * this->lr_mult;
-
-    auto* dX32T = ws()->CreateTensor(Input(0).name() + "/f32");
-    dX32T->ReshapeLike(Input(0));
+    auto* dX32T = ws()->CreateTensor(Input(idx).name() + "/f32");
+    dX32T->ReshapeLike(Input(idx));
 
     auto* dX32 = dX32T->template mutable_data<float, Context>();
-    auto* dX16 = Input(0).template mutable_data<float16, Context>();
+    auto* dX16 = Input(idx).template mutable_data<float16, Context>();
     auto* M32 = m->mutable_data<float, Context>(ctx());
     auto* V32 = v->mutable_data<float, Context>(ctx());
 
     kernel::TypeA2B<float16, float, Context>(
-        Input(0).count(), dX16, dX32, ctx());
-    kernel::AdamUpdate<float, Context>(Input(0).count(),
+        Input(idx).count(), dX16, dX32, ctx());
+    kernel::AdamUpdate<float, Context>(Input(idx).count(),
         lr, beta1, beta2, eps, dX32, M32, V32, ctx());
 }
 
+template <>
+void AdamUpdateOp<CPUContext>::ComputeRunWithMultiTensors() {
+    vector<float*> M, V;
+    for (auto i : indices) {
+        idx = i;
+        Tensor* m = ws()->CreateTensor("/mnt/" + Slot() + "/adam/m");
+        Tensor* v = ws()->CreateTensor("/mnt/" + Slot() + "/adam/v");
+        m->ReshapeLike(Input(idx));
+        v->ReshapeLike(Input(idx));
+        M.push_back(m->template mutable_data<float, CPUContext>(ctx()));
+        V.push_back(v->template mutable_data<float, CPUContext>(ctx()));
+    }
+    kernel::MultiTensorAdamUpdate<float, CPUContext>((int)indices.size(),
+        counts.data(), factors.data(), l2_decay, lr, beta1, beta2, eps,
+        zero_grad, dXs.data(), M.data(), V.data(), Xs.data(), ctx());
+}
+
 DEPLOY_CPU(AdamUpdate);
 #ifdef WITH_CUDA
 DEPLOY_CUDA(AdamUpdate);
 #endif
-OPERATOR_SCHEMA(AdamUpdate).NumInputs(1).NumOutputs(1);
+OPERATOR_SCHEMA(AdamUpdate).NumInputs(1, INT_MAX).NumOutputs(1, INT_MAX);
 
 NO_GRADIENT(AdamUpdate);
 
@@ -1,3 +1,5 @@
+#include <chrono>
+
 #include "core/workspace.h"
 #include "utils/math_functions.h"
 #include "operators/update/collective_update_op.h"
@@ -6,6 +8,72 @@ namespace dragon {
 
 #ifdef WITH_MPI
 
+#define COLLECTIVE_MAX_BUCKET_STATS 4096
+
+vector<CollectiveBucketStat>* collective_bucket_stats() {
+    static vector<CollectiveBucketStat> stats;
+    return &stats;
+}
+
+static void RecordBucketStat(const CollectiveBucketStat& stat) {
+    auto* stats = collective_bucket_stats();
+    //  drop the oldest records if nobody fetches them
+    if (stats->size() >= COLLECTIVE_MAX_BUCKET_STATS)
+        stats->erase(stats->begin());
+    stats->push_back(stat);
+}
+
+/*!
+ *  The buckets launched by ``MPI_IALLREDUCE``,
+ *  which will be finished by the following ``MPI_WAIT``.
+ *
+ *  The flat buffer is shared with the launching op,
+ *  which may be released before the request finishes.
+ */
+
+struct PendingBucket {
+    MPI_Request request;
+    shared_ptr<Tensor> flat;
+    vector<Tensor*> tensors;
+    int comm_size;
+    CollectiveBucketStat stat;
+    std::chrono::steady_clock::time_point start;
+};
+
+static vector<PendingBucket>* pending_buckets() {
+    static vector<PendingBucket> buckets;
+    return &buckets;
+}
+
+static double ElapsedMs(const std::chrono::steady_clock::time_point& start) {
+    return std::chrono::duration<double, std::milli>(
+        std::chrono::steady_clock::now() - start).count();
+}
+
+template <class Context>
+static void PackBucket(const vector<Tensor*>& tensors, Tensor* flat) {
+    TIndex count = 0, offset = 0;
+    for (auto* tensor : tensors) count += tensor->count();
+    flat->Reshape({ count });
+    auto* Fdata = (uint8_t*)flat->raw_mutable_data<Context>(tensors[0]->meta());
+    for (auto* tensor : tensors) {
+        Context::template Memcpy<Context, Context>(tensor->nbytes(),
+            Fdata + offset, tensor->raw_data<Context>());
+        offset += tensor->nbytes();
+    }
+}
+
+template <class Context>
+static void UnpackBucket(const vector<Tensor*>& tensors, Tensor* flat) {
+    TIndex offset = 0;
+    auto* Fdata = (const uint8_t*)flat->raw_data<Context>();
+    for (auto* tensor : tensors) {
+        Context::template Memcpy<Context, Context>(tensor->nbytes(),
+            tensor->raw_mutable_data<Context>(), Fdata + offset);
+        offset += tensor->nbytes();
+    }
+}
+
 template <class Context>
 void CollectiveUpdateOp<Context>::InitMPI() {
     comm = (MPI_Comm)OperatorBase::Arg<int64_t>("comm", 0);
@@ -121,6 +189,98 @@ void CollectiveUpdateOp<Context>::MPIBcast(
     MPI_Bcast(dXdata, count, dtype, comm_root, comm);
 }
 
+template <class Context>
+vector<vector<Tensor*> > CollectiveUpdateOp<Context>::MakeBuckets() {
+    //  coalesce the consecutive tensors with the same type,
+    //  until the bucket is larger than ``bucket_size`` bytes
+    vector<vector<Tensor*> > buckets;
+    TIndex nbytes = 0;
+    for (int i = 0; i < InputSize(); i++) {
+        Tensor* tensor = &Input(i);
+        if (tensor->count() == 0) continue;
+        if (buckets.empty() || nbytes + tensor->nbytes() > bucket_size ||
+                buckets.back()[0]->meta() != tensor->meta()) {
+            buckets.push_back(vector<Tensor*>());
+            nbytes = 0;
+        }
+        buckets.back().push_back(tensor);
+        nbytes += tensor->nbytes();
+    }
+    return buckets;
+}
+
+template <class Context>
+void CollectiveUpdateOp<Context>::MPIAllReduceBuckets() {
+    for (auto& bucket : MakeBuckets()) {
+        auto start = std::chrono::steady_clock::now();
+        Tensor* flat = bucket[0];
+        if (bucket.size() > 1) {
+            flat = &flat_bucket;
+            PackBucket<MPIContext>(bucket, flat);
+        }
+        if (XIsType((*flat), float))
+            MPIAllReduce<float>(flat, MPI_FLOAT);
+        else if (XIsType((*flat), float16))
+            MPIAllReduce<float16>(flat, MPI_UNSIGNED_SHORT);
+        else LOG(FATAL) << DTypeHelper((*flat), { "float32", "float16" });
+        if (bucket.size() > 1) UnpackBucket<MPIContext>(bucket, flat);
+        double elapsed = ElapsedMs(start);
+        RecordBucketStat({ bucket[0]->name(), (int)bucket.size(),
+            flat->nbytes(), elapsed, elapsed });
+    }
+}
+
+template <class Context>
+void CollectiveUpdateOp<Context>::MPIAllReduceAsync() {
+    //  launch the inputs as a single bucket without waiting
+    vector<Tensor*> bucket;
+    for (int i = 0; i < InputSize(); i++)
+        if (Input(i).count() > 0) bucket.push_back(&Input(i));
+    if (bucket.empty()) return;
+    //  the buffer of a previous launch may be still in flight
+    if (!async_bucket || async_bucket.use_count() > 1)
+        async_bucket.reset(new Tensor());
+    Tensor* flat = async_bucket.get();
+    PendingBucket pending;
+    pending.start = std::chrono::steady_clock::now();
+    PackBucket<MPIContext>(bucket, flat);
+    pending.flat = async_bucket;
+    pending.tensors = bucket;
+    pending.comm_size = comm_size;
+    pending.stat = { bucket[0]->name(), (int)bucket.size(),
+                     flat->nbytes(), 0., 0. };
+    if (XIsType((*flat), float)) {
+        auto* Fdata = flat->template mutable_data<float, MPIContext>();
+        MPI_Iallreduce(MPI_IN_PLACE, Fdata, flat->count(),
+            MPI_FLOAT, MPI_SUM, comm, &pending.request);
+        pending_buckets()->push_back(pending);
+    } else if (XIsType((*flat), float16)) {
+        //  MPI can not sum the half floats, fallback to the ring
+        MPIAllReduce<float16>(flat, MPI_UNSIGNED_SHORT);
+        UnpackBucket<MPIContext>(bucket, flat);
+        pending.stat.elapsed = pending.stat.blocked = ElapsedMs(pending.start);
+        RecordBucketStat(pending.stat);
+    } else LOG(FATAL) << DTypeHelper((*flat), { "float32", "float16" });
+}
+
+template <class Context>
+void CollectiveUpdateOp<Context>::MPIWait() {
+    for (auto& pending : *pending_buckets()) {
+        auto start = std::chrono::steady_clock::now();
+        MPI_Wait(&pending.request, MPI_STATUS_IGNORE);
+        pending.stat.blocked = ElapsedMs(start);
+        if (pending.comm_size > 1) {
+            auto* Fdata = pending.flat->template mutable_data<float, MPIContext>();
+            math::Scal<float, MPIContext>(pending.flat->count(),
+                1.f / pending.comm_size, Fdata, ctx());
+        }
+        UnpackBucket<MPIContext>(pending.tensors, pending.flat.get());
+        pending.stat.elapsed = ElapsedMs(pending.start);
+        RecordBucketStat(pending.stat);
+    }
+    pending_buckets()->clear();
+}
+
 #ifdef WITH_MPI_NCCL
 
 template <class Context> template <typename T>
@@ -150,13 +310,11 @@ void CollectiveUpdateOp<Context>::NCCLBcast(
 template <class Context>
 void CollectiveUpdateOp<Context>::RunOnDevice() {
     if (mode == "MPI_ALLREDUCE") {
-        for (int i = 0; i < InputSize(); i++) {
-            if (XIsType(Input(i), float))
-                MPIAllReduce<float>(&Input(i), MPI_FLOAT);
-            else if (XIsType(Input(i), float16))
-                MPIAllReduce<float16>(&Input(i), MPI_UNSIGNED_SHORT);
-            else LOG(FATAL) << DTypeHelper(Input(0), { "float32", "float16" });
-        }
+        MPIAllReduceBuckets();
+    } else if (mode == "MPI_IALLREDUCE") {
+        MPIAllReduceAsync();
+    } else if (mode == "MPI_WAIT") {
+        MPIWait();
     } else if (mode == "MPI_BCAST") {
         for (int i = 0; i < InputSize(); i++) {
             if (XIsType(Input(i), float))
@@ -5,44 +5,60 @@
 
 namespace dragon {
 
+template <class Context>
+void NesterovUpdateOp<Context>::FetchParams() {
+    lr = Param("base_lr") * this->lr_mult, momentum = Param("momentum");
+}
+
 template <class Context>
 void NesterovUpdateOp<Context>::ComputeRunWithFloat32() {
     Tensor* h = ws()->CreateTensor("/mnt/" + Slot() + "/nesterov/h");
-    h->ReshapeLike(Input(0));
+    h->ReshapeLike(Input(idx));
 
-    lr = Param("base_lr") * this->lr_mult, momentum = Param("momentum");
-    auto* dXdata = Input(0).template mutable_data<float, Context>();
+    auto* dXdata = Input(idx).template mutable_data<float, Context>();
     auto* Hdata = h->template mutable_data<float, Context>(ctx());
 
     kernel::NesterovUpdate<float, Context>(
-        Input(0).count(), lr, momentum, dXdata, Hdata, ctx());
+        Input(idx).count(), lr, momentum, dXdata, Hdata, ctx());
 }
 
 template <class Context>
 void NesterovUpdateOp<Context>::ComputeRunWithFloat16() {
     Tensor* h = ws()->CreateTensor("/mnt/" + Slot() + "/nesterov/h");
-    h->ReshapeLike(Input(0));
+    h->ReshapeLike(Input(idx));
 
-    lr = Param("base_lr") * this->lr_mult, momentum = Param("momentum");
-
-    auto* dX32T = ws()->CreateTensor(Input(0).name() + "/f32");
-    dX32T->ReshapeLike(Input(0));
+    auto* dX32T = ws()->CreateTensor(Input(idx).name() + "/f32");
+    dX32T->ReshapeLike(Input(idx));
 
     auto* dX32 = dX32T->template mutable_data<float, Context>();
-    auto* dX16 = Input(0).template mutable_data<float16, Context>();
+    auto* dX16 = Input(idx).template mutable_data<float16, Context>();
     auto* H32 = h->template mutable_data<float, Context>(ctx());
 
     kernel::TypeA2B<float16, float, Context>(
-        Input(0).count(), dX16, dX32, ctx());
+        Input(idx).count(), dX16, dX32, ctx());
     kernel::NesterovUpdate<float, Context>(
-        Input(0).count(), lr, momentum, dX32, H32, ctx());
+        Input(idx).count(), lr, momentum, dX32, H32, ctx());
+}
+
+template <>
+void NesterovUpdateOp<CPUContext>::ComputeRunWithMultiTensors() {
+    vector<float*> H;
+    for (auto i : indices) {
+        idx = i;
+        Tensor* h = ws()->CreateTensor("/mnt/" + Slot() + "/nesterov/h");
+        h->ReshapeLike(Input(idx));
+        H.push_back(h->template mutable_data<float, CPUContext>(ctx()));
+    }
+    kernel::MultiTensorNesterovUpdate<float, CPUContext>((int)indices.size(),
+        counts.data(), factors.data(), l2_decay, lr, momentum,
+        zero_grad, dXs.data(), H.data(), Xs.data(), ctx());
 }
 
 DEPLOY_CPU(NesterovUpdate);
 #ifdef WITH_CUDA
 DEPLOY_CUDA(NesterovUpdate);
 #endif
-OPERATOR_SCHEMA(NesterovUpdate).NumInputs(1).NumOutputs(1);
+OPERATOR_SCHEMA(NesterovUpdate).NumInputs(1, INT_MAX).NumOutputs(1, INT_MAX);
 
 NO_GRADIENT(NesterovUpdate);
 
@@ -6,46 +6,61 @@
 namespace dragon {
 
 template <class Context>
-void SGDUpdateOp<Context>::ComputeRunWithFloat32() {
-    Tensor* h = ws()->CreateTensor("/mnt/" + Slot() + "/sgd/h");
-    h->ReshapeLike(Input(0));
-
+void SGDUpdateOp<Context>::FetchParams() {
     lr = Param("base_lr") * this->lr_mult, momentum = Param("momentum");
     //  momentum correction, see arXiv:1706.02677
     if (old_lr > 0) { correction = lr / old_lr; } old_lr = lr;
-    auto* dXdata = Input(0).template mutable_data<float, Context>();
+}
+
+template <class Context>
+void SGDUpdateOp<Context>::ComputeRunWithFloat32() {
+    Tensor* h = ws()->CreateTensor("/mnt/" + Slot() + "/sgd/h");
+    h->ReshapeLike(Input(idx));
+
+    auto* dXdata = Input(idx).template mutable_data<float, Context>();
     auto* Hdata = h->template mutable_data<float, Context>(ctx());
 
-    kernel::SGDUpdate<float, Context>(Input(0).count(),
+    kernel::SGDUpdate<float, Context>(Input(idx).count(),
         lr, momentum * correction, dXdata, Hdata, ctx());
 }
 
 template <class Context>
 void SGDUpdateOp<Context>::ComputeRunWithFloat16() {
     Tensor* h = ws()->CreateTensor("/mnt/" + Slot() + "/sgd/h");
-    h->ReshapeLike(Input(0));
+    h->ReshapeLike(Input(idx));
 
-    lr = Param("base_lr") * this->lr_mult, momentum = Param("momentum");
-    if (old_lr > 0) { correction = lr / old_lr; } old_lr = lr;
-
-    auto* dX32T = ws()->CreateTensor(Input(0).name() + "/f32");
-    dX32T->ReshapeLike(Input(0));
+    auto* dX32T = ws()->CreateTensor(Input(idx).name() + "/f32");
+    dX32T->ReshapeLike(Input(idx));
 
     auto* dX32 = dX32T->template mutable_data<float, Context>();
-    auto* dX16 = Input(0).template mutable_data<float16, Context>();
+    auto* dX16 = Input(idx).template mutable_data<float16, Context>();
     auto* H32 = h->template mutable_data<float, Context>(ctx());
 
     kernel::TypeA2B<float16, float, Context>(
-        Input(0).count(), dX16, dX32, ctx());
-    kernel::SGDUpdate<float, Context>(Input(0).count(),
+        Input(idx).count(), dX16, dX32, ctx());
+    kernel::SGDUpdate<float, Context>(Input(idx).count(),
         lr, momentum * correction, dX32, H32, ctx());
 }
 
+template <>
+void SGDUpdateOp<CPUContext>::ComputeRunWithMultiTensors() {
+    vector<float*> H;
+    for (auto i : indices) {
+        idx = i;
+        Tensor* h = ws()->CreateTensor("/mnt/" + Slot() + "/sgd/h");
+        h->ReshapeLike(Input(idx));
+        H.push_back(h->template mutable_data<float, CPUContext>(ctx()));
+    }
+    kernel::MultiTensorSGDUpdate<float, CPUContext>((int)indices.size(),
+        counts.data(), factors.data(), l2_decay, lr, momentum * correction,
+        zero_grad, dXs.data(), H.data(), Xs.data(), ctx());
+}
+
 DEPLOY_CPU(SGDUpdate);
 #ifdef WITH_CUDA
 DEPLOY_CUDA(SGDUpdate);
 #endif
-OPERATOR_SCHEMA(SGDUpdate).NumInputs(1).NumOutputs(1);
+OPERATOR_SCHEMA(SGDUpdate).NumInputs(1, INT_MAX).NumOutputs(1, INT_MAX);
 
 NO_GRADIENT(SGDUpdate);
 
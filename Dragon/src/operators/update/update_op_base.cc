@@ -14,52 +14,95 @@ float UpdateOpBase<Context>::Param(const string& name) const {
 
 template <class Context>
 string UpdateOpBase<Context>::Slot() {
-    return slot + "/" + Output(0)->name();
+    return slot + "/" + Output(idx)->name();
 }
 
 template <class Context> template <typename T>
 void UpdateOpBase<Context>::PreprocessRunWithType() {
     //  scale
-    scale_factor = Param("scale_gradient");
     if (scale_factor != 1.f) {
-        auto* dXdata = Input(0).template mutable_data<T, Context>();
-        math::Scal<T, Context>(Input(0).count(),
+        auto* dXdata = Input(idx).template mutable_data<T, Context>();
+        math::Scal<T, Context>(Input(idx).count(),
             scale_factor, dXdata, ctx());
     }
     //  clip
-    clip_thresh = Param("clip_gradient");
     if (clip_thresh > 0) {
-        auto* dXdata = Input(0).template mutable_data<T, Context>();
+        auto* dXdata = Input(idx).template mutable_data<T, Context>();
         T sumsq_grad;
-        math::Dot<T, Context>(Input(0).count(),
+        math::Dot<T, Context>(Input(idx).count(),
             dXdata, dXdata, &sumsq_grad, ctx());
         const float l2norm = sqrt(
             dragon_cast<float, T>(sumsq_grad));
         if (l2norm > clip_thresh) {
             float norm_factor = clip_thresh / l2norm;
-            math::Scal<T, Context>(Input(0).count(),
+            math::Scal<T, Context>(Input(idx).count(),
                 norm_factor, dXdata, ctx());
         }
     }
     //  decay
-    l2_decay = Param("l2_decay") * decay_mult;
     if (l2_decay > 0) {
-        auto* dXdata = Input(0).template mutable_data<T, Context>();
-        auto* Xdata = Output(0)->template data<T, Context>();
-        math::Axpy<T, Context>(Input(0).count(),
+        auto* dXdata = Input(idx).template mutable_data<T, Context>();
+        auto* Xdata = Output(idx)->template data<T, Context>();
+        math::Axpy<T, Context>(Input(idx).count(),
             l2_decay, Xdata, dXdata, ctx());
     }
 }
 
+template <class Context>
+bool UpdateOpBase<Context>::PreprocessMultiTensors() { return false; }
+
+template <class Context>
+bool UpdateOpBase<Context>::RunWithMultiTensors() { return false; }
+
+//  the multi-tensor kernels are only available for float32 on cpu
+template <>
+bool UpdateOpBase<CPUContext>::PreprocessMultiTensors() {
+    indices.clear(); counts.clear(); factors.clear();
+    Xs.clear(); dXs.clear();
+    for (idx = 0; idx < InputSize(); idx++) {
+        //  skip empty param or grads
+        if (Input(idx).count() == 0 || Output(idx)->count() == 0) continue;
+        CHECK(Input(idx).dims() == Output(idx)->dims())
+            << "\nTensor and its gradients should have same dims.\nGot "
+            << Output(idx)->DimString() << " and " << Input(idx).DimString();
+        if (!XIsType(Input(idx), float)) return false;
+        indices.push_back(idx);
+    }
+    for (auto i : indices) {
+        auto* dXdata = Input(i).template mutable_data<float, CPUContext>();
+        //  fold the scale and clip into a factor of grads
+        float factor = scale_factor;
+        if (clip_thresh > 0) {
+            float sumsq_grad;
+            math::Dot<float, CPUContext>(Input(i).count(),
+                dXdata, dXdata, &sumsq_grad, ctx());
+            const float l2norm = std::abs(factor) * sqrt(sumsq_grad);
+            if (l2norm > clip_thresh) factor *= clip_thresh / l2norm;
+        }
+        counts.push_back((int)Input(i).count());
+        factors.push_back(factor);
+        dXs.push_back(dXdata);
+        Xs.push_back(Output(i)->template mutable_data<float, CPUContext>());
+    }
+    return true;
+}
+
+template <>
+bool UpdateOpBase<CPUContext>::RunWithMultiTensors() {
+    if (!PreprocessMultiTensors()) return false;
+    if (!indices.empty()) ComputeRunWithMultiTensors();
+    return true;
+}
+
 template <class Context>
 void UpdateOpBase<Context>::UpdateRunWithFloat32() {
-    auto* dXdata = Input(0).template mutable_data<float, Context>();
-    auto* Xdata = Output(0)->template mutable_data<float, Context>();
+    auto* dXdata = Input(idx).template mutable_data<float, Context>();
+    auto* Xdata = Output(idx)->template mutable_data<float, Context>();
     //  weights update & zero grads
-    math::Axpy<float, Context>(Output(0)->count(),
+    math::Axpy<float, Context>(Output(idx)->count(),
         -1, dXdata, Xdata, ctx());
     if (zero_grad) math::Set<float, Context>(
-        Input(0).count(), 0.f, dXdata, ctx());
+        Input(idx).count(), 0.f, dXdata, ctx());
 }
 
 template <class Context>
@@ -74,51 +117,61 @@ void UpdateOpBase<Context>::UpdateRunWithFloat16() {
      * ------------------------------------------------ */
 
     //  the "master" weights
-    auto* X32T = ws()->CreateTensor(Output(0)->name() + "/f32");
-    X32T->ReshapeLike(Input(0));
+    auto* X32T = ws()->CreateTensor(Output(idx)->name() + "/f32");
+    X32T->ReshapeLike(Input(idx));
 
     //  the "master" updates
-    auto* dX32T = ws()->GetTensor(Input(0).name() + "/f32");
+    auto* dX32T = ws()->GetTensor(Input(idx).name() + "/f32");
     
     auto* dX32 = dX32T->template data<float, Context>();
-    auto* X16 = Output(0)->template mutable_data<float16, Context>();
+    auto* X16 = Output(idx)->template mutable_data<float16, Context>();
     auto* X32 = X32T->template mutable_data<float, Context>();
 
     //  X16 -> X32
     kernel::TypeA2B<float16, float, Context>(
-        Input(0).count(), X16, X32, ctx());
+        Input(idx).count(), X16, X32, ctx());
 
     //  weights update & zero grads
     math::Axpy<float, Context>(
-        Input(0).count(), -1, dX32, X32, ctx());
+        Input(idx).count(), -1, dX32, X32, ctx());
     if (zero_grad) {
         float16 zero = dragon_cast<float16, float>(0.f);
-        auto* dX16 = Input(0).template mutable_data<float16, Context>();
-        math::Set<float16, Context>(Input(0).count(), zero, dX16, ctx());
+        auto* dX16 = Input(idx).template mutable_data<float16, Context>();
+        math::Set<float16, Context>(Input(idx).count(), zero, dX16, ctx());
     }
 
     //  X32 -> X16
     kernel::TypeA2B<float, float16, Context>(
-        Input(0).count(), X32, X16, ctx());
+        Input(idx).count(), X32, X16, ctx());
 }
 
 template <class Context>
 void UpdateOpBase<Context>::RunOnDevice() {
-    //  skip empty param or grads
-    if (Input(0).count() == 0 || Output(0)->count() == 0) return;
-    CHECK(Input(0).dims() == Output(0)->dims())
-        << "\nTensor and its gradients should have same dims.\nGot "
-        << Output(0)->DimString() << " and " << Input(0).DimString();
-    if (XIsType(Input(0), float)) {
-        PreprocessRunWithType<float>();
-        ComputeRunWithFloat32();
-        UpdateRunWithFloat32();
-    } else if (XIsType(Input(0), float16)) {
-        PreprocessRunWithType<float16>();
-        ComputeRunWithFloat16();
-        UpdateRunWithFloat16();
-    } else LOG(FATAL) << DTypeHelper(Input(0), { "float32", "float16" });
-} 
+    //  the hyper-parameters are shared by all the params
+    scale_factor = Param("scale_gradient");
+    clip_thresh = Param("clip_gradient");
+    l2_decay = Param("l2_decay") * decay_mult;
+    FetchParams();
+    //  update all the params in one parallel region if possible
+    if (RunWithMultiTensors()) return;
+    //  otherwise, update the params one by one
+    for (idx = 0; idx < InputSize(); idx++) {
+        //  skip empty param or grads
+        if (Input(idx).count() == 0 || Output(idx)->count() == 0) continue;
+        CHECK(Input(idx).dims() == Output(idx)->dims())
+            << "\nTensor and its gradients should have same dims.\nGot "
+            << Output(idx)->DimString() << " and " << Input(idx).DimString();
+        if (XIsType(Input(idx), float)) {
+            PreprocessRunWithType<float>();
+            ComputeRunWithFloat32();
+            UpdateRunWithFloat32();
+        } else if (XIsType(Input(idx), float16)) {
+            PreprocessRunWithType<float16>();
+            ComputeRunWithFloat16();
+            UpdateRunWithFloat16();
+        } else LOG(FATAL) << DTypeHelper(Input(idx), { "float32", "float16" });
+    }
+}
 
 template class UpdateOpBase<CPUContext>;
 #ifdef WITH_CUDA
@@ -13,13 +13,28 @@ void Conv2dOp<Context>::RunWithType() {
     auto* Wdata = Input(1).template data<T, Context>();
     auto* Ydata = Output(0)->template mutable_data<T, Context>();
 
-    for (int n = 0; n < Input(0).dim(0); n++)
-        Wx(Xdata + n * x_offset, Wdata, Ydata + n * y_offset);
-  
+    const TIndex N = Input(0).dim(0), batch = LoweringBatch();
+    const int tile = WinogradTile();
+    if (tile > 0) {
+        WinogradWx(tile, Xdata, Wdata, Ydata);
+    } else if (batch > 1) {
+        //  lower multiple images into a GEMM
+        for (TIndex n = 0; n < N; n += batch)
+            BatchedWx(std::min(batch, N - n), Xdata + n * x_offset,
+                Wdata, Ydata + n * y_offset);
+    } else {
+        for (int n = 0; n < N; n++)
+            Wx(Xdata + n * x_offset, Wdata, Ydata + n * y_offset);
+    }
+
     if (HasBias()) {
         auto* Bdata = Input(2).template data<T, Context>();
         Pb(Bdata, Ydata);
     }
+
+    if (activation == "RELU")
+        kernel::Relu<T, Context>(Output(0)->count(),
+            0.f, Ydata, Ydata, ctx());
 }
 
 template <class Context>
@@ -46,13 +61,41 @@ void Conv2dGradientOp<Context>::RunWithType() {
             Db(dYdata + n * y_offset, dBdata);
     }
 
-    for (int n = 0; n < Input(2).dim(0); n++) {
+    const TIndex N = Input(2).dim(0), batch = LoweringBatch();
+    bool need_dx = Output(0)->name() != "ignore";
+    if (need_dx) {
+        //  dX by Winograd, while dW still by the lowering
+        const int tile = WinogradTile(true);
+        if (tile > 0) {
+            auto* Wdata = Input(1).template data<T, Context>();
+            auto* dXdata = Output(0)->template mutable_data<T, Context>();
+            WinogradDx(tile, dYdata, Wdata, dXdata);
+            need_dx = false;
+        }
+    }
+
+    if (batch > 1) {
+        auto* Xdata = Input(0).template data<T, Context>();
+        auto* Wdata = Input(1).template data<T, Context>();
+        T* dWdata = nullptr, *dXdata = nullptr;
+        if (Output(1)->name() != "ignore")
+            dWdata = Output(1)->template mutable_data<T, Context>(ctx());
+        if (need_dx)
+            dXdata = Output(0)->template mutable_data<T, Context>();
+        for (TIndex n = 0; n < N; n += batch)
+            BatchedDxDw(std::min(batch, N - n),
+                dYdata + n * y_offset, Xdata + n * x_offset, Wdata,
+                    dXdata ? dXdata + n * x_offset : nullptr, dWdata);
+        return;
+    }
+
+    for (int n = 0; n < N; n++) {
         if (Output(1)->name() != "ignore") {
             auto* Xdata = Input(0).template data<T, Context>();
             auto* dWdata = Output(1)->template mutable_data<T, Context>(ctx());
             Dw(dYdata + n * y_offset, Xdata + n * x_offset, dWdata);
         }
-        if (Output(0)->name() != "ignore") {
+        if (need_dx) {
             auto* Wdata = Input(1).template data<T, Context>();
             auto* dXdata = Output(0)->template mutable_data<T, Context>();
             Dx(dYdata + n * y_offset, Wdata, dXdata + n * x_offset);
@@ -1,9 +1,143 @@
+#include <cstring>
+
 #include "core/workspace.h"
 #include "utils/filler.h"
+#include "utils/omp_alternative.h"
 #include "operators/vision/conv_op_base.h"
 
 namespace dragon {
 
+namespace {
+
+//  the lowered GEMMs are widened to about these columns
+const TIndex kLoweringColumns = 4096;
+
+//  the spatial dims at least this are wide enough per image
+const TIndex kLoweringMaxSpatialDim = 1024;
+
+//  the 1x1 NCHW convs copy both the inputs and outputs to lower,
+//  which only pays off for the very skinny GEMMs
+const TIndex kLoweringMax1x1SpatialDim = 128;
+
+//  x: [A, B, S] -> y: [B, A, S]
+template <typename T>
+void _SwapAxes(
+    const int               A,
+    const int               B,
+    const int               S,
+    const T*                x,
+    T*                      y) {
+#ifdef WITH_OMP
+    #pragma omp parallel for num_threads(GET_OMP_THREADS(A * B * S))
+#endif
+    for (int idx = 0; idx < A * B; ++idx) {
+        const int a = idx / B, b = idx % B;
+        memcpy(y + ((size_t)b * A + a) * S,
+            x + (size_t)idx * S, S * sizeof(T));
+    }
+}
+
+//  im: [N, C, H, W] -> col: [C * kernel_h * kernel_w, N, col_h * col_w]
+template <typename T>
+void _Im2ColBatched2d_NCHW(
+    const int               N,
+    const int               C,
+    const int               H,
+    const int               W,
+    const int               col_h,
+    const int               col_w,
+    const int               kernel_h,
+    const int               kernel_w,
+    const int               stride_h,
+    const int               stride_w,
+    const int               pad_h,
+    const int               pad_w,
+    const int               dilation_h,
+    const int               dilation_w,
+    const T*                im,
+    T*                      col) {
+    const int rows = C * kernel_h * kernel_w;
+    const int col_dim = col_h * col_w;
+#ifdef WITH_OMP
+    #pragma omp parallel for num_threads(GET_OMP_THREADS(rows * N * col_dim))
+#endif
+    for (int idx = 0; idx < rows * N; ++idx) {
+        const int r = idx / N, n = idx % N;
+        const int kw = r % kernel_w;
+        const int kh = (r / kernel_w) % kernel_h;
+        const int c = r / kernel_w / kernel_h;
+        const T* x = im + ((size_t)n * C + c) * H * W;
+        T* y = col + (size_t)idx * col_dim;
+        int h = -pad_h + kh * dilation_h;
+        for (int output_h = 0; output_h < col_h; ++output_h) {
+            if (h < 0 || h >= H) {
+                memset(y, 0, col_w * sizeof(T));
+                y += col_w;
+            } else {
+                int w = -pad_w + kw * dilation_w;
+                for (int output_w = 0; output_w < col_w; ++output_w) {
+                    *(y++) = (w >= 0 && w < W) ? x[h * W + w] : T(0);
+                    w += stride_w;
+                }
+            }
+            h += stride_h;
+        }
+    }
+}
+
+//  col: [C * kernel_h * kernel_w, N, col_h * col_w] -> im: [N, C, H, W]
+template <typename T>
+void _Col2ImBatched2d_NCHW(
+    const int               N,
+    const int               C,
+    const int               H,
+    const int               W,
+    const int               col_h,
+    const int               col_w,
+    const int               kernel_h,
+    const int               kernel_w,
+    const int               stride_h,
+    const int               stride_w,
+    const int               pad_h,
+    const int               pad_w,
+    const int               dilation_h,
+    const int               dilation_w,
+    const T*                col,
+    T*                      im) {
+    const int col_dim = col_h * col_w;
+    //  each plane of im is accumulated by a thread
+#ifdef WITH_OMP
+    #pragma omp parallel for num_threads(GET_OMP_THREADS( \
+        N * C * kernel_h * kernel_w * col_dim))
+#endif
+    for (int idx = 0; idx < N * C; ++idx) {
+        const int n = idx / C, c = idx % C;
+        T* x = im + (size_t)idx * H * W;
+        memset(x, 0, H * W * sizeof(T));
+        for (int kh = 0; kh < kernel_h; ++kh) {
+            for (int kw = 0; kw < kernel_w; ++kw) {
+                const int r = (c * kernel_h + kh) * kernel_w + kw;
+                const T* y = col + ((size_t)r * N + n) * col_dim;
+                int h = -pad_h + kh * dilation_h;
+                for (int output_h = 0; output_h < col_h; ++output_h) {
+                    if (h < 0 || h >= H) {
+                        y += col_w;
+                    } else {
+                        int w = -pad_w + kw * dilation_w;
+                        for (int output_w = 0; output_w < col_w; ++output_w) {
+                            if (w >= 0 && w < W) x[h * W + w] += *y;
+                            ++y; w += stride_w;
+                        }
+                    }
+                    h += stride_h;
+                }
+            }
+        }
+    }
+}
+
+}  // namespace
+
 template <class Context>
 void ConvOpBase<Context>::ComputeOutputShape() {
     output_shape.clear();
@@ -172,6 +306,166 @@ void ConvOpBase<Context>::Db(const T* dy, T* db) {
     }
 }
 
+template <class Context>
+TIndex ConvOpBase<Context>::LoweringBatch() {
+    //  the lowering is only selected for CPUContext
+    const TIndex N = Input(0).dim(0);
+    const TIndex max_spatial_dim = (is_1x1 && data_format == "NCHW") ?
+        kLoweringMax1x1SpatialDim : kLoweringMaxSpatialDim;
+    if (!std::is_same<Context, CPUContext>::value ||
+            ReverseDimensions() || group != 1 || N < 2 ||
+                conv_out_spatial_dim >= max_spatial_dim)
+        return 1;
+    //  widen the skinny GEMMs of the small spatial dims
+    TIndex batch = std::min(N, (kLoweringColumns +
+        conv_out_spatial_dim - 1) / conv_out_spatial_dim);
+    //  the col buffer, and the transposed output for NCHW
+    TIndex image_bytes = sizeof(float) * (
+        (is_1x1 && data_format == "NHWC") ? 0 : col_dim);
+    if (data_format == "NCHW") image_bytes +=
+        sizeof(float) * conv_out_channels * conv_out_spatial_dim;
+    if (image_bytes > 0) batch = std::min(batch,
+        (TIndex)CONV_LOWERING_BYTES() / image_bytes);
+    return batch >= 2 ? batch : 1;
+}
+
+template <class Context> template <typename T>
+void ConvOpBase<Context>::BatchedWx(
+    TIndex                  n,
+    const T*                x,
+    const T*                weights,
+    T*                      y) {
+    const TIndex S = conv_out_spatial_dim;
+    if (data_format == "NCHW") {
+        //  Y[Cout, n * S] = W[Cout, K] x Col[K, n * S]
+        auto buffers = ws()->template caches<T, Context>({
+            kernel_dim * n * S, conv_out_channels * n * S });
+        if (is_1x1) {
+            _SwapAxes<T>(n, channels, S, x, buffers[0]);
+        } else {
+            _Im2ColBatched2d_NCHW<T>(n, channels,
+                input_shape[0], input_shape[1],
+                    output_shape[0], output_shape[1],
+                        kernel_size[0], kernel_size[1],
+                            stride[0], stride[1], pad[0], pad[1],
+                                dilation[0], dilation[1], x, buffers[0]);
+        }
+        math::Gemm<T, Context>(
+            CblasNoTrans, CblasNoTrans,
+                conv_out_channels, n * S, kernel_dim,
+                    1.0, weights, buffers[0],
+                        0.0, buffers[1], ctx());
+        _SwapAxes<T>(conv_out_channels, n, S, buffers[1], y);
+    } else if (data_format == "NHWC") {
+        //  Y[n * S, Cout] = Col[n * S, K] x W[K, Cout]
+        const T* col_buffer = x;
+        if (!is_1x1) {
+            auto* workspace = ws()->template
+                caches<T, Context>({ n * col_dim })[0];
+#ifdef WITH_OMP
+            #pragma omp parallel for num_threads(GET_OMP_THREADS(n * col_dim))
+#endif
+            for (int i = 0; i < n; ++i)
+                Im2Col(x + i * x_offset, workspace + i * col_dim);
+            col_buffer = workspace;
+        }
+        math::Gemm<T, Context>(
+            CblasNoTrans, CblasNoTrans,
+                n * S, conv_out_channels, kernel_dim,
+                    1.0, col_buffer, weights,
+                        0.0, y, ctx());
+    }
+}
+
+template <class Context> template <typename T>
+void ConvOpBase<Context>::BatchedDxDw(
+    TIndex                  n,
+    const T*                dy,
+    const T*                x,
+    const T*                weights,
+    T*                      dx,
+    T*                      dw) {
+    const TIndex S = conv_out_spatial_dim;
+    if (data_format == "NCHW") {
+        auto buffers = ws()->template caches<T, Context>({
+            kernel_dim * n * S, conv_out_channels * n * S });
+        auto* col_buffer = buffers[0], *dy_buffer = buffers[1];
+        _SwapAxes<T>(n, conv_out_channels, S, dy, dy_buffer);
+        if (dw != nullptr) {
+            //  dW[Cout, K] += dY[Cout, n * S] x Col[K, n * S]^T
+            if (is_1x1) {
+                _SwapAxes<T>(n, channels, S, x, col_buffer);
+            } else {
+                _Im2ColBatched2d_NCHW<T>(n, channels,
+                    input_shape[0], input_shape[1],
+                        output_shape[0], output_shape[1],
+                            kernel_size[0], kernel_size[1],
+                                stride[0], stride[1], pad[0], pad[1],
+                                    dilation[0], dilation[1], x, col_buffer);
+            }
+            math::Gemm<T, Context>(
+                CblasNoTrans, CblasTrans,
+                    conv_out_channels, kernel_dim, n * S,
+                        1.0, dy_buffer, col_buffer,
+                            1.0, dw, ctx());
+        }
+        if (dx != nullptr) {
+            //  Col[K, n * S] = W[Cout, K]^T x dY[Cout, n * S]
+            math::Gemm<T, Context>(
+                CblasTrans, CblasNoTrans,
+                    kernel_dim, n * S, conv_out_channels,
+                        1.0, weights, dy_buffer,
+                            0.0, col_buffer, ctx());
+            if (is_1x1) {
+                _SwapAxes<T>(channels, n, S, col_buffer, dx);
+            } else {
+                _Col2ImBatched2d_NCHW<T>(n, channels,
+                    input_shape[0], input_shape[1],
+                        output_shape[0], output_shape[1],
+                            kernel_size[0], kernel_size[1],
+                                stride[0], stride[1], pad[0], pad[1],
+                                    dilation[0], dilation[1], col_buffer, dx);
+            }
+        }
+    } else if (data_format == "NHWC") {
+        T* col_buffer = nullptr;
+        if (!is_1x1) col_buffer = ws()->template
+            caches<T, Context>({ n * col_dim })[0];
+        if (dw != nullptr) {
+            //  dW[K, Cout] += Col[n * S, K]^T x dY[n * S, Cout]
+            const T* col = x;
+            if (!is_1x1) {
+#ifdef WITH_OMP
+                #pragma omp parallel for num_threads(GET_OMP_THREADS(n * col_dim))
+#endif
+                for (int i = 0; i < n; ++i)
+                    Im2Col(x + i * x_offset, col_buffer + i * col_dim);
+                col = col_buffer;
+            }
+            math::Gemm<T, Context>(
+                CblasTrans, CblasNoTrans,
+                    kernel_dim, conv_out_channels, n * S,
+                        1.0, col, dy,
+                            1.0, dw, ctx());
+        }
+        if (dx != nullptr) {
+            //  Col[n * S, K] = dY[n * S, Cout] x W[K, Cout]^T
+            math::Gemm<T, Context>(
+                CblasNoTrans, CblasTrans,
+                    n * S, kernel_dim, conv_out_channels,
+                        1.0, dy, weights,
+                            0.0, is_1x1 ? dx : col_buffer, ctx());
+            if (!is_1x1) {
+#ifdef WITH_OMP
+                #pragma omp parallel for num_threads(GET_OMP_THREADS(n * col_dim))
+#endif
+                for (int i = 0; i < n; ++i)
+                    Col2Im(col_buffer + i * col_dim, dx + i * x_offset);
+            }
+        }
+    }
+}
+
 template <class Context>
 void ConvOpBase<Context>::Setup() {
     vector<int> ks = OperatorBase::Args<int>("kernel_size");
@@ -358,6 +652,8 @@ template void ConvOpBase<CPUContext>::Pb(const float*, float*);
 template void ConvOpBase<CPUContext>::Dx(const float*, const float*, float*);
 template void ConvOpBase<CPUContext>::Dw(const float*, const float*, float*);
 template void ConvOpBase<CPUContext>::Db(const float*, float*);
+template void ConvOpBase<CPUContext>::BatchedWx(TIndex, const float*, const float*, float*);
+template void ConvOpBase<CPUContext>::BatchedDxDw(TIndex, const float*, const float*, const float*, float*, float*);
 
 #ifdef WITH_CUDA
 template class ConvOpBase<CUDAContext>;
@@ -366,6 +662,8 @@ template void ConvOpBase<CUDAContext>::Pb(const float*, float*);
 template void ConvOpBase<CUDAContext>::Dx(const float*, const float*, float*);
 template void ConvOpBase<CUDAContext>::Dw(const float*, const float*, float*);
 template void ConvOpBase<CUDAContext>::Db(const float*, float*);
+template void ConvOpBase<CUDAContext>::BatchedWx(TIndex, const float*, const float*, float*);
+template void ConvOpBase<CUDAContext>::BatchedDxDw(TIndex, const float*, const float*, const float*, float*, float*);
 #endif
 
 }    // namespace dragon
\ No newline at end of file
@@ -0,0 +1,371 @@
+#include <cstring>
+
+#include "core/workspace.h"
+#include "utils/omp_alternative.h"
+#include "operators/vision/conv_op_base.h"
+
+namespace dragon {
+
+namespace {
+
+//  the channels of auto-selected convs are at least this,
+//  otherwise the transforms outweigh the saved multiplications
+const TIndex kWinogradMinChannels = 16;
+
+//  the filters are transformed per run, which is amortized if the
+//  outputs of a batch are at least this, or the channels are at most this
+const TIndex kWinogradMinOutputs = 512;
+const TIndex kWinogradMaxChannels = 64;
+
+//  the filter transform costs about as the GEMMs of these tiles
+const TIndex kWinogradFilterTiles = 32;
+
+//  the transforms are blocked to access the planes of Winograd
+//  domain contiguously, which are strided by the power of two mostly
+const int kWinogradBlock = 32;
+
+/*!
+ *  The 1D transforms of F(M, 3), i.e.,
+ *  y = A^T [(G g) * (B^T d)], applied on the rows and columns of tiles
+ */
+template <int M> struct WinogradF3x3;
+
+template <> struct WinogradF3x3<2> {
+    template <typename T>
+    static inline void Filter(const T* g, int gs, T* u, int us) {
+        u[0] = g[0];
+        u[us] = (g[0] + g[gs] + g[2 * gs]) * (T)0.5;
+        u[2 * us] = (g[0] - g[gs] + g[2 * gs]) * (T)0.5;
+        u[3 * us] = g[2 * gs];
+    }
+
+    template <typename T>
+    static inline void Input(const T* d, int ds, T* v, int vs) {
+        v[0] = d[0] - d[2 * ds];
+        v[vs] = d[ds] + d[2 * ds];
+        v[2 * vs] = d[2 * ds] - d[ds];
+        v[3 * vs] = d[ds] - d[3 * ds];
+    }
+
+    template <typename T>
+    static inline void Output(const T* m, int ms, T* y, int ys) {
+        y[0] = m[0] + m[ms] + m[2 * ms];
+        y[ys] = m[ms] - m[2 * ms] - m[3 * ms];
+    }
+};
+
+template <> struct WinogradF3x3<4> {
+    template <typename T>
+    static inline void Filter(const T* g, int gs, T* u, int us) {
+        const T g0 = g[0], g1 = g[gs], g2 = g[2 * gs];
+        u[0] = g0 * (T)0.25;
+        u[us] = (g0 + g1 + g2) * (T)(-1. / 6.);
+        u[2 * us] = (g0 - g1 + g2) * (T)(-1. / 6.);
+        u[3 * us] = g0 * (T)(1. / 24.) + g1 * (T)(1. / 12.) + g2 * (T)(1. / 6.);
+        u[4 * us] = g0 * (T)(1. / 24.) - g1 * (T)(1. / 12.) + g2 * (T)(1. / 6.);
+        u[5 * us] = g2;
+    }
+
+    template <typename T>
+    static inline void Input(const T* d, int ds, T* v, int vs) {
+        const T d0 = d[0], d1 = d[ds], d2 = d[2 * ds];
+        const T d3 = d[3 * ds], d4 = d[4 * ds], d5 = d[5 * ds];
+        v[0] = (T)4 * d0 - (T)5 * d2 + d4;
+        v[vs] = d3 + d4 - (T)4 * (d1 + d2);
+        v[2 * vs] = d4 - d3 + (T)4 * (d1 - d2);
+        v[3 * vs] = d4 - d2 + (T)2 * (d3 - d1);
+        v[4 * vs] = d4 - d2 - (T)2 * (d3 - d1);
+        v[5 * vs] = (T)4 * d1 - (T)5 * d3 + d5;
+    }
+
+    template <typename T>
+    static inline void Output(const T* m, int ms, T* y, int ys) {
+        const T a = m[ms] + m[2 * ms], b = m[ms] - m[2 * ms];
+        const T c = m[3 * ms] + m[4 * ms], d = m[3 * ms] - m[4 * ms];
+        y[0] = m[0] + a + c;
+        y[ys] = b + (T)2 * d;
+        y[2 * ys] = a + (T)4 * c;
+        y[3 * ys] = b + (T)8 * d + m[5 * ms];
+    }
+};
+
+//  g: (k, c, i, j) at g[k * s[0] + c * s[1] + i * s[2] + j * s[3]]
+//  -> U: [alpha * alpha, K, C]
+template <typename T, int M>
+void _WinogradFilter(
+    const int               K,
+    const int               C,
+    const T*                g,
+    const TIndex*           s,
+    T*                      U) {
+    typedef WinogradF3x3<M> F;
+    const int alpha = M + 2;
+#ifdef WITH_OMP
+    #pragma omp parallel for num_threads(GET_OMP_THREADS(K * C * 9))
+#endif
+    for (int b = 0; b < K * C; b += kWinogradBlock) {
+        const int bs = std::min(kWinogradBlock, K * C - b);
+        T w[3][3], tmp[alpha][3], u[alpha * alpha][kWinogradBlock];
+        for (int e = 0; e < bs; ++e) {
+            const int idx = b + e;
+            const T* gk = g + (idx / C) * s[0] + (idx % C) * s[1];
+            for (int i = 0; i < 3; ++i)
+                for (int j = 0; j < 3; ++j)
+                    w[i][j] = gk[i * s[2] + j * s[3]];
+            for (int j = 0; j < 3; ++j)
+                F::Filter(&w[0][j], 3, &tmp[0][j], 3);
+            for (int i = 0; i < alpha; ++i)
+                F::Filter(tmp[i], 1, &u[i * alpha][e], kWinogradBlock);
+        }
+        for (int i = 0; i < alpha * alpha; ++i)
+            memcpy(U + (size_t)i * K * C + b, u[i], bs * sizeof(T));
+    }
+}
+
+//  x: [N, C, H, W] or [N, H, W, C] -> V: [alpha * alpha, C, N * tiles]
+template <typename T, int M>
+void _WinogradInput(
+    const int               N,
+    const int               C,
+    const int               H,
+    const int               W,
+    const int               tiles_h,
+    const int               tiles_w,
+    const int               pad_h,
+    const int               pad_w,
+    const bool              nchw,
+    const T*                x,
+    T*                      V) {
+    typedef WinogradF3x3<M> F;
+    const int alpha = M + 2, P = N * tiles_h * tiles_w;
+    const TIndex x_c = nchw ? H * W : 1, x_p = nchw ? 1 : C;
+#ifdef WITH_OMP
+    #pragma omp parallel for num_threads(GET_OMP_THREADS(C * P * alpha * alpha))
+#endif
+    for (int b = 0; b < C * P; b += kWinogradBlock) {
+        const int bs = std::min(kWinogradBlock, C * P - b);
+        T d[alpha][alpha], tmp[alpha][alpha], v[alpha * alpha][kWinogradBlock];
+        for (int e = 0; e < bs; ++e) {
+            const int c = (b + e) / P, p = (b + e) % P;
+            const int n = p / (tiles_h * tiles_w), t = p % (tiles_h * tiles_w);
+            const int h0 = (t / tiles_w) * M - pad_h;
+            const int w0 = (t % tiles_w) * M - pad_w;
+            const T* im = x + (size_t)n * C * H * W + c * x_c;
+            for (int i = 0; i < alpha; ++i) {
+                const int h = h0 + i;
+                for (int j = 0; j < alpha; ++j) {
+                    const int w = w0 + j;
+                    d[i][j] = (h >= 0 && h < H && w >= 0 && w < W) ?
+                        im[(h * W + w) * x_p] : (T)0;
+                }
+            }
+            for (int j = 0; j < alpha; ++j)
+                F::Input(&d[0][j], alpha, &tmp[0][j], alpha);
+            for (int i = 0; i < alpha; ++i)
+                F::Input(tmp[i], 1, &v[i * alpha][e], kWinogradBlock);
+        }
+        for (int i = 0; i < alpha * alpha; ++i)
+            memcpy(V + (size_t)i * C * P + b, v[i], bs * sizeof(T));
+    }
+}
+
+//  Y: [alpha * alpha, K, N * tiles] -> y: [N, K, H, W] or [N, H, W, K]
+template <typename T, int M>
+void _WinogradOutput(
+    const int               N,
+    const int               K,
+    const int               H,
+    const int               W,
+    const int               tiles_h,
+    const int               tiles_w,
+    const bool              nchw,
+    const T*                Y,
+    T*                      y) {
+    typedef WinogradF3x3<M> F;
+    const int alpha = M + 2, P = N * tiles_h * tiles_w;
+    const TIndex y_c = nchw ? H * W : 1, y_p = nchw ? 1 : K;
+#ifdef WITH_OMP
+    #pragma omp parallel for num_threads(GET_OMP_THREADS(K * P * alpha * alpha))
+#endif
+    for (int b = 0; b < K * P; b += kWinogradBlock) {
+        const int bs = std::min(kWinogradBlock, K * P - b);
+        T m[alpha * alpha][kWinogradBlock], tmp[M][alpha], o[M][M];
+        for (int i = 0; i < alpha * alpha; ++i)
+            memcpy(m[i], Y + (size_t)i * K * P + b, bs * sizeof(T));
+        for (int e = 0; e < bs; ++e) {
+            const int k = (b + e) / P, p = (b + e) % P;
+            const int n = p / (tiles_h * tiles_w), t = p % (tiles_h * tiles_w);
+            const int h0 = (t / tiles_w) * M, w0 = (t % tiles_w) * M;
+            for (int j = 0; j < alpha; ++j)
+                F::Output(&m[j][e], alpha * kWinogradBlock, &tmp[0][j], alpha);
+            for (int i = 0; i < M; ++i) F::Output(tmp[i], 1, o[i], 1);
+            T* im = y + (size_t)n * K * H * W + k * y_c;
+            for (int i = 0; i < M && h0 + i < H; ++i)
+                for (int j = 0; j < M && w0 + j < W; ++j)
+                    im[((h0 + i) * W + w0 + j) * y_p] = o[i][j];
+        }
+    }
+}
+
+//  y = conv3x3(x, g) with the stride 1 and dilation 1
+template <typename T, class Context, int M>
+void _WinogradConv3x3(
+    const int               N,
+    const int               C,
+    const int               K,
+    const int               H,
+    const int               W,
+    const int               out_h,
+    const int               out_w,
+    const int               pad_h,
+    const int               pad_w,
+    const bool              nchw,
+    const T*                x,
+    const T*                g,
+    const TIndex*           g_strides,
+    T*                      y,
+    Workspace*              ws,
+    Context*                ctx) {
+    const int alpha = M + 2;
+    const int tiles_h = (out_h + M - 1) / M, tiles_w = (out_w + M - 1) / M;
+    const TIndex tiles = tiles_h * tiles_w;
+    //  transform a batch of images into the buffers of bounded bytes
+    const TIndex image_bytes = sizeof(T) * alpha * alpha * (C + K) * tiles;
+    const TIndex batch = std::max((TIndex)1, std::min((TIndex)N,
+        (TIndex)CONV_LOWERING_BYTES() / image_bytes));
+    auto buffers = ws->template caches<T, Context>({
+        alpha * alpha * K * C,
+            alpha * alpha * C * batch * tiles,
+                alpha * alpha * K * batch * tiles });
+    _WinogradFilter<T, M>(K, C, g, g_strides, buffers[0]);
+    for (TIndex n = 0; n < N; n += batch) {
+        const int nb = (int)std::min(batch, N - n), P = nb * tiles;
+        _WinogradInput<T, M>(nb, C, H, W, tiles_h, tiles_w,
+            pad_h, pad_w, nchw, x + n * C * H * W, buffers[1]);
+        //  Y[xi][K, P] = U[xi][K, C] x V[xi][C, P]
+        for (int xi = 0; xi < alpha * alpha; ++xi)
+            math::Gemm<T, Context>(
+                CblasNoTrans, CblasNoTrans,
+                    K, P, C,
+                        1.0, buffers[0] + xi * K * C,
+                             buffers[1] + xi * C * P,
+                        0.0, buffers[2] + xi * K * P, ctx);
+        _WinogradOutput<T, M>(nb, K, out_h, out_w, tiles_h, tiles_w,
+            nchw, buffers[2], y + n * K * out_h * out_w);
+    }
+}
+
+template <typename T, class Context>
+void _WinogradConv3x3(
+    const int               tile,
+    const int               N,
+    const int               C,
+    const int               K,
+    const int               H,
+    const int               W,
+    const int               out_h,
+    const int               out_w,
+    const int               pad_h,
+    const int               pad_w,
+    const bool              nchw,
+    const T*                x,
+    const T*                g,
+    const TIndex*           g_strides,
+    T*                      y,
+    Workspace*              ws,
+    Context*                ctx) {
+    if (tile == 4) {
+        _WinogradConv3x3<T, Context, 4>(N, C, K, H, W,
+            out_h, out_w, pad_h, pad_w, nchw,
+                x, g, g_strides, y, ws, ctx);
+    } else if (tile == 2) {
+        _WinogradConv3x3<T, Context, 2>(N, C, K, H, W,
+            out_h, out_w, pad_h, pad_w, nchw,
+                x, g, g_strides, y, ws, ctx);
+    } else LOG(FATAL) << "Unsupported Winograd tile: " << tile;
+}
+
+}  // namespace
+
+template <class Context>
+int ConvOpBase<Context>::WinogradTile(bool data_grad) {
+    //  Winograd is only selected for CPUContext
+    if (!std::is_same<Context, CPUContext>::value || engine == "IM2COL" ||
+            ReverseDimensions() || group != 1 || num_spatial_axes != 2)
+        return 0;
+    for (int i = 0; i < 2; i++) {
+        if (kernel_size[i] != 3 || stride[i] != 1 || dilation[i] != 1)
+            return 0;
+        //  the gradient pads dY by (2 - pad)
+        if (data_grad && pad[i] > 2) return 0;
+    }
+    //  the tiles cover the outputs, i.e., dX for the gradient
+    const TIndex N = Input(0).dim(0);
+    const TIndex H = data_grad ? input_shape[0] : output_shape[0];
+    const TIndex W = data_grad ? input_shape[1] : output_shape[1];
+    if (engine != "WINOGRAD") {
+        const TIndex channels = std::max(
+            conv_in_channels, conv_out_channels);
+        if (std::min(conv_in_channels, conv_out_channels) <
+                kWinogradMinChannels) return 0;
+        if (N * H * W < kWinogradMinOutputs &&
+                channels > kWinogradMaxChannels) return 0;
+    }
+    //  F(4x4, 3x3) multiplies less, while transforming more filters
+    const TIndex tiles2 = N * ((H + 1) / 2) * ((W + 1) / 2);
+    const TIndex tiles4 = N * ((H + 3) / 4) * ((W + 3) / 4);
+    return 36 * (kWinogradFilterTiles + tiles4) <
+        16 * (kWinogradFilterTiles + tiles2) ? 4 : 2;
+}
+
+template <class Context> template <typename T>
+void ConvOpBase<Context>::WinogradWx(
+    int                     tile,
+    const T*                x,
+    const T*                weights,
+    T*                      y) {
+    const TIndex C = conv_in_channels, K = conv_out_channels;
+    //  W: [K, C, 3, 3] or [3, 3, C, K]
+    const TIndex g_strides[4] = {
+        data_format == "NCHW" ? C * 9 : 1,
+        data_format == "NCHW" ? 9 : K,
+        data_format == "NCHW" ? 3 : 3 * C * K,
+        data_format == "NCHW" ? 1 : C * K,
+    };
+    _WinogradConv3x3<T, Context>(tile, (int)Input(0).dim(0), C, K,
+        input_shape[0], input_shape[1], output_shape[0], output_shape[1],
+            pad[0], pad[1], data_format == "NCHW",
+                x, weights, g_strides, y, ws(), ctx());
+}
+
+template <class Context> template <typename T>
+void ConvOpBase<Context>::WinogradDx(
+    int                     tile,
+    const T*                dy,
+    const T*                weights,
+    T*                      dx) {
+    const TIndex C = conv_in_channels, K = conv_out_channels;
+    //  dX = conv3x3(pad(dY, 2 - pad), rot180(W)^T),
+    //  i.e., swap the in/out channels and flip the kernel
+    const TIndex sk = data_format == "NCHW" ? C * 9 : 1;
+    const TIndex sc = data_format == "NCHW" ? 9 : K;
+    const TIndex sh = data_format == "NCHW" ? 3 : 3 * C * K;
+    const TIndex sw = data_format == "NCHW" ? 1 : C * K;
+    const TIndex g_strides[4] = { sc, sk, -sh, -sw };
+    _WinogradConv3x3<T, Context>(tile, (int)Input(0).dim(0), K, C,
+        output_shape[0], output_shape[1], input_shape[0], input_shape[1],
+            2 - pad[0], 2 - pad[1], data_format == "NCHW",
+                dy, weights + 2 * sh + 2 * sw, g_strides, dx, ws(), ctx());
+}
+
+template int ConvOpBase<CPUContext>::WinogradTile(bool);
+template void ConvOpBase<CPUContext>::WinogradWx(int, const float*, const float*, float*);
+template void ConvOpBase<CPUContext>::WinogradDx(int, const float*, const float*, float*);
+
+#ifdef WITH_CUDA
+template int ConvOpBase<CUDAContext>::WinogradTile(bool);
+template void ConvOpBase<CUDAContext>::WinogradWx(int, const float*, const float*, float*);
+template void ConvOpBase<CUDAContext>::WinogradDx(int, const float*, const float*, float*);
+#endif
+
+}    // namespace dragon
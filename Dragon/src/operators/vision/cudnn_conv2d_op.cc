@@ -91,6 +91,10 @@ void CuDNNConv2dOp<Context>::RunWithType() {
             CUDNNType<T>::one, bias_desc, Bdata,
                 CUDNNType<T>::one, output_desc, Ydata));
     }
+
+    if (this->activation == "RELU")
+        kernel::Relu<T, Context>(Output(0)->count(),
+            0.f, Ydata, Ydata, ctx());
 }
 
 template <class Context>
@@ -0,0 +1,116 @@
+#include <cmath>
+
+#include "core/workspace.h"
+#include "utils/filler.h"
+#include "operators/vision/fold_affine_op.h"
+
+namespace dragon {
+
+template <class Context>
+vector<std::pair<MixedMemory*, size_t> > FoldAffineOp<Context>::Versions() {
+    vector<std::pair<MixedMemory*, size_t> > current;
+    for (int i = 0; i < InputSize(); i++) {
+        MixedMemory* mem = Input(i).memory();
+        current.emplace_back(mem, mem ? mem->version() : 0);
+    }
+    for (int i = 0; i < OutputSize(); i++) {
+        MixedMemory* mem = Output(i)->memory();
+        current.emplace_back(mem, mem ? mem->version() : 0);
+    }
+    return current;
+}
+
+template <class Context> template <typename T>
+void FoldAffineOp<Context>::RunWithType() {
+    CHECK_GT(Input(0).count(), 0)
+        << "\nTensor(" << Input(0).name() << ") is empty, "
+        << "the folding requires the initialized weights.";
+    const TIndex K = data_format == "NCHW" ?
+        Input(0).dim(0) : Input(0).dim(-1);
+    const TIndex inner_dim = Input(0).count() / K;
+    const vector<TIndex> param_shape(1, K);
+
+    for (int i = 0, idx = has_bias ? 2 : 1; i < types.size(); i++) {
+        for (int j = 0; j < num_params[i]; j++, idx++) {
+            //  the statistics of caffe are scaled by a factor
+            const bool is_factor = types[i] == "BatchNorm" && j == 2;
+            TENSOR_FILL(Input(idx), (is_factor ?
+                vector<TIndex>(1, 1) : param_shape));
+        }
+    }
+
+    //  skip if neither the params nor the folded are changed
+    if (Versions() == versions) return;
+
+    //  y = x * scale + shift, starting from the bias of conv
+    vector<float> scale(K, 1.f), shift(K, 0.f);
+    int idx = 1;
+    if (has_bias) {
+        auto* Bdata = Input(idx++).template data<T, CPUContext>();
+        for (int k = 0; k < K; k++) shift[k] = Bdata[k];
+    }
+
+    for (int i = 0; i < types.size(); i++) {
+        vector<const T*> params;
+        for (int j = 0; j < num_params[i]; j++, idx++)
+            params.push_back(Input(idx).template data<T, CPUContext>());
+        if (types[i] == "BatchNorm" || types[i] == "FusedBatchNorm") {
+            float factor = 1.f;
+            if (modes[i] == "CAFFE") factor = params[2][0] == 0 ?
+                0.f : 1.f / params[2][0];
+            for (int k = 0; k < K; k++) {
+                float alpha = 1.f / std::sqrt(
+                    params[1][k] * factor + eps[i]);
+                if (types[i] == "FusedBatchNorm") alpha *= params[2][k];
+                scale[k] *= alpha;
+                shift[k] = (shift[k] - params[0][k] * factor) * alpha;
+                if (types[i] == "FusedBatchNorm") shift[k] += params[3][k];
+            }
+        } else if (types[i] == "Affine") {
+            for (int k = 0; k < K; k++) {
+                scale[k] *= params[0][k];
+                shift[k] *= params[0][k];
+                if (num_params[i] > 1) shift[k] += params[1][k];
+            }
+        } else if (types[i] == "BiasAdd") {
+            for (int k = 0; k < K; k++) shift[k] += params[0][k];
+        } else {
+            LOG(FATAL) << "Unsupported op to fold: " << types[i];
+        }
+    }
+
+    Output(0)->ReshapeLike(Input(0));
+    Output(1)->Reshape(param_shape);
+    auto* Wdata = Input(0).template data<T, CPUContext>();
+    auto* Ydata = Output(0)->template mutable_data<T, CPUContext>();
+    auto* Bdata = Output(1)->template mutable_data<T, CPUContext>();
+    for (int k = 0; k < K; k++) Bdata[k] = shift[k];
+    if (data_format == "NCHW") {
+        //  W: [K, C, kh, kw]
+        for (int k = 0; k < K; k++)
+            for (int i = 0; i < inner_dim; i++)
+                Ydata[k * inner_dim + i] = Wdata[k * inner_dim + i] * scale[k];
+    } else if (data_format == "NHWC") {
+        //  W: [kh, kw, C, K]
+        for (int i = 0; i < inner_dim; i++)
+            for (int k = 0; k < K; k++)
+                Ydata[i * K + k] = Wdata[i * K + k] * scale[k];
+    } else LOG(FATAL) << "Unknown data format: " << data_format;
+    versions = Versions();
+}
+
+template <class Context>
+void FoldAffineOp<Context>::RunOnDevice() {
+    if (XIsType(Input(0), float)) RunWithType<float>();
+    else LOG(FATAL) << DTypeHelper(Input(0), { "float32" });
+}
+
+DEPLOY_CPU(FoldAffine);
+#ifdef WITH_CUDA
+DEPLOY_CUDA(FoldAffine);
+#endif
+OPERATOR_SCHEMA(FoldAffine).NumInputs(1, INT_MAX).NumOutputs(2);
+
+NO_GRADIENT(FoldAffine);
+
+}    // namespace dragon
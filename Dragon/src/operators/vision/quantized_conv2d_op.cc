@@ -0,0 +1,182 @@
+#include "core/workspace.h"
+#include "utils/filler.h"
+#include "utils/op_kernel.h"
+#include "utils/math_functions.h"
+#include "utils/omp_alternative.h"
+#include "operators/vision/quantized_conv_op.h"
+
+namespace dragon {
+
+namespace {
+
+/*!
+ *  Lower an image into the rows of [out_h * out_w, K],
+ *  where K is ordered as the weights, i.e., (C, kh, kw) for NCHW,
+ *  and (kh, kw, C) for NHWC. The paddings are filled by ``pad_value``.
+ */
+template <typename T>
+void _Im2Row2d(
+    const int               C,
+    const int               H,
+    const int               W,
+    const int               out_h,
+    const int               out_w,
+    const int               kernel_h,
+    const int               kernel_w,
+    const int               stride_h,
+    const int               stride_w,
+    const int               pad_h,
+    const int               pad_w,
+    const int               dilation_h,
+    const int               dilation_w,
+    const string&           data_format,
+    const T*                im,
+    const T                 pad_value,
+    const int               ldr,
+    T*                      row) {
+    const bool nchw = data_format == "NCHW";
+#ifdef WITH_OMP
+    #pragma omp parallel for num_threads(GET_OMP_THREADS(out_h * out_w * ldr))
+#endif
+    for (int p = 0; p < out_h * out_w; p++) {
+        const int oh = p / out_w, ow = p % out_w;
+        T* r = row + (size_t)p * ldr;
+        for (int i = 0; i < kernel_h; i++) {
+            const int h = oh * stride_h - pad_h + i * dilation_h;
+            for (int j = 0; j < kernel_w; j++) {
+                const int w = ow * stride_w - pad_w + j * dilation_w;
+                const bool inside = h >= 0 && h < H && w >= 0 && w < W;
+                if (nchw) {
+                    T* r_ij = r + i * kernel_w + j;
+                    const int kernel_dim = kernel_h * kernel_w;
+                    for (int c = 0; c < C; c++) r_ij[c * kernel_dim] =
+                        inside ? im[((size_t)c * H + h) * W + w] : pad_value;
+                } else {
+                    T* r_ij = r + (i * kernel_w + j) * C;
+                    if (inside) memcpy(r_ij,
+                        im + ((size_t)h * W + w) * C, C * sizeof(T));
+                    else for (int c = 0; c < C; c++) r_ij[c] = pad_value;
+                }
+            }
+        }
+    }
+}
+
+}  // namespace
+
+template <class Context>
+vector<std::pair<MixedMemory*, size_t> > QuantizedConv2dOp<Context>::Versions() {
+    MixedMemory* w = Input(1).memory(), *q = packed->memory();
+    return vector<std::pair<MixedMemory*, size_t> >({
+        { w, w ? w->version() : 0 }, { q, q ? q->version() : 0 } });
+}
+
+template <class Context> template <typename T>
+void QuantizedConv2dOp<Context>::QuantizeWeights() {
+    //  skip if neither the float nor the quantized are mutated,
+    //  where the latter could be shared by the ops of other graphs
+    packed = ws()->CreateTensor("/mnt/" + anchor() + "/quantized/weights");
+    if (Versions() == versions) return;
+
+    const int N = this->conv_out_channels, K = this->kernel_dim;
+    scales = ws()->CreateTensor("/mnt/" + anchor() + "/quantized/scales");
+    sums = ws()->CreateTensor("/mnt/" + anchor() + "/quantized/sums");
+    packed->Reshape({ (TIndex)math::Int8GemmPackedSize(N, K) });
+    scales->Reshape({ N }); sums->Reshape({ N });
+
+    //  W: [N, C, kh, kw] for NCHW, [kh, kw, C, N] for NHWC
+    kernel::QuantizeWeights<T, Context>(N, K, data_format == "NHWC",
+        Input(1).template data<T, Context>(),
+            scales->template mutable_data<float, Context>(),
+                sums->template mutable_data<int, Context>(),
+                    (int8_t*)packed->template mutable_data<uint8_t, Context>(),
+                        ctx());
+    versions = Versions();
+}
+
+template <class Context> template <typename T>
+void QuantizedConv2dOp<Context>::RunWithType() {
+    TENSOR_FILL(Input(1), weight_shape);
+    if (HasBias()) { TENSOR_FILL(Input(2), bias_shape); }
+    QuantizeWeights<T>();
+
+    const int N = this->conv_out_channels, K = this->kernel_dim;
+    const int P = this->conv_out_spatial_dim, ldr = (K + 3) / 4 * 4;
+    const bool is_rows = data_format == "NHWC" && this->is_1x1 && K == ldr;
+    //  the segments are aligned by 64 bytes
+    auto align = [](size_t nbytes) { return (nbytes + 63) / 64 * 64; };
+    auto buffers = ws()->template caches<Context>({
+        align(x_offset), is_rows ? 0 : align((size_t)P * ldr),
+            align((size_t)P * N * sizeof(int)), N * 2 * sizeof(float) });
+    auto* Qdata = (uint8_t*)buffers[0];
+    auto* Rdata = is_rows ? Qdata : (uint8_t*)buffers[1];
+    auto* Cdata = (int*)buffers[2];
+    auto* alpha = (float*)buffers[3], *beta = alpha + N;
+
+    //  y = alpha * (x_q * w_q) + beta
+    auto* Sdata = scales->template data<float, Context>();
+    auto* Zdata = sums->template data<int, Context>();
+    auto* Bdata = HasBias() ? Input(2).template data<T, Context>() : nullptr;
+    for (int k = 0; k < N; k++) {
+        alpha[k] = x_scale * Sdata[k];
+        beta[k] = (Bdata ? Bdata[k] : 0.f) - alpha[k] * x_zero_point * Zdata[k];
+    }
+
+    auto* Xdata = Input(0).template data<T, Context>();
+    auto* Pdata = (const int8_t*)packed->template data<uint8_t, Context>();
+    auto* Ydata = Output(0)->template mutable_data<T, Context>();
+    const bool relu = this->activation == "RELU";
+
+    for (int n = 0; n < Input(0).dim(0); n++) {
+        kernel::Quantize<T, Context>(x_offset, x_scale, x_zero_point,
+            Xdata + n * x_offset, Qdata, ctx());
+        if (!is_rows) {
+            _Im2Row2d<uint8_t>(this->conv_in_channels,
+                this->input_shape[0], this->input_shape[1],
+                    this->output_shape[0], this->output_shape[1],
+                        kernel_size[0], kernel_size[1],
+                            stride[0], stride[1], pad[0], pad[1],
+                                dilation[0], dilation[1], data_format,
+                                    Qdata, (uint8_t)x_zero_point, ldr, Rdata);
+        }
+        math::Int8Gemm<Context>(P, N, K, Rdata, ldr, Pdata, Cdata, ctx());
+
+        T* y = Ydata + n * y_offset;
+        if (data_format == "NCHW") {
+#ifdef WITH_OMP
+            #pragma omp parallel for num_threads(GET_OMP_THREADS(P * N))
+#endif
+            for (int k = 0; k < N; k++) {
+                for (int p = 0; p < P; p++) {
+                    const float v = alpha[k] * Cdata[p * N + k] + beta[k];
+                    y[k * P + p] = relu ? std::max(v, 0.f) : v;
+                }
+            }
+        } else {
+#ifdef WITH_OMP
+            #pragma omp parallel for num_threads(GET_OMP_THREADS(P * N))
+#endif
+            for (int p = 0; p < P; p++) {
+                for (int k = 0; k < N; k++) {
+                    const float v = alpha[k] * Cdata[p * N + k] + beta[k];
+                    y[p * N + k] = relu ? std::max(v, 0.f) : v;
+                }
+            }
+        }
+    }
+}
+
+template <class Context>
+void QuantizedConv2dOp<Context>::RunOnDevice() {
+    Reshape();
+
+    if (XIsType(Input(0), float)) RunWithType<float>();
+    else LOG(FATAL) << DTypeHelper(Input(0), { "float32" });
+}
+
+DEPLOY_CPU(QuantizedConv2d);
+OPERATOR_SCHEMA(QuantizedConv2d).NumInputs(2, 3).NumOutputs(1);
+
+NO_GRADIENT(QuantizedConv2d);
+
+}    // namespace dragon
@@ -0,0 +1,242 @@
+#include <cstring>
+#include <algorithm>
+
+#include "core/context.h"
+#include "utils/omp_alternative.h"
+#include "utils/math_functions.h"
+
+#if defined(__GNUC__) && (defined(__x86_64__) || defined(__i386__))
+#include <immintrin.h>
+#define WITH_INT8_DISPATCH
+#endif
+
+namespace dragon {
+
+namespace math {
+
+/*
+ *  The packed B is laid out as [N / 16][K / 4][16][4],
+ *  i.e., 4 depths of 16 columns are accumulated by an instruction
+ *  of AVX512-VNNI, which multiplies the unsigned A with the signed B.
+ *
+ *  The kernels are dispatched at runtime for the x86 compilers of GCC.
+ */
+
+#define INT8_GEMM_ROWS 4
+
+namespace {
+
+void _Int8GemmRows(
+    const int               M,
+    const int               N,
+    const int               K4,
+    const uint8_t*          A,
+    const int               lda,
+    const int8_t*           B,
+    int*                    C) {
+    int acc[16];
+    for (int jb = 0; jb < N; jb += 16) {
+        const int nr = std::min(16, N - jb);
+        const int8_t* Bj = B + (size_t)jb * K4 * 4;
+        for (int i = 0; i < M; i++) {
+            const uint8_t* Ai = A + (size_t)i * lda;
+            for (int jj = 0; jj < 16; jj++) acc[jj] = 0;
+            for (int k4 = 0; k4 < K4; k4++) {
+                const uint8_t* a = Ai + k4 * 4;
+                const int8_t* b = Bj + k4 * 64;
+                for (int jj = 0; jj < 16; jj++)
+                    acc[jj] += a[0] * b[jj * 4] + a[1] * b[jj * 4 + 1] +
+                        a[2] * b[jj * 4 + 2] + a[3] * b[jj * 4 + 3];
+            }
+            for (int jj = 0; jj < nr; jj++) C[(size_t)i * N + jb + jj] = acc[jj];
+        }
+    }
+}
+
+#ifdef WITH_INT8_DISPATCH
+
+template <int R, bool TWO>
+__attribute__((target("avx512f,avx512bw,avx512vnni")))
+inline void _Int8GemmBlockVNNI(
+    const int               K4,
+    const uint8_t*          A,
+    const int               lda,
+    const int8_t*           B0,
+    const int8_t*           B1,
+    int*                    C,
+    const int               ldc,
+    const __mmask16         mask0,
+    const __mmask16         mask1) {
+    __m512i acc0[R], acc1[R];
+    for (int r = 0; r < R; r++)
+        acc0[r] = acc1[r] = _mm512_setzero_si512();
+    for (int k4 = 0; k4 < K4; k4++) {
+        const __m512i b0 = _mm512_loadu_si512(B0 + k4 * 64);
+        const __m512i b1 = TWO ? _mm512_loadu_si512(
+            B1 + k4 * 64) : _mm512_setzero_si512();
+        for (int r = 0; r < R; r++) {
+            int a4; memcpy(&a4, A + (size_t)r * lda + k4 * 4, 4);
+            const __m512i a = _mm512_set1_epi32(a4);
+            acc0[r] = _mm512_dpbusd_epi32(acc0[r], a, b0);
+            if (TWO) acc1[r] = _mm512_dpbusd_epi32(acc1[r], a, b1);
+        }
+    }
+    for (int r = 0; r < R; r++) {
+        _mm512_mask_storeu_epi32(C + (size_t)r * ldc, mask0, acc0[r]);
+        if (TWO) _mm512_mask_storeu_epi32(
+            C + (size_t)r * ldc + 16, mask1, acc1[r]);
+    }
+}
+
+__attribute__((target("avx512f,avx512bw,avx512vnni")))
+void _Int8GemmRowsVNNI(
+    const int               M,
+    const int               N,
+    const int               K4,
+    const uint8_t*          A,
+    const int               lda,
+    const int8_t*           B,
+    int*                    C) {
+    for (int jb = 0; jb < N; jb += 32) {
+        const int n0 = std::min(16, N - jb), n1 = std::min(16, N - jb - 16);
+        const __mmask16 mask0 = (__mmask16)((1u << n0) - 1);
+        const __mmask16 mask1 = n1 > 0 ? (__mmask16)((1u << n1) - 1) : 0;
+        const int8_t* B0 = B + (size_t)jb * K4 * 4;
+        const int8_t* B1 = B0 + (size_t)K4 * 64;
+        int* Cj = C + jb;
+        int i = 0;
+        if (n1 > 0) {
+            for (; i + INT8_GEMM_ROWS <= M; i += INT8_GEMM_ROWS)
+                _Int8GemmBlockVNNI<INT8_GEMM_ROWS, true>(K4, A + (size_t)i * lda,
+                    lda, B0, B1, Cj + (size_t)i * N, N, mask0, mask1);
+            for (; i < M; i++)
+                _Int8GemmBlockVNNI<1, true>(K4, A + (size_t)i * lda,
+                    lda, B0, B1, Cj + (size_t)i * N, N, mask0, mask1);
+        } else {
+            for (; i + INT8_GEMM_ROWS <= M; i += INT8_GEMM_ROWS)
+                _Int8GemmBlockVNNI<INT8_GEMM_ROWS, false>(K4, A + (size_t)i * lda,
+                    lda, B0, B1, Cj + (size_t)i * N, N, mask0, mask1);
+            for (; i < M; i++)
+                _Int8GemmBlockVNNI<1, false>(K4, A + (size_t)i * lda,
+                    lda, B0, B1, Cj + (size_t)i * N, N, mask0, mask1);
+        }
+    }
+}
+
+template <int R>
+__attribute__((target("avx2")))
+inline void _Int8GemmBlockAVX2(
+    const int               K4,
+    const uint8_t*          A,
+    const int               lda,
+    const int8_t*           B,
+    int*                    C,
+    const int               ldc,
+    const int               nr) {
+    //  the exact products of int16, instead of the saturated ``maddubs``
+    __m256i acc[R][4], b[4];
+    for (int r = 0; r < R; r++)
+        for (int q = 0; q < 4; q++) acc[r][q] = _mm256_setzero_si256();
+    for (int k4 = 0; k4 < K4; k4++) {
+        const __m128i* Bk = (const __m128i*)(B + k4 * 64);
+        for (int q = 0; q < 4; q++)
+            b[q] = _mm256_cvtepi8_epi16(_mm_loadu_si128(Bk + q));
+        for (int r = 0; r < R; r++) {
+            int a4; memcpy(&a4, A + (size_t)r * lda + k4 * 4, 4);
+            const __m256i a = _mm256_cvtepu8_epi16(_mm_set1_epi32(a4));
+            for (int q = 0; q < 4; q++) acc[r][q] = _mm256_add_epi32(
+                acc[r][q], _mm256_madd_epi16(a, b[q]));
+        }
+    }
+    int y[16];
+    for (int r = 0; r < R; r++) {
+        //  reduce the pairs of each column and restore the order
+        for (int q = 0; q < 4; q += 2) {
+            const __m256i sum = _mm256_permute4x64_epi64(
+                _mm256_hadd_epi32(acc[r][q], acc[r][q + 1]), 0xD8);
+            _mm256_storeu_si256((__m256i*)(y + q * 4), sum);
+        }
+        memcpy(C + (size_t)r * ldc, y, nr * sizeof(int));
+    }
+}
+
+__attribute__((target("avx2")))
+void _Int8GemmRowsAVX2(
+    const int               M,
+    const int               N,
+    const int               K4,
+    const uint8_t*          A,
+    const int               lda,
+    const int8_t*           B,
+    int*                    C) {
+    for (int jb = 0; jb < N; jb += 16) {
+        const int nr = std::min(16, N - jb);
+        const int8_t* Bj = B + (size_t)jb * K4 * 4;
+        int i = 0;
+        for (; i + INT8_GEMM_ROWS <= M; i += INT8_GEMM_ROWS)
+            _Int8GemmBlockAVX2<INT8_GEMM_ROWS>(K4, A + (size_t)i * lda,
+                lda, Bj, C + (size_t)i * N + jb, N, nr);
+        for (; i < M; i++)
+            _Int8GemmBlockAVX2<1>(K4, A + (size_t)i * lda,
+                lda, Bj, C + (size_t)i * N + jb, N, nr);
+    }
+}
+
+#endif  // WITH_INT8_DISPATCH
+
+}  // namespace
+
+template <> void Int8GemmPack<CPUContext>(
+    const int               N,
+    const int               K,
+    const int8_t*           B,
+    int8_t*                 packed,
+    CPUContext*             ctx) {
+    const int K4 = (K + 3) / 4;
+    memset(packed, 0, Int8GemmPackedSize(N, K));
+    for (int n = 0; n < N; n++)
+        for (int k = 0; k < K; k++)
+            packed[((size_t)(n / 16) * K4 + k / 4) * 64 +
+                (n % 16) * 4 + k % 4] = B[(size_t)n * K + k];
+}
+
+template <> void Int8Gemm<CPUContext>(
+    const int               M,
+    const int               N,
+    const int               K,
+    const uint8_t*          A,
+    const int               lda,
+    const int8_t*           packed_B,
+    int*                    C,
+    CPUContext*             ctx) {
+    const int K4 = (K + 3) / 4;
+#ifdef WITH_INT8_DISPATCH
+    static const bool use_vnni = __builtin_cpu_supports("avx512vnni");
+    static const bool use_avx2 = __builtin_cpu_supports("avx2");
+#endif
+    //  split the rows into the chunks for threads
+    const int num_chunks = (M + 63) / 64;
+#ifdef WITH_OMP
+    #pragma omp parallel for num_threads(GET_OMP_THREADS(M * N * K4 / 256))
+#endif
+    for (int c = 0; c < num_chunks; c++) {
+        const int i = c * 64, rows = std::min(64, M - i);
+#ifdef WITH_INT8_DISPATCH
+        if (use_vnni) {
+            _Int8GemmRowsVNNI(rows, N, K4, A + (size_t)i * lda,
+                lda, packed_B, C + (size_t)i * N);
+            continue;
+        } else if (use_avx2) {
+            _Int8GemmRowsAVX2(rows, N, K4, A + (size_t)i * lda,
+                lda, packed_B, C + (size_t)i * N);
+            continue;
+        }
+#endif
+        _Int8GemmRows(rows, N, K4, A + (size_t)i * lda,
+            lda, packed_B, C + (size_t)i * N);
+    }
+}
+
+}    // namespace math
+
+}    // namespace dragon
@@ -1,3 +1,4 @@
+#include <limits>
 #include <algorithm>
 #include <functional>
 
@@ -492,6 +493,54 @@ template <> void Clip<float, CPUContext>(
     }
 }
 
+/******************** arithmetic.quantize ********************/
+
+template <> void Quantize<float, CPUContext>(
+    const int               count,
+    const float             scale,
+    const int               zero_point,
+    const float*            x,
+    uint8_t*                y,
+    CPUContext*             ctx) {
+    const float inv_scale = 1.f / scale;
+#ifdef WITH_OMP
+    #pragma omp parallel for num_threads(GET_OMP_THREADS(count))
+#endif
+    for (int i = 0; i < count; ++i) {
+        const int q = (int)std::nearbyint(x[i] * inv_scale) + zero_point;
+        y[i] = (uint8_t)std::max(0, std::min(q, 255));
+    }
+}
+
+template <> void QuantizeWeights<float, CPUContext>(
+    const int               N,
+    const int               K,
+    const bool              transposed,
+    const float*            w,
+    float*                  scales,
+    int*                    sums,
+    int8_t*                 packed,
+    CPUContext*             ctx) {
+    //  the symmetric scales for each output channel
+    vector<int8_t> q((size_t)N * K);
+    const int stride_n = transposed ? 1 : K;
+    const int stride_k = transposed ? N : 1;
+    for (int n = 0; n < N; ++n) {
+        float absmax = 0.f;
+        for (int k = 0; k < K; ++k) absmax = std::max(
+            absmax, std::abs(w[n * stride_n + k * stride_k]));
+        scales[n] = absmax > 0.f ? absmax / 127.f : 1.f;
+        sums[n] = 0;
+        for (int k = 0; k < K; ++k) {
+            const int v = (int)std::nearbyint(
+                w[n * stride_n + k * stride_k] / scales[n]);
+            q[(size_t)n * K + k] = (int8_t)std::max(-127, std::min(v, 127));
+            sums[n] += q[(size_t)n * K + k];
+        }
+    }
+    math::Int8GemmPack<CPUContext>(N, K, q.data(), packed, ctx);
+}
+
 /******************** control_flow.compare ********************/
 
 template <> void Equal<float, CPUContext>(
@@ -1208,26 +1257,103 @@ template<> void Arange<int, CPUContext>(
 
 /******************** ndarray.argreduce ********************/
 
-template<> void Argmax<float, CPUContext>(
+//  the reducers are shared with ndarray.reduce
+template <typename T>
+struct _SumReducer {
+    static T Init() { return T(0); }
+    static T Apply(const T a, const T b) { return a + b; }
+};
+
+template <typename T>
+struct _MaxReducer {
+    static T Init() { return std::numeric_limits<T>::lowest(); }
+    static T Apply(const T a, const T b) { return a > b ? a : b; }
+};
+
+template <typename T>
+struct _MinReducer {
+    static T Init() { return std::numeric_limits<T>::max(); }
+    static T Apply(const T a, const T b) { return a < b ? a : b; }
+};
+
+template <typename T, class Reducer>
+T _ReduceRow(const int n, const T* x) {
+    //  the independent lanes are vectorized by the compiler
+    T lanes[8];
+    for (int q = 0; q < 8; ++q) lanes[q] = Reducer::Init();
+    int j = 0;
+    for (; j + 8 <= n; j += 8)
+        for (int q = 0; q < 8; ++q)
+            lanes[q] = Reducer::Apply(lanes[q], x[j + q]);
+    for (; j < n; ++j) lanes[0] = Reducer::Apply(lanes[0], x[j]);
+    T val = lanes[0];
+    for (int q = 1; q < 8; ++q) val = Reducer::Apply(val, lanes[q]);
+    return val;
+}
+
+template <typename T, bool kMax>
+void _ArgReduce(
     const int               count,
     const int               axis_dim,
     const int               inner_dim,
     const int               top_k,
-    const float*            x,
+    const T*                x,
     int64_t*                indices,
-    float*                  values,
-    CPUContext*             ctx) {
-    vector<pair<float, int> > vec(axis_dim);
+    T*                      values) {
+    //  the ties are broken as sorting the pairs of (value, index)
+    auto Better = [](const T a, const T b) { return kMax ? a >= b : a < b; };
+    if (count == 0) return;
+    const int outer_dim = count / inner_dim;
+    if (top_k == 1 && inner_dim == 1) {
+        //  reduce the contiguous row, then locate the first or last
+#ifdef WITH_OMP
+        #pragma omp parallel for num_threads(GET_OMP_THREADS(count * axis_dim))
+#endif
+        for (int i = 0; i < outer_dim; ++i) {
+            const T* xi = x + (size_t)i * axis_dim;
+            const T val = kMax ?
+                _ReduceRow<T, _MaxReducer<T> >(axis_dim, xi) :
+                    _ReduceRow<T, _MinReducer<T> >(axis_dim, xi);
+            int j = kMax ? axis_dim - 1 : 0;
+            if (kMax) while (j > 0 && xi[j] != val) --j;
+            else while (j < axis_dim - 1 && xi[j] != val) ++j;
+            indices[i] = j;
+            if (values) values[i] = xi[j];
+        }
+        return;
+    }
+    if (top_k == 1) {
+        //  scan the axis once, and update the contiguous inner results
+#ifdef WITH_OMP
+        #pragma omp parallel for num_threads(GET_OMP_THREADS(count))
+#endif
+        for (int i = 0; i < outer_dim; ++i) {
+            const T* xi = x + (size_t)i * axis_dim * inner_dim;
+            int64_t* index = indices + (size_t)i * inner_dim;
+            vector<T> buffer(values ? 0 : inner_dim);
+            T* value = values ? values + (size_t)i * inner_dim : buffer.data();
+            for (int k = 0; k < inner_dim; ++k) { value[k] = xi[k]; index[k] = 0; }
+            for (int j = 1; j < axis_dim; ++j) {
+                xi += inner_dim;
+                for (int k = 0; k < inner_dim; ++k) {
+                    if (Better(xi[k], value[k])) { value[k] = xi[k]; index[k] = j; }
+                }
+            }
+        }
+        return;
+    }
 #ifdef WITH_OMP
     #pragma omp parallel for num_threads(GET_OMP_THREADS(count))
 #endif
     for (int i = 0; i < count; ++i) {
-        for (int j = 0; j < axis_dim; ++j) 
-            vec[j] = std::make_pair(x[(i / inner_dim * axis_dim + j) *
-                inner_dim + i % inner_dim], j);
-        std::partial_sort(
-            vec.begin(), vec.begin() + top_k, vec.end(),
-                std::greater< pair<float, int> >());
+        vector<pair<T, int> > vec(axis_dim);
+        const T* xi = x + (size_t)(i / inner_dim) *
+            axis_dim * inner_dim + i % inner_dim;
+        for (int j = 0; j < axis_dim; ++j)
+            vec[j] = std::make_pair(xi[j * inner_dim], j);
+        if (kMax) std::partial_sort(vec.begin(), vec.begin() + top_k,
+            vec.end(), std::greater< pair<T, int> >());
+        else std::partial_sort(vec.begin(), vec.begin() + top_k, vec.end());
         for (int j = 0; j < top_k; ++j) {
             TIndex y_idx = (i / inner_dim * top_k + j) *
                 inner_dim + i % inner_dim;
@@ -1237,6 +1363,19 @@ template<> void Argmax<float, CPUContext>(
     }
 }
 
+template<> void Argmax<float, CPUContext>(
+    const int               count,
+    const int               axis_dim,
+    const int               inner_dim,
+    const int               top_k,
+    const float*            x,
+    int64_t*                indices,
+    float*                  values,
+    CPUContext*             ctx) {
+    _ArgReduce<float, true>(count, axis_dim,
+        inner_dim, top_k, x, indices, values);
+}
+
 template<> void Argmin<float, CPUContext>(
     const int               count,
     const int               axis_dim,
@@ -1246,22 +1385,8 @@ template<> void Argmin<float, CPUContext>(
     int64_t*                indices,
     float*                  values,
     CPUContext*             ctx) {
-    vector<pair<float, int> > vec(axis_dim);
-#ifdef WITH_OMP
-#pragma omp parallel for num_threads(GET_OMP_THREADS(count))
-#endif
-    for (int i = 0; i < count; ++i) {
-        for (int j = 0; j < axis_dim; ++j) 
-            vec[j] = std::make_pair(x[(i / inner_dim * axis_dim + j) *
-                inner_dim + i % inner_dim], j);
-        std::partial_sort(vec.begin(), vec.begin() + top_k, vec.end());
-        for (int j = 0; j < top_k; ++j) {
-            TIndex y_idx = (i / inner_dim * top_k + j) *
-                inner_dim + i % inner_dim;
-            indices[y_idx] = vec[j].second;
-            if (values) values[y_idx] = vec[j].first;
-        }
-    }
+    _ArgReduce<float, false>(count, axis_dim,
+        inner_dim, top_k, x, indices, values);
 }
 
 /******************** ndarray.gather ********************/
@@ -1758,15 +1883,17 @@ template<> void Sum<float, CPUContext>(
     const float*            x,
     float*                  y,
     CPUContext*             ctx) {
+    if (count == 0) return;
+    const int outer_dim = count / inner_dim;
 #ifdef WITH_OMP
     #pragma omp parallel for num_threads(GET_OMP_THREADS(count))
 #endif
-    for (int i = 0; i < count; ++i) {
-        float sum_val = 0.0;
-        for (int j = 0; j < axis_dim; ++j)
-            sum_val += x[(i / inner_dim * axis_dim + j)
-                          * inner_dim + i % inner_dim];
-        y[i] = sum_val;
+    for (int i = 0; i < outer_dim; ++i) {
+        const float* xi = x + (size_t)i * axis_dim * inner_dim;
+        float* yi = y + (size_t)i * inner_dim;
+        for (int k = 0; k < inner_dim; ++k) yi[k] = 0.f;
+        for (int j = 0; j < axis_dim; ++j, xi += inner_dim)
+            for (int k = 0; k < inner_dim; ++k) yi[k] += xi[k];
     }
 }
 
@@ -1778,13 +1905,184 @@ template<> void SumGrad<float, CPUContext>(
     const float*            dy,
     float*                  dx,
     CPUContext*             ctx) {
+    if (count == 0) return;
+    const int outer_dim = count / inner_dim;
 #ifdef WITH_OMP
     #pragma omp parallel for num_threads(GET_OMP_THREADS(count))
 #endif
-    for (int i = 0; i < count; ++i) {
-        for (int j = 0; j < axis_dim; ++j)
-            dx[(i / inner_dim * axis_dim + j)
-                * inner_dim + i % inner_dim] = dy[i] * coeff;
+    for (int i = 0; i < outer_dim; ++i) {
+        const float* dyi = dy + (size_t)i * inner_dim;
+        float* dxi = dx + (size_t)i * axis_dim * inner_dim;
+        for (int j = 0; j < axis_dim; ++j, dxi += inner_dim)
+            for (int k = 0; k < inner_dim; ++k) dxi[k] = dyi[k] * coeff;
+    }
+}
+
+/*!
+ *  Drop the axes of size 1, then merge the adjacent axes
+ *  which are either both reduced or both kept.
+ */
+static void _CollapseReduceDims(
+    const int               ndim,
+    const int*              dims,
+    const int               num_axes,
+    const int*              axes,
+    vector<int>&            new_dims,
+    vector<int>&            reduced) {
+    vector<int> is_reduced(ndim, 0);
+    for (int i = 0; i < num_axes; ++i) is_reduced[axes[i]] = 1;
+    new_dims.clear(); reduced.clear();
+    for (int i = 0; i < ndim; ++i) {
+        if (dims[i] == 1) continue;
+        if (!reduced.empty() && reduced.back() == is_reduced[i]) {
+            new_dims.back() *= dims[i];
+        } else {
+            new_dims.push_back(dims[i]);
+            reduced.push_back(is_reduced[i]);
+        }
+    }
+    if (new_dims.empty()) { new_dims.push_back(1); reduced.push_back(1); }
+}
+
+/*!
+ *  Walk the rows of x in the memory order, i.e., x is read once,
+ *  where the reduced axes have the zero strides of y.
+ */
+template <typename T, class Reducer>
+void _ReduceRows(
+    const int               ndim,
+    const int*              dims,
+    const int*              y_strides,
+    const bool              inner_reduced,
+    const T*                x,
+    T*                      y) {
+    const int inner_dim = dims[ndim - 1];
+    int num_rows = 1;
+    for (int i = 0; i < ndim - 1; ++i) num_rows *= dims[i];
+    vector<int> index(ndim, 0);
+    int y_offset = 0;
+    for (int r = 0; r < num_rows; ++r, x += inner_dim) {
+        if (inner_reduced) {
+            y[y_offset] = Reducer::Apply(y[y_offset],
+                _ReduceRow<T, Reducer>(inner_dim, x));
+        } else {
+            T* yr = y + y_offset;
+            for (int k = 0; k < inner_dim; ++k)
+                yr[k] = Reducer::Apply(yr[k], x[k]);
+        }
+        for (int i = ndim - 2; i >= 0; --i) {
+            y_offset += y_strides[i];
+            if (++index[i] < dims[i]) break;
+            y_offset -= y_strides[i] * dims[i]; index[i] = 0;
+        }
+    }
+}
+
+template <typename T, class Reducer>
+void _Reduce(
+    const int               ndim,
+    const int*              dims,
+    const int               num_axes,
+    const int*              axes,
+    const T*                x,
+    T*                      y) {
+    vector<int> new_dims, reduced;
+    _CollapseReduceDims(ndim, dims,
+        num_axes, axes, new_dims, reduced);
+    const int n = (int)new_dims.size();
+    vector<int> y_strides(n);
+    int x_count = 1, y_count = 1;
+    for (int i = n - 1; i >= 0; --i) {
+        y_strides[i] = reduced[i] ? 0 : y_count;
+        if (!reduced[i]) y_count *= new_dims[i];
+        x_count *= new_dims[i];
+    }
+    for (int i = 0; i < y_count; ++i) y[i] = Reducer::Init();
+    if (x_count == 0) return;
+    if (n > 1 && !reduced[0]) {
+        //  the outer kept axis is split to write y exclusively
+        const int x_stride = x_count / new_dims[0];
+#ifdef WITH_OMP
+        #pragma omp parallel for num_threads(GET_OMP_THREADS(x_count))
+#endif
+        for (int i = 0; i < new_dims[0]; ++i)
+            _ReduceRows<T, Reducer>(n - 1, new_dims.data() + 1,
+                y_strides.data() + 1, reduced[n - 1] != 0,
+                    x + (size_t)i * x_stride, y + (size_t)i * y_strides[0]);
+    } else {
+        _ReduceRows<T, Reducer>(n, new_dims.data(),
+            y_strides.data(), reduced[n - 1] != 0, x, y);
+    }
+}
+
+template <> void Reduce<float, CPUContext>(
+    const int               ndim,
+    const int*              dims,
+    const int               num_axes,
+    const int*              axes,
+    const string&           operation,
+    const float*            x,
+    float*                  y,
+    CPUContext*             ctx) {
+    if (operation == "SUM" || operation == "MEAN") {
+        _Reduce<float, _SumReducer<float> >(
+            ndim, dims, num_axes, axes, x, y);
+    } else if (operation == "MAX") {
+        _Reduce<float, _MaxReducer<float> >(
+            ndim, dims, num_axes, axes, x, y);
+    } else if (operation == "MIN") {
+        _Reduce<float, _MinReducer<float> >(
+            ndim, dims, num_axes, axes, x, y);
+    } else LOG(FATAL) << "Unknown operation: [" << operation << "].";
+    if (operation == "MEAN") {
+        int count = 1, reduce_dim = 1;
+        for (int i = 0; i < ndim; ++i) count *= dims[i];
+        for (int i = 0; i < num_axes; ++i) reduce_dim *= dims[axes[i]];
+        if (reduce_dim > 0) math::Scal<float, CPUContext>(
+            count / reduce_dim, 1.f / reduce_dim, y, ctx);
+    }
+}
+
+template <> void ReduceGrad<float, CPUContext>(
+    const int               ndim,
+    const int*              dims,
+    const int               num_axes,
+    const int*              axes,
+    const float             coeff,
+    const float*            dy,
+    float*                  dx,
+    CPUContext*             ctx) {
+    vector<int> new_dims, reduced;
+    _CollapseReduceDims(ndim, dims,
+        num_axes, axes, new_dims, reduced);
+    const int n = (int)new_dims.size();
+    vector<int> y_strides(n);
+    int x_count = 1, y_count = 1;
+    for (int i = n - 1; i >= 0; --i) {
+        y_strides[i] = reduced[i] ? 0 : y_count;
+        if (!reduced[i]) y_count *= new_dims[i];
+        x_count *= new_dims[i];
+    }
+    //  each row of dx is written from a row or an element of dy
+    const int inner_dim = new_dims[n - 1];
+    const int num_rows = x_count / std::max(inner_dim, 1);
+#ifdef WITH_OMP
+    #pragma omp parallel for num_threads(GET_OMP_THREADS(x_count))
+#endif
+    for (int r = 0; r < num_rows; ++r) {
+        int y_offset = 0;
+        for (int i = n - 2, rem = r; i >= 0; --i) {
+            y_offset += (rem % new_dims[i]) * y_strides[i];
+            rem /= new_dims[i];
+        }
+        float* dxr = dx + (size_t)r * inner_dim;
+        if (reduced[n - 1]) {
+            const float val = dy[y_offset] * coeff;
+            for (int k = 0; k < inner_dim; ++k) dxr[k] = val;
+        } else {
+            const float* dyr = dy + y_offset;
+            for (int k = 0; k < inner_dim; ++k) dxr[k] = dyr[k] * coeff;
+        }
     }
 }
 
@@ -1921,6 +2219,175 @@ template <> void TileGrad<float, CPUContext>(
 
 /******************** ndarray.transpose ********************/
 
+/*!
+ *  Drop the axes of size 1, then merge the axes
+ *  which are adjacent in both x and y.
+ */
+static void _CollapseTransposeDims(
+    const int               ndim,
+    const int*              dims,
+    const int*              perm,
+    vector<int>&            new_dims,
+    vector<int>&            new_perm) {
+    //  the ranks of the kept axes of x
+    vector<int> rank(ndim, -1);
+    for (int i = 0, k = 0; i < ndim; ++i) if (dims[i] != 1) rank[i] = k++;
+    //  group the axes in the order of y
+    vector<int> starts, ends;
+    for (int j = 0; j < ndim; ++j) {
+        const int k = rank[perm[j]];
+        if (k == -1) continue;
+        if (!ends.empty() && ends.back() + 1 == k) ends.back() = k;
+        else { starts.push_back(k); ends.push_back(k); }
+    }
+    vector<int> kept_dims;
+    for (int i = 0; i < ndim; ++i)
+        if (dims[i] != 1) kept_dims.push_back(dims[i]);
+    //  the groups are ordered by x to be the new axes
+    const int n = (int)starts.size();
+    vector<int> order(n);
+    for (int g = 0; g < n; ++g) order[g] = g;
+    std::sort(order.begin(), order.end(),
+        [&](int a, int b) { return starts[a] < starts[b]; });
+    new_dims.assign(n, 1); new_perm.assign(n, 0);
+    for (int i = 0; i < n; ++i) {
+        const int g = order[i];
+        for (int k = starts[g]; k <= ends[g]; ++k) new_dims[i] *= kept_dims[k];
+        new_perm[g] = i;
+    }
+}
+
+/*!
+ *  y[j * ldy + i] = x[i * ldx + j], for i < rows and j < cols.
+ */
+template <typename T>
+void _Transpose2d(
+    const int               rows,
+    const int               cols,
+    const T*                x,
+    const int               ldx,
+    T*                      y,
+    const int               ldy) {
+    for (int i = 0; i < rows; ++i)
+        for (int j = 0; j < cols; ++j)
+            y[(size_t)j * ldy + i] = x[(size_t)i * ldx + j];
+}
+
+#ifdef WITH_SSE
+
+template <> void _Transpose2d<float>(
+    const int               rows,
+    const int               cols,
+    const float*            x,
+    const int               ldx,
+    float*                  y,
+    const int               ldy) {
+    int i = 0;
+    for (; i + 4 <= rows; i += 4) {
+        const float* x0 = x + (size_t)i * ldx;
+        int j = 0;
+        for (; j + 4 <= cols; j += 4) {
+            __m128 r0 = _mm_loadu_ps(x0 + j);
+            __m128 r1 = _mm_loadu_ps(x0 + ldx + j);
+            __m128 r2 = _mm_loadu_ps(x0 + 2 * ldx + j);
+            __m128 r3 = _mm_loadu_ps(x0 + 3 * ldx + j);
+            _MM_TRANSPOSE4_PS(r0, r1, r2, r3);
+            float* y0 = y + (size_t)j * ldy + i;
+            _mm_storeu_ps(y0, r0);
+            _mm_storeu_ps(y0 + ldy, r1);
+            _mm_storeu_ps(y0 + 2 * ldy, r2);
+            _mm_storeu_ps(y0 + 3 * ldy, r3);
+        }
+        for (; j < cols; ++j)
+            for (int ii = i; ii < i + 4; ++ii)
+                y[(size_t)j * ldy + ii] = x[(size_t)ii * ldx + j];
+    }
+    for (; i < rows; ++i)
+        for (int j = 0; j < cols; ++j)
+            y[(size_t)j * ldy + i] = x[(size_t)i * ldx + j];
+}
+
+#endif  // WITH_SSE
+
+#define TRANSPOSE_BLOCK 32
+
+/*!
+ *  The innermost axes of x and y are copied by the rows if identical,
+ *  otherwise they are transposed by the cache blocks,
+ *  which covers the 2d and NCHW <-> NHWC as the batched cases.
+ */
+template <typename T>
+void _Transpose(
+    const int               ndim,
+    const int*              dims,
+    const int*              perm,
+    const T*                x,
+    T*                      y) {
+    vector<int> new_dims, new_perm;
+    _CollapseTransposeDims(ndim, dims, perm, new_dims, new_perm);
+    const int n = (int)new_dims.size();
+    vector<int> x_strides(n), y_dims(n), y_strides(n);
+    int count = 1;
+    for (int i = n - 1; i >= 0; --i) {
+        x_strides[i] = count; count *= new_dims[i];
+    }
+    for (int j = n - 1, stride = 1; j >= 0; --j) {
+        y_dims[j] = new_dims[new_perm[j]];
+        y_strides[j] = stride; stride *= y_dims[j];
+    }
+    if (count == 0) return;
+    if (n <= 1) { memcpy(y, x, count * sizeof(T)); return; }
+
+    const int a = new_perm[n - 1];
+    if (a == n - 1) {
+        //  the innermost axes are identical, copy the rows
+        const int inner_dim = new_dims[n - 1], num_rows = count / inner_dim;
+#ifdef WITH_OMP
+        #pragma omp parallel for num_threads(GET_OMP_THREADS(count))
+#endif
+        for (int r = 0; r < num_rows; ++r) {
+            int x_offset = 0;
+            for (int j = n - 2, rem = r; j >= 0; --j) {
+                x_offset += (rem % y_dims[j]) * x_strides[new_perm[j]];
+                rem /= y_dims[j];
+            }
+            memcpy(y + (size_t)r * inner_dim,
+                x + x_offset, inner_dim * sizeof(T));
+        }
+        return;
+    }
+
+    //  the blocks of [rows, cols] are transposed for each outer index,
+    //  where the rows are the innermost of y, and the cols are of x
+    int p = 0;
+    while (new_perm[p] != n - 1) ++p;
+    vector<int> outer_axes;
+    for (int j = 0; j < n - 1; ++j) if (j != p) outer_axes.push_back(j);
+    const int rows = new_dims[a], cols = new_dims[n - 1];
+    const int num_blocks = (rows + TRANSPOSE_BLOCK - 1) / TRANSPOSE_BLOCK;
+    const int num_tasks = count / rows / cols * num_blocks;
+#ifdef WITH_OMP
+    #pragma omp parallel for num_threads(GET_OMP_THREADS(count))
+#endif
+    for (int t = 0; t < num_tasks; ++t) {
+        int x_offset = 0, y_offset = 0;
+        for (int i = (int)outer_axes.size() - 1,
+                rem = t / num_blocks; i >= 0; --i) {
+            const int j = outer_axes[i], idx = rem % y_dims[j];
+            x_offset += idx * x_strides[new_perm[j]];
+            y_offset += idx * y_strides[j];
+            rem /= y_dims[j];
+        }
+        const int r0 = t % num_blocks * TRANSPOSE_BLOCK;
+        const int nr = std::min(TRANSPOSE_BLOCK, rows - r0);
+        for (int c0 = 0; c0 < cols; c0 += TRANSPOSE_BLOCK) {
+            _Transpose2d<T>(nr, std::min(TRANSPOSE_BLOCK, cols - c0),
+                x + x_offset + (size_t)r0 * x_strides[a] + c0, x_strides[a],
+                    y + y_offset + (size_t)c0 * y_strides[p] + r0, y_strides[p]);
+        }
+    }
+}
+
 template <> void Transpose<float, CPUContext>(
     const int               count,
     const int               ndim,
@@ -1930,18 +2397,11 @@ template <> void Transpose<float, CPUContext>(
     const float*            x,
     float*                  y,
     CPUContext*             ctx) {
-#ifdef WITH_OMP
-    #pragma omp parallel for num_threads(GET_OMP_THREADS(count))
-#endif
-    for (int i = 0; i < count; ++i) {
-       int x_idx = 0, y_idx = i;
-       for (int j = 0; j < ndim; ++j) {
-           int k = order[j];
-           x_idx += (y_idx / new_steps[j]) * old_steps[k];
-           y_idx %= new_steps[j];
-       }
-       y[i] = x[x_idx];
-    }
+    if (count == 0) return;
+    vector<int> dims(ndim);
+    for (int i = 0; i < ndim; ++i)
+        dims[i] = (i == 0 ? count : old_steps[i - 1]) / old_steps[i];
+    _Transpose<float>(ndim, dims.data(), order, x, y);
 }
 
 template <> void Transpose<float16, CPUContext>(
@@ -1965,18 +2425,14 @@ template <> void TransposeGrad<float, CPUContext>(
     const float*            dy,
     float*                  dx,
     CPUContext*             ctx) {
-#ifdef WITH_OMP
-    #pragma omp parallel for num_threads(GET_OMP_THREADS(count))
-#endif
-    for (int i = 0; i < count; ++i) {
-        int x_idx = 0, y_idx = i;
-        for (int j = 0; j < ndim; ++j) {
-            int k = order[j];
-            x_idx += (y_idx / new_steps[j]) * old_steps[k];
-            y_idx %= new_steps[j];
-        }
-        dx[x_idx] = dy[i];
+    //  dx is the transposed dy by the inverse order
+    if (count == 0) return;
+    vector<int> dims(ndim), inverse_order(ndim);
+    for (int i = 0; i < ndim; ++i) {
+        dims[i] = (i == 0 ? count : new_steps[i - 1]) / new_steps[i];
+        inverse_order[order[i]] = i;
     }
+    _Transpose<float>(ndim, dims.data(), inverse_order.data(), dy, dx);
 }
 
 template <> void TransposeGrad<float16, CPUContext>(
@@ -2058,6 +2514,50 @@ template <> void LSTMCellGrad<float, CPUContext>(
     }
 }
 
+/******************** update.multi_tensor ********************/
+
+//  the elements of a chunk are updated by the same thread
+#define MULTI_TENSOR_CHUNK_SIZE 4096
+
+template <typename T, class Functor>
+void _MultiTensorUpdate(
+    const int               num_tensors,
+    const int*              counts,
+    const float*            factors,
+    const T                 l2_decay,
+    const bool              zero_grad,
+    T**                     g,
+    T**                     x,
+    Functor                 update) {
+    //  split all the tensors into chunks to balance the threads
+    vector<std::pair<int, int> > chunks;
+    int total = 0;
+    for (int t = 0; t < num_tensors; ++t) {
+        for (int i = 0; i < counts[t]; i += MULTI_TENSOR_CHUNK_SIZE)
+            chunks.emplace_back(t, i);
+        total += counts[t];
+    }
+    const int num_chunks = (int)chunks.size();
+    //  the non-positive decay is disabled as the single-tensor path
+    const T decay = l2_decay > 0 ? l2_decay : T(0);
+#ifdef WITH_OMP
+    #pragma omp parallel for num_threads(GET_OMP_THREADS(total))
+#endif
+    for (int c = 0; c < num_chunks; ++c) {
+        const int t = chunks[c].first;
+        const int end = std::min(counts[t],
+            chunks[c].second + MULTI_TENSOR_CHUNK_SIZE);
+        const T factor = factors[t];
+        T* gt = g[t], *xt = x[t];
+        for (int i = chunks[c].second; i < end; ++i) {
+            //  scale & clip & decay -> update -> apply & zero grads
+            T gi = update(t, i, gt[i] * factor + decay * xt[i]);
+            xt[i] -= gi;
+            gt[i] = zero_grad ? T(0) : gi;
+        }
+    }
+}
+
 /******************** update.adam_update ********************/
 
 template <typename T>
@@ -2107,6 +2607,29 @@ template <> void AdamUpdate<float16, CPUContext>(
     CPU_FP16_NOT_SUPPORTED;
 }
 
+template <> void MultiTensorAdamUpdate<float, CPUContext>(
+    const int               num_tensors,
+    const int*              counts,
+    const float*            factors,
+    const float             l2_decay,
+    const float             lr,
+    const float             beta1,
+    const float             beta2,
+    const float             eps,
+    const bool              zero_grad,
+    float**                 g,
+    float**                 m,
+    float**                 v,
+    float**                 x,
+    CPUContext*             ctx) {
+    _MultiTensorUpdate<float>(num_tensors, counts, factors,
+        l2_decay, zero_grad, g, x, [=](int t, int i, float gi) {
+            float mi = m[t][i] = m[t][i] * beta1 + gi * (1 - beta1);
+            float vi = v[t][i] = v[t][i] * beta2 + gi * gi * (1 - beta2);
+            return lr * mi / (std::sqrt(vi) + eps);
+        });
+}
+
 /******************** update.nesterov_update ********************/
 
 template <typename T>
@@ -2146,6 +2669,26 @@ template <> void NesterovUpdate<float16, CPUContext>(
     CPU_FP16_NOT_SUPPORTED;
 }
 
+template <> void MultiTensorNesterovUpdate<float, CPUContext>(
+    const int               num_tensors,
+    const int*              counts,
+    const float*            factors,
+    const float             l2_decay,
+    const float             lr,
+    const float             momentum,
+    const bool              zero_grad,
+    float**                 g,
+    float**                 h,
+    float**                 x,
+    CPUContext*             ctx) {
+    _MultiTensorUpdate<float>(num_tensors, counts, factors,
+        l2_decay, zero_grad, g, x, [=](int t, int i, float gi) {
+            float hi = h[t][i];
+            float hi_new = h[t][i] = momentum * hi + lr * gi;
+            return (1 + momentum) * hi_new - momentum * hi;
+        });
+}
+
 /******************** update.rmsprop_update ********************/
 
 template <typename T>
@@ -2188,6 +2731,26 @@ template <> void RMSPropUpdate<float16, CPUContext>(
     CPU_FP16_NOT_SUPPORTED;
 }
 
+template <> void MultiTensorRMSPropUpdate<float, CPUContext>(
+    const int               num_tensors,
+    const int*              counts,
+    const float*            factors,
+    const float             l2_decay,
+    const float             lr,
+    const float             decay,
+    const float             eps,
+    const bool              zero_grad,
+    float**                 g,
+    float**                 h,
+    float**                 x,
+    CPUContext*             ctx) {
+    _MultiTensorUpdate<float>(num_tensors, counts, factors,
+        l2_decay, zero_grad, g, x, [=](int t, int i, float gi) {
+            float hi = h[t][i] = decay * h[t][i] + (1 - decay) * gi * gi;
+            return lr * gi / (std::sqrt(hi) + eps);
+        });
+}
+
 /******************** update.sgd_update ********************/
 
 template <typename T>
@@ -2226,6 +2789,24 @@ template <> void SGDUpdate<float16, CPUContext>(
     CPU_FP16_NOT_SUPPORTED;
 }
 
+template <> void MultiTensorSGDUpdate<float, CPUContext>(
+    const int               num_tensors,
+    const int*              counts,
+    const float*            factors,
+    const float             l2_decay,
+    const float             lr,
+    const float             momentum,
+    const bool              zero_grad,
+    float**                 g,
+    float**                 h,
+    float**                 x,
+    CPUContext*             ctx) {
+    _MultiTensorUpdate<float>(num_tensors, counts, factors,
+        l2_decay, zero_grad, g, x, [=](int t, int i, float gi) {
+            return h[t][i] = momentum * h[t][i] + lr * gi;
+        });
+}
+
 /******************** vision.bias_add ********************/
 
 template<> void BiasAdd<float, CPUContext>(
@@ -2303,6 +2303,144 @@ template<> void SumGrad<float, CUDAContext>(
                  axis_dim, inner_dim, coeff, dy, dx);
 }
 
+#define REDUCE_MAX_DIMS 8
+
+/*!
+ *  The collapsed dims passed by value, where the reduced axes of y
+ *  have the zero strides.
+ */
+struct _ReduceDims {
+    int ndim, dims[REDUCE_MAX_DIMS], reduced[REDUCE_MAX_DIMS];
+    int x_strides[REDUCE_MAX_DIMS], y_strides[REDUCE_MAX_DIMS];
+};
+
+static _ReduceDims _CollapseReduceDims(
+    const int               ndim,
+    const int*              dims,
+    const int               num_axes,
+    const int*              axes) {
+    vector<int> is_reduced(ndim, 0), new_dims, reduced;
+    for (int i = 0; i < num_axes; ++i) is_reduced[axes[i]] = 1;
+    for (int i = 0; i < ndim; ++i) {
+        if (dims[i] == 1) continue;
+        if (!reduced.empty() && reduced.back() == is_reduced[i]) {
+            new_dims.back() *= dims[i];
+        } else {
+            new_dims.push_back(dims[i]);
+            reduced.push_back(is_reduced[i]);
+        }
+    }
+    if (new_dims.empty()) { new_dims.push_back(1); reduced.push_back(1); }
+    CHECK_LE(new_dims.size(), REDUCE_MAX_DIMS)
+        << "\nToo many axes to reduce on the device.";
+    _ReduceDims params;
+    params.ndim = (int)new_dims.size();
+    for (int i = params.ndim - 1, x_stride = 1, y_stride = 1; i >= 0; --i) {
+        params.dims[i] = new_dims[i];
+        params.reduced[i] = reduced[i];
+        params.x_strides[i] = x_stride;
+        params.y_strides[i] = reduced[i] ? 0 : y_stride;
+        x_stride *= new_dims[i];
+        if (!reduced[i]) y_stride *= new_dims[i];
+    }
+    return params;
+}
+
+template <typename T>
+__global__ void _Reduce(
+    const int               count,
+    const int               reduce_dim,
+    const _ReduceDims       params,
+    const int               op,
+    const T                 init,
+    const T                 scale,
+    const T*                x,
+    T*                      y) {
+    CUDA_1D_KERNEL_LOOP(idx, count) {
+        int x_offset = 0;
+        for (int i = params.ndim - 1, rem = idx; i >= 0; --i) {
+            if (params.reduced[i]) continue;
+            x_offset += (rem % params.dims[i]) * params.x_strides[i];
+            rem /= params.dims[i];
+        }
+        T val = init;
+        for (int r = 0; r < reduce_dim; ++r) {
+            int offset = x_offset;
+            for (int i = params.ndim - 1, rem = r; i >= 0; --i) {
+                if (!params.reduced[i]) continue;
+                offset += (rem % params.dims[i]) * params.x_strides[i];
+                rem /= params.dims[i];
+            }
+            const T v = x[offset];
+            if (op == 0) val += v;
+            else if (op == 1) val = v > val ? v : val;
+            else val = v < val ? v : val;
+        }
+        y[idx] = val * scale;
+    }
+}
+
+template <> void Reduce<float, CUDAContext>(
+    const int               ndim,
+    const int*              dims,
+    const int               num_axes,
+    const int*              axes,
+    const string&           operation,
+    const float*            x,
+    float*                  y,
+    CUDAContext*            ctx) {
+    int count = 1, reduce_dim = 1;
+    for (int i = 0; i < ndim; ++i) count *= dims[i];
+    for (int i = 0; i < num_axes; ++i) reduce_dim *= dims[axes[i]];
+    if (reduce_dim > 0) count /= reduce_dim;
+    int op = 0; float init = 0.f, scale = 1.f;
+    if (operation == "MEAN") scale = 1.f / reduce_dim;
+    else if (operation == "MAX") { op = 1; init = -FLT_MAX; }
+    else if (operation == "MIN") { op = 2; init = FLT_MAX; }
+    else if (operation != "SUM")
+        LOG(FATAL) << "Unknown operation: [" << operation << "].";
+    _Reduce<float>
+        << < CUDA_BLOCKS(count), CUDA_THREADS,
+             0, ctx->cuda_stream() >> >(count, reduce_dim,
+                 _CollapseReduceDims(ndim, dims, num_axes, axes),
+                     op, init, scale, x, y);
+}
+
+template <typename T>
+__global__ void _ReduceGrad(
+    const int               count,
+    const _ReduceDims       params,
+    const T                 coeff,
+    const T*                dy,
+    T*                      dx) {
+    CUDA_1D_KERNEL_LOOP(idx, count) {
+        int y_offset = 0;
+        for (int i = params.ndim - 1, rem = idx; i >= 0; --i) {
+            y_offset += (rem % params.dims[i]) * params.y_strides[i];
+            rem /= params.dims[i];
+        }
+        dx[idx] = dy[y_offset] * coeff;
+    }
+}
+
+template <> void ReduceGrad<float, CUDAContext>(
+    const int               ndim,
+    const int*              dims,
+    const int               num_axes,
+    const int*              axes,
+    const float             coeff,
+    const float*            dy,
+    float*                  dx,
+    CUDAContext*            ctx) {
+    int count = 1;
+    for (int i = 0; i < ndim; ++i) count *= dims[i];
+    _ReduceGrad<float>
+        << < CUDA_BLOCKS(count), CUDA_THREADS,
+             0, ctx->cuda_stream() >> >(count,
+                 _CollapseReduceDims(ndim, dims, num_axes, axes),
+                     coeff, dy, dx);
+}
+
 /******************** ndarray.repeat ********************/
 
 template <typename T>
@@ -0,0 +1,56 @@
+#include <chrono>
+#include <map>
+#include <mutex>
+#include <thread>
+
+#include "utils/profiler.h"
+
+namespace dragon {
+
+namespace {
+
+std::mutex g_profiler_mutex;
+std::vector<Profiler::Event> g_profiler_events;
+std::map<std::thread::id, int> g_profiler_threads;
+
+}  // namespace
+
+std::atomic<bool>& Profiler::enabled() {
+    static std::atomic<bool> flag(false);
+    return flag;
+}
+
+void Profiler::Start() { enabled() = true; }
+
+void Profiler::Stop() { enabled() = false; }
+
+void Profiler::Reset() {
+    std::lock_guard<std::mutex> lock(g_profiler_mutex);
+    g_profiler_events.clear();
+    g_profiler_threads.clear();
+}
+
+int64_t Profiler::Now() {
+    return std::chrono::duration_cast<std::chrono::microseconds>(
+        std::chrono::steady_clock::now().time_since_epoch()).count();
+}
+
+void Profiler::Record(Event& event) {
+    if (event.session.empty()) event.session = "eager";
+    std::lock_guard<std::mutex> lock(g_profiler_mutex);
+    //  map the threads into the small integers for the timeline
+    auto tid = std::this_thread::get_id();
+    auto it = g_profiler_threads.find(tid);
+    if (it == g_profiler_threads.end())
+        it = g_profiler_threads.insert(std::make_pair(
+            tid, (int)g_profiler_threads.size())).first;
+    event.thread = it->second;
+    g_profiler_events.emplace_back(std::move(event));
+}
+
+std::vector<Profiler::Event> Profiler::Events() {
+    std::lock_guard<std::mutex> lock(g_profiler_mutex);
+    return g_profiler_events;
+}
+
+}    // namespace dragon
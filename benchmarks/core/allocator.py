@@ -0,0 +1,97 @@
+# ------------------------------------------------------------
+# Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+#
+# Licensed under the BSD 2-Clause License.
+# You should have received a copy of the BSD 2-Clause License
+# along with the software. If not, See,
+#
+#      <https://opensource.org/licenses/BSD-2-Clause>
+#
+# ------------------------------------------------------------
+
+
+"""Count the CPU allocations per training step of the eager torch models.
+
+The eager mode resets and regrows the pooled tensors at each step,
+which requests the system allocator constantly without the caching.
+
+Examples
+--------
+>>> python allocator.py --model resnet18 --batch-size 1 --cache-limits 0 1073741824
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import time
+import argparse
+import numpy as np
+
+import dragon as dg
+import dragon.vm.torch as torch
+from dragon.vm.torch.vision import models
+
+
+def benchmark(step, iterations, warmup=2):
+    """Return the milliseconds and allocator statistics per step.
+
+    Parameters
+    ----------
+    step : function
+        The training step.
+    iterations : int
+        The number of timed steps.
+    warmup : int
+        The number of warm-up steps.
+
+    Returns
+    -------
+    float
+        The latency.
+    dict
+        The statistics of the allocator.
+
+    """
+    for i in range(warmup): step()
+    dg.workspace.ResetAllocatorStats()
+    tic = time.time()
+    for i in range(iterations): step()
+    latency = (time.time() - tic) * 1000. / iterations
+    return latency, dg.workspace.GetAllocatorStats()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark the CPU caching allocator.')
+    parser.add_argument('--model', default='resnet18',
+                        help='The name of model in torch.vision.models.')
+    parser.add_argument('--batch-size', type=int, default=1, help='The batch size.')
+    parser.add_argument('--image-size', type=int, default=224, help='The size of images.')
+    parser.add_argument('--cache-limits', type=int, nargs='+', default=[0, 1 << 30],
+                        help='The max bytes to cache, 0 to disable the caching.')
+    parser.add_argument('--iterations', type=int, default=5, help='The number of timed steps.')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    m = getattr(models, args.model)().train()
+    optimizer = torch.optim.SGD(m.parameters(), lr=0.01, momentum=0.9)
+    x = torch.from_numpy(np.random.randn(args.batch_size,
+        3, args.image_size, args.image_size).astype('float32'))
+
+    def step():
+        optimizer.zero_grad()
+        loss = m(x).sum()
+        loss.backward()
+        optimizer.step()
+
+    for limit in args.cache_limits:
+        dg.config.SetCPUCacheLimit(limit)
+        latency, stats = benchmark(step, args.iterations)
+        print('cache_limit={0:<12d}{1:>10.2f} ms, {2:>8.1f} allocs/step, '
+              '{3:>8.1f} system allocs/step, peak {4:.2f} MB, cached {5:.2f} MB'.format(
+                limit, latency, stats['num_allocs'] / args.iterations,
+                stats['num_system_allocs'] / args.iterations,
+                stats['peak'] / 1e6, stats['bytes_cached'] / 1e6))
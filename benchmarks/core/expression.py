@@ -0,0 +1,107 @@
+# ------------------------------------------------------------
+# Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+#
+# Licensed under the BSD 2-Clause License.
+# You should have received a copy of the BSD 2-Clause License
+# along with the software. If not, See,
+#
+#      <https://opensource.org/licenses/BSD-2-Clause>
+#
+# ------------------------------------------------------------
+
+
+"""Measure the cost of building a long chain of ops.
+
+The symbolic chain is built by ``Tensor.CreateOperator`` and compiled by ``function``,
+the torch chain is built by the auto-grad and flowed by ``backward``.
+
+Examples
+--------
+>>> python expression.py --layers 1000 2000 5000
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import time
+import argparse
+import numpy as np
+
+import dragon as dg
+import dragon.vm.torch as torch
+
+
+def symbolic_chain(layers):
+    """Return the seconds of building and compiling a symbolic chain.
+
+    Parameters
+    ----------
+    layers : int
+        The number of ops.
+
+    Returns
+    -------
+    float
+        The seconds of building.
+    float
+        The seconds of compiling.
+
+    """
+    x = dg.Tensor('x', shape=[4], dtype='float32').Variable()
+    dg.workspace.FeedTensor(x, np.ones(4, dtype='float32'))
+    tic = time.time()
+    y = x
+    for i in range(layers): y = y * 1.0
+    build = time.time() - tic
+    tic = time.time()
+    f = dg.function(outputs=y)
+    compile = time.time() - tic
+    f()
+    return build, compile
+
+
+def torch_chain(layers):
+    """Return the seconds of building and flowing a torch chain.
+
+    Parameters
+    ----------
+    layers : int
+        The number of ops.
+
+    Returns
+    -------
+    float
+        The seconds of building.
+    float
+        The seconds of backward.
+
+    """
+    x = torch.ones(4)
+    x.requires_grad = True
+    tic = time.time()
+    y = x
+    for i in range(layers): y = y * 1.0
+    build = time.time() - tic
+    tic = time.time()
+    y.sum().backward()
+    return build, time.time() - tic
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark the expression tracking.')
+    parser.add_argument('--layers', type=int, nargs='+',
+                        default=[1000, 2000, 5000], help='The number of ops in the chain.')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    for layers in args.layers:
+        build, compile = symbolic_chain(layers)
+        print('symbolic layers={0:<6d}build {1:>8.3f} s, function {2:>8.3f} s'
+              .format(layers, build, compile))
+        build, flow = torch_chain(layers)
+        print('torch    layers={0:<6d}build {1:>8.3f} s, backward {2:>8.3f} s'
+              .format(layers, build, flow))
@@ -0,0 +1,132 @@
+# ------------------------------------------------------------
+# Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+#
+# Licensed under the BSD 2-Clause License.
+# You should have received a copy of the BSD 2-Clause License
+# along with the software. If not, See,
+#
+#      <https://opensource.org/licenses/BSD-2-Clause>
+#
+# ------------------------------------------------------------
+
+
+"""Measure the memory planned by the lifetimes of tensors.
+
+A deep network of conv-bn-relu is run by a static graph,
+for inference, or training with or without the mirror stage.
+
+Examples
+--------
+>>> python memory.py --layers 32 --channels 32 --image-size 32 --inference
+
+>>> python memory.py --layers 32 --channels 32 --image-size 32 --mirror
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import time
+import argparse
+import numpy as np
+
+import dragon as dg
+import dragon.memonger as opt
+import dragon.vm.theano as theano
+import dragon.vm.theano.tensor as T
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark the memory planning.')
+    parser.add_argument('--layers', type=int, default=32, help='The number of conv layers.')
+    parser.add_argument('--channels', type=int, default=32, help='The channels of conv layers.')
+    parser.add_argument('--image-size', type=int, default=32, help='The size of images.')
+    parser.add_argument('--batch-size', type=int, default=16, help='The batch size.')
+    parser.add_argument('--inference', action='store_true', help='Run the forward pass only.')
+    parser.add_argument('--mirror', action='store_true', help='Recompute the batchnorm in backward.')
+    parser.add_argument('--iterations', type=int, default=10, help='The number of timed steps.')
+    return parser.parse_args()
+
+
+def check_variable_shape(rng):
+    """Check the planned graph under the inputs of changing shapes.
+
+    The reshaped tensor shares the block of its input,
+    which moves out if the input grows.
+
+    """
+    opt.PlanMemory(True)
+    x = dg.Tensor(shape=[2, 8], dtype='float32').Variable()
+    y = dg.ops.Reshape(dg.ops.Relu(x), shape=[-1])
+    loss = dg.ops.Sum(dg.ops.Sigmoid(y))
+    f = theano.function(outputs=loss)
+    for shape in [(2, 8), (2, 8), (64, 64), (3, 5), (128, 128), (128, 128)]:
+        value = rng.randn(*shape).astype('float32')
+        x.set_value(value)
+        expected = (1. / (1. + np.exp(-np.maximum(value, 0.)))).sum()
+        error = abs(float(f()) - expected) / expected
+        assert error < 1e-4, 'The loss of shape {} is wrong, ' \
+            'relative error {:.2e}.'.format(shape, error)
+
+
+def benchmark(args, plan_memory):
+    """Return the milliseconds per step, the outputs and the memory plan.
+
+    Parameters
+    ----------
+    args : namespace
+        The parsed arguments.
+    plan_memory : boolean
+        Whether to plan the memory.
+
+    Returns
+    -------
+    float
+        The latency.
+    list of ndarray
+        The loss and grads of the last step.
+    dict
+        The memory plan.
+
+    """
+    opt.PlanMemory(plan_memory)
+    rng = np.random.RandomState(1337)
+    x = dg.Tensor(shape=[args.batch_size, args.channels,
+        args.image_size, args.image_size], dtype='float32').Variable()
+    x.set_value(rng.randn(*x.shape).astype('float32'))
+    y, weights = x, []
+    for i in range(args.layers):
+        w = dg.Tensor(shape=[args.channels, args.channels, 3, 3], dtype='float32').Variable()
+        w.set_value(rng.randn(*w.shape).astype('float32') * 0.1)
+        mean = dg.Tensor(shape=[args.channels], dtype='float32').Constant(value=0.)
+        var = dg.Tensor(shape=[args.channels], dtype='float32').Constant(value=1.)
+        y = dg.ops.Conv2d([y, w], num_output=args.channels, kernel_size=3, pad=1)
+        bn_inputs, bn_kwargs = [y, mean, var], {'axis': 1, 'use_stats': 0}
+        y = opt.Drop(dg.ops.BatchNorm, bn_inputs, **bn_kwargs) if args.mirror \
+            else dg.ops.BatchNorm(bn_inputs, **bn_kwargs)
+        y = dg.ops.Relu(y)
+        weights.append(w)
+    loss = dg.ops.Sum(y)
+    grads = [] if args.inference else T.grad(loss, weights)
+    f = theano.function(outputs=[loss] + grads)
+
+    outputs = f()
+    tic = time.time()
+    for i in range(args.iterations): outputs = f()
+    if not isinstance(outputs, list): outputs = [outputs]
+    latency = (time.time() - tic) * 1000. / args.iterations
+    return latency, outputs, dg.workspace.GetMemoryPlan(f.meta_graph)
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    check_variable_shape(np.random.RandomState(1337))
+    results = [benchmark(args, plan_memory) for plan_memory in (False, True)]
+    error = max(np.abs(a - b).max() for a, b in zip(results[0][1], results[1][1]))
+    for plan_memory, (latency, _, plan) in zip((False, True), results):
+        print('plan_memory={0:<6}{1:>10.2f} ms, naive {2:.2f} MB, planned {3:.2f} MB, '
+              'peak living {4:.2f} MB, applied={5}'.format(
+                str(plan_memory), latency, plan['naive_bytes'] / 1e6,
+                plan['planned_bytes'] / 1e6, plan['live_bytes'] / 1e6, plan['applied']))
+    print('max error of outputs: {:.2e}'.format(error))
@@ -0,0 +1,192 @@
+# ------------------------------------------------------------
+# Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+#
+# Licensed under the BSD 2-Clause License.
+# You should have received a copy of the BSD 2-Clause License
+# along with the software. If not, See,
+#
+#      <https://opensource.org/licenses/BSD-2-Clause>
+#
+# ------------------------------------------------------------
+
+
+"""Measure the CPU kernels of transpose, reduce and arg-reduce across shapes.
+
+The results are checked against numpy, which is also timed as a reference.
+The gradients of reduce are checked before the timing.
+
+Examples
+--------
+>>> python ndarray.py --iterations 20
+
+>>> python ndarray.py --chain
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import time
+import argparse
+import numpy as np
+
+import dragon as dg
+import dragon.vm.theano as theano
+import dragon.vm.theano.tensor as T
+
+
+TRANSPOSE_CASES = [
+    ('2d', [2048, 2048], (1, 0)),
+    ('nchw->nhwc', [16, 64, 56, 56], (0, 2, 3, 1)),
+    ('nhwc->nchw', [16, 56, 56, 64], (0, 3, 1, 2)),
+    ('general', [64, 32, 32, 32], (2, 0, 3, 1)),
+    ('inner-kept', [32, 64, 24, 24], (1, 0, 2, 3)),
+]
+
+REDUCE_CASES = [
+    ('rows', [4096, 1024], (1,), 'SUM'),
+    ('columns', [4096, 1024], (0,), 'SUM'),
+    ('global-pool', [16, 64, 56, 56], (2, 3), 'MEAN'),
+    ('nchw-stats', [16, 64, 56, 56], (0, 2, 3), 'SUM'),
+    ('nhwc-stats', [16, 56, 56, 64], (0, 1, 2), 'SUM'),
+    ('rows-max', [4096, 1024], (1,), 'MAX'),
+    ('columns-min', [4096, 1024], (0,), 'MIN'),
+]
+
+ARG_REDUCE_CASES = [
+    ('last', [4096, 1000], 1, 'ARGMAX'),
+    ('middle', [64, 1000, 49], 1, 'ARGMAX'),
+    ('first', [1000, 4096], 0, 'ARGMIN'),
+]
+
+NUMPY_OPS = {
+    'SUM': np.sum, 'MEAN': np.mean, 'MAX': np.max, 'MIN': np.min,
+    'ARGMAX': np.argmax, 'ARGMIN': np.argmin,
+}
+
+
+def variable(shape, rng):
+    x = dg.Tensor(shape=shape, dtype='float32').Variable()
+    x.set_value(rng.randn(*shape).astype('float32'))
+    return x
+
+
+def chain(x, axes, operation):
+    """Reduce the axes one by one, from the last to the first."""
+    for axis in sorted(axes, reverse=True):
+        if operation in ('MAX', 'MIN'):
+            x = getattr(dg.ops, operation.capitalize())(x, axis=axis)
+        else: x = dg.ops.Reduce(x, axis=axis, operation=operation)
+    return x
+
+
+def check_reduce_grads(rng):
+    """Check the gradients of reduce, where the ties of max and min are frequent."""
+    for shape, axes, keep_dims in [
+        ([6, 5, 4], (1,), False),
+        ([6, 5, 4], (0, 2), True),
+        ([3, 4, 5, 6], (1, 2, 3), False),
+        ([7], (0,), False),
+    ]:
+        x_value = rng.randint(0, 3, size=shape).astype('float32')
+        y_shape = np.sum(x_value, axis=axes, keepdims=True).shape
+        w_value = rng.randn(*y_shape).astype('float32')
+        x = dg.Tensor(shape=shape, dtype='float32').Variable()
+        x.set_value(x_value)
+        w = dg.Tensor(shape=list(y_shape), dtype='float32').Variable()
+        w.set_value(w_value if keep_dims else w_value.reshape(
+            np.sum(x_value, axis=axes).shape))
+        for operation in ('SUM', 'MEAN', 'MAX', 'MIN'):
+            y = dg.ops.Reduce(x, axis=list(axes), operation=operation, keep_dims=keep_dims)
+            outputs = theano.function(outputs=T.grad(dg.ops.Sum(y * w), x))()
+            if operation in ('MAX', 'MIN'):
+                # the grads are shared by the elements equal to the output
+                y_value = NUMPY_OPS[operation](x_value, axis=axes, keepdims=True)
+                mask = (x_value == y_value).astype('float32')
+                expected = mask * w_value / np.sum(mask, axis=axes, keepdims=True)
+            else:
+                expected = np.broadcast_to(w_value, shape).copy()
+                if operation == 'MEAN': expected /= np.prod([shape[i] for i in axes])
+            error = np.abs(outputs - expected).max()
+            assert error < 1e-5, 'The gradient of {} over {} of {} is wrong, ' \
+                'max error {:.2e}.'.format(operation, axes, shape, error)
+
+
+def benchmark(args, y, expected_fn):
+    """Return the latency and errors of an output.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The arguments.
+    y : Tensor
+        The output.
+    expected_fn : function
+        The function of numpy to compute the expected.
+
+    Returns
+    -------
+    float
+        The latency.
+    float
+        The latency of numpy.
+    float
+        The max absolute error.
+
+    """
+    f = theano.function(outputs=y)
+    outputs = f().copy()
+    tic = time.time()
+    for i in range(args.iterations): f(return_outputs=False)
+    latency = (time.time() - tic) * 1000. / args.iterations
+    expected = expected_fn()
+    tic = time.time()
+    for i in range(args.iterations): expected_fn()
+    reference = (time.time() - tic) * 1000. / args.iterations
+    error = np.abs(outputs.astype('float64') - expected).max() / \
+        max(np.abs(expected).max(), 1e-6)
+    return latency, reference, error
+
+
+def report(name, latency, reference, error, tolerance):
+    print('{0:<28s}dragon {1:>9.3f} ms, numpy {2:>9.3f} ms, '
+          'relative error {3:.2e} {4}'.format(name, latency, reference,
+            error, 'OK' if error <= tolerance else 'FAILED'))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark the kernels of ndarray.')
+    parser.add_argument('--chain', action='store_true',
+                        help='Reduce the multiple axes by a chain of single-axis reduces.')
+    parser.add_argument('--tolerance', type=float, default=1e-4,
+                        help='The max relative error to numpy.')
+    parser.add_argument('--iterations', type=int, default=10, help='The number of timed runs.')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    rng = np.random.RandomState(1337)
+    check_reduce_grads(rng)
+
+    for name, shape, perms in TRANSPOSE_CASES:
+        x = variable(shape, rng)
+        x_value = x.get_value()
+        report('transpose ' + name, *benchmark(args, dg.ops.Transpose(x, perms=list(perms)),
+            lambda: np.ascontiguousarray(x_value.transpose(perms))), tolerance=0.)
+
+    for name, shape, axes, operation in REDUCE_CASES:
+        x = variable(shape, rng)
+        x_value = x.get_value()
+        y = chain(x, axes, operation) if args.chain else \
+            dg.ops.Reduce(x, axis=list(axes), operation=operation)
+        report('reduce ' + name, *benchmark(args, y,
+            lambda: NUMPY_OPS[operation](x_value, axis=axes)), tolerance=args.tolerance)
+
+    for name, shape, axis, operation in ARG_REDUCE_CASES:
+        x = variable(shape, rng)
+        x_value = x.get_value()
+        y = getattr(dg.ops, operation.capitalize())(x, axis=axis)
+        report('arg-reduce ' + name, *benchmark(args, y,
+            lambda: NUMPY_OPS[operation](x_value, axis=axis)), tolerance=0.)
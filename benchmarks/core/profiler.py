@@ -0,0 +1,91 @@
+# ------------------------------------------------------------
+# Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+#
+# Licensed under the BSD 2-Clause License.
+# You should have received a copy of the BSD 2-Clause License
+# along with the software. If not, See,
+#
+#      <https://opensource.org/licenses/BSD-2-Clause>
+#
+# ------------------------------------------------------------
+
+
+"""Profile the eager and traced torch models, and measure the overhead.
+
+The summary of each session is printed,
+and the timeline is exported for ``chrome://tracing``.
+
+Examples
+--------
+>>> python profiler.py --model resnet18 --output /tmp/resnet18.json
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import time
+import argparse
+import numpy as np
+
+import dragon as dg
+import dragon.vm.torch as torch
+from dragon.vm.torch.vision import models
+
+
+def benchmark(fn, iterations, warmup=3):
+    """Return the milliseconds per call of a function.
+
+    Parameters
+    ----------
+    fn : function
+        The function to call.
+    iterations : int
+        The number of timed calls.
+    warmup : int
+        The number of warm-up calls.
+
+    Returns
+    -------
+    float
+        The latency.
+
+    """
+    for i in range(warmup): fn()
+    tic = time.time()
+    for i in range(iterations): fn()
+    return (time.time() - tic) * 1000. / iterations
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark the operator profiler.')
+    parser.add_argument('--model', default='resnet18',
+                        help='The name of model in torch.vision.models.')
+    parser.add_argument('--batch-size', type=int, default=1, help='The batch size.')
+    parser.add_argument('--iterations', type=int, default=10, help='The number of timed calls.')
+    parser.add_argument('--output', default='timeline.json', help='The path of timeline.')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    m = getattr(models, args.model)().eval()
+    x = torch.from_numpy(np.random.randn(
+        args.batch_size, 3, 224, 224).astype('float32'))
+    traced = torch.jit.trace(m, x)
+
+    def eager():
+        with torch.no_grad(): m(x)
+
+    for mode, fn in [('eager', eager), ('traced', lambda: traced(x))]:
+        disabled = benchmark(fn, args.iterations)
+        dg.profiler.Start()
+        enabled = benchmark(fn, args.iterations)
+        dg.profiler.Stop()
+        print('{0:<8s}disabled {1:>10.2f} ms, enabled {2:>10.2f} ms, overhead {3:>6.2f}%'
+              .format(mode, disabled, enabled, 100. * (enabled - disabled) / disabled))
+
+    print('\n' + dg.profiler.Summary())
+    dg.profiler.Export(args.output)
+    print('Export {} events to {}.'.format(len(dg.profiler.GetEvents()), args.output))
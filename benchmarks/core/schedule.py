@@ -0,0 +1,123 @@
+# ------------------------------------------------------------
+# Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+#
+# Licensed under the BSD 2-Clause License.
+# You should have received a copy of the BSD 2-Clause License
+# along with the software. If not, See,
+#
+#      <https://opensource.org/licenses/BSD-2-Clause>
+#
+# ------------------------------------------------------------
+
+
+"""Measure the latency of graphs under different inter-op threads on CPU.
+
+The graphs are traced from the torch models with parallel branches,
+e.g. the inception blocks and the fire modules of squeezenet.
+
+Examples
+--------
+>>> python schedule.py --models squeezenet1_0 resnet18 --inter-op-threads 1 2 4
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import time
+import argparse
+import numpy as np
+
+import dragon as dg
+import dragon.vm.torch as torch
+from dragon.core.utils import MakeArgument, MakeOperatorDef
+from dragon.protos import dragon_pb2 as pb
+from dragon.vm.torch.vision import models
+
+
+def benchmark(fn, iterations, warmup=3):
+    """Return the milliseconds per call of a function.
+
+    Parameters
+    ----------
+    fn : function
+        The function to call.
+    iterations : int
+        The number of timed calls.
+    warmup : int
+        The number of warm-up calls.
+
+    Returns
+    -------
+    float
+        The latency.
+
+    """
+    for i in range(warmup): fn()
+    tic = time.time()
+    for i in range(iterations): fn()
+    return (time.time() - tic) * 1000. / iterations
+
+
+def check_aliases(num_threads=4, size=1 << 18, runs=10):
+    """Check the writes through a view are ordered with the reads of its input.
+
+    ``Reshape`` shares the memory of ``x`` with ``y``, and the inplace ``Relu``
+    on ``y`` overwrites ``x``, which is read by the branches before and after it.
+
+    """
+    x, y = '/schedule/aliases/x', '/schedule/aliases/y'
+    before, after = '/schedule/aliases/before', '/schedule/aliases/after'
+    meta_graph = pb.GraphDef()
+    meta_graph.name = 'schedule_aliases'
+    meta_graph.op.extend([
+        MakeOperatorDef('Reshape', [x], [y], name='reshape', shape=[-1]),
+        MakeOperatorDef('Exp', [x], [before], name='before'),
+        MakeOperatorDef('Relu', [y], [y], name='relu'),
+        MakeOperatorDef('Exp', [x], [after], name='after'),
+    ])
+    meta_graph.target.extend([y, before, after])
+    meta_graph.arg.extend([MakeArgument('optimization_level', 0),
+        MakeArgument('inter_op_threads', num_threads)])
+    dg.workspace.FeedTensor(x, -np.ones((size // 2, 2), 'float32'))
+    dg.workspace.CreateGraph(meta_graph)
+    for i in range(runs):
+        dg.workspace.FeedTensor(x, -np.ones((size // 2, 2), 'float32'))
+        dg.workspace.RunGraph(meta_graph.name, return_outputs=False)
+        results = [dg.workspace.FetchTensor(e) for e in (before, after)]
+        assert np.allclose(results[0], np.exp(-1.)) and np.allclose(results[1], 1.), \
+            'The aliases are raced with inter_op_threads={}.'.format(num_threads)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark the inter-op scheduling.')
+    parser.add_argument('--models', nargs='+', default=['squeezenet1_0', 'resnet18'],
+                        help='The name of models in torch.vision.models.')
+    parser.add_argument('--inter-op-threads', type=int, nargs='+', default=[1, 2, 4],
+                        help='The number of inter-op threads.')
+    parser.add_argument('--intra-op-threads', type=int, default=0,
+                        help='The number of intra-op threads, 0 to use all processors.')
+    parser.add_argument('--batch-size', type=int, default=1, help='The batch size.')
+    parser.add_argument('--iterations', type=int, default=10, help='The number of timed calls.')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    dg.config.SetIntraOpThreads(args.intra_op_threads)
+    check_aliases(max(args.inter_op_threads))
+    for name in args.models:
+        m = getattr(models, name)().eval()
+        size = 299 if 'inception' in name else 224
+        x = torch.from_numpy(np.random.randn(
+            args.batch_size, 3, size, size).astype('float32'))
+        expected = None
+        for num_threads in args.inter_op_threads:
+            dg.config.SetInterOpThreads(num_threads)
+            traced = torch.jit.trace(m, x)
+            y = traced(x).numpy()
+            if expected is None: expected = y
+            latency = benchmark(lambda: traced(x), args.iterations)
+            print('{0:<16s}inter_op_threads={1:<4d}{2:>10.2f} ms, max error {3:.2e}'
+                  .format(name, num_threads, latency, np.abs(y - expected).max()))
@@ -0,0 +1,138 @@
+# ------------------------------------------------------------
+# Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+#
+# Licensed under the BSD 2-Clause License.
+# You should have received a copy of the BSD 2-Clause License
+# along with the software. If not, See,
+#
+#      <https://opensource.org/licenses/BSD-2-Clause>
+#
+# ------------------------------------------------------------
+
+"""Compare the records per second of ``DataReader`` with batched reads.
+
+Examples
+--------
+>>> python lmdb_reader.py --database /tmp/bench_lmdb_large --size 4096
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import os
+import sys
+import time
+import argparse
+import numpy as np
+from multiprocessing import Queue
+
+from dragon.tools.db import LMDB, wrapper_str
+from dragon.io.data_reader import DataReader
+
+
+def make_synthetic_db(database, size, record_size, zfill=8):
+    """Make a database of random records.
+
+    Parameters
+    ----------
+    database : str
+        The path of database.
+    size : int
+        The total size(MB) of records.
+    record_size : int
+        The size(KB) of each record.
+    zfill : int
+        The number of zeros for encoding keys.
+
+    Returns
+    -------
+    None
+
+    """
+    if os.path.isdir(database): return
+    db = LMDB(max_commit=1000)
+    db.open(database, mode='w')
+    zfill_flag = '{0:0%d}' % zfill
+    num_records = (size << 10) // record_size
+    # repeat a random block to make the records quickly
+    block = np.random.randint(0, 256, (record_size << 11,)).astype(np.uint8).tobytes()
+    for i in range(num_records):
+        offset = np.random.randint(0, record_size << 10)
+        db.put(zfill_flag.format(i), block[offset : offset + (record_size << 10)])
+        # commit periodically to keep the transaction small
+        if (i + 1) % 10000 == 0: db.commit()
+    db.put('size', wrapper_str(str(num_records)))
+    db.put('zfill', wrapper_str(str(zfill)))
+    db.commit()
+    db.close()
+
+
+def drop_caches():
+    """Try to drop the page cache, which requires the root.
+
+    Returns
+    -------
+    None
+
+    """
+    try:
+        with open('/proc/sys/vm/drop_caches', 'w') as f: f.write('3\n')
+    except (IOError, OSError):
+        print('Failed to drop the page cache, the results may be warm.')
+
+
+def benchmark(args, read_batch):
+    """Measure the records per second of a reader.
+
+    Returns
+    -------
+    float
+        The throughput.
+
+    """
+    reader = DataReader(**{
+        'source': args.database,
+        'shuffle': args.shuffle,
+        'read_batch': read_batch})
+    reader.Q_out = Queue(max(args.prefetch // read_batch, 1))
+    reader.start()
+    num_records, start = 0, None
+    while True:
+        element = reader.Q_out.get()
+        num_records += len(element) if isinstance(element, list) else 1
+        if start is None and num_records >= args.warmup:
+            num_records, start = 0, time.time()
+        if start is not None and num_records >= args.records: break
+    throughput = num_records / (time.time() - start)
+    reader.terminate()
+    return throughput
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark the batched reads of DataReader.')
+    parser.add_argument('--database', default='/tmp/bench_lmdb_large', help='The path of database.')
+    parser.add_argument('--size', type=int, default=2048, help='The size(MB) of synthetic database.')
+    parser.add_argument('--record_size', type=int, default=100, help='The size(KB) of each record.')
+    parser.add_argument('--shuffle', type=int, default=1, help='Whether to shuffle the chunks.')
+    parser.add_argument('--prefetch', type=int, default=640, help='The number of prefetched records.')
+    parser.add_argument('--warmup', type=int, default=1000, help='The number of warm-up records.')
+    parser.add_argument('--records', type=int, default=10000, help='The number of timed records.')
+    parser.add_argument('--read_batch', type=int, default=0, help='Run a single read batch.')
+    parser.add_argument('--drop_caches', action='store_true', help='Drop the page cache before each run.')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    make_synthetic_db(args.database, args.size, args.record_size)
+    if args.read_batch > 0:
+        # each reader runs in a fresh process to avoid contention
+        if args.drop_caches: drop_caches()
+        print('read_batch={0}: {1:.2f} records/sec'.format(
+            args.read_batch, benchmark(args, args.read_batch)))
+        os._exit(0)
+    for read_batch in (1, 16, 64):
+        os.system('{0} {1} --read_batch {2} {3}'.format(
+            sys.executable, os.path.abspath(__file__), read_batch, ' '.join(sys.argv[1:])))
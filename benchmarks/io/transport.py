@@ -0,0 +1,151 @@
+# ------------------------------------------------------------
+# Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+#
+# Licensed under the BSD 2-Clause License.
+# You should have received a copy of the BSD 2-Clause License
+# along with the software. If not, See,
+#
+#      <https://opensource.org/licenses/BSD-2-Clause>
+#
+# ------------------------------------------------------------
+
+"""Compare the throughput of ``DataBatch`` transports.
+
+Examples
+--------
+>>> python transport.py --database /tmp/bench_lmdb --batch_size 128
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import os
+import sys
+import time
+import argparse
+import numpy as np
+import cv2
+
+from dragon.tools.db import LMDB, wrapper_str
+from dragon.vm.caffe.proto import caffe_pb2
+from dragon.io.data_batch import DataBatch
+
+
+def make_synthetic_db(database, num_images, image_size, zfill=8):
+    """Make a database of random encoded images.
+
+    Parameters
+    ----------
+    database : str
+        The path of database.
+    num_images : int
+        The number of images.
+    image_size : int
+        The height and width of images.
+    zfill : int
+        The number of zeros for encoding keys.
+
+    Returns
+    -------
+    None
+
+    """
+    if os.path.isdir(database): return
+    db = LMDB()
+    db.open(database, mode='w')
+    zfill_flag = '{0:0%d}' % zfill
+    for i in range(num_images):
+        img = np.random.randint(0, 256, (image_size, image_size, 3)).astype(np.uint8)
+        result, imgencode = cv2.imencode('.jpg', img)
+        datum = caffe_pb2.Datum()
+        datum.height, datum.width, datum.channels = img.shape
+        datum.label = i % 1000
+        datum.encoded = True
+        datum.data = imgencode.tobytes()
+        db.put(zfill_flag.format(i), datum.SerializeToString())
+    db.put('size', wrapper_str(str(num_images)))
+    db.put('zfill', wrapper_str(str(zfill)))
+    db.commit()
+    db.close()
+
+
+def benchmark(args, transport):
+    """Measure the batches per second of a transport.
+
+    Returns
+    -------
+    float
+        The throughput.
+
+    """
+    batch = DataBatch(**{
+        'source': args.database,
+        'shuffle': True,
+        'crop_size': args.crop_size,
+        'mirror': True,
+        'phase': 'TRAIN',
+        'batch_size': args.batch_size,
+        'mean_values': [102.9801, 115.9465, 122.7717],
+        'num_transformers': args.num_transformers,
+        'transport': transport})
+    for i in range(args.warmup): batch.get()
+    start = time.time()
+    for i in range(args.iters): batch.get()
+    return args.iters / (time.time() - start)
+
+
+def check_resume(args, transport, num_batches=4):
+    """Check the resumed batch reproduces the records and transforms.
+
+    Returns
+    -------
+    None
+
+    """
+    kwargs = {
+        'source': args.database,
+        'shuffle': True,
+        'crop_size': args.crop_size,
+        'mirror': True,
+        'phase': 'TRAIN',
+        'batch_size': args.batch_size,
+        'num_transformers': 1,
+        'transport': transport}
+    batch = DataBatch(**kwargs)
+    for i in range(num_batches): batch.get()
+    state = batch.state_dict()
+    expected = [[blob.copy() for blob in batch.get()] for i in range(num_batches)]
+    batch = DataBatch(state=state, **kwargs)
+    for i in range(num_batches):
+        for blob, expected_blob in zip(batch.get(), expected[i]):
+            assert np.array_equal(blob, expected_blob), \
+                'The batch {} is not reproduced after resuming.'.format(i)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark the transports of DataBatch.')
+    parser.add_argument('--database', default='/tmp/bench_lmdb', help='The path of database.')
+    parser.add_argument('--num_images', type=int, default=5000, help='The number of synthetic images.')
+    parser.add_argument('--image_size', type=int, default=256, help='The size of synthetic images.')
+    parser.add_argument('--crop_size', type=int, default=224, help='The crop size.')
+    parser.add_argument('--batch_size', type=int, default=128, help='The size of a batch.')
+    parser.add_argument('--num_transformers', type=int, default=3, help='The number of transformers.')
+    parser.add_argument('--warmup', type=int, default=10, help='The number of warm-up batches.')
+    parser.add_argument('--iters', type=int, default=50, help='The number of timed batches.')
+    parser.add_argument('--transport', default='', help='Run a single transport.')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    make_synthetic_db(args.database, args.num_images, args.image_size)
+    if args.transport:
+        # each transport runs in a fresh process to avoid contention
+        check_resume(args, args.transport)
+        print('{0}: {1:.2f} batches/sec'.format(args.transport, benchmark(args, args.transport)))
+        os._exit(0)
+    for transport in ('queue', 'shared_memory'):
+        os.system('{0} {1} --transport {2} {3}'.format(
+            sys.executable, os.path.abspath(__file__), transport, ' '.join(sys.argv[1:])))
@@ -0,0 +1,202 @@
+# ------------------------------------------------------------
+# Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+#
+# Licensed under the BSD 2-Clause License.
+# You should have received a copy of the BSD 2-Clause License
+# along with the software. If not, See,
+#
+#      <https://opensource.org/licenses/BSD-2-Clause>
+#
+# ------------------------------------------------------------
+
+"""Measure the data parallel training steps under different bucket sizes.
+
+The bucket size of ``0`` reduces the grads one by one after backward,
+the others reduce the buckets of grads during backward.
+
+The updates are checked against numpy before the timing,
+where the ranks use different params at each step.
+
+Examples
+--------
+>>> mpirun -np 4 python allreduce.py --layers 32 --dim 256 --bucket-sizes 0 65536 1048576
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import time
+import argparse
+import numpy as np
+
+import dragon as dg
+import dragon.core.mpi as mpi
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark the bucketed all-reduce.')
+    parser.add_argument('--layers', type=int, default=32, help='The number of linear layers.')
+    parser.add_argument('--dim', type=int, default=256, help='The dimension of linear layers.')
+    parser.add_argument('--batch-size', type=int, default=32, help='The batch size of each node.')
+    parser.add_argument('--bucket-sizes', type=int, nargs='+',
+                        default=[0, 1 << 16, 1 << 20, 25 << 20], help='The bucket sizes in bytes.')
+    parser.add_argument('--iterations', type=int, default=50, help='The number of timed steps.')
+    return parser.parse_args()
+
+
+def check_unused_params(args, bucket_size, lr=0.1, split=False):
+    """Check the averaged updates if some params are unused by some ranks.
+
+    The first layer is used by all ranks, the second is used by the ranks
+    alternately, and the last is never used.
+
+    If ``split``, each layer is updated by its own optimizer,
+    i.e. the buckets of some owners are unused by some ranks.
+
+    Returns
+    -------
+    list of Module
+        The layers, which should be kept alive to avoid recycling the names.
+
+    """
+    mpi.SetBucketSize(bucket_size)
+    layers = [nn.Linear(args.dim, args.dim) for i in range(3)]
+    params = [p for layer in layers for p in layer.parameters()]
+    values = [p.numpy().copy() for p in params]
+    optimizers = [torch.optim.SGD(layer.parameters(), lr=lr)
+        for layer in layers] if split else [torch.optim.SGD(params, lr=lr)]
+
+    def inputs(rank):
+        return np.ones((args.batch_size, args.dim), 'float32') * (rank + 1)
+
+    x = torch.from_numpy(inputs(mpi.Rank()))
+    for step in range(4):
+        loss = layers[0](x).sum()
+        if (mpi.Rank() + step) % 2 == 0: loss = loss + layers[1](x).sum()
+        loss.backward()
+        for optimizer in optimizers: optimizer.step()
+        # the grads of ``sum(x * w^T + b)`` are independent of the params
+        for rank in range(mpi.Size()):
+            for i in range(2 if (rank + step) % 2 == 0 else 1):
+                values[i * 2] -= lr / mpi.Size() * np.tile(
+                    inputs(rank).sum(0), (args.dim, 1))
+                values[i * 2 + 1] -= lr / mpi.Size() * args.batch_size
+        for i, p in enumerate(params):
+            error = np.abs(p.numpy() - values[i]).max() / \
+                max(np.abs(values[i]).max(), 1.)
+            assert error < 1e-4, 'The param({}) of bucket_size={} is wrong at ' \
+                'step {} (split={}), relative error {:.2e}.'.format(
+                    i, bucket_size, step, split, error)
+    return layers
+
+
+def check_flat_resources(args, bucket_size, steps=20):
+    """Check the buckets neither leak nor reduce the grads twice.
+
+    A layer is removed from (or added into) the param group by turns,
+    which expires the buckets created by the previous phase.
+
+    Returns
+    -------
+    list of Module
+        The layers, which should be kept alive to avoid recycling the names.
+
+    """
+    mpi.SetBucketSize(bucket_size)
+    layers = [nn.Linear(args.dim, args.dim) for i in range(3)]
+    group = {'params': [p for layer in layers for p in layer.parameters()]}
+    optimizer = torch.optim.SGD([group], lr=1e-4)
+    x = torch.from_numpy(np.ones((args.batch_size, args.dim), 'float32'))
+    mpi.GetBucketStats() # drop the records of previous checks
+
+    def step(max_reduced=None):
+        sum([layer(x).sum() for layer in layers]).backward()
+        optimizer.step()
+        stats = mpi.GetBucketStats()
+        num_reduced = sum(e['num_tensors'] for e in stats)
+        num_params = len(group['params'])
+        assert num_params <= num_reduced <= (max_reduced or num_params), 'Reduced {} grads ' \
+            'of {} params with bucket_size={}.'.format(num_reduced, num_params, bucket_size)
+        return dg.workspace.GetGradientFlowCacheStats()['collective_ops'], \
+            len(dg.workspace.Tensors())
+
+    num_params, history = len(group['params']), []
+    for phase in range(4):
+        if phase % 2 == 1: del group['params'][num_params - 2:]
+        elif phase > 0: group['params'].extend(layers[2].parameters())
+        # the expired buckets may have been launched by the backward pass,
+        # the grads of removed params are reduced for the last time
+        step(num_params if phase > 0 else None)
+        # the buckets and grads are created by the first steps
+        step()
+        expected = step()
+        # the expired buckets should not leave their ops behind
+        if phase >= 2: expected = history[phase - 2]
+        for i in range(steps):
+            counts = step()
+            assert counts == expected, 'The number of (collective ops, tensors) ' \
+                'grows from {} to {} with bucket_size={}.'.format(expected, counts, bucket_size)
+        history.append(expected)
+    return layers
+
+
+def benchmark(args, bucket_size):
+    """Return the steps per second and statistics of buckets.
+
+    Parameters
+    ----------
+    args : namespace
+        The parsed arguments.
+    bucket_size : int
+        The bucket size in bytes.
+
+    Returns
+    -------
+    float
+        The steps per second.
+    list of dict
+        The statistics of buckets in the last step.
+
+    """
+    mpi.SetBucketSize(bucket_size)
+    layers = []
+    for i in range(args.layers):
+        layers += [nn.Linear(args.dim, args.dim), nn.ReLU()]
+    model = nn.Sequential(*layers)
+    optimizer = torch.optim.SGD(model.parameters(), lr=1e-4, momentum=0.9)
+    x = torch.from_numpy(np.random.randn(
+        args.batch_size, args.dim).astype('float32'))
+
+    def step():
+        model(x).sum().backward()
+        optimizer.step()
+        return mpi.GetBucketStats()
+
+    # the buckets are created by the first step
+    for i in range(5): step()
+    tic = time.time()
+    for i in range(args.iterations): stats = step()
+    return args.iterations / (time.time() - tic), stats
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    mpi.Init()
+    mpi.Parallel([list(range(mpi.Size()))])
+    import dragon.vm.torch as torch
+    from dragon.vm.torch import nn
+    checked = [check_unused_params(args, bucket_size, split=split)
+        for bucket_size in args.bucket_sizes for split in (False, True)]
+    checked += [check_flat_resources(args, bucket_size)
+        for bucket_size in args.bucket_sizes]
+    for bucket_size in args.bucket_sizes:
+        throughput, stats = benchmark(args, bucket_size)
+        if mpi.Rank() == 0:
+            print('bucket_size={0:<10d}{1:>8.2f} steps/sec, {2:>4d} buckets, '
+                  'elapsed {3:.2f} ms, blocked {4:.2f} ms'.format(
+                    bucket_size, throughput, len(stats),
+                    sum(e['elapsed'] for e in stats),
+                    sum(e['blocked'] for e in stats)))
+    mpi.Finalize()
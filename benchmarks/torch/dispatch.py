@@ -0,0 +1,216 @@
+# ------------------------------------------------------------
+# Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+#
+# Licensed under the BSD 2-Clause License.
+# You should have received a copy of the BSD 2-Clause License
+# along with the software. If not, See,
+#
+#      <https://opensource.org/licenses/BSD-2-Clause>
+#
+# ------------------------------------------------------------
+
+"""Measure the ops per second of small elementwise ops on CPU.
+
+The kernels of tiny tensors are negligible, i.e.,
+the results are dominated by the dispatching of the torch VM.
+
+The caches of dispatching are checked before the timing.
+
+Examples
+--------
+>>> python dispatch.py --size 16 --iterations 10000
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import time
+import argparse
+import numpy as np
+
+import dragon as dg
+import dragon.vm.torch as torch
+from dragon.core.utils import MakeOperatorDef
+from dragon.vm.torch import execute_engine
+from dragon.vm.torch.ops import primitive
+
+
+def benchmark(fn, iterations, warmup=100):
+    """Return the calls per second of a function.
+
+    Parameters
+    ----------
+    fn : function
+        The function to call.
+    iterations : int
+        The number of timed calls.
+    warmup : int
+        The number of warm-up calls.
+
+    Returns
+    -------
+    float
+        The throughput.
+
+    """
+    for i in range(warmup): fn()
+    tic = time.time()
+    for i in range(iterations): fn()
+    return iterations / (time.time() - tic)
+
+
+def check_scalar_eviction():
+    """Check the scalars evicted from the cache under a live graph."""
+    x = torch.ones(3, requires_grad=True)
+    y = 1.5 / x
+    for i in range(primitive._MAX_SCALAR_TENSORS + 100):
+        (float(i) + 0.25) / torch.ones(1)
+    y.sum().backward()
+    assert np.allclose(x.grad.numpy(), -1.5), \
+        'The evicted scalar is broken: {}'.format(x.grad.numpy())
+
+
+def check_scalar_release():
+    """Check the evicted scalars released by others are skipped."""
+    x = torch.ones(3, requires_grad=True)
+    y = 2.5 / x
+    name = '/share/scalar/cpu:0/float32/2.5'
+    for i in range(primitive._MAX_SCALAR_TENSORS + 100):
+        (float(i) + 0.25) / torch.ones(1)
+    # e.g. the tensor is released along with the workspace
+    dg.workspace.ReleaseTensor(name)
+    del y
+    assert not dg.workspace.HasTensor(name)
+
+
+def check_scalar_arguments(size=5):
+    """Check the scalars of float tensors are given as the arguments."""
+    num_scalars = len(primitive._SCALAR_TENSORS)
+    data = np.random.randn(size).astype('float32')
+    x = torch.from_numpy(data.copy())
+    cases = [
+        (lambda a: a + 2.5, lambda a: a + 2.5, 1.),
+        (lambda a: a - 2.5, lambda a: a - 2.5, 1.),
+        (lambda a: a * 2.5, lambda a: a * 2.5, 2.5),
+        (lambda a: a / 2.5, lambda a: a / 2.5, 0.4),
+        (lambda a: 2.5 + a, lambda a: 2.5 + a, 1.),
+        (lambda a: 2.5 - a, lambda a: 2.5 - a, -1.),
+        (lambda a: 2.5 * a, lambda a: 2.5 * a, 2.5),
+    ]
+    for i, (fn, ref, grad) in enumerate(cases):
+        assert np.allclose(fn(x).numpy(), ref(data)), \
+            'The scalar op({}) is wrong.'.format(i)
+        w = torch.from_numpy(data.copy())
+        w.requires_grad = True
+        fn(w).sum().backward()
+        assert np.allclose(w.grad.numpy(), grad), \
+            'The grads of scalar op({}) are wrong.'.format(i)
+    assert len(primitive._SCALAR_TENSORS) == num_scalars, \
+        'The tensors of scalars are created for the arguments.'
+    # the inplace ops still take the tensors of scalars
+    y = torch.from_numpy(data.copy()); y += 2.5; y *= 2.
+    assert np.allclose(y.numpy(), (data + 2.5) * 2.), 'The inplace scalar op is wrong.'
+    # ``x * 0`` and ``x / 0`` keep the ``nan`` and ``inf`` as numpy
+    data[0], data[1] = np.nan, np.inf
+    x = torch.from_numpy(data.copy())
+    with np.errstate(all='ignore'):
+        for fn in (lambda a: a * 0., lambda a: a / 0., lambda a: a + np.inf):
+            assert np.allclose(fn(x).numpy(), fn(data), equal_nan=True), \
+                'The scalar op of nan or inf is wrong.'
+
+
+def check_template_reuse():
+    """Check the hottest template of ONCE ops survives the eviction."""
+    ctx = ('CPU', 0)
+    hot = execute_engine._get_once_template('Fill', ctx, {'value': 1.0})
+    for i in range(execute_engine._MAX_ONCE_TEMPLATES + 100):
+        execute_engine._get_once_template('Fill', ctx, {'value': float(i) + 0.25})
+        template = execute_engine._get_once_template('Fill', ctx, {'value': 1.0})
+        assert template is hot, 'The hottest template is evicted.'
+    assert len(execute_engine._ONCE_TEMPLATES) <= execute_engine._MAX_ONCE_TEMPLATES
+
+
+def check_scalar_bound():
+    """Check the tensors of scalars are bounded by the cache."""
+    x = torch.ones(1)
+    for i in range(primitive._MAX_SCALAR_TENSORS * 2):
+        (float(i) + 0.5) / x
+    num_scalars = len([name for name in dg.workspace.Tensors()
+        if name.startswith('/share/scalar/')])
+    assert num_scalars <= primitive._MAX_SCALAR_TENSORS, \
+        'Got {} tensors of scalars, excepted at most {}.'.format(
+            num_scalars, primitive._MAX_SCALAR_TENSORS)
+
+
+def check_flow_cache(num_flows=70):
+    """Check the gradient flows are cached by the recent use."""
+    dg.workspace.ResetGradientFlowCache()
+    w = torch.ones(1, requires_grad=True)
+
+    def flow(length):
+        y = w
+        for i in range(length): y = y * 3.0
+        y.sum().backward()
+
+    # the hottest flow interleaves with the others
+    flow(1)
+    for i in range(num_flows):
+        flow(i + 2)
+        flow(1)
+    stats = dg.workspace.GetGradientFlowCacheStats()
+    assert stats['hits'] == num_flows and stats['misses'] == num_flows + 1, \
+        'The hottest flow is evicted: {}'.format(stats)
+    assert stats['entries'] < num_flows + 1, 'No flows are evicted: {}'.format(stats)
+
+    # the tensors referred by arguments are renamed as well
+    dg.workspace.ResetGradientFlowCache()
+    for handle in range(2):
+        x, y, like = ['[TPool]check/tensor:{}{}'.format(handle, e) for e in ('', '_y', '_like')]
+        dg.workspace.FeedTensor(x, np.ones((2, 3), 'float32'))
+        dg.workspace.FeedTensor(like, np.ones((3, 2), 'float32'))
+        op = MakeOperatorDef('Reshape', [x], [y], shape_like=like)
+        dg.workspace.RunOperator(op)
+        dg.workspace.RunGradientFlow([op], targets=[y])
+        assert dg.workspace.FetchTensor(x + '_grad').shape == (2, 3)
+    stats = dg.workspace.GetGradientFlowCacheStats()
+    assert stats['hits'] == 1, 'The renamed flow is not hit: {}'.format(stats)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark the dispatching of torch VM.')
+    parser.add_argument('--size', type=int, default=16, help='The number of elements.')
+    parser.add_argument('--iterations', type=int, default=10000, help='The number of timed ops.')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    check_scalar_eviction()
+    check_scalar_release()
+    check_scalar_bound()
+    check_scalar_arguments()
+    check_template_reuse()
+    check_flow_cache()
+    x = torch.from_numpy(np.random.randn(args.size).astype('float32'))
+    y = torch.from_numpy(np.random.randn(args.size).astype('float32'))
+    w = torch.from_numpy(np.random.randn(args.size).astype('float32'))
+    w.requires_grad = True
+    out = torch.zeros(args.size)
+
+    def backward():
+        (x * w + y).sum().backward()
+
+    cases = [
+        ('add (persistent)', lambda: x + y),
+        ('mul (persistent)', lambda: x * y),
+        ('add (requires_grad)', lambda: x + w),
+        ('add scalar', lambda: x + 1.0),
+        ('mul scalar', lambda: x * 0.5),
+        ('fill (once)', lambda: torch.ones(args.size, out=out)),
+        ('mul + add + sum + backward', backward),
+    ]
+    for name, fn in cases:
+        iterations = args.iterations // 10 if 'backward' in name else args.iterations
+        print('{0:<30s}{1:>12.1f} calls/sec'.format(name, benchmark(fn, iterations)))
@@ -0,0 +1,164 @@
+# ------------------------------------------------------------
+# Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+#
+# Licensed under the BSD 2-Clause License.
+# You should have received a copy of the BSD 2-Clause License
+# along with the software. If not, See,
+#
+#      <https://opensource.org/licenses/BSD-2-Clause>
+#
+# ------------------------------------------------------------
+
+"""Measure the optimizer steps of many small params on CPU.
+
+The params of a group are updated by a single fused op,
+the results are checked against numpy before the timing.
+
+Examples
+--------
+>>> python optimizer.py --params 100 --iterations 200
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import time
+import argparse
+import numpy as np
+
+import dragon.vm.torch as torch
+
+
+def check_group_change(rng, lr=0.1):
+    """Check the params added or replaced after the first steps are updated."""
+    values = [rng.randn(8).astype('float32') for i in range(3)]
+    params = [torch.from_numpy(v.copy()) for v in values]
+    for p in params: p.requires_grad = True
+    group = {'params': params[:1]}
+    optimizer = torch.optim.SGD([group], lr=lr)
+    x = torch.from_numpy(rng.randn(8).astype('float32'))
+
+    def step(expected):
+        sum([(p * x).sum() for p in group['params']]).backward()
+        optimizer.step()
+        for i in expected: values[i] -= lr * x.numpy()
+        for i, p in enumerate(params):
+            assert np.allclose(p.numpy(), values[i], atol=1e-5), \
+                'The param({}) is not updated as expected.'.format(i)
+
+    for i in range(2): step([0])
+    # add a param into the group
+    group['params'].append(params[1])
+    for i in range(2): step([0, 1])
+    # replace a param of the group
+    group['params'][0] = params[2]
+    for i in range(2): step([1, 2])
+
+
+def check_cached_flows(rng):
+    """Check the grads and buckets collected by the first step are reused."""
+    params = [torch.from_numpy(rng.randn(8).astype('float32')) for i in range(3)]
+    for p in params: p.requires_grad = True
+    optimizer = torch.optim.SGD(params, lr=0.1)
+    group = optimizer.param_groups[0]
+    x = torch.from_numpy(rng.randn(8).astype('float32'))
+    flows = []
+    for i in range(2):
+        sum([(p * x).sum() for p in params]).backward()
+        optimizer.step()
+        flows.append(optimizer._grad_flows[group['slot']][1])
+    assert flows[0] is flows[1], 'The collected grads are not reused.'
+    for (_, grads_0, buckets_0, _), (_, grads_1, buckets_1, _) in zip(*flows):
+        assert grads_0 is grads_1 and buckets_0 is buckets_1, \
+            'The collected grads or buckets are not reused.'
+
+
+def check_multi_tensors(rng, sizes=(3, 5000, 9000), steps=3):
+    """Check the multi-tensor updates against numpy.
+
+    The params span several chunks of threads, and the grads are
+    scaled, clipped and decayed before the updates.
+
+    """
+    lr, decay, scale, clip, eps = 0.1, 0.01, 0.5, 4.0, 1e-3
+    x_values = [rng.randn(size).astype('float32') for size in sizes]
+    xs = [torch.from_numpy(v) for v in x_values]
+
+    def sgd(g, s, t, nesterov=False, momentum=0.9):
+        h = s.get('h', 0.)
+        s['h'] = momentum * h + lr * g
+        if nesterov: return (1 + momentum) * s['h'] - momentum * h
+        return s['h']
+
+    def rmsprop(g, s, t, alpha=0.99):
+        s['h'] = alpha * s.get('h', 0.) + (1 - alpha) * g * g
+        return lr * g / (np.sqrt(s['h']) + eps)
+
+    def adam(g, s, t, beta1=0.9, beta2=0.999):
+        s['m'] = beta1 * s.get('m', 0.) + (1 - beta1) * g
+        s['v'] = beta2 * s.get('v', 0.) + (1 - beta2) * g * g
+        coeff = np.sqrt(1 - beta2 ** t) / (1 - beta1 ** t)
+        return lr * coeff * s['m'] / (np.sqrt(s['v']) + eps)
+
+    kwargs = {'lr': lr, 'weight_decay': decay,
+              'scale_gradient': scale, 'clip_gradient': clip}
+    for name, optim_cls, optim_kwargs, update in [
+        ('sgd', torch.optim.SGD, {'momentum': 0.9}, sgd),
+        ('nesterov', torch.optim.SGD, {'momentum': 0.9, 'nesterov': True},
+            lambda g, s, t: sgd(g, s, t, nesterov=True)),
+        ('rmsprop', torch.optim.RMSprop, {'alpha': 0.99, 'eps': eps}, rmsprop),
+        ('adam', torch.optim.Adam, {'eps': eps}, adam),
+    ]:
+        values = [rng.randn(size).astype('float32') for size in sizes]
+        params = [torch.from_numpy(v.copy()) for v in values]
+        for p in params: p.requires_grad = True
+        optim_kwargs.update(kwargs)
+        optimizer = optim_cls(params, **optim_kwargs)
+        states = [{} for size in sizes]
+        for t in range(1, steps + 1):
+            sum([(p * x).sum() for p, x in zip(params, xs)]).backward()
+            optimizer.step()
+            for i, g in enumerate(x_values):
+                g = g * scale
+                norm = np.sqrt((g * g).sum())
+                if norm > clip: g = g * clip / norm
+                values[i] = values[i] - update(g + decay * values[i], states[i], t)
+            for i, p in enumerate(params):
+                assert np.allclose(p.numpy(), values[i], atol=1e-5), \
+                    'The param({}) of {} is wrong at step {}.'.format(i, name, t)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark the optimizer steps.')
+    parser.add_argument('--params', type=int, default=100, help='The number of params.')
+    parser.add_argument('--size', type=int, default=256, help='The number of elements of a param.')
+    parser.add_argument('--iterations', type=int, default=200, help='The number of timed steps.')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    rng = np.random.RandomState(1337)
+    check_group_change(rng)
+    check_cached_flows(rng)
+    check_multi_tensors(rng)
+
+    params = [torch.from_numpy(rng.randn(args.size).astype('float32'))
+        for i in range(args.params)]
+    for p in params: p.requires_grad = True
+    x = torch.from_numpy(rng.randn(args.size).astype('float32'))
+
+    def backward():
+        sum([(p * x).sum() for p in params]).backward()
+
+    for name, optimizer in [
+        ('sgd', torch.optim.SGD(params, lr=1e-4, momentum=0.9)),
+        ('adam', torch.optim.Adam(params, lr=1e-4)),
+    ]:
+        for i in range(5): backward(); optimizer.step()
+        tic = time.time()
+        for i in range(args.iterations): optimizer.step()
+        print('{0:<8s}{1:>10.1f} steps/sec'.format(name,
+            args.iterations / (time.time() - tic)))
@@ -0,0 +1,109 @@
+# ------------------------------------------------------------
+# Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+#
+# Licensed under the BSD 2-Clause License.
+# You should have received a copy of the BSD 2-Clause License
+# along with the software. If not, See,
+#
+#      <https://opensource.org/licenses/BSD-2-Clause>
+#
+# ------------------------------------------------------------
+
+
+"""Measure the per-iteration latency of the eager and traced models on CPU.
+
+The eager models dispatch each op from Python,
+while the traced models replay a static graph
+with the pruned and shared tensors.
+
+Examples
+--------
+>>> python trace.py --models resnet18 vgg11 squeezenet1_0 --batch-size 1
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import time
+import argparse
+import numpy as np
+
+import dragon.vm.torch as torch
+from dragon.vm.torch import nn
+from dragon.vm.torch.vision import models
+
+
+def check_dynamic_arguments():
+    """Check the traced view keeps its shape after an interleaved eager view."""
+    class ViewLinear(nn.Module):
+        def __init__(self):
+            super(ViewLinear, self).__init__()
+            self.fc = nn.Linear(12, 3)
+
+        def forward(self, x):
+            return self.fc((x * 2).view(x.size(0), -1))
+
+    m = ViewLinear().eval()
+    x = torch.from_numpy(np.random.randn(2, 3, 4).astype('float32'))
+    traced = torch.jit.trace(m, x)
+    with torch.no_grad(): expected = m(x).numpy()
+    # the eager view feeds its shape into the same argument tensors
+    (torch.ones(2, 3, 4) * 2).view(6, 4)
+    assert np.allclose(traced(x).numpy(), expected, atol=1e-5), \
+        'The traced view is changed by the eager view.'
+
+
+def benchmark(fn, iterations, warmup=3):
+    """Return the milliseconds per call of a function.
+
+    Parameters
+    ----------
+    fn : function
+        The function to call.
+    iterations : int
+        The number of timed calls.
+    warmup : int
+        The number of warm-up calls.
+
+    Returns
+    -------
+    float
+        The latency.
+
+    """
+    for i in range(warmup): fn()
+    tic = time.time()
+    for i in range(iterations): fn()
+    return (time.time() - tic) * 1000. / iterations
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark the traced torch models.')
+    parser.add_argument('--models', nargs='+', default=['resnet18', 'vgg11', 'squeezenet1_0'],
+                        help='The name of models in torch.vision.models.')
+    parser.add_argument('--batch-size', type=int, default=1, help='The batch size.')
+    parser.add_argument('--image-size', type=int, default=224, help='The size of images.')
+    parser.add_argument('--iterations', type=int, default=20, help='The number of timed calls.')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    check_dynamic_arguments()
+    x = torch.from_numpy(np.random.randn(args.batch_size, 3,
+        args.image_size, args.image_size).astype('float32'))
+    for name in args.models:
+        m = getattr(models, name)().eval()
+        traced = torch.jit.trace(m, x)
+
+        def eager():
+            with torch.no_grad(): return m(x)
+
+        error = np.abs(eager().numpy() - traced(x).numpy()).max()
+        eager_ms = benchmark(eager, args.iterations)
+        traced_ms = benchmark(lambda: traced(x), args.iterations)
+        print('{0:<16s}eager {1:>8.2f} ms, traced {2:>8.2f} ms, '
+              'speedup {3:.2f}x, max error {4:.2e}'.format(
+                name, eager_ms, traced_ms, eager_ms / traced_ms, error))
@@ -0,0 +1,111 @@
+# ------------------------------------------------------------
+# Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+#
+# Licensed under the BSD 2-Clause License.
+# You should have received a copy of the BSD 2-Clause License
+# along with the software. If not, See,
+#
+#      <https://opensource.org/licenses/BSD-2-Clause>
+#
+# ------------------------------------------------------------
+
+
+"""Compare the batched lowering of CPU convolutions with the per-image lowering.
+
+The layers are taken from ResNet and VGG, and both the forward pass
+and the forward-backward pass are measured.
+
+Examples
+--------
+>>> python conv2d.py --batch-size 8 --data-format NCHW
+
+>>> python conv2d.py --batch-size 8 --data-format NHWC --backward
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import time
+import argparse
+import numpy as np
+
+import dragon as dg
+import dragon.vm.theano as theano
+import dragon.vm.theano.tensor as T
+
+
+# (name, in_channels, out_channels, kernel_size, stride, image_size)
+LAYERS = [
+    ('resnet.conv2_3x3', 64, 64, 3, 1, 56),
+    ('resnet.conv3_3x3', 128, 128, 3, 1, 28),
+    ('resnet.conv4_3x3', 256, 256, 3, 1, 14),
+    ('resnet.conv5_3x3', 512, 512, 3, 1, 7),
+    ('resnet.conv4_1x1', 1024, 256, 1, 1, 14),
+    ('resnet.conv5_1x1', 2048, 512, 1, 1, 7),
+    ('resnet.conv5_down', 256, 512, 3, 2, 14),
+    ('vgg.conv5_3x3', 512, 512, 3, 1, 14),
+]
+
+
+def benchmark(args, layer, lowering_limit):
+    """Return the latency and outputs of a conv layer.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The arguments.
+    layer : tuple
+        The definition of layer.
+    lowering_limit : int
+        The max bytes to lower a batch of images.
+
+    Returns
+    -------
+    float
+        The latency.
+    list of ndarray
+        The outputs of last run.
+
+    """
+    dg.config.SetConvLoweringLimit(lowering_limit)
+    name, in_channels, out_channels, kernel_size, stride, size = layer
+    rng = np.random.RandomState(1337)
+    x_shape = [args.batch_size, in_channels, size, size] if args.data_format == 'NCHW' \
+        else [args.batch_size, size, size, in_channels]
+    w_shape = [out_channels, in_channels, kernel_size, kernel_size] if args.data_format == 'NCHW' \
+        else [kernel_size, kernel_size, in_channels, out_channels]
+    x = dg.Tensor(shape=x_shape, dtype='float32').Variable()
+    w = dg.Tensor(shape=w_shape, dtype='float32').Variable()
+    x.set_value(rng.randn(*x_shape).astype('float32'))
+    w.set_value(rng.randn(*w_shape).astype('float32') * 0.01)
+    y = dg.ops.Conv2d([x, w], num_output=out_channels, kernel_size=kernel_size,
+        stride=stride, pad=kernel_size // 2, data_format=args.data_format)
+    f = theano.function(outputs=[y] + (T.grad(dg.ops.Sum(y), [x, w]) if args.backward else []))
+    outputs = f()
+    tic = time.time()
+    for i in range(args.iterations): outputs = f()
+    if not isinstance(outputs, list): outputs = [outputs]
+    return (time.time() - tic) * 1000. / args.iterations, outputs
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark the lowering of CPU convolutions.')
+    parser.add_argument('--batch-size', type=int, default=8, help='The batch size.')
+    parser.add_argument('--data-format', default='NCHW', help='NCHW or NHWC.')
+    parser.add_argument('--backward', action='store_true', help='Whether to run the backward pass.')
+    parser.add_argument('--iterations', type=int, default=5, help='The number of timed runs.')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    for layer in LAYERS:
+        per_image, expected = benchmark(args, layer, 0)
+        batched, outputs = benchmark(args, layer, 64 << 20)
+        error = max(np.abs(a - b).max() / max(np.abs(a).max(), 1e-6)
+                    for a, b in zip(expected, outputs))
+        print('{0:<20s}per-image {1:>9.2f} ms, batched {2:>9.2f} ms, '
+              'speedup {3:>5.2f}x, relative error {4:.2e}'.format(
+                layer[0], per_image, batched, per_image / batched, error))
@@ -0,0 +1,165 @@
+# ------------------------------------------------------------
+# Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+#
+# Licensed under the BSD 2-Clause License.
+# You should have received a copy of the BSD 2-Clause License
+# along with the software. If not, See,
+#
+#      <https://opensource.org/licenses/BSD-2-Clause>
+#
+# ------------------------------------------------------------
+
+
+"""Compare the inference graphs with and without folding the batch norms.
+
+The frozen batch norms are folded into the preceding convolutions,
+and the results are checked against the unfused graphs within the tolerance.
+
+Examples
+--------
+>>> python fold.py --models resnet18 vgg11_bn --batch-size 1
+
+>>> python fold.py --models caffe --data-format NHWC
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import time
+import argparse
+import numpy as np
+
+import dragon as dg
+import dragon.vm.theano as theano
+import dragon.vm.torch as torch
+from dragon.vm.torch.vision import models
+
+
+def caffe_style(args, rng):
+    """Return the function of ``Conv2d -> BatchNorm -> Affine -> Relu`` blocks.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The arguments.
+    rng : numpy.random.RandomState
+        The random generator.
+
+    Returns
+    -------
+    function
+        The function to call.
+
+    """
+    def variable(shape, value):
+        t = dg.Tensor(shape=shape, dtype='float32').Variable()
+        t.set_value(value.astype('float32'))
+        return t
+
+    channels, axis = [3, 32, 64, 64], 1 if args.data_format == 'NCHW' else -1
+    x_shape = [args.batch_size, 3, args.image_size, args.image_size]
+    if args.data_format == 'NHWC': x_shape = [x_shape[i] for i in (0, 2, 3, 1)]
+    y = x = variable(x_shape, rng.randn(*x_shape))
+    for i in range(1, len(channels)):
+        c_in, c_out = channels[i - 1], channels[i]
+        w_shape = [c_out, c_in, 3, 3] if args.data_format == 'NCHW' else [3, 3, c_in, c_out]
+        y = dg.ops.Conv2d([y, variable(w_shape, rng.randn(*w_shape) * 0.1)],
+            num_output=c_out, kernel_size=3, stride=1, pad=1, data_format=args.data_format)
+        factor = rng.rand(1) + 0.5
+        y = dg.ops.BatchNorm([y, variable([c_out], rng.randn(c_out) * factor),
+            variable([c_out], (rng.rand(c_out) + 0.5) * factor), variable([1], factor)],
+            axis=axis, use_stats=1, mode='CAFFE')
+        y = dg.ops.Affine([y, variable([c_out], rng.rand(c_out) + 0.5),
+            variable([c_out], rng.randn(c_out))], axis=axis)
+        y = dg.ops.Relu(y)
+    f = theano.function(outputs=y)
+    return lambda: f().copy()
+
+
+def torch_style(m, x):
+    """Return the traced function of a torch model.
+
+    Parameters
+    ----------
+    m : vm.torch.nn.Module
+        The model in the eval mode.
+    x : vm.torch.Tensor
+        The example inputs.
+
+    Returns
+    -------
+    function
+        The function to call.
+
+    """
+    traced = torch.jit.trace(m, x)
+    return lambda: traced(x).numpy().copy()
+
+
+def benchmark(args, fold, build):
+    """Return the latency and outputs of a model.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The arguments.
+    fold : boolean
+        Whether to fold the batch norms.
+    build : function
+        The function to build the function to call.
+
+    Returns
+    -------
+    float
+        The latency.
+    ndarray
+        The outputs of last run.
+
+    """
+    dg.config.FoldBatchNorm(fold)
+    fn = build()
+    dg.config.FoldBatchNorm(False)
+    outputs = fn()
+    tic = time.time()
+    for i in range(args.iterations): outputs = fn()
+    return (time.time() - tic) * 1000. / args.iterations, outputs
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark the folding of batch norms.')
+    parser.add_argument('--models', nargs='+', default=['caffe', 'resnet18', 'vgg11_bn'],
+                        help='The name of models in torch.vision.models, or caffe.')
+    parser.add_argument('--batch-size', type=int, default=1, help='The batch size.')
+    parser.add_argument('--image-size', type=int, default=224, help='The size of images.')
+    parser.add_argument('--data-format', default='NCHW', help='NCHW or NHWC, only for caffe.')
+    parser.add_argument('--tolerance', type=float, default=1e-3,
+                        help='The max relative error to the unfused graph.')
+    parser.add_argument('--iterations', type=int, default=10, help='The number of timed runs.')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    for model in args.models:
+        if model == 'caffe':
+            build = lambda: caffe_style(args, np.random.RandomState(1337))
+        else:
+            m = getattr(models, model)()
+            for module in m.modules():
+                if isinstance(module, torch.nn.BatchNorm2d):
+                    # Randomize the statistics, which are trivial at the init
+                    module.running_mean.normal_()
+                    module.running_var.uniform_(0.5, 1.5)
+                    module.bias.data.normal_()
+            x = torch.from_numpy(np.random.randn(args.batch_size, 3,
+                args.image_size, args.image_size).astype('float32'))
+            build = lambda: torch_style(m.eval(), x)
+        unfused, expected = benchmark(args, False, build)
+        folded, outputs = benchmark(args, True, build)
+        error = np.abs(expected - outputs).max() / max(np.abs(expected).max(), 1e-6)
+        print('{0:<16s}unfused {1:>9.2f} ms, folded {2:>9.2f} ms, '
+              'speedup {3:>5.2f}x, relative error {4:.2e} {5}'.format(
+                model, unfused, folded, unfused / folded, error,
+                'OK' if error <= args.tolerance else 'FAILED'))
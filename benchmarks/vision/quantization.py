@@ -0,0 +1,133 @@
+# ------------------------------------------------------------
+# Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+#
+# Licensed under the BSD 2-Clause License.
+# You should have received a copy of the BSD 2-Clause License
+# along with the software. If not, See,
+#
+#      <https://opensource.org/licenses/BSD-2-Clause>
+#
+# ------------------------------------------------------------
+
+
+"""Compare the inference graphs of float32 and the post-training int8.
+
+The inputs of convolutions are calibrated on the random batches,
+and the int8 outputs are checked against the float32 on the held-out batches.
+
+Examples
+--------
+>>> python quantization.py --models resnet18 squeezenet1_0
+
+>>> python quantization.py --models vgg11_bn --fold
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import copy
+import time
+import argparse
+import numpy as np
+
+import dragon as dg
+import dragon.vm.torch as torch
+from dragon.vm.torch.vision import models
+from dragon.tools.quantization import Calibrator, Quantize
+
+
+def batch(args, rng, batch_size):
+    """Return a random batch of images.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The arguments.
+    rng : numpy.random.RandomState
+        The random generator.
+    batch_size : int
+        The batch size.
+
+    Returns
+    -------
+    vm.torch.Tensor
+        The images.
+
+    """
+    return torch.from_numpy(rng.randn(batch_size, 3,
+        args.image_size, args.image_size).astype('float32'))
+
+
+def benchmark(args, fn, x):
+    """Return the latency of a function.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The arguments.
+    fn : function
+        The function to call.
+    x : vm.torch.Tensor
+        The inputs.
+
+    Returns
+    -------
+    float
+        The latency.
+
+    """
+    fn(x)
+    tic = time.time()
+    for i in range(args.iterations): fn(x)
+    return (time.time() - tic) * 1000. / args.iterations
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark the int8 quantization.')
+    parser.add_argument('--models', nargs='+', default=['resnet18', 'squeezenet1_0'],
+                        help='The name of models in torch.vision.models.')
+    parser.add_argument('--batch-size', type=int, default=1, help='The batch size.')
+    parser.add_argument('--image-size', type=int, default=224, help='The size of images.')
+    parser.add_argument('--calibration', type=int, default=8,
+                        help='The number of batches to calibrate.')
+    parser.add_argument('--evaluation', type=int, default=4,
+                        help='The number of held-out batches to compare.')
+    parser.add_argument('--fold', action='store_true', help='Fold the batch norms.')
+    parser.add_argument('--iterations', type=int, default=10, help='The number of timed runs.')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    rng = np.random.RandomState(1337)
+    for model in args.models:
+        m = getattr(models, model)().eval()
+        x = batch(args, rng, args.batch_size)
+        dg.config.FoldBatchNorm(args.fold)
+        traced = torch.jit.trace(m, x)
+        dg.config.FoldBatchNorm(False)
+
+        calibrator = Calibrator(traced.graph_def)
+        for i in range(args.calibration):
+            traced(batch(args, rng, args.batch_size))
+            calibrator.update()
+        quantized = copy.copy(traced)
+        quantized.graph_def = Quantize(traced.graph_def, calibrator.ranges)
+
+        # The outputs are shared by graphs, copy them before the next run
+        errors, agreements = [], []
+        for i in range(args.evaluation):
+            xi = batch(args, rng, args.batch_size)
+            expected = traced(xi).numpy().copy()
+            outputs = quantized(xi).numpy().copy()
+            errors.append(np.abs(expected - outputs).max() /
+                max(np.abs(expected).max(), 1e-6))
+            agreements.extend(expected.argmax(-1) == outputs.argmax(-1))
+
+        fp32 = benchmark(args, traced, x)
+        int8 = benchmark(args, quantized, x)
+        print('{0:<16s}float32 {1:>9.2f} ms, int8 {2:>9.2f} ms, speedup {3:>5.2f}x, '
+              'relative error {4:.2e}, top-1 agreement {5:.1%}'.format(
+                model, fp32, int8, fp32 / int8, max(errors), np.mean(agreements)))
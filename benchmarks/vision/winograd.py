@@ -0,0 +1,109 @@
+# ------------------------------------------------------------
+# Copyright (c) 2017-present, SeetaTech, Co.,Ltd.
+#
+# Licensed under the BSD 2-Clause License.
+# You should have received a copy of the BSD 2-Clause License
+# along with the software. If not, See,
+#
+#      <https://opensource.org/licenses/BSD-2-Clause>
+#
+# ------------------------------------------------------------
+
+
+"""Compare the Winograd engine of CPU 3x3 convolutions with the im2col engine.
+
+The engines are selected by the device scope, and the results
+of Winograd are checked against the im2col within the tolerance.
+
+Examples
+--------
+>>> python winograd.py --batch-size 4 --channels 16 64 256 --sizes 7 14 28 56
+
+>>> python winograd.py --batch-size 4 --data-format NHWC --backward
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import time
+import argparse
+import numpy as np
+
+import dragon as dg
+import dragon.vm.theano as theano
+import dragon.vm.theano.tensor as T
+
+
+def benchmark(args, channels, size, engine):
+    """Return the latency and outputs of a 3x3 conv layer.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The arguments.
+    channels : int
+        The number of input and output channels.
+    size : int
+        The size of images.
+    engine : str
+        The engine, ``IM2COL`` or ``WINOGRAD``.
+
+    Returns
+    -------
+    float
+        The latency.
+    list of ndarray
+        The outputs of last run.
+
+    """
+    rng = np.random.RandomState(1337)
+    x_shape = [args.batch_size, channels, size, size] if args.data_format == 'NCHW' \
+        else [args.batch_size, size, size, channels]
+    w_shape = [channels, channels, 3, 3] if args.data_format == 'NCHW' \
+        else [3, 3, channels, channels]
+    x = dg.Tensor(shape=x_shape, dtype='float32').Variable()
+    w = dg.Tensor(shape=w_shape, dtype='float32').Variable()
+    x.set_value(rng.randn(*x_shape).astype('float32'))
+    w.set_value(rng.randn(*w_shape).astype('float32') * 0.1)
+    with dg.device_scope('cpu', engine=engine):
+        y = dg.ops.Conv2d([x, w], num_output=channels, kernel_size=3,
+            stride=1, pad=1, data_format=args.data_format)
+        # dY = Y, i.e., checking the backward-data with the various gradients
+        outputs = [y] + ([T.grad(dg.ops.Sum(y * y) * 0.5, x)] if args.backward else [])
+    f = theano.function(outputs=outputs)
+    outputs = f()
+    tic = time.time()
+    for i in range(args.iterations): outputs = f()
+    if not isinstance(outputs, list): outputs = [outputs]
+    return (time.time() - tic) * 1000. / args.iterations, outputs
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark the Winograd engine of CPU convolutions.')
+    parser.add_argument('--batch-size', type=int, default=4, help='The batch size.')
+    parser.add_argument('--channels', type=int, nargs='+', default=[16, 32, 64, 128, 256],
+                        help='The number of input and output channels.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[7, 14, 28, 56],
+                        help='The size of images.')
+    parser.add_argument('--data-format', default='NCHW', help='NCHW or NHWC.')
+    parser.add_argument('--backward', action='store_true', help='Whether to run the backward pass.')
+    parser.add_argument('--tolerance', type=float, default=1e-3,
+                        help='The max relative error to Im2Col.')
+    parser.add_argument('--iterations', type=int, default=5, help='The number of timed runs.')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    for channels in args.channels:
+        for size in args.sizes:
+            im2col, expected = benchmark(args, channels, size, 'IM2COL')
+            winograd, outputs = benchmark(args, channels, size, 'WINOGRAD')
+            error = max(np.abs(a - b).max() / max(np.abs(a).max(), 1e-6)
+                        for a, b in zip(expected, outputs))
+            print('channels={0:<6d}size={1:<5d}im2col {2:>9.2f} ms, winograd {3:>9.2f} ms, '
+                  'speedup {4:>5.2f}x, relative error {5:.2e} {6}'.format(
+                    channels, size, im2col, winograd, im2col / winograd, error,
+                    'OK' if error <= args.tolerance else 'FAILED'))